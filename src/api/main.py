@@ -1,13 +1,16 @@
 """FastAPI application for Symbology API."""
 import os
+import time
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html
-from fastapi.responses import JSONResponse
-from src.database.base import init_db
+from fastapi.responses import JSONResponse, Response
+from src.api.schemas import NEXT_CURSOR_HEADER
+from src.database.base import init_db, record_queries, request_session_scope
 from src.utils.config import settings
 from src.utils.logging import configure_logging, get_logger, get_uvicorn_log_config
+from src.utils.metrics import CONTENT_TYPE, HTTP_REQUEST_SECONDS, REGISTRY
 import uvicorn
 
 
@@ -37,6 +40,10 @@ def create_app() -> FastAPI:
                 "name": "prompts",
                 "description": "Operations related to prompt templates and management",
             },
+            {
+                "name": "search",
+                "description": "Full-text search over documents and generated content",
+            },
         ],
         contact={
             "name": "Symbology Team",
@@ -55,8 +62,44 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=[NEXT_CURSOR_HEADER],
     )
 
+    # Route handlers are plain functions run in the threadpool; give each request its own session
+    @app.middleware("http")
+    async def database_session_middleware(request: Request, call_next):
+        with request_session_scope():
+            return await call_next(request)
+
+    # Record latency by route template rather than raw path, so ids don't explode label cardinality
+    @app.middleware("http")
+    async def metrics_middleware(request: Request, call_next):
+        start = time.perf_counter()
+        status = 500
+        try:
+            response = await call_next(request)
+            status = response.status_code
+            return response
+        finally:
+            route = request.scope.get("route")
+            HTTP_REQUEST_SECONDS.observe(
+                time.perf_counter() - start,
+                method=request.method,
+                route=getattr(route, "path", "unmatched"),
+                status=status,
+            )
+
+    if settings.database.record_queries:
+        # Group each request's statements to flag slow queries and N+1 patterns
+        @app.middleware("http")
+        async def query_recorder_middleware(request: Request, call_next):
+            with record_queries(f"{request.method} {request.url.path}") as recorder:
+                response = await call_next(request)
+                route = request.scope.get("route")
+                if route is not None:
+                    recorder.name = f"{request.method} {route.path}"
+                return response
+
     # Add exception handling middleware
     @app.exception_handler(Exception)
     async def global_exception_handler(request: Request, exc: Exception):
@@ -83,6 +126,12 @@ def create_app() -> FastAPI:
         return {"status": "online", "message": "Symbology API is running"}
 
 
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        """Prometheus metrics for the API, database and any work run in this process."""
+        return Response(content=REGISTRY.render(), media_type=CONTENT_TYPE)
+
+
     @app.get("/docs", include_in_schema=False)
     async def custom_swagger_ui_html():
         """Custom Swagger UI with a better theme."""
@@ -112,12 +161,14 @@ def start_api():
     configure_logging(
         log_level=settings.logging.level,
         json_format=settings.logging.json_format,
-        configure_root_logger=True
+        configure_root_logger=True,
+        profile=settings.logging.profile,
     )
     logger = get_logger(__name__)
 
     # Initialize database connection
-    init_db(settings.database.url)
+    init_db(settings.database.url, pool_size=settings.database.pool_size,
+            max_overflow=settings.database.max_overflow)
     logger.debug("database_connection_initialized", host=settings.database.host, port=settings.database.port)
 
     app = create_app()
@@ -6,6 +6,7 @@ from src.api.routes.filings import router as filings_router
 from src.api.routes.generated_content import router as generated_content_router
 from src.api.routes.model_configs import router as model_configs_router
 from src.api.routes.prompts import router as prompts_router
+from src.api.routes.search import router as search_router
 from src.utils.logging import get_logger
 
 # Create logger for this module
@@ -21,6 +22,7 @@ api_router.include_router(filings_router, prefix="/filings", tags=["filings"])
 api_router.include_router(prompts_router, prefix="/prompts", tags=["prompts"])
 api_router.include_router(generated_content_router, prefix="/generated-content", tags=["generated-content"])
 api_router.include_router(model_configs_router, prefix="/model-configs", tags=["model-configs"])
+api_router.include_router(search_router, prefix="/search", tags=["search"])
 
 logger.info("api_routes_configured",
            endpoints=[
@@ -30,4 +32,5 @@ logger.info("api_routes_configured",
                "/prompts",
                "/generated-content",
                "/model-configs",
+               "/search",
            ])
\ No newline at end of file
@@ -1,11 +1,20 @@
 """Companies API routes."""
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence, Union
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, Query, status
-from src.api.schemas import CompanyResponse
-from src.database.companies import Company, get_company, get_company_by_ticker, list_all_companies, search_companies_by_query
-from src.database.generated_content import get_frontpage_summary_by_ticker
+from fastapi import APIRouter, HTTPException, Query, Response, status
+from sqlalchemy import Row
+from src.api.schemas import CompanyResponse, NEXT_CURSOR_HEADER
+from src.database.companies import (
+    Company,
+    get_company,
+    get_company_by_ticker,
+    list_all_companies,
+    list_companies_page,
+    search_companies_by_query,
+)
+from src.database.generated_content import get_frontpage_summaries_by_company_ids
+from src.database.pagination import InvalidCursorError
 from src.utils.logging import get_logger
 
 # Create logger for this module
@@ -15,28 +24,38 @@ logger = get_logger(__name__)
 router = APIRouter()
 
 
+def _get_frontpage_summaries(companies: Sequence[Union[Company, Row]]) -> Dict[UUID, str]:
+    """Get the frontpage summaries for a list of companies with a single query."""
+    try:
+        return get_frontpage_summaries_by_company_ids([company.id for company in companies if company.ticker])
+    except Exception as e:
+        logger.warning("failed_to_get_frontpage_summaries", companies=len(companies), error=str(e))
+        return {}
+
+
+def _companies_to_response(companies: Sequence[Union[Company, Row]]) -> List[CompanyResponse]:
+    """Convert Company models or company rows to CompanyResponses with frontpage summaries."""
+    summaries = _get_frontpage_summaries(companies)
+    return [
+        CompanyResponse(
+            id=company.id,
+            name=company.name,
+            display_name=company.display_name,
+            ticker=company.ticker,
+            exchanges=company.exchanges,
+            sic=company.sic,
+            sic_description=company.sic_description,
+            fiscal_year_end=company.fiscal_year_end,
+            former_names=company.former_names,
+            summary=summaries.get(company.id)
+        )
+        for company in companies
+    ]
+
+
 def _company_to_response(company: Company) -> CompanyResponse:
     """Convert a Company model to CompanyResponse with frontpage summary."""
-    # Get the frontpage summary from generated content
-    summary = None
-    if company.ticker:
-        try:
-            summary = get_frontpage_summary_by_ticker(company.ticker)
-        except Exception as e:
-            logger.warning("failed_to_get_frontpage_summary", ticker=company.ticker, error=str(e))
-
-    return CompanyResponse(
-        id=company.id,
-        name=company.name,
-        display_name=company.display_name,
-        ticker=company.ticker,
-        exchanges=company.exchanges,
-        sic=company.sic,
-        sic_description=company.sic_description,
-        fiscal_year_end=company.fiscal_year_end,
-        former_names=company.former_names,
-        summary=summary
-    )
+    return _companies_to_response([company])[0]
 
 @router.get(
     "/search",
@@ -47,7 +66,7 @@ def _company_to_response(company: Company) -> CompanyResponse:
         500: {"description": "Internal server error"}
     }
 )
-async def search_companies_partial(
+def search_companies_partial(
     query: str = Query(..., description="Search query for company name or ticker"),
     limit: int = Query(10, description="Maximum number of results to return", ge=1, le=50)
 ):
@@ -61,7 +80,7 @@ async def search_companies_partial(
 
     logger.info("api_search_companies_partial", query=query, limit=limit)
     companies = search_companies_by_query(query, limit)
-    return [_company_to_response(company) for company in companies]
+    return _companies_to_response(companies)
 
 @router.get(
     "/id/{company_id}",
@@ -72,7 +91,7 @@ async def search_companies_partial(
         500: {"description": "Internal server error"}
     }
 )
-async def get_company_by_id_route(company_id: UUID):
+def get_company_by_id_route(company_id: UUID):
     """Get a company by its ID."""
     logger.info("api_get_company_by_id", company_id=str(company_id))
     company = get_company(company_id)
@@ -89,7 +108,7 @@ async def get_company_by_id_route(company_id: UUID):
         500: {"description": "Internal server error"}
     }
 )
-async def get_company_by_ticker_route(ticker: str):
+def get_company_by_ticker_route(ticker: str):
     """Get a company by its ticker symbol."""
     logger.info("api_get_company_by_ticker_route", ticker=ticker)
     company = get_company_by_ticker(ticker)
@@ -106,9 +125,11 @@ async def get_company_by_ticker_route(ticker: str):
         500: {"description": "Internal server error"}
     }
 )
-async def get_companies_route(
+def get_companies_route(
+    response: Response,
     search: Optional[str] = Query(None, description="Search query for company name or ticker"),
-    skip: int = Query(0, description="Number of companies to skip", ge=0),
+    cursor: Optional[str] = Query(None, description=f"Cursor for the next page, from the {NEXT_CURSOR_HEADER} header"),
+    skip: int = Query(0, description="Number of companies to skip (deprecated, use cursor)", ge=0),
     limit: int = Query(50, description="Maximum number of companies to return", ge=1, le=100),
     ticker: Optional[str] = Query(None, description="Company ticker symbol"),
 ):
@@ -116,7 +137,8 @@ async def get_companies_route(
 
     Can be used for:
     - Searching companies by name/ticker with 'search' parameter
-    - Getting paginated list with 'skip' and 'limit' parameters
+    - Getting paginated list with 'cursor' and 'limit' parameters; the cursor for the
+      next page is returned in the X-Next-Cursor header
     - Finding specific company by 'ticker'
     """
     # Handle specific ticker lookup
@@ -131,11 +153,20 @@ async def get_companies_route(
     if search:
         logger.info("api_get_companies_search", search=search, limit=limit)
         companies = search_companies_by_query(search, limit)
-        return [_company_to_response(company) for company in companies]
-
-    # Handle paginated list
-    logger.info("api_get_companies_list", skip=skip, limit=limit)
-    companies = list_all_companies(offset=skip, limit=limit)
-    return [_company_to_response(company) for company in companies]
+        return _companies_to_response(companies)
 
+    # Handle offset pagination for existing clients
+    if skip:
+        logger.info("api_get_companies_list", skip=skip, limit=limit)
+        companies = list_all_companies(offset=skip, limit=limit)
+        return _companies_to_response(companies)
 
+    # Handle paginated list
+    logger.info("api_get_companies_list", cursor=cursor, limit=limit)
+    try:
+        page = list_companies_page(cursor=cursor, limit=limit)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return _companies_to_response(page.items)
@@ -5,6 +5,7 @@ from uuid import UUID
 from fastapi import APIRouter, HTTPException, status
 from fastapi.responses import PlainTextResponse
 from src.api.schemas import DocumentResponse
+from src.database.content_hashes import AmbiguousHashError
 from src.database.documents import get_document, get_documents_by_filing
 from src.database.documents import get_documents_by_ids as db_get_documents_by_ids
 from src.utils.logging import get_logger
@@ -62,11 +63,11 @@ def _document_to_response(document, include_content: bool = True) -> DocumentRes
         500: {"description": "Internal server error"}
     }
 )
-async def get_document_by_id(document_id: UUID):
+def get_document_by_id(document_id: UUID):
     """Get a document by its ID."""
     try:
         logger.info("api_get_document_by_id", document_id=str(document_id))
-        document = get_document(document_id)
+        document = get_document(document_id, include_content=True)
         if not document:
             raise HTTPException(status_code=404, detail="Document not found")
 
@@ -95,11 +96,11 @@ async def get_document_by_id(document_id: UUID):
         500: {"description": "Internal server error"}
     }
 )
-async def get_document_content(document_id: UUID):
+def get_document_content(document_id: UUID):
     """Get a document's content by its ID."""
     try:
         logger.info("api_get_document_content", document_id=str(document_id))
-        document = get_document(document_id)
+        document = get_document(document_id, include_content=True)
         if not document:
             raise HTTPException(status_code=404, detail="Document not found")
 
@@ -135,7 +136,7 @@ async def get_document_content(document_id: UUID):
         500: {"description": "Internal server error"}
     }
 )
-async def get_documents_by_filing_id(filing_id: UUID):
+def get_documents_by_filing_id(filing_id: UUID):
     """Get all documents for a specific filing."""
     try:
         logger.info("api_get_documents_by_filing", filing_id=str(filing_id))
@@ -177,7 +178,7 @@ async def get_documents_by_filing_id(filing_id: UUID):
         500: {"description": "Internal server error"}
     }
 )
-async def get_documents_by_ids(document_ids: List[UUID]):
+def get_documents_by_ids(document_ids: List[UUID]):
     """Get documents by their IDs."""
     try:
         logger.info("api_get_documents_by_ids", document_ids=[str(doc_id) for doc_id in document_ids])
@@ -185,7 +186,7 @@ async def get_documents_by_ids(document_ids: List[UUID]):
         if not document_ids:
             return []
 
-        documents = db_get_documents_by_ids(document_ids)
+        documents = db_get_documents_by_ids(document_ids, include_content=True)
 
         if not documents:
             return []
@@ -220,10 +221,11 @@ async def get_documents_by_ids(document_ids: List[UUID]):
     status_code=status.HTTP_200_OK,
     responses={
         404: {"description": "Document not found"},
+        409: {"description": "Content hash prefix matches more than one document"},
         500: {"description": "Internal server error"}
     }
 )
-async def get_document_by_accession_and_hash(accession_number: str, content_hash: str):
+def get_document_by_accession_and_hash(accession_number: str, content_hash: str):
     """Get a document by filing accession number and content hash.
 
     This endpoint supports the new URL pattern: /d/[accession_number]/[content_hash]
@@ -240,7 +242,7 @@ async def get_document_by_accession_and_hash(accession_number: str, content_hash
                    accession_number=accession_number, content_hash=content_hash)
 
         from src.database.documents import get_document_by_accession_and_hash
-        document = get_document_by_accession_and_hash(accession_number, content_hash)
+        document = get_document_by_accession_and_hash(accession_number, content_hash, include_content=True)
 
         if not document:
             logger.warning("document_not_found_by_accession_and_hash",
@@ -257,6 +259,8 @@ async def get_document_by_accession_and_hash(accession_number: str, content_hash
 
     except HTTPException:
         raise
+    except AmbiguousHashError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e)) from e
     except Exception as e:
         logger.error("api_get_document_by_accession_and_hash_failed",
                     accession_number=accession_number, content_hash=content_hash,
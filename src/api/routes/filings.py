@@ -1,12 +1,14 @@
 """Filings API routes."""
-from typing import List
+from datetime import date
+from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException
-from src.api.schemas import CompanyResponse, DocumentResponse, FilingResponse
+from fastapi import APIRouter, HTTPException, Query, Response
+from src.api.schemas import CompanyResponse, DocumentResponse, FilingResponse, NEXT_CURSOR_HEADER
 from src.database.documents import get_documents_by_filing
-from src.database.filings import Filing, get_filing_by_accession_number, get_filings_by_company
-from src.database.generated_content import get_frontpage_summary_by_ticker
+from src.database.filings import Filing, get_filing_by_accession_number, get_filings_page
+from src.database.pagination import InvalidCursorError, Page
+from src.database.generated_content import get_frontpage_summaries_by_company_ids
 from src.utils.logging import get_logger
 
 # Create logger for this module
@@ -36,9 +38,30 @@ def _filing_to_response(filing: Filing) -> FilingResponse:
     )
 
 
+def _get_filings_page(response: Response, company_id: UUID, form: Optional[str], start_date: Optional[date],
+                      end_date: Optional[date], cursor: Optional[str], limit: int) -> Page[Filing]:
+    """Get a page of filings and set the next page cursor header."""
+    try:
+        page = get_filings_page(company_id, form=form, start_date=start_date, end_date=end_date,
+                                cursor=cursor, limit=limit)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page
+
+
 @router.get("/by-company/{company_id}", response_model=List[FilingResponse])
-async def get_company_filings(company_id: UUID) -> List[FilingResponse]:
-    """Get all filings for a specific company.
+def get_company_filings(
+    company_id: UUID,
+    response: Response,
+    form: Optional[str] = Query(None, description="SEC form type (10-K, 10-Q)"),
+    start_date: Optional[date] = Query(None, description="Earliest filing date"),
+    end_date: Optional[date] = Query(None, description="Latest filing date"),
+    cursor: Optional[str] = Query(None, description=f"Cursor for the next page, from the {NEXT_CURSOR_HEADER} header"),
+    limit: int = Query(100, description="Maximum number of filings to return", ge=1, le=500),
+) -> List[FilingResponse]:
+    """Get filings for a specific company, newest first.
 
     Args:
         company_id: UUID of the company
@@ -49,7 +72,7 @@ async def get_company_filings(company_id: UUID) -> List[FilingResponse]:
     try:
         logger.debug("fetching_company_filings", company_id=str(company_id))
 
-        filings = get_filings_by_company(company_id)
+        filings = _get_filings_page(response, company_id, form, start_date, end_date, cursor, limit)
 
         # Convert to response models
         filing_responses = [_filing_to_response(filing) for filing in filings]
@@ -60,6 +83,8 @@ async def get_company_filings(company_id: UUID) -> List[FilingResponse]:
 
         return filing_responses
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error("get_company_filings_failed",
                     company_id=str(company_id),
@@ -69,8 +94,16 @@ async def get_company_filings(company_id: UUID) -> List[FilingResponse]:
 
 
 @router.get("/by-ticker/{ticker}", response_model=List[FilingResponse])
-async def get_filings_by_ticker(ticker: str) -> List[FilingResponse]:
-    """Get all filings for a company by ticker symbol.
+def get_filings_by_ticker(
+    ticker: str,
+    response: Response,
+    form: Optional[str] = Query(None, description="SEC form type (10-K, 10-Q)"),
+    start_date: Optional[date] = Query(None, description="Earliest filing date"),
+    end_date: Optional[date] = Query(None, description="Latest filing date"),
+    cursor: Optional[str] = Query(None, description=f"Cursor for the next page, from the {NEXT_CURSOR_HEADER} header"),
+    limit: int = Query(100, description="Maximum number of filings to return", ge=1, le=500),
+) -> List[FilingResponse]:
+    """Get filings for a company by ticker symbol, newest first.
 
     Args:
         ticker: Stock ticker symbol
@@ -88,7 +121,7 @@ async def get_filings_by_ticker(ticker: str) -> List[FilingResponse]:
         if not company:
             raise HTTPException(status_code=404, detail=f"Company with ticker '{ticker}' not found")
 
-        filings = get_filings_by_company(company.id)
+        filings = _get_filings_page(response, company.id, form, start_date, end_date, cursor, limit)
 
         # Convert to response models
         filing_responses = [_filing_to_response(filing) for filing in filings]
@@ -111,7 +144,7 @@ async def get_filings_by_ticker(ticker: str) -> List[FilingResponse]:
 
 
 @router.get("/{accession_number}", response_model=FilingResponse)
-async def get_filing_by_accession(accession_number: str) -> FilingResponse:
+def get_filing_by_accession(accession_number: str) -> FilingResponse:
     """Get a specific filing by its accession number.
 
     Args:
@@ -149,7 +182,7 @@ async def get_filing_by_accession(accession_number: str) -> FilingResponse:
 
 
 @router.get("/{accession_number}/documents", response_model=List[DocumentResponse])
-async def get_filing_documents_by_accession(accession_number: str) -> List[DocumentResponse]:
+def get_filing_documents_by_accession(accession_number: str) -> List[DocumentResponse]:
     """Get all documents for a filing by its accession number.
 
     Args:
@@ -168,7 +201,7 @@ async def get_filing_documents_by_accession(accession_number: str) -> List[Docum
                 detail=f"Filing with accession number '{accession_number}' not found"
             )
 
-        documents = get_documents_by_filing(filing.id)
+        documents = get_documents_by_filing(filing.id, include_content=True)
 
         # Convert to response format
         response_data = []
@@ -215,7 +248,7 @@ async def get_filing_documents_by_accession(accession_number: str) -> List[Docum
 
 
 @router.get("/{accession_number}/company", response_model=CompanyResponse)
-async def get_filing_company_by_accession(accession_number: str) -> CompanyResponse:
+def get_filing_company_by_accession(accession_number: str) -> CompanyResponse:
     """Get the company information for a filing by its accession number.
 
     Args:
@@ -245,7 +278,7 @@ async def get_filing_company_by_accession(accession_number: str) -> CompanyRespo
         summary = None
         if company.ticker:
             try:
-                summary = get_frontpage_summary_by_ticker(company.ticker)
+                summary = get_frontpage_summaries_by_company_ids([company.id]).get(company.id)
             except Exception as e:
                 logger.warning("failed_to_get_frontpage_summary", ticker=company.ticker, error=str(e))
 
@@ -4,6 +4,7 @@ from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, status
 from src.api.schemas import GeneratedContentResponse
+from src.database.content_hashes import AmbiguousHashError
 from src.database.generated_content import (
     get_aggregate_summaries_by_ticker,
     get_generated_content,
@@ -26,7 +27,7 @@ logger = get_logger(__name__)
         500: {"description": "Internal server error"}
     }
 )
-async def get_company_generated_content_by_ticker(ticker: str, limit: int = 10):
+def get_company_generated_content_by_ticker(ticker: str, limit: int = 10):
     """Get the most recent generated content for each document type by ticker.
 
     Returns only the most recent content for each document type to avoid duplicates
@@ -80,11 +81,11 @@ async def get_company_generated_content_by_ticker(ticker: str, limit: int = 10):
         500: {"description": "Internal server error"}
     }
 )
-async def get_aggregate_summaries_by_ticker_route(ticker: str, limit: int = 10):
+def get_aggregate_summaries_by_ticker_route(ticker: str, limit: int = 10):
     """Get the most recent aggregate summary content for a company by ticker.
 
-    Returns only aggregate summaries (content with descriptions containing "aggregate_summary")
-    to show high-level insights and summaries for each document type.
+    Returns only aggregate summaries, the most recent one for each document type, to show
+    high-level insights and summaries for each document type.
 
     Args:
         ticker: Company ticker symbol (e.g., 'AAPL', 'GOOGL')
@@ -131,10 +132,11 @@ async def get_aggregate_summaries_by_ticker_route(ticker: str, limit: int = 10):
     status_code=status.HTTP_200_OK,
     responses={
         404: {"description": "Generated content not found"},
+        409: {"description": "Content hash prefix matches more than one generated content"},
         500: {"description": "Internal server error"}
     }
 )
-async def get_generated_content_by_ticker_and_hash(ticker: str, content_hash: str):
+def get_generated_content_by_ticker_and_hash(ticker: str, content_hash: str):
     """Get generated content by ticker and content hash for URL routing.
 
     This endpoint supports the URL format: /g/{ticker}/{hash}
@@ -167,6 +169,8 @@ async def get_generated_content_by_ticker_and_hash(ticker: str, content_hash: st
 
     except HTTPException:
         raise
+    except AmbiguousHashError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e)) from e
     except Exception as e:
         logger.error("api_get_generated_content_by_ticker_and_hash_failed",
                     ticker=ticker, content_hash=content_hash, error=str(e), exc_info=True)
@@ -185,7 +189,7 @@ async def get_generated_content_by_ticker_and_hash(ticker: str, content_hash: st
         500: {"description": "Internal server error"}
     }
 )
-async def get_generated_content_by_id(content_id: UUID):
+def get_generated_content_by_id(content_id: UUID):
     """Get generated content by its ID.
 
     Args:
@@ -228,10 +232,11 @@ async def get_generated_content_by_id(content_id: UUID):
     status_code=status.HTTP_200_OK,
     responses={
         404: {"description": "Generated content not found"},
+        409: {"description": "Content hash prefix matches more than one generated content"},
         500: {"description": "Internal server error"}
     }
 )
-async def get_generated_content_by_hash_only(content_hash: str):
+def get_generated_content_by_hash_only(content_hash: str):
     """Get generated content by its content hash only.
 
     Args:
@@ -260,6 +265,8 @@ async def get_generated_content_by_hash_only(content_hash: str):
 
     except HTTPException:
         raise
+    except AmbiguousHashError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e)) from e
     except Exception as e:
         logger.error("api_get_generated_content_by_hash_failed",
                     content_hash=content_hash, error=str(e), exc_info=True)
@@ -278,7 +285,7 @@ async def get_generated_content_by_hash_only(content_hash: str):
         500: {"description": "Internal server error"}
     }
 )
-async def get_generated_content_sources(content_id: UUID):
+def get_generated_content_sources(content_id: UUID):
     """Get all sources (documents and other content) for a generated content.
 
     Args:
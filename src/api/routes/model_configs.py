@@ -23,7 +23,7 @@ logger = get_logger(__name__)
         500: {"description": "Internal server error"}
     }
 )
-async def list_all_model_configs():
+def list_all_model_configs():
     """Get all model configurations.
 
     Returns:
@@ -70,7 +70,7 @@ async def list_all_model_configs():
         500: {"description": "Internal server error"}
     }
 )
-async def get_model_config_by_id(config_id: UUID):
+def get_model_config_by_id(config_id: UUID):
     """Get model configuration by its ID.
 
     Args:
@@ -126,7 +126,7 @@ async def get_model_config_by_id(config_id: UUID):
         500: {"description": "Internal server error"}
     }
 )
-async def get_model_config_by_model_name(model_name: str):
+def get_model_config_by_model_name(model_name: str):
     """Get model configuration by model name.
 
     Args:
@@ -11,7 +11,7 @@ logger = get_logger(__name__)
 
 
 @router.get("/{prompt_id}", response_model=PromptResponse)
-async def get_prompt_by_id(prompt_id: UUID):
+def get_prompt_by_id(prompt_id: UUID):
     """Get a specific prompt by ID."""
     try:
         prompt = get_prompt(prompt_id)
@@ -28,7 +28,11 @@ async def get_prompt_by_id(prompt_id: UUID):
             "name": prompt.name,
             "description": prompt.description,
             "role": prompt.role.value,  # Convert enum to string
-            "content": prompt.content
+            "content": prompt.content,
+            "template_version": prompt.template_version,
+            "source_document_ids": prompt.source_document_ids or [],
+            "source_content_ids": prompt.source_content_ids or [],
+            "additional_text": prompt.additional_text
         }
 
         return response
@@ -0,0 +1,101 @@
+"""Full-text search API routes."""
+from datetime import date
+from typing import List, Optional
+
+from fastapi import APIRouter, HTTPException, Query, status
+from src.api.schemas import DocumentSearchResult, GeneratedContentSearchResult
+from src.database.documents import DocumentType
+from src.database.search import search_documents, search_generated_content
+from src.utils.logging import get_logger
+
+# Create logger for this module
+logger = get_logger(__name__)
+
+# Create router
+router = APIRouter()
+
+
+@router.get(
+    "/documents",
+    response_model=List[DocumentSearchResult],
+    status_code=status.HTTP_200_OK,
+    responses={
+        400: {"description": "Bad request - missing or invalid parameters"},
+        500: {"description": "Internal server error"}
+    }
+)
+def search_documents_route(
+    query: str = Query(..., description="Search query, e.g. 'tariff exposure' or '\"supply chain\" -covid'"),
+    ticker: Optional[str] = Query(None, description="Company ticker symbol"),
+    form: Optional[str] = Query(None, description="SEC form type (10-K, 10-Q)"),
+    document_type: Optional[DocumentType] = Query(None, description="Document type"),
+    period_start: Optional[date] = Query(None, description="Earliest period of report"),
+    period_end: Optional[date] = Query(None, description="Latest period of report"),
+    skip: int = Query(0, description="Number of results to skip", ge=0),
+    limit: int = Query(20, description="Maximum number of results to return", ge=1, le=100),
+):
+    """Search inside filing documents.
+
+    Returns the best matching documents first, with highlighted excerpts.
+    """
+    if not query.strip():
+        raise HTTPException(status_code=400, detail="Search query must not be empty")
+    if period_start and period_end and period_start > period_end:
+        raise HTTPException(status_code=400, detail="period_start must not be after period_end")
+
+    logger.info("api_search_documents", query=query, ticker=ticker, form=form,
+                document_type=document_type.value if document_type else None, skip=skip, limit=limit)
+    results = search_documents(query, ticker=ticker, form=form, document_type=document_type,
+                               period_start=period_start, period_end=period_end, limit=limit, offset=skip)
+    return [
+        DocumentSearchResult(
+            id=result.id,
+            title=result.title,
+            document_type=result.document_type.value if result.document_type else None,
+            company_ticker=result.ticker,
+            form=result.form,
+            accession_number=result.accession_number,
+            period_of_report=result.period_of_report,
+            short_hash=result.content_hash[:12] if result.content_hash else None,
+            rank=result.rank,
+            snippet=result.snippet,
+        )
+        for result in results
+    ]
+
+
+@router.get(
+    "/generated-content",
+    response_model=List[GeneratedContentSearchResult],
+    status_code=status.HTTP_200_OK,
+    responses={
+        400: {"description": "Bad request - missing parameters"},
+        500: {"description": "Internal server error"}
+    }
+)
+def search_generated_content_route(
+    query: str = Query(..., description="Search query"),
+    ticker: Optional[str] = Query(None, description="Company ticker symbol"),
+    description: Optional[str] = Query(None, description="Content description, e.g. risk_factors_aggregate_summary"),
+    skip: int = Query(0, description="Number of results to skip", ge=0),
+    limit: int = Query(20, description="Maximum number of results to return", ge=1, le=100),
+):
+    """Search inside generated content, with highlighted excerpts."""
+    if not query.strip():
+        raise HTTPException(status_code=400, detail="Search query must not be empty")
+
+    logger.info("api_search_generated_content", query=query, ticker=ticker, description=description,
+                skip=skip, limit=limit)
+    results = search_generated_content(query, ticker=ticker, description=description, limit=limit, offset=skip)
+    return [
+        GeneratedContentSearchResult(
+            id=result.id,
+            description=result.description,
+            company_ticker=result.ticker,
+            short_hash=result.content_hash[:12] if result.content_hash else None,
+            created_at=result.created_at,
+            rank=result.rank,
+            snippet=result.snippet,
+        )
+        for result in results
+    ]
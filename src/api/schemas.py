@@ -6,6 +6,9 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+# Response header carrying the cursor for the next page of a paginated list
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
 
 class PromptRole(str, Enum):
     """Enumeration of valid prompt roles."""
@@ -159,7 +162,11 @@ class PromptResponse(BaseModel):
     name: str = Field(..., description="Name of the prompt")
     description: Optional[str] = Field(None, description="Description of the prompt")
     role: str = Field(..., description="Role of the prompt (system, assistant, user)")
-    content: str = Field(..., description="Prompt content text")
+    content: Optional[str] = Field(None, description="Prompt content text, null for user prompts stored as a recipe")
+    template_version: Optional[int] = Field(None, description="User prompt template version, for recipe prompts")
+    source_document_ids: List[UUID] = Field(default_factory=list, description="Source document IDs, for recipe prompts")
+    source_content_ids: List[UUID] = Field(default_factory=list, description="Source content IDs, for recipe prompts")
+    additional_text: Optional[str] = Field(None, description="Additional text, for recipe prompts")
 
     class Config:
         json_schema_extra = {
@@ -320,6 +327,7 @@ class GeneratedContentResponse(BaseModel):
     company_id: Optional[UUID] = Field(None, description="ID of the company this content belongs to")
     description: Optional[str] = Field(None, description="Content description")
     document_type: Optional[str] = Field(None, description="Type of document (e.g., MDA, RISK_FACTORS, DESCRIPTION)")
+    kind: Optional[str] = Field(None, description="Summary pipeline stage (single, aggregate, frontpage)")
     source_type: str = Field(..., description="Type of sources used (documents, generated_content, both)")
     created_at: datetime = Field(..., description="Timestamp when the content was created")
     total_duration: Optional[float] = Field(None, description="Total duration of content generation in seconds")
@@ -355,6 +363,47 @@ class GeneratedContentResponse(BaseModel):
         }
 
 
+class DocumentSearchResult(BaseModel):
+    """Response schema for a full-text document search hit."""
+    id: UUID = Field(..., description="Unique identifier for the document")
+    title: str = Field(..., description="Name of the document")
+    document_type: Optional[str] = Field(None, description="Type of the document")
+    company_ticker: str = Field(..., description="Ticker of the company the document belongs to")
+    form: Optional[str] = Field(None, description="SEC form type of the filing")
+    accession_number: Optional[str] = Field(None, description="SEC accession number of the filing")
+    period_of_report: Optional[date] = Field(None, description="Period of report of the filing")
+    short_hash: Optional[str] = Field(None, description="Shortened version of content hash for URLs")
+    rank: float = Field(..., description="Relevance of the document to the query")
+    snippet: Optional[str] = Field(None, description="Matching excerpts, with matches wrapped in <mark> tags")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "id": "123e4567-e89b-12d3-a456-426614174002",
+                "title": "aapl-20230930-risk_factors",
+                "document_type": "risk_factors",
+                "company_ticker": "AAPL",
+                "form": "10-K",
+                "accession_number": "0000320193-23-000106",
+                "period_of_report": "2023-09-30",
+                "short_hash": "a1b2c3d4e5f6",
+                "rank": 0.42,
+                "snippet": "... the imposition of new <mark>tariffs</mark> could adversely affect ..."
+            }
+        }
+
+
+class GeneratedContentSearchResult(BaseModel):
+    """Response schema for a full-text generated content search hit."""
+    id: UUID = Field(..., description="Unique identifier for the generated content")
+    description: Optional[str] = Field(None, description="Content description")
+    company_ticker: Optional[str] = Field(None, description="Ticker of the company the content belongs to")
+    short_hash: Optional[str] = Field(None, description="Shortened hash for URLs (first 12 characters)")
+    created_at: datetime = Field(..., description="Timestamp when the content was created")
+    rank: float = Field(..., description="Relevance of the content to the query")
+    snippet: Optional[str] = Field(None, description="Matching excerpts, with matches wrapped in <mark> tags")
+
+
 class GeneratedContentCreateRequest(BaseModel):
     """Request schema for creating generated content."""
     company_id: Optional[UUID] = Field(None, description="ID of the company")
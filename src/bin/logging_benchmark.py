@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Logging Overhead Benchmark for Symbology
+
+Measures the time a log call costs the calling thread under each logging
+profile. Output is written to /dev/null, so the numbers cover event processing
+and handler dispatch rather than terminal speed.
+
+Usage:
+    python -m src.bin.logging_benchmark
+    python -m src.bin.logging_benchmark --iterations 50000 --json-format
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Callable, Dict, List, Tuple
+
+from src.utils.logging import configure_logging, DEFAULT_SAMPLED_EVENTS, get_logger, LOG_PROFILES, shutdown_logging
+
+# Event the production profile samples, as in a per-row upsert loop
+SAMPLED_EVENT = "created_new_financial_value"
+
+
+def _time_calls(log_call: Callable[[int], None], iterations: int) -> float:
+    """Return the mean microseconds per call of log_call."""
+    start = time.perf_counter()
+    for i in range(iterations):
+        log_call(i)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def run_profile(profile: str, iterations: int, json_format: bool) -> List[Tuple[str, float]]:
+    """Benchmark one logging profile and return (case, microseconds per call) pairs."""
+    configure_logging(log_level="INFO", json_format=json_format, profile=profile)
+    logger = get_logger(f"src.bin.logging_benchmark.{profile}")
+
+    cases: Dict[str, Callable[[int], None]] = {
+        "info event": lambda i: logger.info("benchmark_event", iteration=i, ticker="AAPL", form="10-K"),
+        "info event (sampled in production)": lambda i: logger.info(SAMPLED_EVENT, value_id=i, concept="Revenue"),
+        "debug event (below level)": lambda i: logger.debug("benchmark_debug_event", iteration=i),
+    }
+
+    # Warm up logger caches before timing
+    for log_call in cases.values():
+        log_call(0)
+
+    results = [(case, _time_calls(log_call, iterations)) for case, log_call in cases.items()]
+
+    # The production profile's writes finish on a background thread; wait for them
+    # so they don't overlap the next profile's timings
+    shutdown_logging()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure per-call logging overhead of each logging profile")
+    parser.add_argument("--iterations", type=int, default=20000, help="Log calls per case")
+    parser.add_argument("--json-format", action="store_true", help="Render events as JSON instead of console output")
+    args = parser.parse_args()
+
+    results: Dict[str, List[Tuple[str, float]]] = {}
+    stdout = sys.stdout
+    with open(os.devnull, "w") as devnull:
+        # Handlers bind sys.stdout when logging is configured
+        sys.stdout = devnull
+        try:
+            for profile in LOG_PROFILES:
+                results[profile] = run_profile(profile, args.iterations, args.json_format)
+        finally:
+            sys.stdout = stdout
+
+    print(f"Per-call logging overhead ({args.iterations} calls per case, "
+          f"{'json' if args.json_format else 'console'} rendering)")
+    print(f"{'case':<40} {'development':>14} {'production':>14} {'speedup':>9}")
+    for (case, development), (_, production) in zip(results["development"], results["production"]):
+        print(f"{case:<40} {development:>11.2f} us {production:>11.2f} us {development / production:>8.1f}x")
+    print(f"\nProduction samples {SAMPLED_EVENT} 1 in {DEFAULT_SAMPLED_EVENTS[SAMPLED_EVENT]}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,8 +8,6 @@ from rich.panel import Panel
 from rich.table import Table
 from src.database.base import get_db_session, init_db
 from src.database.companies import Company, get_company_by_ticker
-from src.ingestion.edgar_db.accessors import edgar_login
-from src.ingestion.ingestion_helpers import ingest_company
 from src.utils.config import settings
 from src.utils.logging import get_logger
 
@@ -37,6 +35,9 @@ def ingest_company_cmd(ticker: str, force: bool):
 
     TICKER: Company ticker symbol (e.g., AAPL)
     """
+    from src.ingestion.edgar_db.accessors import edgar_login
+    from src.ingestion.ingestion_helpers import ingest_company
+
     ticker = ticker.upper()
 
     console.print(f"[bold blue]Ingesting company: {ticker}[/bold blue]")
@@ -0,0 +1,81 @@
+"""CLI commands for database schema management."""
+
+import sys
+
+import click
+from rich.console import Console
+from rich.table import Table
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+console = Console()
+
+
+def create_migration_engine():
+    """Create an engine without init_db, which refuses to start on an unmigrated schema."""
+    from sqlalchemy import create_engine
+    from src.utils.config import settings
+    return create_engine(settings.database.url)
+
+
+@click.group()
+def db():
+    """Database schema commands."""
+    pass
+
+
+@db.command('status')
+def status():
+    """Show the schema version and any pending migrations."""
+    from src.database.migrations import get_schema_version, LATEST_SCHEMA_VERSION, pending_migrations
+
+    try:
+        engine = create_migration_engine()
+        with engine.connect() as connection:
+            version = get_schema_version(connection)
+            pending = pending_migrations(connection)
+        engine.dispose()
+
+        console.print(f"[blue]Schema version:[/blue] {version if version is not None else 'not initialized'}")
+        console.print(f"[blue]Latest version:[/blue] {LATEST_SCHEMA_VERSION}")
+
+        if not pending:
+            console.print("[green]✓[/green] Database schema is up to date")
+            return
+
+        table = Table(title="Pending Migrations")
+        table.add_column("Version", style="cyan")
+        table.add_column("Description")
+        for migration in pending:
+            table.add_row(str(migration.version), migration.description)
+        console.print(table)
+
+    except Exception as e:
+        console.print(f"[red]Error reading schema version: {e}[/red]")
+        logger.exception("Failed to read schema version")
+        sys.exit(1)
+
+
+@db.command('migrate')
+@click.option('--dry-run', is_flag=True, help='List pending migrations without applying them')
+def migrate_cmd(dry_run: bool):
+    """Apply pending schema migrations."""
+    from src.database.migrations import migrate
+
+    try:
+        engine = create_migration_engine()
+        migrations = migrate(engine, dry_run=dry_run)
+        engine.dispose()
+
+        if not migrations:
+            console.print("[green]✓[/green] Database schema is up to date")
+            return
+
+        verb = "Would apply" if dry_run else "Applied"
+        for migration in migrations:
+            console.print(f"[green]✓[/green] {verb} migration {migration.version}: {migration.description}")
+
+    except Exception as e:
+        console.print(f"[red]Error migrating database: {e}[/red]")
+        logger.exception("Failed to migrate database")
+        sys.exit(1)
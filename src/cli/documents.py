@@ -3,13 +3,14 @@
 import json
 import logging
 import sys
+from typing import Optional
 
 import click
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 from src.database.base import get_db_session
-from src.database.documents import Document, DocumentType, get_documents_by_filing
+from src.database.documents import DocumentType, get_document_by_content_hash, get_documents_page
 from src.database.filings import Filing
 from src.utils.logging import get_logger
 
@@ -39,8 +40,9 @@ document_type_choices = [doc_type.value for doc_type in DocumentType]
 @click.option('--document-type', type=click.Choice(document_type_choices),
               help='Filter by document type')
 @click.option('--limit', default=20, help='Maximum number of documents to show')
+@click.option('--cursor', help='Cursor of the page to show, from a previous listing')
 @click.option('-o', '--output', type=click.Choice(['table', 'json']), default='table', help='Output format')
-def list_documents(accession_number: str, document_type: str, limit: int, output: str):
+def list_documents(accession_number: str, document_type: str, limit: int, cursor: Optional[str], output: str):
     """List documents for a specific filing."""
 
     # For JSON output, temporarily suppress INFO level logs to avoid interference with JSON parsing
@@ -65,17 +67,14 @@ def list_documents(accession_number: str, document_type: str, limit: int, output
                 console.print(f"[red]Error: Filing with accession number '{accession_number}' not found[/red]")
             sys.exit(1)
 
-        # Get documents
-        documents_list = get_documents_by_filing(filing.id)
-
-        # Filter by document type if specified
-        if document_type:
-            dt = DocumentType(document_type)
-            if dt:
-                documents_list = [doc for doc in documents_list if doc.document_type == dt]
-
-        # Apply limit
-        documents_list = documents_list[:limit]
+        # Get a page of documents, filtered in the database
+        page = get_documents_page(
+            filing_id=filing.id,
+            document_type=DocumentType(document_type) if document_type else None,
+            cursor=cursor,
+            limit=limit
+        )
+        documents_list = page.items
 
         if not documents_list:
             if output == 'json':
@@ -124,6 +123,9 @@ def list_documents(accession_number: str, document_type: str, limit: int, output
 
             console.print(table)
 
+            if page.next_cursor:
+                console.print(f"\n[yellow]More documents available. Use --cursor {page.next_cursor} to see the next page.[/yellow]")
+
     except Exception as e:
         if output == 'json':
             error_data = {"error": str(e)}
@@ -157,16 +159,10 @@ def get_document(content_hash: str, show_content: bool, output: str):
             db_logger.setLevel(logging.WARNING)
 
     try:
-        session = init_session()
-
-        # Try to find document by content hash (exact or prefix match)
-        document = session.query(Document).filter(Document.content_hash == content_hash).first()
+        init_session()
 
-        if not document and len(content_hash) < 64:
-            # Try prefix match for short hashes
-            document = session.query(Document).filter(
-                Document.content_hash.like(f"{content_hash}%")
-            ).first()
+        # Find document by content hash (exact or prefix match)
+        document = get_document_by_content_hash(content_hash)
 
         if not document:
             if output == 'json':
@@ -9,10 +9,8 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 from src.database.base import get_db_session
-from src.database.companies import get_company_by_ticker
+from src.database.companies import get_company, get_company_by_ticker
 from src.database.filings import get_filing_by_accession_number, get_filings_by_company
-from src.ingestion.edgar_db.accessors import edgar_login
-import src.ingestion.ingestion_helpers as ih
 from src.utils.config import settings
 from src.utils.logging import get_logger
 
@@ -38,9 +36,10 @@ def filings():
 @click.argument('ticker')
 @click.argument('form', default='10-K')
 @click.argument('count', default='1')
-@click.option('--force', is_flag=True, help='Force re-ingestion even if data exists')
+@click.option('--force', is_flag=True, help='Extract document sections again instead of reading cached ones')
 @click.option('--include-documents', is_flag=True, default=True, help='Also ingest filing documents')
-def ingest_filings(ticker: str, form: str, count: int, force: bool, include_documents: bool):
+@click.option('--offline', is_flag=True, help='Replay filings from the local EDGAR cache without network access')
+def ingest_filings(ticker: str, form: str, count: int, force: bool, include_documents: bool, offline: bool):
     """
     Ingest SEC filings for a company.
 
@@ -48,17 +47,26 @@ def ingest_filings(ticker: str, form: str, count: int, force: bool, include_docu
     FORM_TYPE: SEC form type (10-K, 10-Q, 8-K)
     YEARS: Comma-separated years (e.g., 2022,2023) or single year
     """
+    from src.ingestion.edgar_db.accessors import edgar_login
+    import src.ingestion.ingestion_helpers as ih
+
     ticker = ticker.upper()
     count = int(count)
 
-    console.print(f"[bold blue]Ingesting {count} of the latest {form} filings for {ticker}[/bold blue]")
+    source = " from the EDGAR cache" if offline else ""
+    console.print(f"[bold blue]Ingesting {count} of the latest {form} filings for {ticker}{source}[/bold blue]")
 
     try:
         init_session()
-        edgar_login(settings.edgar_api.edgar_contact)
+        if not offline:
+            edgar_login(settings.edgar_api.edgar_contact)
 
         # Get company
         db_company = get_company_by_ticker(ticker)
+        if not db_company and offline:
+            # Rebuilding from the cache: restore the company record first
+            _, company_id = ih.ingest_company(ticker, offline=True)
+            db_company = get_company(company_id)
         if not db_company:
             console.print(f"[red]Error: Company {ticker} not found. Ingest company first.[/red]")
             sys.exit(1)
@@ -70,7 +78,9 @@ def ingest_filings(ticker: str, form: str, count: int, force: bool, include_docu
             ticker=ticker,
             form=form,
             count=count,
-            include_documents=include_documents
+            include_documents=include_documents,
+            offline=offline,
+            refresh_sections=force
         )
 
         # Display results
@@ -88,6 +98,67 @@ def ingest_filings(ticker: str, form: str, count: int, force: bool, include_docu
         sys.exit(1)
 
 
+@filings.command('ingest-universe')
+@click.argument('universe_file', type=click.Path(exists=True, dir_okay=False))
+@click.option('--workers', default=4, show_default=True, help='Maximum number of tickers ingested concurrently')
+@click.option('--executor', 'executor_type', type=click.Choice(['thread', 'process']), default='thread',
+              show_default=True, help='Run workers as threads or processes')
+@click.option('--include-documents/--skip-documents', default=True, help='Also ingest filing documents')
+@click.option('-o', '--output', type=click.Choice(['table', 'json']), default='table', help='Output format')
+def ingest_universe(universe_file: str, workers: int, executor_type: str, include_documents: bool, output: str):
+    """
+    Ingest filings for many tickers in parallel.
+
+    UNIVERSE_FILE: File listing "TICKER FORM COUNT" entries (text or JSON)
+    """
+    from src.ingestion.edgar_db.accessors import edgar_login
+    from src.ingestion.engine import load_universe, run_ingestion
+
+    try:
+        init_session()
+        edgar_login(settings.edgar_api.edgar_contact)
+
+        entries = load_universe(universe_file)
+        if not entries:
+            console.print(f"[yellow]No entries found in {universe_file}[/yellow]")
+            return
+
+        if output != 'json':
+            console.print(f"[bold blue]Ingesting {len(entries)} universe entries with {workers} {executor_type} workers[/bold blue]")
+
+        stats = run_ingestion(
+            entries,
+            max_workers=workers,
+            executor_type=executor_type,
+            include_documents=include_documents,
+        )
+
+        if output == 'json':
+            click.echo(json.dumps(stats.to_dict(), indent=2))
+        else:
+            table = Table(title="Ingestion Summary")
+            table.add_column("Metric", style="cyan")
+            table.add_column("Value", style="white")
+            table.add_row("Tickers", str(stats.tickers))
+            table.add_row("Filings", str(stats.filings))
+            table.add_row("Documents", str(stats.documents))
+            table.add_row("Elapsed", f"{stats.elapsed:0.1f}s")
+            table.add_row("Filings/s", f"{stats.filings_per_second:0.3f}")
+            table.add_row("Documents/s", f"{stats.documents_per_second:0.3f}")
+            console.print(table)
+
+            if stats.failures:
+                console.print(f"[red]Failed tickers: {', '.join(stats.failures)}[/red]")
+
+        if stats.failures:
+            sys.exit(1)
+
+    except Exception as e:
+        console.print(f"[red]Error during universe ingestion: {e}[/red]")
+        logger.exception("Universe ingestion failed")
+        sys.exit(1)
+
+
 @filings.command('list')
 @click.argument('ticker')
 @click.option('--form', help='Filter by form type (10-K, 10-Q, 8-K)')
@@ -119,9 +190,10 @@ def list_filings(ticker: str, form: str, output: str):
                 console.print(f"[red]Error: Company {ticker} not found[/red]")
             sys.exit(1)
 
-        # Get filings
+        # Get filings, filtered by form type in the database
         filings_list = get_filings_by_company(
             company_obj.id,
+            form=form,
         )
 
         if not filings_list:
@@ -131,11 +203,7 @@ def list_filings(ticker: str, form: str, output: str):
                 console.print(f"[yellow]No filings found for {ticker}[/yellow]")
             return
 
-        # Filter by form type if specified
-        filtered_filings = []
-        for filing in filings_list:
-            if form is None or filing.form == form:
-                filtered_filings.append(filing)
+        filtered_filings = filings_list
 
         if output == 'json':
             # Prepare data for JSON output
@@ -1,5 +1,6 @@
 """CLI commands for generated content management."""
 
+import hashlib
 import json
 import logging
 import sys
@@ -14,9 +15,7 @@ from src.database.companies import get_company_by_ticker
 from src.database.documents import Document, get_document_by_content_hash
 import src.database.generated_content as db
 from src.database.model_configs import get_model_config_by_content_hash
-from src.database.prompts import create_prompt, get_prompt_by_content_hash, PromptRole
-from src.llm.client import get_generate_response, remove_thinking_tags
-from src.llm.prompts import format_user_prompt_content
+from src.database.prompts import get_prompt_by_content_hash
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -45,13 +44,19 @@ def generated_content():
 @click.option('--additional-content', help='Additional text content to include (or "-" to read from stdin)')
 @click.option('--company', help='Company ticker (optional)')
 @click.option('--description', help='Optional description of the generated content')
+@click.option('--force', is_flag=True, help='Call the model even if content exists for the same inputs')
+@click.option('--stream', is_flag=True, help='Print the response as it is generated (table output only)')
 @click.option('-o', '--output', type=click.Choice(['table', 'json']), default='table', help='Output format')
 def create_generated_content(prompt: str, model_config: str, source_documents: Tuple[str],
                            source_content: Tuple[str], additional_content: Optional[str],
-                           company: Optional[str], description: Optional[str], output: str):
+                           company: Optional[str], description: Optional[str], force: bool, stream: bool,
+                           output: str):
     """
     Generate AI content from prompt, model config, and source materials.
     """
+    from src.llm.client import get_generate_response, stream_generate_response
+    from src.llm.prompts import format_user_prompt_content, save_user_prompt
+
     # For JSON output, temporarily suppress INFO level logs to avoid interference with JSON parsing
     if output == 'json':
         # Get all loggers and set their level to WARNING temporarily
@@ -171,17 +176,65 @@ def create_generated_content(prompt: str, model_config: str, source_documents: T
 
         if output != 'json':
             console.print(f"[blue]User prompt assembled: {len(user_prompt):,} characters[/blue]")
-        # todo: save the user prompt to the database
+
+        input_fingerprint = db.compute_input_fingerprint(
+            model_config_obj.content_hash,
+            prompt_obj.content_hash,
+            hashlib.sha256(user_prompt.encode('utf-8')).hexdigest(),
+            [doc.content_hash for doc in source_docs],
+            [content.content_hash for content in source_contents],
+        )
+        existing_content = None if force else db.get_generated_content_by_input_fingerprint(input_fingerprint)
+        if existing_content:
+            # Identical inputs were already generated; skip the model call
+            if output == 'json':
+                click.echo(json.dumps({
+                    "id": str(existing_content.id),
+                    "content_hash": existing_content.content_hash,
+                    "short_hash": existing_content.get_short_hash(),
+                    "company": company.upper() if company else None,
+                    "description": existing_content.description,
+                    "source_type": existing_content.source_type.value,
+                    "created_at": existing_content.created_at.isoformat() if existing_content.created_at else None,
+                    "total_duration": existing_content.total_duration,
+                    "warning": existing_content.warning,
+                    "model_config_hash": model_config_obj.get_short_hash(),
+                    "system_prompt_hash": prompt_obj.get_short_hash(),
+                    "input_fingerprint": input_fingerprint,
+                    "skipped": True
+                }, indent=2))
+            else:
+                console.print(f"[yellow]Content already generated from these inputs with hash "
+                              f"{existing_content.get_short_hash()} (use --force to regenerate)[/yellow]")
+            return
 
         # Call the LLM with system prompt + user prompt
         if output != 'json':
             console.print(f"[blue]Generating content using model {model_config_obj.model}...[/blue]")
+        # Streaming writes partial output to the console, so it only applies to table output
+        stream = stream and output != 'json'
         try:
-            response, warning = get_generate_response(
-                model_config=model_config_obj,
-                system_prompt=prompt_obj.content,
-                user_prompt=user_prompt
-            )
+            if stream:
+                generate_stream = stream_generate_response(
+                    model_config=model_config_obj,
+                    system_prompt=prompt_obj.content,
+                    user_prompt=user_prompt
+                )
+                console.print()
+                last_chunk = None
+                for last_chunk in generate_stream:
+                    console.out(last_chunk.text, end="", highlight=False)
+                console.print()
+                response, warning = generate_stream.response, generate_stream.warning
+                if generate_stream.time_to_first_token is not None:
+                    console.print(f"[blue]Time to first token: {generate_stream.time_to_first_token:.2f}s, "
+                                  f"{last_chunk.tokens_per_second or 0:.2f} tokens/s[/blue]")
+            else:
+                response, warning = get_generate_response(
+                    model_config=model_config_obj,
+                    system_prompt=prompt_obj.content,
+                    user_prompt=user_prompt
+                )
 
             if output != 'json':
                 console.print("[green]✓ Content generated successfully[/green]")
@@ -190,12 +243,7 @@ def create_generated_content(prompt: str, model_config: str, source_documents: T
             # Save user prompt to database
             if output != 'json':
                 console.print("[blue]Saving user prompt to database...[/blue]")
-            user_prompt_obj, was_created = create_prompt({
-                'name': f"User prompt for {prompt_obj.name}",
-                'description': f"Generated user prompt combining {len(source_docs)} documents, {len(source_contents)} content items" + (", and additional text" if additional_text else ""),
-                'role': PromptRole.USER,
-                'content': user_prompt
-            })
+            user_prompt_obj, was_created = save_user_prompt(prompt_obj, source_docs, source_contents, additional_text)
 
             if output != 'json':
                 if was_created:
@@ -230,6 +278,7 @@ def create_generated_content(prompt: str, model_config: str, source_documents: T
                 'source_type': source_type,
                 'total_duration': response.total_duration / 1e9 if hasattr(response, 'total_duration') else None,
                 'warning': warning,
+                'input_fingerprint': input_fingerprint,
                 'model_config_id': model_config_obj.id,
                 'system_prompt_id': prompt_obj.id,
                 'user_prompt_id': user_prompt_obj.id
@@ -275,9 +324,11 @@ def create_generated_content(prompt: str, model_config: str, source_documents: T
                 click.echo(json.dumps(content_data, indent=2))
             else:
                 console.print(f"[green]✓ Generated content saved with hash {generated_content_obj.get_short_hash()}[/green]")
-                console.print("\n[bold]Generated Content:[/bold]")
-                console.print(Panel(response.response[:1000] + ("..." if len(response.response) > 1000 else ""),
-                                   title="Generated Content Preview"))
+                # Streamed content was already printed in full
+                if not stream:
+                    console.print("\n[bold]Generated Content:[/bold]")
+                    console.print(Panel(response.response[:1000] + ("..." if len(response.response) > 1000 else ""),
+                                       title="Generated Content Preview"))
 
         except Exception as e:
             if output == 'json':
@@ -317,12 +368,157 @@ def create_generated_content(prompt: str, model_config: str, source_documents: T
                 db_logger.setLevel(original_level)
 
 
+@generated_content.command('create-batch')
+@click.argument('jobs_file', type=click.Path(exists=True, dir_okay=False))
+@click.option('--max-concurrency', type=int, help='Maximum number of concurrent generation requests')
+@click.option('--per-model-concurrency', type=int, help='Maximum number of concurrent requests per model')
+@click.option('--force', is_flag=True, help='Regenerate even if content exists for the same inputs')
+@click.option('-o', '--output', type=click.Choice(['table', 'json']), default='table', help='Output format')
+def create_generated_content_batch(jobs_file: str, max_concurrency: Optional[int],
+                                   per_model_concurrency: Optional[int], force: bool, output: str):
+    """
+    Generate content for a batch of jobs concurrently.
+
+    JOBS_FILE: JSON list of jobs with the same fields as 'create' (prompt, model_config,
+    source_documents, source_content, additional_content, company, description)
+    """
+    from src.llm.jobs import GenerationJob, run_generation_jobs
+
+    if output == 'json':
+        original_levels = {}
+        logger_names = [
+            'src.database.generated_content',
+            'src.database.prompts',
+            'src.database.model_configs',
+            'src.database.documents',
+            'src.database.companies',
+            'src.llm.client',
+            'src.llm.jobs',
+            'httpcore',
+            'httpx',
+            'ollama',
+            'transformers',
+            'huggingface_hub',
+            'urllib3.connectionpool'
+        ]
+        for logger_name in logger_names:
+            db_logger = logging.getLogger(logger_name)
+            original_levels[logger_name] = db_logger.level
+            db_logger.setLevel(logging.ERROR)
+
+    try:
+        init_session()
+
+        with open(jobs_file) as f:
+            job_specs = json.load(f)
+
+        jobs: List[GenerationJob] = []
+        for index, spec in enumerate(job_specs):
+            prompt_obj = get_prompt_by_content_hash(spec['prompt'])
+            if not prompt_obj:
+                raise ValueError(f"Job {index}: prompt with hash {spec['prompt']} not found")
+
+            model_config_obj = get_model_config_by_content_hash(spec['model_config'])
+            if not model_config_obj:
+                raise ValueError(f"Job {index}: model config with hash {spec['model_config']} not found")
+
+            source_docs: List[Document] = []
+            for doc_hash in dict.fromkeys(spec.get('source_documents', [])):
+                doc = get_document_by_content_hash(doc_hash)
+                if not doc:
+                    raise ValueError(f"Job {index}: source document with hash {doc_hash} not found")
+                source_docs.append(doc)
+
+            source_contents: List[db.GeneratedContent] = []
+            for content_hash in dict.fromkeys(spec.get('source_content', [])):
+                content_obj = db.get_generated_content_by_hash(content_hash)
+                if not content_obj:
+                    raise ValueError(f"Job {index}: source content with hash {content_hash} not found")
+                source_contents.append(content_obj)
+
+            additional_text = spec.get('additional_content')
+            if not (source_docs or source_contents or additional_text):
+                raise ValueError(f"Job {index}: at least one source must be provided")
+
+            company_obj = get_company_by_ticker(spec['company'].upper()) if spec.get('company') else None
+
+            jobs.append(GenerationJob(
+                system_prompt=prompt_obj,
+                model_config=model_config_obj,
+                source_documents=source_docs,
+                source_content=source_contents,
+                additional_text=additional_text,
+                company_id=company_obj.id if company_obj else None,
+                description=spec.get('description'),
+            ))
+
+        if output != 'json':
+            console.print(f"[blue]Running {len(jobs)} generation jobs...[/blue]")
+
+        results = run_generation_jobs(jobs, max_concurrency=max_concurrency,
+                                      per_model_concurrency=per_model_concurrency, force=force)
+
+        if output == 'json':
+            click.echo(json.dumps([
+                {
+                    "short_hash": result.generated_content.get_short_hash() if result.generated_content else None,
+                    "content_hash": result.generated_content.content_hash if result.generated_content else None,
+                    "description": result.job.description,
+                    "was_created": result.was_created,
+                    "skipped": result.skipped,
+                    "warning": result.warning,
+                    "error": result.error,
+                }
+                for result in results
+            ], indent=2))
+        else:
+            table = Table(title="Generation Jobs")
+            table.add_column("Job", style="cyan")
+            table.add_column("Model", style="white")
+            table.add_column("Description", style="white")
+            table.add_column("Hash", style="green")
+            table.add_column("Status", style="white")
+            for index, result in enumerate(results):
+                if result.skipped:
+                    status = "[yellow]skipped[/yellow]"
+                elif result.ok:
+                    status = "[green]created[/green]" if result.was_created else "[yellow]existing[/yellow]"
+                else:
+                    status = f"[red]{result.error}[/red]"
+                table.add_row(
+                    str(index),
+                    result.job.model_config.model,
+                    result.job.description or "",
+                    result.generated_content.get_short_hash() if result.generated_content else "",
+                    status,
+                )
+            console.print(table)
+
+        if any(not result.ok for result in results):
+            sys.exit(1)
+
+    except Exception as e:
+        if output == 'json':
+            click.echo(json.dumps({"error": str(e)}))
+        else:
+            console.print(f"[red]Error running generation jobs: {e}[/red]")
+        logger.exception("Failed to run generation jobs")
+        sys.exit(1)
+    finally:
+        # Restore original log levels
+        if output == 'json':
+            for logger_name, original_level in original_levels.items():
+                db_logger = logging.getLogger(logger_name)
+                db_logger.setLevel(original_level)
+
+
 @generated_content.command('get')
 @click.argument('hash')
 @click.option('--show-full', is_flag=True, help='Show full content instead of preview')
 @click.option('-o', '--output', type=click.Choice(['table', 'json']), default='table', help='Output format')
 def get_generated_content(hash: str, show_full: bool, output: str):
     """Get and display generated content by hash."""
+    from src.llm.client import remove_thinking_tags
 
     # For JSON output, temporarily suppress INFO level logs to avoid interference with JSON parsing
     if output == 'json':
@@ -407,8 +603,9 @@ def get_generated_content(hash: str, show_full: bool, output: str):
 @click.option('--company', help='Filter by company ticker')
 @click.option('--description', help='Filter by description (partial match)')
 @click.option('--limit', default=10, help='Maximum number of items to show')
+@click.option('--cursor', help='Cursor of the page to show, from a previous listing')
 @click.option('-o', '--output', type=click.Choice(['table', 'json']), default='table', help='Output format')
-def list_generated_content(company: str, description: str, limit: int, output: str):
+def list_generated_content(company: str, description: str, limit: int, cursor: Optional[str], output: str):
     """List generated content in the database."""
 
     # For JSON output, temporarily suppress INFO level logs to avoid interference with JSON parsing
@@ -421,21 +618,10 @@ def list_generated_content(company: str, description: str, limit: int, output: s
             db_logger.setLevel(logging.WARNING)
 
     try:
-        session = init_session()
-
-        query = session.query(db.GeneratedContent)
-
-        # Apply filters
-        if company:
-            company_upper = company.upper()
-            query = query.join(db.GeneratedContent.company).filter(
-                db.GeneratedContent.company.has(ticker=company_upper)
-            )
-
-        if description:
-            query = query.filter(db.GeneratedContent.description.ilike(f"%{description}%"))
+        init_session()
 
-        content_list = query.limit(limit).all()
+        page = db.get_generated_content_page(ticker=company, description=description, cursor=cursor, limit=limit)
+        content_list = page.items
 
         if not content_list:
             if output == 'json':
@@ -486,8 +672,8 @@ def list_generated_content(company: str, description: str, limit: int, output: s
 
             console.print(table)
 
-            if len(content_list) == limit:
-                console.print(f"\n[yellow]Showing first {limit} results. Use --limit to see more.[/yellow]")
+            if page.next_cursor:
+                console.print(f"\n[yellow]More results available. Use --cursor {page.next_cursor} to see the next page.[/yellow]")
 
     except Exception as e:
         if output == 'json':
@@ -12,44 +12,76 @@ Usage:
     symbology [COMMAND] [OPTIONS]
 
 Examples:
+    symbology db migrate
     symbology companies ingest AAPL
     symbology filings ingest AAPL 10-K 2022,2023
     symbology prompts create risk-analysis
     symbology model-configs create qwen3:14b --temperature 0.7 --num-ctx 9000
     symbology generated-content create <prompt-hash> <model-config-hash> <source-hashes...>
+    symbology pipeline run AAPL 10-K 5 risk_factors management_discussion
     symbology prompts get <hash>
     symbology generated-content get <hash>
     symbology ratings create <content-hash> 5 "Excellent analysis"
 """
 
 
-import click
+from importlib import import_module
+from typing import Dict, List, Optional
 
-# Import command modules
-from src.cli.companies import companies
-from src.cli.documents import documents
-from src.cli.filings import filings
-from src.cli.financials import financials
-from src.cli.generated_content import generated_content
-from src.cli.model_configs import model_configs
-from src.cli.prompts import prompts
-from src.cli.ratings import ratings
-
-# Add project root to path for imports
-# sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+import click
 from src.utils.config import settings
 from src.utils.logging import configure_logging, get_logger
+from src.utils.metrics import export_metrics
 
 # Configure logging
 configure_logging(
     log_level=settings.logging.level,
-    json_format=settings.logging.json_format
+    json_format=settings.logging.json_format,
+    profile=settings.logging.profile,
 )
 
 logger = get_logger(__name__)
 
 
-@click.group()
+class LazyGroup(click.Group):
+    """Click group that imports each command's module only when the command is looked up.
+
+    Command modules pull in the ORM, and some pull in pandas, edgar or the LLM
+    client, so importing all of them up front made every invocation pay for all
+    of them.
+    """
+
+    def __init__(self, *args, lazy_commands: Optional[Dict[str, str]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Command name -> "module:attribute"
+        self.lazy_commands = lazy_commands or {}
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name in self.lazy_commands and cmd_name not in self.commands:
+            module_name, attribute = self.lazy_commands[cmd_name].split(":")
+            self.add_command(getattr(import_module(module_name), attribute), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+
+# Command groups, imported when invoked
+COMMANDS = {
+    "companies": "src.cli.companies:companies",
+    "db": "src.cli.db:db",
+    "documents": "src.cli.documents:documents",
+    "filings": "src.cli.filings:filings",
+    "financials": "src.cli.financials:financials",
+    "generated-content": "src.cli.generated_content:generated_content",
+    "model-configs": "src.cli.model_configs:model_configs",
+    "pipeline": "src.cli.pipeline:pipeline",
+    "prompts": "src.cli.prompts:prompts",
+    "ratings": "src.cli.ratings:ratings",
+}
+
+
+@click.group(cls=LazyGroup, lazy_commands=COMMANDS)
 @click.option('--verbose', '-v', is_flag=True, help='Enable verbose logging')
 @click.pass_context
 def cli(ctx, verbose):
@@ -59,17 +91,12 @@ def cli(ctx, verbose):
     if verbose:
         configure_logging(log_level="DEBUG", json_format=False)
 
+    if settings.database.record_queries:
+        from src.database.base import record_queries
+        ctx.with_resource(record_queries(f"cli {ctx.invoked_subcommand}"))
 
-# Add command groups
-cli.add_command(companies)
-cli.add_command(documents)
-cli.add_command(filings)
-cli.add_command(financials)
-cli.add_command(generated_content)
-cli.add_command(model_configs)
-cli.add_command(prompts)
-cli.add_command(ratings)
-
+    # Commands exit before metrics could be scraped, so export them when the command finishes
+    ctx.call_on_close(lambda: export_metrics(f"symbology_cli_{ctx.invoked_subcommand}"))
 
 
 if __name__ == '__main__':
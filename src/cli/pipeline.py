@@ -0,0 +1,157 @@
+"""CLI commands for running the summary pipeline."""
+
+import json
+import logging
+import sys
+from typing import Optional, Tuple
+
+import click
+from rich.console import Console
+from rich.table import Table
+from src.database.base import get_db_session
+from src.database.documents import DocumentType
+from src.utils.config import settings
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+console = Console()
+
+
+def init_session():
+    """Initialize database session."""
+    from src.database.base import init_db
+    from src.utils.config import settings
+    init_db(settings.database.url)
+    return get_db_session()
+
+
+@click.group()
+def pipeline():
+    """Summary pipeline commands."""
+    pass
+
+
+@pipeline.command('run')
+@click.argument('ticker')
+@click.argument('form')
+@click.argument('count', type=int)
+@click.argument('document_types', nargs=-1, required=True,
+                type=click.Choice([d.value for d in DocumentType]))
+@click.option('--skip-ingest', is_flag=True, help='Summarize filings already in the database without contacting EDGAR')
+@click.option('--force', is_flag=True, help='Regenerate summaries even if they exist for the same inputs')
+@click.option('--max-concurrency', type=int, help='Maximum number of concurrent generation requests')
+@click.option('--per-model-concurrency', type=int, help='Maximum number of concurrent requests per model')
+@click.option('-o', '--output', type=click.Choice(['table', 'json']), default='table', help='Output format')
+def run_pipeline_cmd(ticker: str, form: str, count: int, document_types: Tuple[str], skip_ingest: bool, force: bool,
+                     max_concurrency: Optional[int], per_model_concurrency: Optional[int], output: str):
+    """
+    Ingest filings and generate single, aggregate and frontpage summaries in one process.
+
+    TICKER: Company ticker symbol (e.g., AAPL)
+    FORM: SEC form type (10-K, 10-Q)
+    COUNT: Number of latest filings to summarize
+    DOCUMENT_TYPES: One or more document types (e.g., risk_factors management_discussion)
+    """
+    from src.ingestion.edgar_db.accessors import edgar_login
+    from src.llm.pipeline import run_pipeline
+
+    if output == 'json':
+        original_levels = {}
+        logger_names = [
+            'src.database.generated_content',
+            'src.database.prompts',
+            'src.database.model_configs',
+            'src.database.documents',
+            'src.database.filings',
+            'src.database.companies',
+            'src.ingestion.ingestion_helpers',
+            'src.llm.client',
+            'src.llm.jobs',
+            'src.llm.pipeline',
+            'httpcore',
+            'httpx',
+            'ollama',
+            'transformers',
+            'huggingface_hub',
+            'urllib3.connectionpool'
+        ]
+        for logger_name in logger_names:
+            db_logger = logging.getLogger(logger_name)
+            original_levels[logger_name] = db_logger.level
+            db_logger.setLevel(logging.ERROR)
+
+    try:
+        init_session()
+        if not skip_ingest:
+            edgar_login(settings.edgar_api.edgar_contact)
+
+        if output != 'json':
+            console.print(f"[bold blue]Running summary pipeline for {ticker.upper()} {form} x{count}: "
+                          f"{', '.join(document_types)}[/bold blue]")
+
+        results = run_pipeline(
+            ticker,
+            form,
+            count,
+            [DocumentType(d) for d in document_types],
+            ingest=not skip_ingest,
+            max_concurrency=max_concurrency,
+            per_model_concurrency=per_model_concurrency,
+            force=force,
+        )
+
+        def _hash(result):
+            return result.generated_content.get_short_hash() if result and result.generated_content else None
+
+        if output == 'json':
+            click.echo(json.dumps([
+                {
+                    "document_type": r.document_type.value,
+                    "single_summaries": [_hash(s) for s in r.single_summaries],
+                    "aggregate_summary": _hash(r.aggregate_summary),
+                    "frontpage_summary": _hash(r.frontpage_summary),
+                    "generated": sum(1 for g in r.results if g.was_created),
+                    "skipped": sum(1 for g in r.results if g.skipped),
+                    "errors": [g.error for g in r.results if g.error],
+                }
+                for r in results
+            ], indent=2))
+        else:
+            table = Table(title="Summary Pipeline")
+            table.add_column("Document Type", style="cyan")
+            table.add_column("Single", style="white")
+            table.add_column("Aggregate", style="green")
+            table.add_column("Frontpage", style="green")
+            table.add_column("Generated", style="white")
+            table.add_column("Skipped", style="yellow")
+            for r in results:
+                table.add_row(
+                    r.document_type.value,
+                    str(len(r.single_summaries)),
+                    _hash(r.aggregate_summary) or "",
+                    _hash(r.frontpage_summary) or "",
+                    str(sum(1 for g in r.results if g.was_created)),
+                    str(sum(1 for g in r.results if g.skipped)),
+                )
+            console.print(table)
+            for r in results:
+                for g in r.results:
+                    if g.error:
+                        console.print(f"[red]{r.document_type.value}: {g.error}[/red]")
+
+        if not all(r.ok for r in results):
+            sys.exit(1)
+
+    except Exception as e:
+        if output == 'json':
+            click.echo(json.dumps({"error": str(e)}))
+        else:
+            console.print(f"[red]Error running pipeline: {e}[/red]")
+        logger.exception("Pipeline failed")
+        sys.exit(1)
+    finally:
+        # Restore original log levels
+        if output == 'json':
+            for logger_name, original_level in original_levels.items():
+                db_logger = logging.getLogger(logger_name)
+                db_logger.setLevel(original_level)
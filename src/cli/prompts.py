@@ -2,7 +2,6 @@
 
 import json
 import logging
-from pathlib import Path
 import sys
 from typing import Optional
 
@@ -44,6 +43,8 @@ def create_prompt(name: str, description: Optional[str], role: str, examples_dir
 
     Automatically appends examples from prompts/{name}/examples/ if they exist.
     """
+    from src.llm.prompts import load_prompt_file
+
     # For JSON output, temporarily suppress INFO level logs to avoid interference with JSON parsing
     if output == 'json':
         # Get all loggers and set their level to WARNING temporarily
@@ -54,30 +55,16 @@ def create_prompt(name: str, description: Optional[str], role: str, examples_dir
             db_logger.setLevel(logging.WARNING)
 
     try:
-        prompts_dir = Path("prompts")
-        prompt_dir = prompts_dir / name
-        prompt_file = prompt_dir / "prompt.md"
-        examples_dir_path = prompt_dir / "examples"
-
-        if not prompt_file.exists():
+        try:
+            content = load_prompt_file(name)
+        except FileNotFoundError as e:
             if output == 'json':
-                error_data = {"error": f"{prompt_file} does not exist"}
+                error_data = {"error": str(e)}
                 click.echo(json.dumps(error_data))
             else:
-                console.print(f"[red]Error: {prompt_file} does not exist[/red]")
+                console.print(f"[red]Error: {e}[/red]")
             sys.exit(1)
 
-        # Read main prompt content
-        content = prompt_file.read_text().strip()
-
-        # Append examples if they exist
-        if examples_dir_path.exists() and examples_dir_path.is_dir():
-            example_files = sorted(examples_dir_path.glob("*.md"))
-            if example_files:
-                for example_file in example_files:
-                    content += "\n\n"
-                    content += example_file.read_text().strip()
-
         # Create prompt in database
         init_session()
         prompt_data = {
@@ -132,6 +119,7 @@ def create_prompt(name: str, description: Optional[str], role: str, examples_dir
 @click.option('-o', '--output', type=click.Choice(['table', 'json']), default='table', help='Output format')
 def get_prompt(hash_or_name: str, output: str):
     """Get and display a prompt by hash or name."""
+    from src.llm.prompts import render_user_prompt
 
     # For JSON output, temporarily suppress INFO level logs to avoid interference with JSON parsing
     if output == 'json':
@@ -159,6 +147,9 @@ def get_prompt(hash_or_name: str, output: str):
                 console.print(f"[red]Error: Prompt '{hash_or_name}' not found[/red]")
             sys.exit(1)
 
+        # User prompts stored as recipes are rendered from their sources
+        content = render_user_prompt(prompt_obj)
+
         if output == 'json':
             # Prepare data for JSON output
             prompt_data = {
@@ -168,8 +159,8 @@ def get_prompt(hash_or_name: str, output: str):
                 "role": prompt_obj.role.value,
                 "content_hash": prompt_obj.content_hash,
                 "short_hash": prompt_obj.get_short_hash(),
-                "content": prompt_obj.content,
-                "content_size": len(prompt_obj.content) if prompt_obj.content else 0
+                "content": content,
+                "content_size": len(content) if content else 0
             }
             click.echo(json.dumps(prompt_data, indent=2))
         else:
@@ -185,7 +176,7 @@ def get_prompt(hash_or_name: str, output: str):
 
             console.print(Panel(table, title=panel_title))
             console.print("\n[bold]Content:[/bold]")
-            console.print(Panel(prompt_obj.content, title="Prompt Content"))
+            console.print(Panel(content or "", title="Prompt Content"))
 
     except Exception as e:
         if output == 'json':
@@ -278,3 +269,46 @@ def list_prompts(limit: int, output: str):
             for logger_name, original_level in original_levels.items():
                 db_logger = logging.getLogger(logger_name)
                 db_logger.setLevel(original_level)
+
+
+@prompts.command('compact')
+@click.option('--dry-run', is_flag=True, help='Count the prompts that would be compacted without changing them')
+@click.option('-o', '--output', type=click.Choice(['table', 'json']), default='table', help='Output format')
+def compact_prompts(dry_run: bool, output: str):
+    """Store materialized user prompts as recipes of their sources."""
+    from src.llm.prompts import compact_user_prompts
+
+    # For JSON output, temporarily suppress INFO level logs to avoid interference with JSON parsing
+    if output == 'json':
+        original_levels = {}
+        for logger_name in ['src.database.prompts', 'src.llm.prompts']:
+            db_logger = logging.getLogger(logger_name)
+            original_levels[logger_name] = db_logger.level
+            db_logger.setLevel(logging.WARNING)
+
+    try:
+        init_session()
+        counts = compact_user_prompts(dry_run=dry_run)
+
+        if output == 'json':
+            click.echo(json.dumps({**counts, "dry_run": dry_run}, indent=2))
+        else:
+            verb = "Would compact" if dry_run else "Compacted"
+            console.print(f"[green]{verb} {counts['compacted']} user prompts[/green]")
+            if counts['skipped']:
+                console.print(f"[yellow]Skipped {counts['skipped']} prompts that can't be rendered from their sources[/yellow]")
+
+    except Exception as e:
+        if output == 'json':
+            error_data = {"error": str(e)}
+            click.echo(json.dumps(error_data))
+        else:
+            console.print(f"[red]Error compacting prompts: {e}[/red]")
+        logger.exception("Failed to compact prompts")
+        sys.exit(1)
+    finally:
+        # Restore original log levels
+        if output == 'json':
+            for logger_name, original_level in original_levels.items():
+                db_logger = logging.getLogger(logger_name)
+                db_logger.setLevel(original_level)
@@ -56,6 +56,7 @@ from src.database.financial_values import (
     update_financial_value,
 )
 from src.database.generated_content import (
+    ContentKind,
     ContentSourceType,
     create_generated_content,
     delete_generated_content,
@@ -1,8 +1,18 @@
-from typing import Generator, Tuple
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+import re
+import threading
+import time
+from typing import Any, Dict, Generator, Iterator, List, Optional, Tuple, Union
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.orm import declarative_base, scoped_session, Session, sessionmaker
+from src.utils.config import settings
 from src.utils.logging import get_logger
+from src.utils.metrics import DB_POOL_CONNECTIONS, DB_QUERIES, DB_QUERY_SECONDS, REGISTRY
 
 # Initialize structlog
 logger = get_logger(__name__)
@@ -15,29 +25,219 @@ engine = None
 db_session = None
 SessionLocal = None
 
-def init_db(database_url: str) -> Tuple[object, object]:
+# Set while handling an API request, so each request gets its own session no matter
+# which threadpool worker runs it. Outside a request sessions are thread-local.
+_session_scope: ContextVar[Optional[object]] = ContextVar("db_session_scope", default=None)
+
+
+def _session_scope_key() -> object:
+    scope = _session_scope.get()
+    return scope if scope is not None else threading.get_ident()
+
+
+def _statement_type(statement: str) -> str:
+    # Label queries by their leading keyword; the full statement would be unbounded cardinality
+    keyword = statement.lstrip().split(None, 1)[0].upper() if statement and statement.strip() else ""
+    return keyword if keyword in ("SELECT", "INSERT", "UPDATE", "DELETE", "WITH") else "OTHER"
+
+
+# Bound parameter lists, e.g. an expanded IN (...), vary in length between otherwise identical statements
+_PARAMETER_LIST_PATTERN = re.compile(r"\(\s*(?:%\(\w+\)s\s*,\s*)+%\(\w+\)s\s*\)")
+
+
+def statement_shape(statement: str) -> str:
+    """Normalize a SQL statement so executions that differ only in bound values compare equal."""
+    return _PARAMETER_LIST_PATTERN.sub("(...)", " ".join(statement.split()))
+
+
+def parameter_shape(parameters: Any) -> Any:
+    """Describe bound parameters by name and type, without their (possibly large or sensitive) values."""
+    if isinstance(parameters, dict):
+        return {name: type(value).__name__ for name, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)) and parameters and isinstance(parameters[0], (dict, list, tuple)):
+        # executemany: one parameter set per row
+        return {"rows": len(parameters), "row": parameter_shape(parameters[0])}
+    if isinstance(parameters, (list, tuple)):
+        return [type(value).__name__ for value in parameters]
+    return type(parameters).__name__
+
+
+@dataclass
+class QueryRecord:
+    """A statement executed while recording, with its bound parameter shape and duration in seconds."""
+    statement: str
+    parameters: Any
+    duration: float
+
+
+class QueryRecorder:
+    """Statements executed during one API request, CLI command or test block.
+
+    Slow statements are logged as they complete. Statement shapes executed
+    repeatedly, the signature of an N+1 lazy load, are reported by log_summary().
+    """
+
+    def __init__(self, name: str, slow_query_ms: Optional[float] = None, repeated_query_threshold: Optional[int] = None):
+        self.name = name
+        self.slow_query_ms = settings.database.slow_query_ms if slow_query_ms is None else slow_query_ms
+        self.repeated_query_threshold = (settings.database.repeated_query_threshold
+                                         if repeated_query_threshold is None else repeated_query_threshold)
+        self.records: List[QueryRecord] = []
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    @property
+    def statements(self) -> List[str]:
+        return [record.statement for record in self.records]
+
+    @property
+    def duration(self) -> float:
+        return sum(record.duration for record in self.records)
+
+    def record(self, statement: str, parameters: Any, duration: float) -> None:
+        shape = statement_shape(statement)
+        self.records.append(QueryRecord(shape, parameter_shape(parameters), duration))
+        if duration * 1000 >= self.slow_query_ms:
+            logger.warning("slow_query", scope=self.name, duration_ms=round(duration * 1000, 2),
+                           statement=shape, parameters=parameter_shape(parameters))
+
+    def repeated(self, threshold: Optional[int] = None) -> Dict[str, int]:
+        """Statement shapes executed at least threshold times, with their counts."""
+        threshold = self.repeated_query_threshold if threshold is None else threshold
+        return {shape: count for shape, count in Counter(self.statements).items() if count >= threshold}
+
+    def format_statements(self) -> str:
+        """The recorded statements, one per line, for test failure messages."""
+        return "\n".join(f"{record.duration * 1000:8.2f}ms  {record.statement}" for record in self.records)
+
+    def log_summary(self) -> None:
+        for shape, count in self.repeated().items():
+            logger.warning("repeated_query", scope=self.name, count=count, statement=shape)
+        logger.info("query_summary", scope=self.name, queries=len(self.records),
+                    duration_ms=round(self.duration * 1000, 2))
+
+    @contextmanager
+    def listen(self, target: Union[Engine, Connection]) -> Iterator["QueryRecorder"]:
+        """Record every statement run on an engine or connection within the block.
+
+        Unlike record_queries() this does not depend on the calling context, so it
+        also sees statements run on other threads, e.g. by a TestClient's app.
+        """
+        starts: List[float] = []
+
+        def before(conn, cursor, statement, parameters, context, executemany):
+            starts.append(time.perf_counter())
+
+        def after(conn, cursor, statement, parameters, context, executemany):
+            self.record(statement, parameters, time.perf_counter() - starts.pop())
+
+        event.listen(target, "before_cursor_execute", before)
+        event.listen(target, "after_cursor_execute", after)
+        try:
+            yield self
+        finally:
+            event.remove(target, "before_cursor_execute", before)
+            event.remove(target, "after_cursor_execute", after)
+
+
+# Set by record_queries(); statements on instrumented engines are added to it
+_query_recorder: ContextVar[Optional[QueryRecorder]] = ContextVar("query_recorder", default=None)
+
+
+@contextmanager
+def record_queries(name: str) -> Iterator[QueryRecorder]:
+    """Group the statements run in the enclosed block, and log a summary when it exits.
+
+    The recorder follows the context into threadpool workers, like request_session_scope.
+    init_db instruments its engine; enable per-request and per-command recording with
+    DATABASE_RECORD_QUERIES=true.
+    """
+    recorder = QueryRecorder(name)
+    token = _query_recorder.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _query_recorder.reset(token)
+        recorder.log_summary()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    duration = time.perf_counter() - conn.info["query_start_time"].pop()
+    if settings.metrics.enabled:
+        statement_type = _statement_type(statement)
+        DB_QUERIES.inc(statement=statement_type)
+        DB_QUERY_SECONDS.observe(duration, statement=statement_type)
+
+    recorder = _query_recorder.get()
+    if recorder is not None:
+        recorder.record(statement, parameters, duration)
+
+
+def _handle_error(exception_context):
+    # after_cursor_execute is skipped for failed statements; drop their start time
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_start_time"):
+        conn.info["query_start_time"].pop()
+
+
+def _collect_pool_stats() -> None:
+    if engine is None or not hasattr(engine.pool, "checkedout"):
+        return
+    DB_POOL_CONNECTIONS.set(engine.pool.size(), state="size")
+    DB_POOL_CONNECTIONS.set(engine.pool.checkedout(), state="checked_out")
+    DB_POOL_CONNECTIONS.set(engine.pool.checkedin(), state="checked_in")
+    DB_POOL_CONNECTIONS.set(engine.pool.overflow(), state="overflow")
+
+
+def instrument_engine(target: Engine) -> None:
+    """Time every statement an engine runs, for the metrics registry and any active record_queries() block."""
+    if not event.contains(target, "before_cursor_execute", _before_cursor_execute):
+        event.listen(target, "before_cursor_execute", _before_cursor_execute)
+        event.listen(target, "after_cursor_execute", _after_cursor_execute)
+        event.listen(target, "handle_error", _handle_error)
+
+
+REGISTRY.add_collector(_collect_pool_stats)
+
+
+def init_db(database_url: str, pool_size: int = 5, max_overflow: int = 10) -> Tuple[object, object]:
     """Initialize the database with the provided connection URL.
 
     Args:
         database_url: Connection string for the database
+        pool_size: Number of connections kept open in the pool
+        max_overflow: Number of connections allowed beyond pool_size under load
 
     Returns:
         Tuple containing (engine, db_session)
+
+    Raises:
+        SchemaVersionError: If the database has pending migrations
     """
     global engine, db_session, SessionLocal
 
     try:
         # Create SQLAlchemy engine using the provided URL
-        engine = create_engine(database_url)
+        engine = create_engine(database_url, pool_size=pool_size, max_overflow=max_overflow, pool_pre_ping=True)
+        # The cursor listeners time every statement, which is only worth it if something reads the timings
+        if settings.metrics.enabled or settings.database.record_queries:
+            instrument_engine(engine)
 
         # Create a scoped session factory
         SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-        db_session = scoped_session(SessionLocal)
+        db_session = scoped_session(SessionLocal, scopefunc=_session_scope_key)
 
-        # Create all tables
-        Base.metadata.create_all(bind=engine)
+        # Check the schema is migrated rather than running create_all, which
+        # introspects every table on each start; see src.database.migrations
+        from src.database.migrations import verify_schema_version
+        schema_version = verify_schema_version(engine)
 
-        logger.debug("database_initialized")
+        logger.debug("database_initialized", schema_version=schema_version)
 
         return engine, db_session
     except Exception as e:
@@ -76,6 +276,21 @@ def get_db() -> Generator[Session, None, None]:
         logger.debug("database_session_closed_after_request")
         db.close()
 
+@contextmanager
+def request_session_scope() -> Iterator[None]:
+    """Give the enclosed block its own get_db_session() session, closed on exit.
+
+    Context variables follow the request into the threadpool, so route handlers
+    running on different worker threads never share a session.
+    """
+    token = _session_scope.set(object())
+    try:
+        yield
+    finally:
+        if db_session is not None:
+            db_session.remove()
+        _session_scope.reset(token)
+
 def close_session() -> None:
     """Close the current session and remove it from the registry.
     Call this when you're done with a series of database operations.
@@ -1,11 +1,16 @@
 from datetime import date
-from typing import Any, Dict, List, Optional, TYPE_CHECKING, Union
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, TYPE_CHECKING, Union
 from uuid import UUID
 
-from sqlalchemy import Date, String
+from sqlalchemy import case, Date, DDL, event, func, Index, Row, String
 from sqlalchemy.dialects.postgresql import ARRAY, JSON
-from sqlalchemy.orm import attributes, Mapped, mapped_column, relationship
+from sqlalchemy.orm import attributes, lazyload, Mapped, mapped_column, relationship
+from sqlalchemy.orm.interfaces import ORMOption
 from src.database.base import Base, get_db_session
+from src.database.company_search import CompanySearchIndex
+from src.database.pagination import Page, paginate
 from src.utils.logging import get_logger
 from uuid_extensions import uuid7
 
@@ -34,6 +39,7 @@ class Company(Base):
     # Company details
     name: Mapped[str] = mapped_column(String(255))
     display_name: Mapped[Optional[str]] = mapped_column(String(255))
+    # Indexed for exact and prefix matches by ix_companies_ticker_pattern
     ticker: Mapped[str] = mapped_column(String(10))
     exchanges: Mapped[List[str]] = mapped_column(ARRAY(String), default=list)
     sic: Mapped[Optional[str]] = mapped_column(String(4), index=True)
@@ -45,6 +51,45 @@ class Company(Base):
         return f"<Company(id={self.id}, name='{self.name}', ticker='{self.ticker}')>"
 
 
+# Indexes backing search_companies_by_query: pattern_ops btree indexes serve exact
+# and prefix matches, the trigram index serves substring matches
+Index("ix_companies_ticker_pattern", Company.ticker, postgresql_ops={"ticker": "varchar_pattern_ops"})
+Index("ix_companies_name_lower_pattern", func.lower(Company.name).label("name_lower"),
+      postgresql_ops={"name_lower": "text_pattern_ops"})
+Index("ix_companies_name_trgm", Company.name, postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"})
+
+# The trigram operator class must exist before the tables are created
+event.listen(Base.metadata, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"))
+
+
+# Scalar columns returned by read-path queries. Rows expose the same attributes as
+# Company, without any of its relationships.
+COMPANY_COLUMNS = (
+    Company.id,
+    Company.name,
+    Company.display_name,
+    Company.ticker,
+    Company.exchanges,
+    Company.sic,
+    Company.sic_description,
+    Company.fiscal_year_end,
+    Company.former_names,
+)
+
+def company_lazy_load_options() -> Sequence[ORMOption]:
+    """Default loader options for single-company lookups.
+
+    Filings and documents are only loaded if the caller accesses them, instead of
+    eagerly on every query. Pass e.g. (selectinload(Company.filings),) to load them
+    up front. Built on use, since building loader options configures the mappers,
+    which fails before the related models are imported.
+    """
+    return (
+        lazyload(Company.filings),
+        lazyload(Company.documents),
+    )
+
+
 def get_company_ids() -> List[UUID]:
     """Get a list of all company IDs in the database.
 
@@ -87,18 +132,23 @@ def get_all_company_tickers() -> List[str]:
         raise
 
 
-def get_company(company_id: Union[UUID, str]) -> Optional[Company]:
+def get_company(company_id: Union[UUID, str],
+                load_options: Optional[Sequence[ORMOption]] = None) -> Optional[Company]:
     """Get a company by its ID.
 
     Args:
         company_id: UUID of the company to retrieve
+        load_options: Loader options for the company's relationships (defaults to
+            company_lazy_load_options())
 
     Returns:
         Company object if found, None otherwise
     """
     try:
         session = get_db_session()
-        company = session.query(Company).filter(Company.id == company_id).first()
+        if load_options is None:
+            load_options = company_lazy_load_options()
+        company = session.query(Company).options(*load_options).filter(Company.id == company_id).first()
         if company:
             logger.info("retrieved_company", company=company.name, ticker=company.ticker)
         else:
@@ -123,6 +173,7 @@ def create_company(company_data: Dict[str, Any]) -> Company:
         company = Company(**company_data)
         session.add(company)
         session.commit()
+        invalidate_company_search_index()
         logger.info("created_company", company_id=str(company.id), name=company.name)
         return company
     except Exception as e:
@@ -158,6 +209,7 @@ def update_company(company_id: Union[UUID, str], company_data: Dict[str, Any]) -
                 logger.warning("update_company_invalid_attribute", company_id=str(company_id), attribute=key)
 
         session.commit()
+        invalidate_company_search_index()
         logger.info("updated_company", company_id=str(company.id), name=company.name)
         return company
     except Exception as e:
@@ -184,6 +236,7 @@ def delete_company(company_id: Union[UUID, str]) -> bool:
 
         session.delete(company)
         session.commit()
+        invalidate_company_search_index()
         logger.info("deleted_company", company_id=str(company_id))
         return True
     except Exception as e:
@@ -192,18 +245,23 @@ def delete_company(company_id: Union[UUID, str]) -> bool:
         raise
 
 
-def get_company_by_ticker(ticker: str) -> Optional[Company]:
+def get_company_by_ticker(ticker: str,
+                          load_options: Optional[Sequence[ORMOption]] = None) -> Optional[Company]:
     """Get a company by one of its ticker symbols.
 
     Args:
         ticker: Ticker symbol of the company to retrieve
+        load_options: Loader options for the company's relationships (defaults to
+            company_lazy_load_options())
 
     Returns:
         Company object if found, None otherwise
     """
     try:
         session = get_db_session()
-        company = session.query(Company).filter(ticker.upper() == Company.ticker).first()
+        if load_options is None:
+            load_options = company_lazy_load_options()
+        company = session.query(Company).options(*load_options).filter(ticker.upper() == Company.ticker).first()
         if company:
             logger.info("retrieved_company_by_ticker", company=company.name, ticker=company.ticker)
         else:
@@ -213,30 +271,95 @@ def get_company_by_ticker(ticker: str) -> Optional[Company]:
         logger.error("get_company_by_ticker_failed", ticker=ticker, error=str(e), exc_info=True)
         raise
 
-def search_companies_by_query(query: str, limit: int = 10) -> List[Company]:
+# Seconds before the in-memory search index is rebuilt, so companies written by
+# other processes (e.g. ingestion) show up without a restart
+COMPANY_SEARCH_INDEX_TTL = 300
+
+_company_search_index: Optional[CompanySearchIndex] = None
+_company_search_index_built_at = 0.0
+_company_search_index_lock = threading.Lock()
+
+
+def invalidate_company_search_index() -> None:
+    """Drop the in-memory search index so the next search rebuilds it."""
+    global _company_search_index
+    _company_search_index = None
+
+
+def get_company_search_index() -> CompanySearchIndex:
+    """Get the in-memory company search index, building it if missing or expired.
+
+    Returns:
+        CompanySearchIndex over every company's COMPANY_COLUMNS
+    """
+    global _company_search_index, _company_search_index_built_at
+    index = _company_search_index
+    if index is not None and time.monotonic() - _company_search_index_built_at < COMPANY_SEARCH_INDEX_TTL:
+        return index
+
+    with _company_search_index_lock:
+        index = _company_search_index
+        if index is None or time.monotonic() - _company_search_index_built_at >= COMPANY_SEARCH_INDEX_TTL:
+            try:
+                session = get_db_session()
+                start = time.monotonic()
+                index = CompanySearchIndex(session.query(*COMPANY_COLUMNS).all())
+                _company_search_index, _company_search_index_built_at = index, time.monotonic()
+                logger.info("built_company_search_index", companies=len(index),
+                            duration=f"{_company_search_index_built_at - start:.3f}s")
+            except Exception as e:
+                logger.error("build_company_search_index_failed", error=str(e), exc_info=True)
+                raise
+        return index
+
+
+def _search_companies_in_database(query: str, limit: int) -> List[Row]:
+    """Ranked, index-backed company search: exact ticker, ticker prefix, name prefix, then substring."""
+    session = get_db_session()
+    upper_query = query.upper()
+    lower_query = query.lower()
+    name_lower = func.lower(Company.name)
+
+    rank = case(
+        (Company.ticker == upper_query, 0),
+        (Company.ticker.startswith(upper_query, autoescape=True), 1),
+        (name_lower.startswith(lower_query, autoescape=True), 2),
+        else_=3,
+    )
+    return (
+        session.query(*COMPANY_COLUMNS)
+        .filter(
+            Company.ticker.startswith(upper_query, autoescape=True)
+            | name_lower.startswith(lower_query, autoescape=True)
+            | Company.name.icontains(query, autoescape=True)
+            | Company.ticker.contains(upper_query, autoescape=True)
+        )
+        .order_by(rank, func.similarity(Company.name, query).desc(), Company.name)
+        .limit(limit)
+        .all()
+    )
+
+
+def search_companies_by_query(query: str, limit: int = 10, use_index: bool = True) -> List[Row]:
     """Search for companies by partial ticker or name.
 
+    Results are ranked exact ticker, ticker prefix, name prefix, then substring.
+
     Args:
         query: Search string to match against company names or tickers
         limit: Maximum number of results to return
+        use_index: Serve the search from the in-memory index instead of the database
 
     Returns:
-        List of matching Company objects
+        List of matching company rows with the columns in COMPANY_COLUMNS
     """
     try:
+        if use_index:
+            companies = get_company_search_index().search(query, limit)
+        else:
+            companies = _search_companies_in_database(query, limit)
 
-        session = get_db_session()
-        upper_query = query.upper()
-
-        # Search in name (case-insensitive) or ticker (exact match or case-insensitive)
-        companies = session.query(Company).filter(
-            # Search in name (case-insensitive)
-            (Company.name.ilike(f'%{query}%')) |
-            # Search in ticker (case-insensitive)
-            (Company.ticker.ilike(f'%{upper_query}%'))
-        ).limit(limit).all()
-
-        logger.info("search_companies_by_query", query=query, result_count=len(companies))
+        logger.info("search_companies_by_query", query=query, result_count=len(companies), use_index=use_index)
         return companies
     except Exception as e:
         logger.error("search_companies_by_query_failed", query=query, error=str(e), exc_info=True)
@@ -252,7 +375,7 @@ def search_companies_by_query(query: str, limit: int = 10) -> List[Company]:
         # Fallback to searching just by name if the complex query fails
         try:
             new_session = get_db_session()
-            companies = new_session.query(Company).filter(
+            companies = new_session.query(*COMPANY_COLUMNS).filter(
                 Company.name.ilike(f'%{query}%')
             ).limit(limit).all()
 
@@ -264,7 +387,7 @@ def search_companies_by_query(query: str, limit: int = 10) -> List[Company]:
             return []
 
 
-def list_all_companies(offset: int = 0, limit: int = 50) -> List[Company]:
+def list_all_companies(offset: int = 0, limit: int = 50) -> List[Row]:
     """Get a paginated list of all companies that have summaries.
 
     Args:
@@ -272,14 +395,38 @@ def list_all_companies(offset: int = 0, limit: int = 50) -> List[Company]:
         limit: Maximum number of companies to return
 
     Returns:
-        List of Company objects that have summaries
+        List of company rows with the columns in COMPANY_COLUMNS
     """
     try:
         session = get_db_session()
-        companies = session.query(Company).filter().order_by(Company.name).offset(offset).limit(limit).all()
+        companies = session.query(*COMPANY_COLUMNS).filter().order_by(Company.name).offset(offset).limit(limit).all()
 
         logger.info("list_all_companies", offset=offset, limit=limit, result_count=len(companies))
         return companies
     except Exception as e:
         logger.error("list_all_companies_failed", offset=offset, limit=limit, error=str(e), exc_info=True)
         raise
+
+
+def list_companies_page(cursor: Optional[str] = None, limit: int = 50) -> Page[Row]:
+    """Get a page of companies ordered by name, using keyset pagination.
+
+    Args:
+        cursor: Cursor from the previous page, or None for the first page
+        limit: Maximum number of companies to return
+
+    Returns:
+        Page of company rows with the columns in COMPANY_COLUMNS
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    try:
+        session = get_db_session()
+        page = paginate(session.query(*COMPANY_COLUMNS), Company.id, cursor, limit, sort_column=Company.name)
+
+        logger.info("list_companies_page", limit=limit, result_count=len(page), has_more=page.next_cursor is not None)
+        return page
+    except Exception as e:
+        logger.error("list_companies_page_failed", limit=limit, error=str(e), exc_info=True)
+        raise
@@ -0,0 +1,127 @@
+"""In-memory company search index for autocomplete.
+
+Company names and tickers change rarely but are searched on every keystroke, so
+/companies/search is served from prefix tries held in memory instead of the
+database. The index is built from company rows (see COMPANY_COLUMNS) and ranks
+matches the same way as the database search: exact ticker, ticker prefix, name
+prefix, then substring.
+"""
+from collections import deque
+from typing import Any, Dict, Generic, Iterable, Iterator, List, Optional, Sequence, TypeVar
+
+T = TypeVar("T")
+
+
+class _TrieNode(Generic[T]):
+    __slots__ = ("children", "values")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode[T]"] = {}
+        self.values: List[T] = []
+
+
+class PrefixTrie(Generic[T]):
+    """Maps string keys to values, with lookup of every value stored under a prefix."""
+
+    def __init__(self):
+        self._root: _TrieNode[T] = _TrieNode()
+
+    def insert(self, key: str, value: T) -> None:
+        """Store a value under a key; a key may hold several values."""
+        node = self._root
+        for char in key:
+            node = node.children.setdefault(char, _TrieNode())
+        node.values.append(value)
+
+    def search(self, prefix: str, limit: Optional[int] = None) -> Iterator[T]:
+        """
+        Yield values whose key starts with prefix, shortest keys first.
+
+        The trie is walked as values are consumed, so a caller that stops early
+        doesn't pay for the rest of the subtree.
+
+        Args:
+            prefix: Key prefix to match
+            limit: Maximum number of values to yield, or None for all of them
+        """
+        node = self._root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return
+
+        # Breadth-first, so closer matches come first and large subtrees are not walked
+        count = 0
+        queue = deque([node])
+        while queue:
+            node = queue.popleft()
+            for value in node.values:
+                yield value
+                count += 1
+                if limit is not None and count >= limit:
+                    return
+            queue.extend(node.children[char] for char in sorted(node.children))
+
+
+class CompanySearchIndex:
+    """Ranked autocomplete over company rows with ticker and name prefix tries."""
+
+    def __init__(self, companies: Sequence[Any]):
+        """
+        Build the index.
+
+        Args:
+            companies: Rows or objects with id, name and ticker attributes
+        """
+        self.companies = list(companies)
+        self._by_ticker: Dict[str, List[Any]] = {}
+        self._tickers: PrefixTrie[Any] = PrefixTrie()
+        self._names: PrefixTrie[Any] = PrefixTrie()
+
+        for company in self.companies:
+            if company.ticker:
+                self._by_ticker.setdefault(company.ticker.upper(), []).append(company)
+                self._tickers.insert(company.ticker.upper(), company)
+            if company.name:
+                self._names.insert(company.name.lower(), company)
+
+    def __len__(self) -> int:
+        return len(self.companies)
+
+    def _substring_matches(self, upper_query: str, lower_query: str) -> Iterable[Any]:
+        for company in self.companies:
+            if lower_query in (company.name or "").lower() or upper_query in (company.ticker or "").upper():
+                yield company
+
+    def search(self, query: str, limit: int = 10) -> List[Any]:
+        """
+        Search for companies by ticker or name.
+
+        Args:
+            query: Search string
+            limit: Maximum number of results to return
+
+        Returns:
+            Matching companies, best ranked first
+        """
+        upper_query = query.strip().upper()
+        lower_query = query.strip().lower()
+        if not upper_query or limit <= 0:
+            return []
+
+        # The tiers are generators consumed only until the page is full, so they
+        # aren't capped at limit each: companies already matched by a better
+        # tier are skipped without using up a later tier's share of the page
+        results: Dict[Any, Any] = {}
+        for matches in (
+            self._by_ticker.get(upper_query, []),
+            self._tickers.search(upper_query),
+            self._names.search(lower_query),
+            # Only scanned if the prefix matches did not fill the page
+            self._substring_matches(upper_query, lower_query),
+        ):
+            for company in matches:
+                results.setdefault(company.id, company)
+                if len(results) >= limit:
+                    return list(results.values())
+        return list(results.values())
@@ -0,0 +1,196 @@
+"""Resolution of short content hashes to the rows they identify.
+
+Documents, generated content, prompts and model configs are addressed in URLs
+and the CLI by a prefix of their SHA256 content hash (see get_short_hash). A
+prefix is resolved to the full hash with a LIKE 'prefix%' query, which the
+*_content_hash_pattern indexes serve as a btree range scan, and the row is then
+fetched by the full hash. Resolved prefixes are kept in an in-process LRU cache
+so repeated lookups of the same short URL skip the prefix query.
+
+Flushes in this process forget the cached prefixes of the hashes they write.
+Rows written by other processes (ingestion workers, the CLI, other API
+replicas) can't be seen that way, so entries also expire after HASH_CACHE_TTL
+seconds, which bounds how long a prefix they made ambiguous keeps resolving.
+
+A prefix matching more than one distinct hash raises AmbiguousHashError rather
+than returning an arbitrary match.
+"""
+from collections import OrderedDict
+import re
+import threading
+import time
+from typing import Dict, Hashable, List, Optional, Set, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Query, Session
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Length of a full SHA256 hex digest
+FULL_HASH_LENGTH = 64
+
+# Maximum number of resolved prefixes kept in memory per table
+HASH_CACHE_SIZE = 4096
+
+# Seconds a resolved prefix is trusted, for hashes written by other processes
+HASH_CACHE_TTL = 300
+
+_HEX_PATTERN = re.compile(r"^[0-9a-f]+$")
+
+# table -> (scope, prefix) -> (full hash, time resolved), least recently used first
+_cache: Dict[str, "OrderedDict[Tuple[Hashable, str], Tuple[str, float]]"] = {}
+# table -> prefix -> scopes it is cached under, so a new hash finds the prefixes
+# it shares without scanning the cache
+_prefix_index: Dict[str, Dict[str, Set[Hashable]]] = {}
+_cache_lock = threading.Lock()
+
+
+class AmbiguousHashError(LookupError):
+    """Raised when a hash prefix matches more than one distinct content hash."""
+
+    def __init__(self, prefix: str, matches: List[str]):
+        self.prefix = prefix
+        self.matches = matches
+        super().__init__(f"Hash prefix '{prefix}' is ambiguous, use a longer prefix")
+
+
+def _cache_remove(table: str, scope: Hashable, prefix: str) -> None:
+    # Callers hold _cache_lock
+    entries = _cache.get(table)
+    if entries is None or entries.pop((scope, prefix), None) is None:
+        return
+    scopes = _prefix_index[table][prefix]
+    scopes.discard(scope)
+    if not scopes:
+        del _prefix_index[table][prefix]
+
+
+def _cache_get(key: Tuple[str, Hashable, str]) -> Optional[str]:
+    table, scope, prefix = key
+    with _cache_lock:
+        entries = _cache.get(table)
+        entry = entries.get((scope, prefix)) if entries else None
+        if entry is None:
+            return None
+        full_hash, resolved_at = entry
+        if time.monotonic() - resolved_at >= HASH_CACHE_TTL:
+            _cache_remove(table, scope, prefix)
+            return None
+        entries.move_to_end((scope, prefix))
+        return full_hash
+
+
+def _cache_put(key: Tuple[str, Hashable, str], full_hash: str) -> None:
+    table, scope, prefix = key
+    with _cache_lock:
+        entries = _cache.setdefault(table, OrderedDict())
+        entries[(scope, prefix)] = (full_hash, time.monotonic())
+        entries.move_to_end((scope, prefix))
+        _prefix_index.setdefault(table, {}).setdefault(prefix, set()).add(scope)
+        while len(entries) > HASH_CACHE_SIZE:
+            _cache_remove(table, *next(iter(entries)))
+
+
+def _cache_evict(key: Tuple[str, Hashable, str]) -> None:
+    with _cache_lock:
+        _cache_remove(*key)
+
+
+def clear_hash_cache() -> None:
+    """Forget every resolved prefix."""
+    with _cache_lock:
+        _cache.clear()
+        _prefix_index.clear()
+
+
+def _invalidate_prefixes(table: str, full_hash: str) -> None:
+    # A new hash may make a cached prefix of it ambiguous. Look up each of its
+    # prefixes in the index, rather than comparing it with every cached entry.
+    with _cache_lock:
+        index = _prefix_index.get(table)
+        if not index:
+            return
+        for length in range(1, len(full_hash)):
+            prefix = full_hash[:length]
+            for scope in list(index.get(prefix, ())):
+                _cache_remove(table, scope, prefix)
+
+
+@event.listens_for(Session, "after_flush")
+def _invalidate_flushed_hashes(session, flush_context):
+    for obj in [*session.new, *session.dirty]:
+        full_hash = getattr(obj, "content_hash", None)
+        table = getattr(obj, "__tablename__", None)
+        if full_hash and table:
+            _invalidate_prefixes(table, full_hash)
+
+
+def resolve_content_hash(query: Query, column, content_hash: str, scope: Hashable = None) -> Optional[str]:
+    """
+    Resolve a full or partial content hash to the full hash it identifies.
+
+    Args:
+        query: Query over the hashed model, with any scoping filters applied
+        column: The model's content_hash column
+        content_hash: Full hash or hash prefix
+        scope: Hashable description of the query's filters, e.g. a ticker, used in the cache key
+
+    Returns:
+        The full content hash, or None if nothing matches
+
+    Raises:
+        AmbiguousHashError: If the prefix matches more than one distinct hash
+    """
+    prefix = content_hash.strip().lower()
+    if not prefix or len(prefix) > FULL_HASH_LENGTH or not _HEX_PATTERN.match(prefix):
+        return None
+    if len(prefix) == FULL_HASH_LENGTH:
+        return prefix
+
+    key = (column.class_.__tablename__, scope, prefix)
+    full_hash = _cache_get(key)
+    if full_hash is not None:
+        return full_hash
+
+    matches = [
+        row[0] for row in
+        query.with_entities(column).filter(column.startswith(prefix)).distinct().limit(2).all()
+    ]
+    if len(matches) > 1:
+        logger.warning("ambiguous_content_hash", table=key[0], content_hash=prefix)
+        raise AmbiguousHashError(prefix, matches)
+    if not matches:
+        return None
+
+    _cache_put(key, matches[0])
+    return matches[0]
+
+
+def get_by_content_hash(query: Query, column, content_hash: str, scope: Hashable = None):
+    """
+    Get the first row of a query whose content hash matches a full or partial hash.
+
+    Args:
+        query: Query over the hashed model, with any scoping filters applied
+        column: The model's content_hash column
+        content_hash: Full hash or hash prefix
+        scope: Hashable description of the query's filters, used in the cache key
+
+    Returns:
+        The matching object, or None if nothing matches
+
+    Raises:
+        AmbiguousHashError: If the prefix matches more than one distinct hash
+    """
+    full_hash = resolve_content_hash(query, column, content_hash, scope)
+    if full_hash is None:
+        return None
+
+    obj = query.filter(column == full_hash).first()
+    if obj is None and len(full_hash) != len(content_hash):
+        # The cached row was deleted; resolve the prefix again
+        _cache_evict((column.class_.__tablename__, scope, content_hash.strip().lower()))
+        full_hash = resolve_content_hash(query, column, content_hash, scope)
+        obj = query.filter(column == full_hash).first() if full_hash else None
+    return obj
@@ -1,15 +1,20 @@
 from enum import Enum
 import hashlib
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 from uuid import UUID
 
+from sqlalchemy import Computed, ForeignKey, func, Index, String, Text
 from sqlalchemy import Enum as SQLEnum
-from sqlalchemy import ForeignKey, String, Text
-from sqlalchemy.orm import joinedload, Mapped, mapped_column, relationship
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import joinedload, lazyload, Mapped, mapped_column, relationship, undefer
+from sqlalchemy.orm.interfaces import ORMOption
 from src.database.base import Base, get_db_session
+from src.database.companies import company_lazy_load_options
+from src.database.content_hashes import AmbiguousHashError, get_by_content_hash
 
 # Import Filing for the new functions
 from src.database.filings import Filing
+from src.database.pagination import Page, paginate
 from src.utils.logging import get_logger
 from uuid_extensions import uuid7
 
@@ -33,6 +38,20 @@ class DocumentType(Enum):
         return f"{ self.value }"
 
 
+class DocumentWriteStatus(str, Enum):
+    """Outcome of writing a document with upsert_document."""
+    CREATED = "created"
+    UPDATED = "updated"
+    UNCHANGED = "unchanged"
+
+
+# Text search configuration used for indexing and querying document bodies
+SEARCH_CONFIG = "english"
+
+# Content is truncated before indexing so very large sections stay under the 1MB tsvector limit
+SEARCH_VECTOR_EXPRESSION = f"to_tsvector('{SEARCH_CONFIG}', left(coalesce(content, ''), 500000))"
+
+
 class Document(Base):
     """Document model representing document information associated with filings."""
 
@@ -58,14 +77,24 @@ class Document(Base):
     content: Mapped[Optional[str]] = mapped_column(Text, deferred=True)
     content_hash: Mapped[Optional[str]] = mapped_column(String(64), index=True)
 
+    # Full-text search vector, maintained by Postgres whenever content is written
+    search_vector: Mapped[Optional[str]] = mapped_column(
+        TSVECTOR, Computed(SEARCH_VECTOR_EXPRESSION, persisted=True), deferred=True
+    )
+
+    __table_args__ = (
+        Index("ix_documents_search_vector", "search_vector", postgresql_using="gin"),
+        # Serves content hash prefix lookups (see src.database.content_hashes)
+        Index("ix_documents_content_hash_pattern", "content_hash",
+              postgresql_ops={"content_hash": "varchar_pattern_ops"}),
+    )
+
     def __repr__(self) -> str:
         return f"{self.company.ticker} {self.filing.period_of_report.year} {self.filing.filing_type} {self.document_type.value}"
 
     def generate_content_hash(self) -> str:
         """Generate SHA256 hash of the content for URL identification."""
-        if not self.content:
-            return ""
-        return hashlib.sha256(self.content.encode('utf-8')).hexdigest()
+        return compute_content_hash(self.content)
 
     def get_short_hash(self, length: int = 12) -> str:
         """Get shortened version of content hash for URLs."""
@@ -78,6 +107,29 @@ class Document(Base):
         self.content_hash = self.generate_content_hash()
 
 
+def compute_content_hash(content: Optional[str]) -> str:
+    """SHA256 hash of document content, or an empty string for no content."""
+    if not content:
+        return ""
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def document_lazy_load_options(include_content: bool = False) -> Sequence[ORMOption]:
+    """Loader options for document lookups served by the API.
+
+    The filing and company are still joined, but not their document and filing
+    collections. Built on use, like company_lazy_load_options.
+
+    Args:
+        include_content: Load the deferred content column in the same query
+    """
+    options = (
+        joinedload(Document.filing).options(lazyload(Filing.documents), lazyload(Filing.company)),
+        joinedload(Document.company).options(*company_lazy_load_options()),
+    )
+    return options + (undefer(Document.content),) if include_content else options
+
+
 def get_document_ids() -> List[UUID]:
     """Get a list of all document IDs in the database.
 
@@ -94,19 +146,24 @@ def get_document_ids() -> List[UUID]:
         raise
 
 
-def get_document(document_id: Union[UUID, str]) -> Optional[Document]:
+def get_document(document_id: Union[UUID, str], include_content: bool = False) -> Optional[Document]:
     """Get a document by its ID.
 
     Args:
         document_id: UUID of the document to retrieve
+        include_content: Load the content in the same query
 
     Returns:
         Document object if found, None otherwise
     """
     try:
         session = get_db_session()
-        # Use joinedload to eagerly fetch the filing relationship
-        document = session.query(Document).options(joinedload(Document.filing)).filter(Document.id == document_id).first()
+        document = (
+            session.query(Document)
+            .options(*document_lazy_load_options(include_content))
+            .filter(Document.id == document_id)
+            .first()
+        )
         if document:
             logger.info("retrieved_document", document=document.title)
         else:
@@ -206,24 +263,29 @@ def delete_document(document_id: Union[UUID, str]) -> bool:
         raise
 
 
-def find_or_create_document(company_id: UUID, title: str, document_type: DocumentType, content: Optional[str],
-                           filing_id: Optional[UUID] = None) -> Document:
-    """Find a document by company, filing, and name or create it if it doesn't exist.
+def upsert_document(company_id: UUID, title: str, document_type: DocumentType, content: Optional[str],
+                    filing_id: Optional[UUID] = None) -> Tuple[Document, DocumentWriteStatus]:
+    """Create a document, or update its content if it changed.
+
+    An existing document is matched by company, filing and title. The new content is
+    compared by SHA256 hash with the stored content_hash, so unchanged content is
+    neither loaded nor rewritten.
 
     Args:
         company_id: UUID of the company
-        document_name: Name of the document
-        content: Content of the document
+        title: Title of the document
+        document_type: Type of the document, used when creating it
+        content: Content of the document; None leaves an existing document's content as is
         filing_id: UUID of the filing (optional)
 
     Returns:
-        Found or created Document object
+        Tuple of (Document object, whether it was created, updated or unchanged)
     """
     try:
         session = get_db_session()
 
-        # Build query
-        query = session.query(Document).filter(
+        # Only the document row is needed to compare hashes, not its filing and company
+        query = session.query(Document).options(lazyload(Document.filing), lazyload(Document.company)).filter(
             Document.company_id == company_id,
             Document.title == title
         )
@@ -236,14 +298,23 @@ def find_or_create_document(company_id: UUID, title: str, document_type: Documen
         existing_document = query.first()
 
         if existing_document:
-            # Update content if provided
-            if content is not None:
-                existing_document.content = content
-                session.commit()
-                logger.info("updated_document_content",
-                           document_id=str(existing_document.id),
-                           document_name=title)
-            return existing_document
+            if content is None:
+                return existing_document, DocumentWriteStatus.UNCHANGED
+
+            content_hash = compute_content_hash(content)
+            if content_hash == existing_document.content_hash:
+                logger.debug("document_content_unchanged",
+                             document_id=str(existing_document.id),
+                             document_name=title)
+                return existing_document, DocumentWriteStatus.UNCHANGED
+
+            existing_document.content = content
+            existing_document.content_hash = content_hash
+            session.commit()
+            logger.info("updated_document_content",
+                       document_id=str(existing_document.id),
+                       document_name=title)
+            return existing_document, DocumentWriteStatus.UPDATED
         else:
             # Create new document
             document_data = {
@@ -262,26 +333,49 @@ def find_or_create_document(company_id: UUID, title: str, document_type: Documen
             logger.info("created_new_document",
                        document_id=str(document.id),
                        document_name=title)
-            return document
+            return document, DocumentWriteStatus.CREATED
     except Exception as e:
         session.rollback()
-        logger.error("find_or_create_document_failed", error=str(e), exc_info=True)
+        logger.error("upsert_document_failed", error=str(e), exc_info=True)
         raise
 
 
-# FIXME: This function should not return the document contents
-def get_documents_by_filing(filing_id: UUID) -> List[Document]:
+def find_or_create_document(company_id: UUID, title: str, document_type: DocumentType, content: Optional[str],
+                           filing_id: Optional[UUID] = None) -> Document:
+    """Find a document by company, filing, and name or create it if it doesn't exist.
+
+    Args:
+        company_id: UUID of the company
+        title: Title of the document
+        document_type: Type of the document
+        content: Content of the document
+        filing_id: UUID of the filing (optional)
+
+    Returns:
+        Found or created Document object
+    """
+    document, _ = upsert_document(company_id, title, document_type, content, filing_id)
+    return document
+
+
+def get_documents_by_filing(filing_id: UUID, include_content: bool = False) -> List[Document]:
     """Get all documents associated with a filing.
 
     Args:
         filing_id: UUID of the filing
+        include_content: Load the contents in the same query
 
     Returns:
         List of Document objects
     """
     try:
         session = get_db_session()
-        documents = session.query(Document).filter(Document.filing_id == filing_id).all()
+        documents = (
+            session.query(Document)
+            .options(*document_lazy_load_options(include_content))
+            .filter(Document.filing_id == filing_id)
+            .all()
+        )
         logger.info("retrieved_documents_by_filing",
                    filing_id=str(filing_id),
                    count=len(documents))
@@ -294,23 +388,23 @@ def get_documents_by_filing(filing_id: UUID) -> List[Document]:
         raise
 
 
-def get_documents_by_ids(document_ids: List[UUID]) -> List[Document]:
+def get_documents_by_ids(document_ids: List[UUID], include_content: bool = False) -> List[Document]:
     """Get documents by their IDs.
 
     Args:
         document_ids: List of document UUIDs
+        include_content: Load the contents in the same query
 
     Returns:
-        List of Document objects (only basic info, not content)
+        List of Document objects
     """
     try:
         if not document_ids:
             return []
 
         session = get_db_session()
-        # Only select the fields we need, excluding content for performance
         documents = session.query(Document).filter(Document.id.in_(document_ids)).options(
-            joinedload(Document.filing)
+            *document_lazy_load_options(include_content)
         ).all()
 
         logger.info("retrieved_documents_by_ids",
@@ -325,6 +419,28 @@ def get_documents_by_ids(document_ids: List[UUID]) -> List[Document]:
         raise
 
 
+def count_documents_by_filings(filing_ids: List[UUID]) -> int:
+    """Count the documents stored for a set of filings.
+
+    Args:
+        filing_ids: List of filing UUIDs
+
+    Returns:
+        Number of documents associated with the filings
+    """
+    try:
+        if not filing_ids:
+            return 0
+
+        session = get_db_session()
+        count = session.query(func.count(Document.id)).filter(Document.filing_id.in_(filing_ids)).scalar()
+        logger.debug("counted_documents_by_filings", filing_count=len(filing_ids), document_count=count)
+        return count or 0
+    except Exception as e:
+        logger.error("count_documents_by_filings_failed", error=str(e), exc_info=True)
+        raise
+
+
 def get_document_by_content_hash(content_hash: str) -> Optional[Document]:
     """Get document by its content hash.
 
@@ -337,31 +453,28 @@ def get_document_by_content_hash(content_hash: str) -> Optional[Document]:
     try:
         session = get_db_session()
 
-        # Try exact match first
-        document = session.query(Document).filter(Document.content_hash == content_hash).first()
-
-        # If no exact match and hash is short, try prefix match
-        if not document and len(content_hash) < 64:
-            document = session.query(Document).filter(
-                Document.content_hash.like(f"{content_hash}%")
-            ).first()
+        document = get_by_content_hash(session.query(Document), Document.content_hash, content_hash)
 
         if document:
             logger.info("retrieved_document_by_content_hash", content_hash=content_hash)
         else:
             logger.warning("document_not_found_by_content_hash", content_hash=content_hash)
         return document
+    except AmbiguousHashError:
+        raise
     except Exception as e:
         logger.error("get_document_by_content_hash_failed", content_hash=content_hash, error=str(e), exc_info=True)
         raise
 
 
-def get_document_by_accession_and_hash(accession_number: str, content_hash: str) -> Optional[Document]:
+def get_document_by_accession_and_hash(accession_number: str, content_hash: str,
+                                       include_content: bool = False) -> Optional[Document]:
     """Get document by filing accession number and content hash (for URL routing).
 
     Args:
         accession_number: SEC filing accession number
         content_hash: Full or partial SHA256 hash of the document content
+        include_content: Load the content in the same query
 
     Returns:
         Document object if found, None otherwise
@@ -372,16 +485,12 @@ def get_document_by_accession_and_hash(accession_number: str, content_hash: str)
         # Join with filing to filter by accession number
         query = (
             session.query(Document)
+            .options(*document_lazy_load_options(include_content))
             .join(Filing, Document.filing_id == Filing.id)
             .filter(Filing.accession_number == accession_number)
         )
 
-        # Try exact hash match first
-        document = query.filter(Document.content_hash == content_hash).first()
-
-        # If no exact match and hash is short, try prefix match
-        if not document and len(content_hash) < 64:
-            document = query.filter(Document.content_hash.like(f"{content_hash}%")).first()
+        document = get_by_content_hash(query, Document.content_hash, content_hash, scope=accession_number)
 
         if document:
             logger.info("retrieved_document_by_accession_and_hash",
@@ -390,7 +499,48 @@ def get_document_by_accession_and_hash(accession_number: str, content_hash: str)
             logger.warning("document_not_found_by_accession_and_hash",
                           accession_number=accession_number, content_hash=content_hash)
         return document
+    except AmbiguousHashError:
+        raise
     except Exception as e:
         logger.error("get_document_by_accession_and_hash_failed",
                     accession_number=accession_number, content_hash=content_hash, error=str(e), exc_info=True)
         raise
+
+
+def get_documents_page(filing_id: Optional[UUID] = None, company_id: Optional[UUID] = None,
+                       document_type: Optional[DocumentType] = None, cursor: Optional[str] = None,
+                       limit: int = 50) -> Page[Document]:
+    """Get a page of documents in insertion order, using keyset pagination.
+
+    Args:
+        filing_id: Only return documents of this filing
+        company_id: Only return documents of this company
+        document_type: Only return documents of this type
+        cursor: Cursor from the previous page, or None for the first page
+        limit: Maximum number of documents to return
+
+    Returns:
+        Page of Document objects
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    try:
+        session = get_db_session()
+        query = session.query(Document)
+        if filing_id:
+            query = query.filter(Document.filing_id == filing_id)
+        if company_id:
+            query = query.filter(Document.company_id == company_id)
+        if document_type:
+            query = query.filter(Document.document_type == document_type)
+        page = paginate(query, Document.id, cursor, limit)
+
+        logger.info("retrieved_documents_page",
+                   filing_id=str(filing_id) if filing_id else None,
+                   document_type=document_type.value if document_type else None,
+                   count=len(page))
+        return page
+    except Exception as e:
+        logger.error("get_documents_page_failed", error=str(e), exc_info=True)
+        raise
@@ -1,11 +1,13 @@
 from datetime import date
-from typing import Any, Dict, List, Optional, TYPE_CHECKING, Union
+from typing import Any, Dict, List, Optional, Sequence, TYPE_CHECKING, Union
 from uuid import UUID
 
 from sqlalchemy import Date, ForeignKey, String
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import joinedload, lazyload, Mapped, mapped_column, relationship
+from sqlalchemy.orm.interfaces import ORMOption
 from src.database.base import Base, get_db_session
-from src.database.companies import Company
+from src.database.companies import Company, company_lazy_load_options
+from src.database.pagination import Page, paginate
 from src.utils.logging import get_logger
 from uuid_extensions import uuid7
 
@@ -48,6 +50,19 @@ class Filing(Base):
         return self.period_of_report.year
 
 
+def filing_lazy_load_options() -> Sequence[ORMOption]:
+    """Loader options for filing lookups served by the API.
+
+    The company is still joined, but neither the filing's documents nor the
+    company's filings and documents are selectin-loaded with it. Built on use,
+    like company_lazy_load_options.
+    """
+    return (
+        lazyload(Filing.documents),
+        joinedload(Filing.company).options(*company_lazy_load_options()),
+    )
+
+
 def get_filing_ids() -> List[UUID]:
     """Get a list of all filing IDs in the database.
 
@@ -244,7 +259,12 @@ def get_filing_by_accession_number(accession_number: str) -> Optional[Filing]:
     """
     try:
         session = get_db_session()
-        filing = session.query(Filing).filter(Filing.accession_number == accession_number).first()
+        filing = (
+            session.query(Filing)
+            .options(*filing_lazy_load_options())
+            .filter(Filing.accession_number == accession_number)
+            .first()
+        )
         if filing:
             logger.info("retrieved_filing_by_accession_number",
                        filing_id=str(filing.id),
@@ -260,18 +280,34 @@ def get_filing_by_accession_number(accession_number: str) -> Optional[Filing]:
                     exc_info=True)
         raise
 
-def get_filings_by_company(company_id: Union[UUID, str]) -> List[Filing]:
+def _filter_filings(query, company_id: Union[UUID, str], form: Optional[str] = None,
+                    start_date: Optional[date] = None, end_date: Optional[date] = None):
+    query = query.filter(Filing.company_id == company_id)
+    if form:
+        query = query.filter(Filing.form == form)
+    if start_date:
+        query = query.filter(Filing.filing_date >= start_date)
+    if end_date:
+        query = query.filter(Filing.filing_date <= end_date)
+    return query
+
+
+def get_filings_by_company(company_id: Union[UUID, str], form: Optional[str] = None,
+                           start_date: Optional[date] = None, end_date: Optional[date] = None) -> List[Filing]:
     """Get all filings associated with a company.
 
     Args:
         company_id: UUID of the company
+        form: Only return filings of this form (10-K, 10-Q, etc.)
+        start_date: Only return filings filed on or after this date
+        end_date: Only return filings filed on or before this date
 
     Returns:
         List of Filing objects
     """
     try:
         session = get_db_session()
-        filings = session.query(Filing).filter(Filing.company_id == company_id).all()
+        filings = _filter_filings(session.query(Filing), company_id, form, start_date, end_date).all()
         logger.info("retrieved_filings_by_company",
                    count=len(filings))
         return filings
@@ -282,3 +318,37 @@ def get_filings_by_company(company_id: Union[UUID, str]) -> List[Filing]:
                     exc_info=True)
         raise
 
+
+def get_filings_page(company_id: Union[UUID, str], form: Optional[str] = None, start_date: Optional[date] = None,
+                     end_date: Optional[date] = None, cursor: Optional[str] = None, limit: int = 100) -> Page[Filing]:
+    """Get a page of a company's filings, newest first, using keyset pagination.
+
+    Args:
+        company_id: UUID of the company
+        form: Only return filings of this form (10-K, 10-Q, etc.)
+        start_date: Only return filings filed on or after this date
+        end_date: Only return filings filed on or before this date
+        cursor: Cursor from the previous page, or None for the first page
+        limit: Maximum number of filings to return
+
+    Returns:
+        Page of Filing objects
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    try:
+        session = get_db_session()
+        query = _filter_filings(session.query(Filing).options(*filing_lazy_load_options()),
+                                company_id, form, start_date, end_date)
+        page = paginate(query, Filing.id, cursor, limit, sort_column=Filing.filing_date, descending=True)
+
+        logger.info("retrieved_filings_page", company_id=str(company_id), form=form,
+                    count=len(page), has_more=page.next_cursor is not None)
+        return page
+    except Exception as e:
+        logger.error("get_filings_page_failed",
+                    company_id=str(company_id),
+                    error=str(e),
+                    exc_info=True)
+        raise
@@ -1,8 +1,8 @@
-from typing import Any, Dict, List, Optional, TYPE_CHECKING, Union
+from typing import Any, Dict, Iterable, List, Optional, TYPE_CHECKING, Union
 from uuid import UUID
 
-from sqlalchemy import String, Text
-from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy import func, literal_column, String, Text
+from sqlalchemy.dialects.postgresql import ARRAY, insert
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from src.database.base import Base, get_db_session
 from src.utils.logging import get_logger
@@ -257,3 +257,55 @@ def get_financial_concept_by_name(name: str) -> Optional[FinancialConcept]:
                     error=str(e),
                     exc_info=True)
         raise
+
+
+def bulk_find_or_create_financial_concepts(concepts: Iterable[Dict[str, Any]]) -> Dict[str, UUID]:
+    """Resolve many financial concepts by name in a single statement, creating missing ones.
+
+    Uses one multi-row INSERT ... ON CONFLICT (name) DO UPDATE ... RETURNING so that
+    both new and existing concepts are resolved in one round trip. Descriptions are only
+    overwritten when a new one is provided, and labels are merged without duplicates.
+
+    Args:
+        concepts: Iterable of dicts with 'name' and optional 'description' and 'labels'
+
+    Returns:
+        Dictionary mapping concept name to concept UUID
+    """
+    try:
+        session = get_db_session()
+
+        # Collapse duplicate names; ON CONFLICT cannot touch the same row twice in one statement
+        rows: Dict[str, Dict[str, Any]] = {}
+        for concept in concepts:
+            name = concept['name']
+            row = rows.setdefault(name, {'id': uuid7(), 'name': name, 'description': None, 'labels': []})
+            if concept.get('description') is not None:
+                row['description'] = concept['description']
+            for label in concept.get('labels') or []:
+                if label not in row['labels']:
+                    row['labels'].append(label)
+
+        if not rows:
+            return {}
+
+        stmt = insert(FinancialConcept).values(list(rows.values()))
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[FinancialConcept.name],
+            set_={
+                'description': func.coalesce(stmt.excluded.description, FinancialConcept.description),
+                'labels': literal_column(
+                    "ARRAY(SELECT DISTINCT unnest(financial_concepts.labels || excluded.labels))"
+                ),
+            },
+        ).returning(FinancialConcept.name, FinancialConcept.id)
+
+        concept_ids = {name: concept_id for name, concept_id in session.execute(stmt)}
+        session.commit()
+        logger.info("bulk_resolved_financial_concepts", count=len(concept_ids))
+        return concept_ids
+    except Exception as e:
+        session.rollback()
+        logger.error("bulk_find_or_create_financial_concepts_failed", error=str(e), exc_info=True)
+        raise
+
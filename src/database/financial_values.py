@@ -1,9 +1,10 @@
 from datetime import date
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 from uuid import UUID
 
-from sqlalchemy import Date, ForeignKey, Numeric
+from sqlalchemy import Date, ForeignKey, Numeric, UniqueConstraint
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from src.database.base import Base, get_db_session
 from src.utils.logging import get_logger
@@ -16,6 +17,10 @@ class FinancialValue(Base):
     """FinancialValue model representing financial data points for companies."""
 
     __tablename__ = "financial_values"
+    __table_args__ = (
+        UniqueConstraint("company_id", "concept_id", "value_date", "filing_id",
+                         name="uq_financial_values_company_concept_date_filing"),
+    )
 
     # Primary identifier
     id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid7)
@@ -281,3 +286,55 @@ def get_financial_values_by_company_and_date(company_id: UUID, value_date: date)
                     error=str(e),
                     exc_info=True)
         raise
+
+
+def bulk_upsert_financial_values(company_id: UUID, filing_id: UUID,
+                                 values: Iterable[Tuple[UUID, date, Decimal]]) -> int:
+    """Create or update many financial values for one filing in a single statement.
+
+    Issues one multi-row INSERT ... ON CONFLICT on
+    (company_id, concept_id, value_date, filing_id) and commits once.
+
+    Args:
+        company_id: UUID of the company
+        filing_id: UUID of the related filing
+        values: Iterable of (concept_id, value_date, value) tuples
+
+    Returns:
+        Number of financial values written
+    """
+    try:
+        session = get_db_session()
+
+        # Last value wins for duplicate keys; ON CONFLICT cannot touch the same row twice
+        rows: Dict[Tuple[UUID, date], Dict[str, Any]] = {}
+        for concept_id, value_date, value in values:
+            rows[(concept_id, value_date)] = {
+                'id': uuid7(),
+                'company_id': company_id,
+                'concept_id': concept_id,
+                'filing_id': filing_id,
+                'value_date': value_date,
+                'value': value,
+            }
+
+        if not rows:
+            return 0
+
+        stmt = insert(FinancialValue).values(list(rows.values()))
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_financial_values_company_concept_date_filing",
+            set_={'value': stmt.excluded.value},
+        )
+        session.execute(stmt)
+        session.commit()
+        logger.info("bulk_upserted_financial_values",
+                   company_id=str(company_id),
+                   filing_id=str(filing_id),
+                   count=len(rows))
+        return len(rows)
+    except Exception as e:
+        session.rollback()
+        logger.error("bulk_upsert_financial_values_failed", error=str(e), exc_info=True)
+        raise
+
@@ -2,21 +2,25 @@
 from datetime import datetime
 from enum import Enum
 import hashlib
-from typing import Any, Dict, List, Optional, TYPE_CHECKING, Union
+import re
+from typing import Any, Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING, Union
 from uuid import UUID
 
-from sqlalchemy import Column, DateTime, Float, ForeignKey, func, String, Table, Text
+from sqlalchemy import Column, Computed, DateTime, event, Float, ForeignKey, func, Index, String, Table, Text
 from sqlalchemy import Enum as SQLEnum
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import lazyload, Mapped, mapped_column, relationship, selectinload, undefer
+from sqlalchemy.orm.interfaces import ORMOption
 from src.database.base import Base, get_db_session
 from src.database.companies import Company
-from src.database.documents import DocumentType
+from src.database.content_hashes import AmbiguousHashError, get_by_content_hash
+from src.database.documents import Document, DocumentType, SEARCH_VECTOR_EXPRESSION
+from src.database.pagination import Page, paginate
 from src.utils.logging import get_logger
 from uuid_extensions import uuid7
 
 # Use TYPE_CHECKING to avoid circular imports
 if TYPE_CHECKING:
-    from src.database.documents import Document
     from src.database.model_configs import ModelConfig
     from src.database.prompts import Prompt
     from src.database.ratings import Rating
@@ -32,6 +36,33 @@ class ContentSourceType(str, Enum):
     BOTH = "both"
 
 
+class ContentKind(str, Enum):
+    """Stage of the summary pipeline that produced the content."""
+    SINGLE = "single"
+    AGGREGATE = "aggregate"
+    FRONTPAGE = "frontpage"
+
+
+# Descriptions written by the summary pipeline: {document_type}_{kind}_summary
+_SUMMARY_DESCRIPTION_PATTERN = re.compile(r"^(?P<document_type>\w+)_(?P<kind>single|aggregate|frontpage)_summary$")
+
+
+def parse_content_description(description: Optional[str]) -> Tuple[Optional[DocumentType], Optional[ContentKind]]:
+    """Get the document type and kind encoded in a summary description.
+
+    Args:
+        description: Description such as 'risk_factors_aggregate_summary'
+
+    Returns:
+        Tuple of (document type, kind); either is None if the description doesn't encode it
+    """
+    match = _SUMMARY_DESCRIPTION_PATTERN.match(description or "")
+    if not match:
+        return None, None
+    document_type = next((d for d in DocumentType if d.value == match.group("document_type")), None)
+    return document_type, ContentKind(match.group("kind"))
+
+
 # Association table for many-to-many relationship between GeneratedContent and Document
 generated_content_document_association = Table(
     "generated_content_document_association",
@@ -56,6 +87,12 @@ class GeneratedContent(Base):
     """GeneratedContent model representing AI-generated content from various sources."""
 
     __tablename__ = "generated_content"
+    __table_args__ = (
+        Index("ix_generated_content_search_vector", "search_vector", postgresql_using="gin"),
+        # Serves content hash prefix lookups (see src.database.content_hashes)
+        Index("ix_generated_content_content_hash_pattern", "content_hash",
+              postgresql_ops={"content_hash": "varchar_pattern_ops"}),
+    )
 
     # Primary identifier
     id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid7)
@@ -63,6 +100,9 @@ class GeneratedContent(Base):
     # Content hash for URL identification and verification
     content_hash: Mapped[Optional[str]] = mapped_column(String(64), index=True, unique=True)
 
+    # Hash of everything that went into the generation, used to skip repeated LLM calls
+    input_fingerprint: Mapped[Optional[str]] = mapped_column(String(64), index=True, nullable=True)
+
     # Company Foreign Key (optional, for company-specific content)
     company_id: Mapped[Optional[UUID]] = mapped_column(ForeignKey("companies.id", ondelete="CASCADE"), index=True)
     company: Mapped[Optional["Company"]] = relationship(
@@ -81,6 +121,12 @@ class GeneratedContent(Base):
         index=True
     )
 
+    # Summary pipeline stage, filled in from the description if not set
+    kind: Mapped[Optional[ContentKind]] = mapped_column(
+        SQLEnum(ContentKind, name="content_kind_enum"),
+        nullable=True
+    )
+
     # Form type (10-K, 10-Q, etc.) associated with source documents
     form_type: Mapped[Optional[str]] = mapped_column(String(10), nullable=True, index=True)
 
@@ -101,6 +147,11 @@ class GeneratedContent(Base):
     # The actual content of the generated content
     content: Mapped[Optional[str]] = mapped_column(Text, deferred=True)
 
+    # Full-text search vector, maintained by Postgres whenever content is written
+    search_vector: Mapped[Optional[str]] = mapped_column(
+        TSVECTOR, Computed(SEARCH_VECTOR_EXPRESSION, persisted=True), deferred=True
+    )
+
     # Generated summary of the content (optional)
     summary: Mapped[Optional[str]] = mapped_column(Text)
 
@@ -235,6 +286,7 @@ class GeneratedContent(Base):
             "company_id": str(self.company_id) if self.company_id else None,
             "document_type": self.description,
             "description": self.description,
+            "kind": self.kind.value if self.kind else None,
             "source_type": self.source_type.value,
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "total_duration": self.total_duration,
@@ -249,6 +301,40 @@ class GeneratedContent(Base):
         }
 
 
+# Serves latest-per-type lookups: the newest row for each (company, kind, document type)
+# is the first one in index order, with id breaking created_at ties
+Index("ix_generated_content_company_kind_type_created", GeneratedContent.company_id, GeneratedContent.kind,
+      GeneratedContent.document_type, GeneratedContent.created_at.desc(), GeneratedContent.id.desc())
+
+
+def content_response_load_options() -> Sequence[ORMOption]:
+    """Loader options for generated content serialized with to_dict.
+
+    Loads the content with the row, and the sources in one query per relationship
+    for the whole result. The model config and prompts, which to_dict only
+    references by id, are not selectin-loaded, for the content or its sources.
+    Built on use, like company_lazy_load_options.
+    """
+    def skip_inputs():
+        return (lazyload(GeneratedContent.model_config), lazyload(GeneratedContent.system_prompt),
+                lazyload(GeneratedContent.user_prompt))
+
+    return (
+        undefer(GeneratedContent.content),
+        *skip_inputs(),
+        selectinload(GeneratedContent.source_documents).options(lazyload(Document.filing), lazyload(Document.company)),
+        selectinload(GeneratedContent.source_content).options(*skip_inputs()),
+    )
+
+
+@event.listens_for(GeneratedContent, "before_insert")
+def _set_kind_from_description(mapper, connection, target):
+    if target.kind is None or target.document_type is None:
+        document_type, kind = parse_content_description(target.description)
+        target.kind = target.kind or kind
+        target.document_type = target.document_type or document_type
+
+
 def get_generated_content_ids() -> List[UUID]:
     """Get a list of all generated content IDs in the database.
 
@@ -276,7 +362,12 @@ def get_generated_content(content_id: Union[UUID, str]) -> Optional[GeneratedCon
     """
     try:
         session = get_db_session()
-        content = session.query(GeneratedContent).filter(GeneratedContent.id == content_id).first()
+        content = (
+            session.query(GeneratedContent)
+            .options(*content_response_load_options())
+            .filter(GeneratedContent.id == content_id)
+            .first()
+        )
         if content:
             logger.info("retrieved_generated_content", content_id=str(content_id))
         else:
@@ -299,20 +390,16 @@ def get_generated_content_by_hash(content_hash: str) -> Optional[GeneratedConten
     try:
         session = get_db_session()
 
-        # Try exact match first
-        content = session.query(GeneratedContent).filter(GeneratedContent.content_hash == content_hash).first()
-
-        # If no exact match and hash is short, try prefix match
-        if not content and len(content_hash) < 64:
-            content = session.query(GeneratedContent).filter(
-                GeneratedContent.content_hash.like(f"{content_hash}%")
-            ).first()
+        query = session.query(GeneratedContent).options(*content_response_load_options())
+        content = get_by_content_hash(query, GeneratedContent.content_hash, content_hash)
 
         if content:
             logger.info("retrieved_generated_content_by_hash", content_hash=content_hash)
         else:
             logger.warning("generated_content_not_found_by_hash", content_hash=content_hash)
         return content
+    except AmbiguousHashError:
+        raise
     except Exception as e:
         logger.error("get_generated_content_by_hash_failed", content_hash=content_hash, error=str(e), exc_info=True)
         raise
@@ -334,22 +421,20 @@ def get_generated_content_by_company_and_ticker(ticker: str, content_hash: str)
         # Join with company to filter by ticker
         query = (
             session.query(GeneratedContent)
+            .options(*content_response_load_options())
             .join(Company, GeneratedContent.company_id == Company.id)
             .filter(Company.ticker == ticker.upper())
         )
 
-        # Try exact hash match first
-        content = query.filter(GeneratedContent.content_hash == content_hash).first()
-
-        # If no exact match and hash is short, try prefix match
-        if not content and len(content_hash) < 64:
-            content = query.filter(GeneratedContent.content_hash.like(f"{content_hash}%")).first()
+        content = get_by_content_hash(query, GeneratedContent.content_hash, content_hash, scope=ticker.upper())
 
         if content:
             logger.info("retrieved_generated_content_by_ticker_and_hash", ticker=ticker, content_hash=content_hash)
         else:
             logger.warning("generated_content_not_found_by_ticker_and_hash", ticker=ticker, content_hash=content_hash)
         return content
+    except AmbiguousHashError:
+        raise
     except Exception as e:
         logger.error("get_generated_content_by_ticker_and_hash_failed",
                     ticker=ticker, content_hash=content_hash, error=str(e), exc_info=True)
@@ -369,27 +454,15 @@ def get_recent_generated_content_by_ticker(ticker: str, limit: int = 10) -> List
     try:
         session = get_db_session()
 
-        # Subquery to get the most recent content for each document type
-        subquery = (
-            session.query(
-                GeneratedContent.document_type,
-                func.max(GeneratedContent.created_at).label('latest_date')
-            )
-            .join(Company, GeneratedContent.company_id == Company.id)
-            .filter(Company.ticker == ticker.upper())
-            .filter(GeneratedContent.document_type.is_not(None))
-            .group_by(GeneratedContent.document_type)
-            .subquery()
-        )
-
-        # Main query to get the actual content records
+        # DISTINCT ON keeps the first row per document type, i.e. its most recent content
         content_list = (
             session.query(GeneratedContent)
+            .options(*content_response_load_options())
             .join(Company, GeneratedContent.company_id == Company.id)
-            .join(subquery,
-                  (GeneratedContent.document_type == subquery.c.document_type) &
-                  (GeneratedContent.created_at == subquery.c.latest_date))
             .filter(Company.ticker == ticker.upper())
+            .filter(GeneratedContent.document_type.is_not(None))
+            .distinct(GeneratedContent.document_type)
+            .order_by(GeneratedContent.document_type, GeneratedContent.created_at.desc(), GeneratedContent.id.desc())
             .limit(limit)
             .all()
         )
@@ -404,8 +477,7 @@ def get_recent_generated_content_by_ticker(ticker: str, limit: int = 10) -> List
 def get_aggregate_summaries_by_ticker(ticker: str, limit: int = 10) -> List[GeneratedContent]:
     """Get the most recent aggregate summary content for a company by ticker.
 
-    Filters to only include generated content whose description contains "aggregate_summary".
-    Returns only the most recent content for each description type to avoid duplicates.
+    Returns only the most recent aggregate summary for each document type to avoid duplicates.
 
     Args:
         ticker: Company ticker symbol
@@ -417,28 +489,16 @@ def get_aggregate_summaries_by_ticker(ticker: str, limit: int = 10) -> List[Gene
     try:
         session = get_db_session()
 
-        # Subquery to get the most recent content for each aggregate summary description type
-        subquery = (
-            session.query(
-                GeneratedContent.description,
-                func.max(GeneratedContent.created_at).label('latest_date')
-            )
-            .join(Company, GeneratedContent.company_id == Company.id)
-            .filter(Company.ticker == ticker.upper())
-            .filter(GeneratedContent.description.contains('aggregate_summary'))
-            .group_by(GeneratedContent.description)
-            .subquery()
-        )
-
-        # Main query to get the actual content records
+        # Walks ix_generated_content_company_kind_type_created in order; DISTINCT ON
+        # keeps the first, most recent, row per document type
         content_list = (
             session.query(GeneratedContent)
+            .options(*content_response_load_options())
             .join(Company, GeneratedContent.company_id == Company.id)
-            .join(subquery,
-                  (GeneratedContent.description == subquery.c.description) &
-                  (GeneratedContent.created_at == subquery.c.latest_date))
             .filter(Company.ticker == ticker.upper())
-            .filter(GeneratedContent.description.contains('aggregate_summary'))
+            .filter(GeneratedContent.kind == ContentKind.AGGREGATE)
+            .distinct(GeneratedContent.document_type)
+            .order_by(GeneratedContent.document_type, GeneratedContent.created_at.desc(), GeneratedContent.id.desc())
             .limit(limit)
             .all()
         )
@@ -450,6 +510,63 @@ def get_aggregate_summaries_by_ticker(ticker: str, limit: int = 10) -> List[Gene
         raise
 
 
+def compute_input_fingerprint(model_config_hash: str, system_prompt_hash: str, user_prompt_hash: str,
+                              source_document_hashes: Optional[List[str]] = None,
+                              source_content_hashes: Optional[List[str]] = None) -> str:
+    """Compute the fingerprint of a generation's inputs.
+
+    Two generations with the same fingerprint were produced from the same model
+    configuration, prompts and sources, so the second one can reuse the first result.
+
+    Args:
+        model_config_hash: Content hash of the model configuration
+        system_prompt_hash: Content hash of the system prompt
+        user_prompt_hash: Content hash of the user prompt
+        source_document_hashes: Content hashes of the source documents
+        source_content_hashes: Content hashes of the source generated content
+
+    Returns:
+        SHA256 hex digest of the inputs
+    """
+    parts = [
+        f"model_config:{model_config_hash or ''}",
+        f"system_prompt:{system_prompt_hash or ''}",
+        f"user_prompt:{user_prompt_hash or ''}",
+        f"documents:{','.join(sorted(h for h in source_document_hashes or [] if h))}",
+        f"content:{','.join(sorted(h for h in source_content_hashes or [] if h))}",
+    ]
+    return hashlib.sha256("\n".join(parts).encode('utf-8')).hexdigest()
+
+
+def get_generated_content_by_input_fingerprint(input_fingerprint: str) -> Optional[GeneratedContent]:
+    """Get the most recent content generated from inputs with the given fingerprint.
+
+    Args:
+        input_fingerprint: Fingerprint from compute_input_fingerprint
+
+    Returns:
+        GeneratedContent object if found, None otherwise
+    """
+    try:
+        session = get_db_session()
+
+        content = (
+            session.query(GeneratedContent)
+            .filter(GeneratedContent.input_fingerprint == input_fingerprint)
+            .order_by(GeneratedContent.created_at.desc())
+            .first()
+        )
+
+        if content:
+            logger.info("found_generated_content_by_input_fingerprint",
+                       content_id=str(content.id),
+                       hash=content.get_short_hash())
+        return content
+    except Exception as e:
+        logger.error("get_generated_content_by_input_fingerprint_failed", error=str(e), exc_info=True)
+        raise
+
+
 def create_generated_content(content_data: Dict[str, Any]) -> tuple[GeneratedContent, bool]:
     """Create new generated content.
 
@@ -477,6 +594,11 @@ def create_generated_content(content_data: Dict[str, Any]) -> tuple[GeneratedCon
                            content_id=str(existing_content.id),
                            description=existing_content.description,
                            content_hash=content_hash)
+                # Record the inputs that produced it, so the same job is memoized next time
+                input_fingerprint = content_data.get('input_fingerprint')
+                if input_fingerprint and not existing_content.input_fingerprint:
+                    existing_content.input_fingerprint = input_fingerprint
+                    session.commit()
                 return existing_content, False
 
         # Create new content if no duplicate found
@@ -647,6 +769,42 @@ def get_content_with_sources_loaded(content_id: Union[UUID, str]) -> Optional[Ge
         raise
 
 
+def get_frontpage_summaries_by_company_ids(company_ids: List[UUID]) -> Dict[UUID, str]:
+    """Get the most recent frontpage summary content for several companies in one query.
+
+    Args:
+        company_ids: IDs of the companies
+
+    Returns:
+        Dictionary mapping company ID to summary content, for companies that have one
+    """
+    if not company_ids:
+        return {}
+
+    try:
+        session = get_db_session()
+
+        # DISTINCT ON keeps the first row per company, i.e. its most recent summary
+        rows = (
+            session.query(GeneratedContent.company_id, GeneratedContent.content)
+            .filter(GeneratedContent.company_id.in_(set(company_ids)))
+            .filter(GeneratedContent.kind == ContentKind.FRONTPAGE)
+            .filter(GeneratedContent.document_type == DocumentType.DESCRIPTION)
+            .distinct(GeneratedContent.company_id)
+            .order_by(GeneratedContent.company_id, GeneratedContent.created_at.desc(), GeneratedContent.id.desc())
+            .all()
+        )
+
+        summaries = {company_id: content for company_id, content in rows if content}
+        logger.debug("retrieved_frontpage_summaries_by_company_ids",
+                     requested=len(company_ids), found=len(summaries))
+        return summaries
+
+    except Exception as e:
+        logger.error("get_frontpage_summaries_by_company_ids_failed", error=str(e), exc_info=True)
+        raise
+
+
 def get_frontpage_summary_by_ticker(ticker: str) -> Optional[str]:
     """Get the most recent frontpage summary content for a company by ticker.
 
@@ -664,8 +822,9 @@ def get_frontpage_summary_by_ticker(ticker: str) -> Optional[str]:
             session.query(GeneratedContent)
             .join(Company, GeneratedContent.company_id == Company.id)
             .filter(Company.ticker == ticker.upper())
-            .filter(GeneratedContent.description == 'business_description_frontpage_summary')
-            .order_by(GeneratedContent.created_at.desc())
+            .filter(GeneratedContent.kind == ContentKind.FRONTPAGE)
+            .filter(GeneratedContent.document_type == DocumentType.DESCRIPTION)
+            .order_by(GeneratedContent.created_at.desc(), GeneratedContent.id.desc())
             .first()
         )
 
@@ -679,3 +838,39 @@ def get_frontpage_summary_by_ticker(ticker: str) -> Optional[str]:
     except Exception as e:
         logger.error("get_frontpage_summary_by_ticker_failed", ticker=ticker, error=str(e), exc_info=True)
         raise
+
+
+def get_generated_content_page(ticker: Optional[str] = None, description: Optional[str] = None,
+                               document_type: Optional[DocumentType] = None, cursor: Optional[str] = None,
+                               limit: int = 50) -> Page[GeneratedContent]:
+    """Get a page of generated content, newest first, using keyset pagination.
+
+    Args:
+        ticker: Only return content for this company
+        description: Only return content whose description contains this text
+        document_type: Only return content generated from this document type
+        cursor: Cursor from the previous page, or None for the first page
+        limit: Maximum number of items to return
+
+    Returns:
+        Page of GeneratedContent objects
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    try:
+        session = get_db_session()
+        query = session.query(GeneratedContent)
+        if ticker:
+            query = query.join(Company, GeneratedContent.company_id == Company.id).filter(Company.ticker == ticker.upper())
+        if description:
+            query = query.filter(GeneratedContent.description.ilike(f"%{description}%"))
+        if document_type:
+            query = query.filter(GeneratedContent.document_type == document_type)
+        page = paginate(query, GeneratedContent.id, cursor, limit, descending=True)
+
+        logger.info("retrieved_generated_content_page", ticker=ticker, description=description, count=len(page))
+        return page
+    except Exception as e:
+        logger.error("get_generated_content_page_failed", ticker=ticker, error=str(e), exc_info=True)
+        raise
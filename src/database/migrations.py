@@ -0,0 +1,275 @@
+"""Versioned schema migrations.
+
+The applied schema version is recorded in the schema_version table, one row per
+applied migration. init_db only compares it with LATEST_SCHEMA_VERSION (one
+query), instead of introspecting the catalog with create_all on every start;
+pending migrations are applied explicitly with `symbology db migrate`, or
+`python -m src.database.migrations` where the CLI isn't installed.
+
+Migration 1 creates any missing tables from the models, so an empty database is
+brought to the latest schema by running every migration. Later migrations use
+IF NOT EXISTS guards, so they are no-ops for the tables migration 1 just created
+and add the missing columns, constraints and indexes to databases created by
+earlier versions.
+
+To change the schema, update the model and append a Migration with the next
+version number that makes the same change to existing databases.
+"""
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable, List, Optional
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, select, String, Table, text, update
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import ProgrammingError
+from src.database.base import Base
+from src.database.companies import Company  # noqa: F401
+from src.database.documents import DocumentType, SEARCH_VECTOR_EXPRESSION
+from src.database.financial_concepts import FinancialConcept  # noqa: F401
+from src.database.financial_values import FinancialValue  # noqa: F401
+from src.database.generated_content import ContentKind, GeneratedContent
+from src.database.model_configs import ModelConfig  # noqa: F401
+from src.database.prompts import Prompt  # noqa: F401
+from src.database.ratings import Rating  # noqa: F401
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Kept out of Base.metadata, so create_all and the models never touch it
+schema_version_table = Table(
+    "schema_version",
+    MetaData(),
+    Column("version", Integer, primary_key=True),
+    Column("description", String(255), nullable=False),
+    Column("applied_at", DateTime(timezone=True), nullable=False),
+)
+
+# Serializes concurrent `db migrate` runs, e.g. from several deploy jobs
+_MIGRATION_LOCK_ID = 7_250_025
+
+
+class SchemaVersionError(RuntimeError):
+    """Raised when the database schema is older than the code expects."""
+
+
+@dataclass(frozen=True)
+class Migration:
+    """A schema change, applied in one transaction."""
+    version: int
+    description: str
+    apply: Callable[[Connection], None]
+
+
+def _execute(*statements: str) -> Callable[[Connection], None]:
+    def apply(connection: Connection) -> None:
+        for statement in statements:
+            connection.execute(text(statement))
+    return apply
+
+
+def _create_tables(connection: Connection) -> None:
+    Base.metadata.create_all(bind=connection)
+
+
+def _add_financial_values_unique_constraint(connection: Connection) -> None:
+    # Keep the newest (uuid7) row of any duplicates, which the bulk upsert would have overwritten
+    connection.execute(text("""
+        DELETE FROM financial_values a
+        USING financial_values b
+        WHERE a.company_id = b.company_id
+          AND a.concept_id = b.concept_id
+          AND a.value_date = b.value_date
+          AND a.filing_id = b.filing_id
+          AND a.id < b.id
+    """))
+    connection.execute(text("""
+        DO $$
+        BEGIN
+            ALTER TABLE financial_values ADD CONSTRAINT uq_financial_values_company_concept_date_filing
+                UNIQUE (company_id, concept_id, value_date, filing_id);
+        EXCEPTION WHEN duplicate_object OR duplicate_table THEN NULL;
+        END $$
+    """))
+
+
+def _backfill_content_kind(connection: Connection) -> None:
+    # Summary descriptions are {document_type}_{kind}_summary, see parse_content_description
+    table = GeneratedContent.__table__
+    for kind in ContentKind:
+        connection.execute(
+            update(table)
+            .where(table.c.kind.is_(None), table.c.description.regexp_match(f"^\\w+_{kind.value}_summary$"))
+            .values(kind=kind)
+        )
+        for document_type in DocumentType:
+            connection.execute(
+                update(table)
+                .where(table.c.document_type.is_(None),
+                       table.c.description == f"{document_type.value}_{kind.value}_summary")
+                .values(document_type=document_type)
+            )
+
+
+def _add_content_kind(connection: Connection) -> None:
+    labels = ", ".join(f"'{kind.name}'" for kind in ContentKind)
+    _execute(
+        f"""
+        DO $$
+        BEGIN
+            CREATE TYPE content_kind_enum AS ENUM ({labels});
+        EXCEPTION WHEN duplicate_object THEN NULL;
+        END $$
+        """,
+        "ALTER TABLE generated_content ADD COLUMN IF NOT EXISTS kind content_kind_enum",
+    )(connection)
+    _backfill_content_kind(connection)
+    connection.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_generated_content_company_kind_type_created "
+        "ON generated_content (company_id, kind, document_type, created_at DESC, id DESC)"
+    ))
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(1, "Create tables", _create_tables),
+    Migration(2, "Unique financial values per company, concept, date and filing",
+              _add_financial_values_unique_constraint),
+    Migration(3, "Generated content input fingerprints", _execute(
+        "ALTER TABLE generated_content ADD COLUMN IF NOT EXISTS input_fingerprint VARCHAR(64)",
+        "CREATE INDEX IF NOT EXISTS ix_generated_content_input_fingerprint ON generated_content (input_fingerprint)",
+    )),
+    Migration(4, "Company search indexes", _execute(
+        "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+        "CREATE INDEX IF NOT EXISTS ix_companies_ticker_pattern ON companies (ticker varchar_pattern_ops)",
+        "CREATE INDEX IF NOT EXISTS ix_companies_name_lower_pattern ON companies (lower(name) text_pattern_ops)",
+        "CREATE INDEX IF NOT EXISTS ix_companies_name_trgm ON companies USING gin (name gin_trgm_ops)",
+    )),
+    Migration(5, "Full-text search vectors", _execute(
+        "ALTER TABLE documents ADD COLUMN IF NOT EXISTS search_vector tsvector "
+        f"GENERATED ALWAYS AS ({SEARCH_VECTOR_EXPRESSION}) STORED",
+        "CREATE INDEX IF NOT EXISTS ix_documents_search_vector ON documents USING gin (search_vector)",
+        "ALTER TABLE generated_content ADD COLUMN IF NOT EXISTS search_vector tsvector "
+        f"GENERATED ALWAYS AS ({SEARCH_VECTOR_EXPRESSION}) STORED",
+        "CREATE INDEX IF NOT EXISTS ix_generated_content_search_vector ON generated_content USING gin (search_vector)",
+    )),
+    Migration(6, "Content hash prefix indexes", _execute(*(
+        f"CREATE INDEX IF NOT EXISTS ix_{table}_content_hash_pattern ON {table} (content_hash varchar_pattern_ops)"
+        for table in ("documents", "generated_content", "prompts", "model_configs")
+    ))),
+    Migration(7, "Generated content kind", _add_content_kind),
+    Migration(8, "User prompt recipes", _execute(
+        "ALTER TABLE prompts ALTER COLUMN content DROP NOT NULL",
+        "ALTER TABLE prompts ADD COLUMN IF NOT EXISTS template_version INTEGER",
+        "ALTER TABLE prompts ADD COLUMN IF NOT EXISTS source_document_ids UUID[]",
+        "ALTER TABLE prompts ADD COLUMN IF NOT EXISTS source_content_ids UUID[]",
+        "ALTER TABLE prompts ADD COLUMN IF NOT EXISTS additional_text TEXT",
+    )),
+]
+
+LATEST_SCHEMA_VERSION = MIGRATIONS[-1].version
+
+
+def get_schema_version(connection: Connection) -> Optional[int]:
+    """Get the database's schema version.
+
+    Returns:
+        The latest applied migration version, 0 if none are, or None if the
+        schema_version table does not exist
+    """
+    try:
+        with connection.begin_nested():
+            return connection.execute(select(schema_version_table.c.version)
+                                      .order_by(schema_version_table.c.version.desc())
+                                      .limit(1)).scalar() or 0
+    except ProgrammingError:
+        return None
+
+
+def pending_migrations(connection: Connection) -> List[Migration]:
+    """Migrations newer than the database's schema version, in order."""
+    version = get_schema_version(connection) or 0
+    return [migration for migration in MIGRATIONS if migration.version > version]
+
+
+def verify_schema_version(engine: Engine) -> int:
+    """Check the database schema is at least as new as the code.
+
+    Returns:
+        The database's schema version
+
+    Raises:
+        SchemaVersionError: If migrations are pending
+    """
+    with engine.connect() as connection:
+        version = get_schema_version(connection)
+
+    if version is None or version < LATEST_SCHEMA_VERSION:
+        raise SchemaVersionError(
+            f"Database schema is at version {version or 0}, expected {LATEST_SCHEMA_VERSION}. "
+            "Run `symbology db migrate` to apply pending migrations."
+        )
+    if version > LATEST_SCHEMA_VERSION:
+        # Migrations are additive, so older code can keep running during a rollout
+        logger.warning("database_schema_newer_than_code", version=version, expected=LATEST_SCHEMA_VERSION)
+    return version
+
+
+def migrate(engine: Engine, dry_run: bool = False) -> List[Migration]:
+    """Apply pending migrations, each in its own transaction.
+
+    Args:
+        engine: Engine connected to the database to migrate
+        dry_run: Only report the pending migrations
+
+    Returns:
+        The migrations that were applied (or would be, for a dry run)
+    """
+    with engine.connect() as connection:
+        pending = pending_migrations(connection)
+    if dry_run:
+        return pending
+
+    with engine.begin() as connection:
+        schema_version_table.create(bind=connection, checkfirst=True)
+
+    applied = []
+    for migration in pending:
+        with engine.begin() as connection:
+            connection.execute(text("SELECT pg_advisory_xact_lock(:lock_id)"), {"lock_id": _MIGRATION_LOCK_ID})
+            # Another process may have applied it while this one waited for the lock
+            if (get_schema_version(connection) or 0) >= migration.version:
+                continue
+
+            logger.info("applying_migration", version=migration.version, description=migration.description)
+            migration.apply(connection)
+            connection.execute(schema_version_table.insert().values(
+                version=migration.version,
+                description=migration.description,
+                applied_at=datetime.now(timezone.utc),
+            ))
+        applied.append(migration)
+        logger.info("applied_migration", version=migration.version, description=migration.description)
+
+    return applied
+
+
+def main():
+    """Apply migrations without the CLI, which the API image doesn't install."""
+    import argparse
+    from sqlalchemy import create_engine
+    from src.utils.config import settings
+
+    parser = argparse.ArgumentParser(description="Apply pending database schema migrations")
+    parser.add_argument("--dry-run", action="store_true", help="List pending migrations without applying them")
+    args = parser.parse_args()
+
+    engine = create_engine(settings.database.url)
+    try:
+        for migration in migrate(engine, dry_run=args.dry_run):
+            print(f"{'Would apply' if args.dry_run else 'Applied'} migration {migration.version}: "
+                  f"{migration.description}")
+    finally:
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
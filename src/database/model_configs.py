@@ -5,10 +5,11 @@ import json
 from typing import Any, Dict, List, Optional, Union
 from uuid import UUID
 
-from sqlalchemy import DateTime, String, Text
+from sqlalchemy import DateTime, Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 from src.database.base import Base, get_db_session
+from src.database.content_hashes import AmbiguousHashError, get_by_content_hash
 from src.utils.logging import get_logger
 from uuid_extensions import uuid7
 
@@ -34,6 +35,12 @@ class ModelConfig(Base):
     options_json: Mapped[str] = mapped_column(Text, nullable=False)
     content_hash: Mapped[Optional[str]] = mapped_column(String(64), index=True)
 
+    __table_args__ = (
+        # Serves content hash prefix lookups (see src.database.content_hashes)
+        Index("ix_model_configs_content_hash_pattern", "content_hash",
+              postgresql_ops={"content_hash": "varchar_pattern_ops"}),
+    )
+
     def __repr__(self) -> str:
         return f"<ModelConfig(id={self.id}, name='{self.model}')>"
 
@@ -337,20 +344,15 @@ def get_model_config_by_content_hash(content_hash: str) -> Optional[ModelConfig]
     try:
         session = get_db_session()
 
-        # Try exact match first
-        document = session.query(ModelConfig).filter(ModelConfig.content_hash == content_hash).first()
-
-        # If no exact match and hash is short, try prefix match
-        if not document and len(content_hash) < 64:
-            document = session.query(ModelConfig).filter(
-                ModelConfig.content_hash.like(f"{content_hash}%")
-            ).first()
+        document = get_by_content_hash(session.query(ModelConfig), ModelConfig.content_hash, content_hash)
 
         if document:
             logger.info("retrieved_document_by_content_hash", content_hash=content_hash)
         else:
             logger.warning("document_not_found_by_content_hash", content_hash=content_hash)
         return document
+    except AmbiguousHashError:
+        raise
     except Exception as e:
         logger.error("get_document_by_content_hash_failed", content_hash=content_hash, error=str(e), exc_info=True)
         raise
\ No newline at end of file
@@ -0,0 +1,117 @@
+"""Keyset (cursor) pagination for list queries.
+
+Pages are fetched with `WHERE (sort_key, id) > (last_sort_key, last_id) ORDER BY
+sort_key, id LIMIT n` instead of OFFSET, so a deep page costs the same as the
+first one and rows inserted between requests don't shift pages. Primary keys are
+uuid7, which are time ordered, so ordering by id alone lists rows oldest (or,
+descending, newest) first.
+
+Cursors are opaque url-safe strings encoding the sort key and id of the last row
+of a page.
+"""
+import base64
+from dataclasses import dataclass, field
+from datetime import date, datetime
+import json
+from typing import Any, Generic, List, Optional, TypeVar
+from uuid import UUID
+
+from sqlalchemy import Date, DateTime, tuple_
+from sqlalchemy.orm import Query
+
+T = TypeVar("T")
+
+# Upper bound on page sizes accepted by list functions
+MAX_PAGE_SIZE = 500
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+@dataclass
+class Page(Generic[T]):
+    """A page of results and the cursor for the next page (None on the last page)."""
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+
+def encode_cursor(row_id: UUID, sort_value: Any = None) -> str:
+    """Encode the position after a row as a cursor."""
+    if isinstance(sort_value, (date, datetime)):
+        sort_value = sort_value.isoformat()
+    payload = json.dumps([str(row_id), sort_value], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_column=None) -> tuple[UUID, Any]:
+    """
+    Decode a cursor into the id and sort value of the row it points after.
+
+    Args:
+        cursor: Cursor from a previous page
+        sort_column: Column the cursor's sort value belongs to, used to restore dates
+
+    Returns:
+        Tuple of (row id, sort value)
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        row_id, sort_value = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        row_id = UUID(row_id)
+        if sort_value is not None and sort_column is not None:
+            if isinstance(sort_column.type, DateTime):
+                sort_value = datetime.fromisoformat(sort_value)
+            elif isinstance(sort_column.type, Date):
+                sort_value = date.fromisoformat(sort_value)
+        return row_id, sort_value
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor}") from e
+
+
+def paginate(query: Query, id_column, cursor: Optional[str] = None, limit: int = 50,
+             sort_column=None, descending: bool = False) -> Page:
+    """
+    Fetch one page of a query with keyset pagination.
+
+    Args:
+        query: Query with filters applied but no ordering, limit or offset
+        id_column: Primary key column, used as the (tie-breaking) sort key
+        cursor: Cursor from the previous page, or None for the first page
+        limit: Maximum number of rows in the page
+        sort_column: Optional non-null column to sort by before id, e.g. a name or date
+        descending: Sort from largest to smallest
+
+    Returns:
+        Page of rows, with a cursor if more rows follow
+    """
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    keys = [id_column] if sort_column is None else [sort_column, id_column]
+
+    if cursor:
+        row_id, sort_value = decode_cursor(cursor, sort_column)
+        position = [row_id] if sort_column is None else [sort_value, row_id]
+        key, after = (keys[0], position[0]) if len(keys) == 1 else (tuple_(*keys), tuple_(*position))
+        query = query.filter(key < after if descending else key > after)
+
+    order = [column.desc() if descending else column.asc() for column in keys]
+    rows = query.order_by(*order).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(
+            getattr(last, id_column.key),
+            getattr(last, sort_column.key) if sort_column is not None else None,
+        )
+    return Page(items=rows, next_cursor=next_cursor)
@@ -1,11 +1,14 @@
 import enum
 import hashlib
-from typing import Any, Dict, List, Optional, TYPE_CHECKING, Union
+import json
+from typing import Any, Dict, List, Optional, Sequence, TYPE_CHECKING, Union
 from uuid import UUID
 
-from sqlalchemy import Enum, String, Text
+from sqlalchemy import Enum, Index, Integer, String, Text, Uuid
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import Mapped, mapped_column
 from src.database.base import Base, get_db_session
+from src.database.content_hashes import AmbiguousHashError, get_by_content_hash
 from src.utils.logging import get_logger
 from uuid_extensions import uuid7
 
@@ -35,9 +38,22 @@ class Prompt(Base):
     description: Mapped[Optional[str]] = mapped_column(Text)
 
     role: Mapped[PromptRole] = mapped_column(Enum(PromptRole), index=False)
-    content: Mapped[str] = mapped_column(Text)
+    # Null for user prompts stored as a recipe, which are rendered on demand
+    content: Mapped[Optional[str]] = mapped_column(Text)
     content_hash: Mapped[Optional[str]] = mapped_column(String(64), index=True, unique=True)
 
+    # User prompt recipe: the sources and template version the prompt is rendered from
+    template_version: Mapped[Optional[int]] = mapped_column(Integer)
+    source_document_ids: Mapped[Optional[List[UUID]]] = mapped_column(ARRAY(Uuid))
+    source_content_ids: Mapped[Optional[List[UUID]]] = mapped_column(ARRAY(Uuid))
+    additional_text: Mapped[Optional[str]] = mapped_column(Text)
+
+    __table_args__ = (
+        # Serves content hash prefix lookups (see src.database.content_hashes)
+        Index("ix_prompts_content_hash_pattern", "content_hash",
+              postgresql_ops={"content_hash": "varchar_pattern_ops"}),
+    )
+
 
     def __repr__(self) -> str:
         return f"<Prompt(id={self.id}, desc='{self.description}', role={self.role})>"
@@ -70,6 +86,37 @@ class Prompt(Base):
         """Update the content hash based on current content."""
         self.content_hash = self.generate_content_hash()
 
+    @property
+    def is_recipe(self) -> bool:
+        """Whether the prompt is stored as a recipe rather than as materialized text."""
+        return self.template_version is not None and self.content is None
+
+
+def compute_recipe_hash(template_version: int, source_documents: Sequence[Any], source_content: Sequence[Any],
+                        additional_text: Optional[str] = None) -> str:
+    """Compute the content hash of a user prompt recipe.
+
+    The hash covers the content hashes of the sources, so a recipe whose sources have
+    changed gets a new hash even though its source ids are the same.
+
+    Args:
+        template_version: Version of the user prompt template
+        source_documents: Source documents, in prompt order
+        source_content: Source generated content, in prompt order
+        additional_text: Additional text appended to the prompt
+
+    Returns:
+        SHA256 hex digest of the recipe
+    """
+    recipe = {
+        "template_version": template_version,
+        "source_documents": [[str(doc.id), doc.content_hash] for doc in source_documents],
+        "source_content": [[str(content.id), content.content_hash] for content in source_content],
+        "additional_text": additional_text or None,
+    }
+    return hashlib.sha256(json.dumps(recipe, sort_keys=True).encode('utf-8')).hexdigest()
+
+
 def get_prompt_ids() -> List[UUID]:
     """Get a list of all prompt IDs in the database.
 
@@ -155,6 +202,56 @@ def create_prompt(prompt_data: Dict[str, Any]) -> tuple[Prompt, bool]:
         raise
 
 
+def create_user_prompt(name: str, template_version: int, source_documents: Sequence[Any],
+                       source_content: Sequence[Any], additional_text: Optional[str] = None,
+                       description: Optional[str] = None) -> tuple[Prompt, bool]:
+    """Create a user prompt stored as a recipe instead of its rendered text.
+
+    Args:
+        name: Name of the prompt
+        template_version: Version of the user prompt template used to render it
+        source_documents: Source documents, in prompt order
+        source_content: Source generated content, in prompt order
+        additional_text: Additional text appended to the prompt
+        description: Description of the prompt
+
+    Returns:
+        Tuple of (Prompt object, was_created: bool).
+        was_created is True if a new prompt was created, False if an identical recipe existed.
+    """
+    try:
+        session = get_db_session()
+        content_hash = compute_recipe_hash(template_version, source_documents, source_content, additional_text)
+
+        existing_prompt = session.query(Prompt).filter(Prompt.content_hash == content_hash).first()
+        if existing_prompt:
+            logger.info("found_existing_prompt_with_same_content",
+                       prompt_id=str(existing_prompt.id),
+                       name=existing_prompt.name,
+                       content_hash=content_hash)
+            return existing_prompt, False
+
+        prompt = Prompt(
+            name=name,
+            description=description,
+            role=PromptRole.USER,
+            content=None,
+            content_hash=content_hash,
+            template_version=template_version,
+            source_document_ids=[doc.id for doc in source_documents],
+            source_content_ids=[content.id for content in source_content],
+            additional_text=additional_text or None,
+        )
+        session.add(prompt)
+        session.commit()
+        logger.info("created_user_prompt", prompt_id=str(prompt.id), name=prompt.name, content_hash=content_hash)
+        return prompt, True
+    except Exception as e:
+        session.rollback()
+        logger.error("create_user_prompt_failed", error=str(e), exc_info=True)
+        raise
+
+
 def delete_prompt(prompt_id: Union[UUID, str]) -> bool:
     """Delete a prompt from the database.
 
@@ -194,20 +291,15 @@ def get_prompt_by_content_hash(content_hash: str) -> Optional[Prompt]:
     try:
         session = get_db_session()
 
-        # Try exact match first
-        document = session.query(Prompt).filter(Prompt.content_hash == content_hash).first()
-
-        # If no exact match and hash is short, try prefix match
-        if not document and len(content_hash) < 64:
-            document = session.query(Prompt).filter(
-                Prompt.content_hash.like(f"{content_hash}%")
-            ).first()
+        document = get_by_content_hash(session.query(Prompt), Prompt.content_hash, content_hash)
 
         if document:
             logger.info("retrieved_document_by_content_hash", content_hash=content_hash)
         else:
             logger.warning("document_not_found_by_content_hash", content_hash=content_hash)
         return document
+    except AmbiguousHashError:
+        raise
     except Exception as e:
         logger.error("get_document_by_content_hash_failed", content_hash=content_hash, error=str(e), exc_info=True)
         raise
\ No newline at end of file
@@ -0,0 +1,149 @@
+"""Full-text search over document and generated content bodies.
+
+Both tables carry a generated `search_vector` tsvector column with a GIN index,
+so matching is index-backed. Queries are ranked and paged first, and highlighted
+snippets are only computed for the rows in the returned page, since ts_headline
+re-parses the full text.
+"""
+from datetime import date
+from typing import List, Optional
+
+from sqlalchemy import func, Row, select
+from src.database.base import get_db_session
+from src.database.companies import Company
+from src.database.documents import Document, DocumentType, SEARCH_CONFIG
+from src.database.filings import Filing
+from src.database.generated_content import GeneratedContent
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Options for ts_headline snippets; matches are wrapped in <mark> tags
+HEADLINE_OPTIONS = "MaxFragments=3, MaxWords=35, MinWords=15, FragmentDelimiter=\" ... \", StartSel=<mark>, StopSel=</mark>"
+
+
+def _ts_query(query: str):
+    # websearch syntax supports "quoted phrases", OR and -exclusions, and never raises on user input
+    return func.websearch_to_tsquery(SEARCH_CONFIG, query)
+
+
+def search_documents(query: str, ticker: Optional[str] = None, form: Optional[str] = None,
+                     document_type: Optional[DocumentType] = None, period_start: Optional[date] = None,
+                     period_end: Optional[date] = None, limit: int = 20, offset: int = 0) -> List[Row]:
+    """Search document bodies, ranked by relevance.
+
+    Args:
+        query: Web-search style query, e.g. 'tariff exposure' or '"supply chain" -covid'
+        ticker: Only search documents of this company
+        form: Only search documents from filings of this form (10-K, 10-Q, etc.)
+        document_type: Only search documents of this type
+        period_start: Only search filings with a period of report on or after this date
+        period_end: Only search filings with a period of report on or before this date
+        limit: Maximum number of results to return
+        offset: Number of results to skip
+
+    Returns:
+        Rows with id, title, document_type, content_hash, ticker, form, accession_number,
+        period_of_report, rank and snippet
+    """
+    try:
+        session = get_db_session()
+        ts_query = _ts_query(query)
+        rank = func.ts_rank_cd(Document.search_vector, ts_query)
+
+        page = (
+            select(Document.id.label("id"), rank.label("rank"))
+            .outerjoin(Filing, Document.filing_id == Filing.id)
+            .join(Company, Document.company_id == Company.id)
+            .where(Document.search_vector.op("@@")(ts_query))
+        )
+        if ticker:
+            page = page.where(Company.ticker == ticker.upper())
+        if form:
+            page = page.where(Filing.form == form)
+        if document_type:
+            page = page.where(Document.document_type == document_type)
+        if period_start:
+            page = page.where(Filing.period_of_report >= period_start)
+        if period_end:
+            page = page.where(Filing.period_of_report <= period_end)
+        page = page.order_by(rank.desc(), Document.id).limit(limit).offset(offset).subquery()
+
+        results = session.execute(
+            select(
+                Document.id,
+                Document.title,
+                Document.document_type,
+                Document.content_hash,
+                Company.ticker,
+                Filing.form,
+                Filing.accession_number,
+                Filing.period_of_report,
+                page.c.rank,
+                func.ts_headline(SEARCH_CONFIG, Document.content, ts_query, HEADLINE_OPTIONS).label("snippet"),
+            )
+            .join(page, Document.id == page.c.id)
+            .outerjoin(Filing, Document.filing_id == Filing.id)
+            .join(Company, Document.company_id == Company.id)
+            .order_by(page.c.rank.desc(), Document.id)
+        ).all()
+
+        logger.info("search_documents", query=query, ticker=ticker, form=form,
+                    document_type=document_type.value if document_type else None, result_count=len(results))
+        return results
+    except Exception as e:
+        logger.error("search_documents_failed", query=query, error=str(e), exc_info=True)
+        raise
+
+
+def search_generated_content(query: str, ticker: Optional[str] = None, description: Optional[str] = None,
+                             limit: int = 20, offset: int = 0) -> List[Row]:
+    """Search generated content bodies, ranked by relevance.
+
+    Args:
+        query: Web-search style query
+        ticker: Only search content generated for this company
+        description: Only search content with this description, e.g. 'risk_factors_aggregate_summary'
+        limit: Maximum number of results to return
+        offset: Number of results to skip
+
+    Returns:
+        Rows with id, description, content_hash, created_at, ticker, rank and snippet
+    """
+    try:
+        session = get_db_session()
+        ts_query = _ts_query(query)
+        rank = func.ts_rank_cd(GeneratedContent.search_vector, ts_query)
+
+        page = (
+            select(GeneratedContent.id.label("id"), rank.label("rank"))
+            .outerjoin(Company, GeneratedContent.company_id == Company.id)
+            .where(GeneratedContent.search_vector.op("@@")(ts_query))
+        )
+        if ticker:
+            page = page.where(Company.ticker == ticker.upper())
+        if description:
+            page = page.where(GeneratedContent.description == description)
+        page = page.order_by(rank.desc(), GeneratedContent.id).limit(limit).offset(offset).subquery()
+
+        results = session.execute(
+            select(
+                GeneratedContent.id,
+                GeneratedContent.description,
+                GeneratedContent.content_hash,
+                GeneratedContent.created_at,
+                Company.ticker,
+                page.c.rank,
+                func.ts_headline(SEARCH_CONFIG, GeneratedContent.content, ts_query, HEADLINE_OPTIONS).label("snippet"),
+            )
+            .join(page, GeneratedContent.id == page.c.id)
+            .outerjoin(Company, GeneratedContent.company_id == Company.id)
+            .order_by(page.c.rank.desc(), GeneratedContent.id)
+        ).all()
+
+        logger.info("search_generated_content", query=query, ticker=ticker, description=description,
+                    result_count=len(results))
+        return results
+    except Exception as e:
+        logger.error("search_generated_content_failed", query=query, error=str(e), exc_info=True)
+        raise
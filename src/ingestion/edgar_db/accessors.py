@@ -1,6 +1,8 @@
+from collections import OrderedDict
 from datetime import datetime
 from enum import Enum
-from typing import Callable, Dict, List, Optional
+import threading
+from typing import Any, Callable, Dict, List, Optional
 
 from edgar import Filing, set_identity
 from src.database.documents import DocumentType
@@ -23,6 +25,88 @@ def edgar_login(edgar_contact: str) -> None:
     set_identity(edgar_contact)
 
 
+class FilingObjectCache:
+    """Bounded LRU cache of parsed filing objects, keyed by accession number.
+
+    Parsing a filing with ``filing.obj()`` is expensive, and extracting every
+    section of a 10-K would otherwise parse the same document once per section.
+    The cache is shared between ingestion threads, so access is guarded by a lock.
+    """
+
+    def __init__(self, maxsize: int = 8):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of parsed filings to keep (0 disables caching)
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, filing: Filing) -> Any:
+        """Return the parsed object for a filing, parsing it on a cache miss."""
+        key = filing.accession_number
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        # Parse outside the lock so other filings aren't blocked behind a slow parse
+        filing_obj = filing.obj()
+        logger.debug("parsed_filing_object", accession_number=key)
+
+        if self.maxsize > 0:
+            with self._lock:
+                self._entries[key] = filing_obj
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        return filing_obj
+
+    def clear(self) -> None:
+        """Drop all cached filing objects and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and current size."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._entries), "maxsize": self.maxsize}
+
+
+_filing_object_cache = FilingObjectCache()
+
+
+def get_filing_object(filing: Filing) -> Any:
+    """
+    Get the parsed form object (e.g. TenK, TenQ) for a filing, using the parse cache.
+
+    Args:
+        filing: A Filing object from the edgar package
+
+    Returns:
+        The parsed filing object
+    """
+    return _filing_object_cache.get(filing)
+
+
+def get_parse_cache_stats() -> Dict[str, int]:
+    """Return hit and miss counters for the filing parse cache."""
+    return _filing_object_cache.stats()
+
+
+def clear_parse_cache() -> None:
+    """Clear the filing parse cache."""
+    _filing_object_cache.clear()
+
+
 class FormSection(Enum):
     """Enumeration of standardized form sections across different filing types."""
     BUSINESS_DESCRIPTION = "business_description"
@@ -54,9 +138,15 @@ class SectionAccessor:
         self.part = part
         self.fallback_fn = fallback_fn
 
-    def extract(self, filing: Filing) -> Optional[str]:
-        """Extract content using the defined access method."""
-        filing_obj = filing.obj()
+    def extract(self, filing: Filing, filing_obj: Optional[Any] = None) -> Optional[str]:
+        """Extract content using the defined access method.
+
+        Args:
+            filing: A Filing object from the edgar package
+            filing_obj: Already parsed filing object; looked up in the parse cache if omitted
+        """
+        if filing_obj is None:
+            filing_obj = get_filing_object(filing)
 
         logger.debug("start_extract_section")
         # Try direct property access first
@@ -213,6 +303,10 @@ FORM_SECTION_MAPPINGS: Dict[str, Dict[FormSection, SectionAccessor]] = {
     },
 }
 
+# Version of the section extraction below. Cached sections are keyed by it, so bump it
+# when extraction changes and re-ingested filings are extracted again
+SECTION_EXTRACTOR_VERSION = 1
+
 # Mapping from FormSection to DocumentType for consistency
 SECTION_TO_DOCUMENT_TYPE: Dict[FormSection, DocumentType] = {
     FormSection.BUSINESS_DESCRIPTION: DocumentType.DESCRIPTION,
@@ -226,13 +320,14 @@ SECTION_TO_DOCUMENT_TYPE: Dict[FormSection, DocumentType] = {
 }
 
 
-def get_form_section(filing: Filing, section: FormSection) -> Optional[str]:
+def get_form_section(filing: Filing, section: FormSection, filing_obj: Optional[Any] = None) -> Optional[str]:
     """
     Extract a standardized section from any supported filing type.
 
     Args:
         filing: A Filing object from the edgar package
         section: The standardized section to extract
+        filing_obj: Already parsed filing object, to avoid parsing the filing again
 
     Returns:
         The section content as a string or None if not found/supported
@@ -253,7 +348,7 @@ def get_form_section(filing: Filing, section: FormSection) -> Optional[str]:
         logger.warn("no_accessor_found")
         return None
 
-    return accessor.extract(filing)
+    return accessor.extract(filing, filing_obj)
 
 
 def get_available_sections(filing: Filing) -> List[FormSection]:
@@ -483,9 +578,13 @@ def get_all_available_sections(filing: Filing) -> Dict[FormSection, Optional[str
     """
     result = {}
     available_sections = get_available_sections(filing)
+    if not available_sections:
+        return result
 
+    # Parse once and slice every section from the same object
+    filing_obj = get_filing_object(filing)
     for section in available_sections:
-        result[section] = get_form_section(filing, section)
+        result[section] = get_form_section(filing, section, filing_obj)
 
     return result
 
@@ -501,12 +600,18 @@ def get_sections_for_document_types(filing: Filing) -> Dict[DocumentType, Option
         Dictionary mapping DocumentType to extracted content (None if not available)
     """
     result = {}
+    if filing.form not in FORM_SECTION_MAPPINGS:
+        logger.warn("no_section_found")
+        return result
 
+    # Parse once and slice every section from the same object
+    filing_obj = get_filing_object(filing)
     for section, doc_type in SECTION_TO_DOCUMENT_TYPE.items():
-        content = get_form_section(filing, section)
+        content = get_form_section(filing, section, filing_obj)
         if content:
             result[doc_type] = content
 
+    logger.debug("filing_parse_cache", **get_parse_cache_stats())
     return result
 
 
@@ -0,0 +1,216 @@
+"""On-disk cache for EDGAR payloads used during ingestion.
+
+Payloads are stored as gzip-compressed JSON, content-addressed by the sha256 of
+their (cik, accession number, url) key, so re-ingesting the same filings does not
+hit EDGAR again. The cache is bounded by total size on disk; the least recently
+used entries are evicted first. The size on disk is tracked as a running total,
+so the directory is only scanned when the cache is opened and when it is full.
+
+Filings are immutable once an accession number exists, so ingestion reads their
+extracted sections through the cache, keyed by the section extractor version. Company records and filing indexes change over time and
+are always refreshed when online, but are cached so they can be replayed offline.
+"""
+import gzip
+import hashlib
+import json
+import os
+from pathlib import Path
+import threading
+from typing import Any, Dict, Optional
+
+from src.utils.config import settings
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Fraction of max_bytes a write that fills the cache evicts down to, so a crawl at
+# capacity scans the directory once per batch of writes instead of on every write
+EVICTION_LOW_WATER = 0.9
+
+
+class EdgarCacheMissError(LookupError):
+    """Raised when an offline lookup has no cached payload to replay."""
+
+
+class EdgarCache:
+    """Content-addressed, size-bounded store of gzip-compressed JSON payloads."""
+
+    def __init__(self, root: str, max_bytes: int):
+        """
+        Initialize the cache.
+
+        Args:
+            root: Directory the cache is stored in (created on first write)
+            max_bytes: Maximum total size of cached payloads on disk
+        """
+        self.root = Path(root).expanduser()
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # Running totals, seeded from disk; other processes sharing the directory
+        # aren't counted until the next eviction rescans it
+        self._entries, self._size = self._scan_totals()
+
+    def _scan(self):
+        for path in self.root.glob("*/*.json.gz"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            yield stat.st_mtime, stat.st_size, path
+
+    def _scan_totals(self):
+        entries = size = 0
+        for _mtime, entry_size, _path in self._scan():
+            entries += 1
+            size += entry_size
+        return entries, size
+
+    def _forget(self, path: Path) -> None:
+        # Remove an entry and take it off the running totals
+        try:
+            size = path.stat().st_size
+            path.unlink()
+        except FileNotFoundError:
+            return
+        with self._lock:
+            self._entries -= 1
+            self._size -= size
+
+    @staticmethod
+    def key(cik: Optional[Any] = None, accession_number: Optional[str] = None, url: Optional[str] = None) -> str:
+        """Build the content address for a payload from its EDGAR identifiers."""
+        raw = f"{cik or ''}|{accession_number or ''}|{url or ''}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json.gz"
+
+    def get(self, cik: Optional[Any] = None, accession_number: Optional[str] = None,
+            url: Optional[str] = None) -> Optional[Any]:
+        """
+        Read a cached payload.
+
+        Args:
+            cik: Company CIK
+            accession_number: Filing accession number
+            url: Source URL (or a synthetic edgar:// URL for derived payloads)
+
+        Returns:
+            The decoded payload, or None if it is not cached
+        """
+        path = self._path(self.key(cik, accession_number, url))
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                payload = json.load(f)
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            logger.debug("edgar_cache_miss", cik=cik, accession_number=accession_number, url=url)
+            return None
+        except (OSError, ValueError) as e:
+            # Treat truncated or corrupt entries as misses so they are re-fetched
+            logger.warning("edgar_cache_corrupt_entry", path=str(path), error=str(e))
+            self._forget(path)
+            with self._lock:
+                self.misses += 1
+            return None
+
+        # Touch the entry so eviction is least-recently-used
+        os.utime(path)
+        with self._lock:
+            self.hits += 1
+        logger.debug("edgar_cache_hit", cik=cik, accession_number=accession_number, url=url)
+        return payload
+
+    def put(self, payload: Any, cik: Optional[Any] = None, accession_number: Optional[str] = None,
+            url: Optional[str] = None) -> None:
+        """
+        Write a payload to the cache, evicting old entries if over the size limit.
+
+        Args:
+            payload: JSON-serializable payload (dates are stored as ISO strings)
+            cik: Company CIK
+            accession_number: Filing accession number
+            url: Source URL (or a synthetic edgar:// URL for derived payloads)
+        """
+        path = self._path(self.key(cik, accession_number, url))
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temporary file first so concurrent readers never see partial entries
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump(payload, f, default=str)
+        size = tmp_path.stat().st_size
+
+        with self._lock:
+            try:
+                replaced_size = path.stat().st_size
+            except FileNotFoundError:
+                replaced_size = None
+            os.replace(tmp_path, path)
+            if replaced_size is None:
+                self._entries += 1
+            self._size += size - (replaced_size or 0)
+            full = self._size > self.max_bytes
+
+        logger.debug("edgar_cache_put", cik=cik, accession_number=accession_number, url=url, size=size)
+        if full:
+            self.evict(int(self.max_bytes * EVICTION_LOW_WATER))
+
+    def evict(self, target_bytes: Optional[int] = None) -> int:
+        """
+        Remove least recently used entries until the cache fits in target_bytes.
+
+        Scans the cache directory, and resets the running totals from it.
+
+        Args:
+            target_bytes: Size to evict down to (defaults to max_bytes)
+
+        Returns:
+            Number of entries removed
+        """
+        target_bytes = self.max_bytes if target_bytes is None else target_bytes
+        with self._lock:
+            entries = sorted(self._scan())
+            total = sum(size for _mtime, size, _path in entries)
+
+            removed = 0
+            for _mtime, size, path in entries:
+                if total <= target_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+                removed += 1
+
+            self._entries = len(entries) - removed
+            self._size = total
+
+        if removed:
+            logger.info("edgar_cache_evicted", removed=removed, size=total, max_bytes=self.max_bytes)
+        return removed
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and the current number and size of entries."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": self._entries,
+                "size": self._size,
+                "max_bytes": self.max_bytes,
+            }
+
+
+_edgar_cache: Optional[EdgarCache] = None
+_edgar_cache_lock = threading.Lock()
+
+
+def get_edgar_cache() -> EdgarCache:
+    """Get the process-wide EDGAR cache configured from settings."""
+    global _edgar_cache
+    with _edgar_cache_lock:
+        if _edgar_cache is None:
+            _edgar_cache = EdgarCache(settings.edgar_api.cache_dir, settings.edgar_api.cache_max_bytes)
+        return _edgar_cache
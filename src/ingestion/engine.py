@@ -0,0 +1,271 @@
+"""Parallel ingestion engine for backfilling many tickers at once.
+
+The engine reads a universe file (tickers x forms x counts) and fans the work out
+across a bounded pool of threads or processes. All work for a single ticker runs
+inside one task so filings for a company are always ingested in order, while
+different tickers proceed concurrently.
+
+Universe files are plain text with one ``TICKER FORM COUNT`` entry per line
+(whitespace or comma separated, ``#`` starts a comment), or JSON:
+
+    [
+        {"ticker": "AAPL", "form": "10-K", "count": 5},
+        {"ticker": "MSFT", "forms": {"10-K": 5, "10-Q": 6}}
+    ]
+"""
+from concurrent.futures import as_completed, Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+import json
+from pathlib import Path
+import time
+from typing import Dict, List, Optional, Union
+
+from src.database.base import close_session, init_db
+from src.database.companies import get_company_by_ticker
+from src.database.documents import count_documents_by_filings, DocumentWriteStatus
+from src.ingestion.edgar_db.accessors import edgar_login
+from src.ingestion.ingestion_helpers import ingest_company, ingest_filings
+from src.utils.config import settings
+from src.utils.logging import get_logger
+from src.utils.metrics import (
+    INGESTED_FILINGS,
+    INGESTED_SECTIONS,
+    INGESTION_FILINGS_PER_SECOND,
+    INGESTION_SECTIONS_PER_SECOND,
+)
+
+logger = get_logger(__name__)
+
+EXECUTOR_TYPES = ("thread", "process")
+
+
+@dataclass
+class UniverseEntry:
+    """A single (ticker, form, count) unit of work from a universe file."""
+    ticker: str
+    form: str = "10-K"
+    count: int = 1
+
+
+@dataclass
+class IngestionStats:
+    """Throughput counters for an ingestion run."""
+    tickers: int = 0
+    filings: int = 0
+    documents: int = 0
+    failures: List[str] = field(default_factory=list)
+    elapsed: float = 0.0
+    # Breakdowns for the metrics, which run_ingestion records from the merged results
+    filings_by_form: Dict[str, int] = field(default_factory=dict)
+    sections_by_form: Dict[str, int] = field(default_factory=dict)
+    sections_by_status: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def filings_per_second(self) -> float:
+        return self.filings / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def documents_per_second(self) -> float:
+        return self.documents / self.elapsed if self.elapsed > 0 else 0.0
+
+    def merge(self, other: "IngestionStats") -> None:
+        """Accumulate counters from a worker result (elapsed is tracked by the caller)."""
+        self.tickers += other.tickers
+        self.filings += other.filings
+        self.documents += other.documents
+        self.failures.extend(other.failures)
+        for counts, other_counts in ((self.filings_by_form, other.filings_by_form),
+                                     (self.sections_by_form, other.sections_by_form),
+                                     (self.sections_by_status, other.sections_by_status)):
+            for key, count in other_counts.items():
+                counts[key] = counts.get(key, 0) + count
+
+    def to_dict(self) -> Dict[str, Union[int, float, List[str]]]:
+        return {
+            "tickers": self.tickers,
+            "filings": self.filings,
+            "documents": self.documents,
+            "failures": list(self.failures),
+            "elapsed": round(self.elapsed, 2),
+            "filings_per_second": round(self.filings_per_second, 3),
+            "documents_per_second": round(self.documents_per_second, 3),
+        }
+
+
+def load_universe(path: Union[str, Path]) -> List[UniverseEntry]:
+    """Load a universe file into a list of entries.
+
+    Args:
+        path: Path to a JSON or plain text universe file
+
+    Returns:
+        List of UniverseEntry objects in file order
+    """
+    path = Path(path)
+    raw = path.read_text()
+
+    entries: List[UniverseEntry] = []
+    if path.suffix.lower() == ".json":
+        for item in json.loads(raw):
+            ticker = item["ticker"].upper()
+            if "forms" in item:
+                for form, count in item["forms"].items():
+                    entries.append(UniverseEntry(ticker=ticker, form=form, count=int(count)))
+            else:
+                entries.append(UniverseEntry(ticker=ticker, form=item.get("form", "10-K"), count=int(item.get("count", 1))))
+    else:
+        for line_number, line in enumerate(raw.splitlines(), start=1):
+            line = line.split("#", 1)[0].strip()
+            if not line:
+                continue
+            parts = line.replace(",", " ").split()
+            if len(parts) > 3:
+                raise ValueError(f"{path}:{line_number}: expected 'TICKER [FORM] [COUNT]', got '{line}'")
+            entry = UniverseEntry(ticker=parts[0].upper())
+            if len(parts) > 1:
+                entry.form = parts[1]
+            if len(parts) > 2:
+                entry.count = int(parts[2])
+            entries.append(entry)
+
+    logger.info("loaded_ingestion_universe", path=str(path), entries=len(entries))
+    return entries
+
+
+def group_by_ticker(entries: List[UniverseEntry]) -> Dict[str, List[UniverseEntry]]:
+    """Group universe entries by ticker, preserving the order they were listed in."""
+    grouped: Dict[str, List[UniverseEntry]] = {}
+    for entry in entries:
+        grouped.setdefault(entry.ticker, []).append(entry)
+    return grouped
+
+
+def _init_worker(database_url: str, edgar_contact: str) -> None:
+    """Initialize database and EDGAR identity inside a worker process."""
+    init_db(database_url)
+    edgar_login(edgar_contact)
+
+
+def ingest_ticker(ticker: str, entries: List[UniverseEntry], include_documents: bool = True) -> IngestionStats:
+    """Ingest every (form, count) entry for one ticker, in order.
+
+    Runs inside a pool worker. Each worker thread gets its own scoped session,
+    which is removed once the ticker is done.
+
+    Args:
+        ticker: Company ticker symbol
+        entries: Universe entries for this ticker
+        include_documents: Whether to also ingest filing documents
+
+    Returns:
+        IngestionStats for this ticker, with the counts run_ingestion records as metrics
+    """
+    stats = IngestionStats(tickers=1)
+    section_counts: Dict[DocumentWriteStatus, int] = {}
+    try:
+        db_company = get_company_by_ticker(ticker)
+        if db_company is None:
+            _, company_id = ingest_company(ticker)
+        else:
+            company_id = db_company.id
+
+        for entry in entries:
+            sections_before = sum(section_counts.values())
+            filing_info = ingest_filings(company_id, ticker=ticker, form=entry.form, count=entry.count,
+                                         include_documents=include_documents, section_counts=section_counts)
+            stats.filings += len(filing_info)
+            stats.filings_by_form[entry.form] = stats.filings_by_form.get(entry.form, 0) + len(filing_info)
+            stats.sections_by_form[entry.form] = (stats.sections_by_form.get(entry.form, 0)
+                                                  + sum(section_counts.values()) - sections_before)
+            if include_documents and filing_info:
+                stats.documents += count_documents_by_filings([info[3] for info in filing_info])
+    except Exception as e:
+        logger.error("ingest_ticker_failed", ticker=ticker, error=str(e), exc_info=True)
+        stats.failures.append(ticker)
+    finally:
+        close_session()
+
+    # Includes sections written before a failure, which were counted in the worker too
+    stats.sections_by_status = {status.value: count for status, count in section_counts.items()}
+    return stats
+
+
+def _record_metrics(stats: IngestionStats, executor_type: str) -> None:
+    """Record a run's metrics in this process from the merged worker results."""
+    if executor_type == "process":
+        # Worker processes counted these in their own registries, which this
+        # process never exports; thread workers already counted them here
+        for form, count in stats.filings_by_form.items():
+            if count:
+                INGESTED_FILINGS.inc(count, form=form)
+        for status, count in stats.sections_by_status.items():
+            if count:
+                INGESTED_SECTIONS.inc(count, status=status)
+
+    if stats.elapsed > 0:
+        for form, count in stats.filings_by_form.items():
+            INGESTION_FILINGS_PER_SECOND.set(count / stats.elapsed, form=form)
+            INGESTION_SECTIONS_PER_SECOND.set(stats.sections_by_form.get(form, 0) / stats.elapsed, form=form)
+
+
+def run_ingestion(entries: List[UniverseEntry], max_workers: int = 4, executor_type: str = "thread",
+                  include_documents: bool = True, database_url: Optional[str] = None,
+                  edgar_contact: Optional[str] = None) -> IngestionStats:
+    """Ingest a universe of tickers with a bounded worker pool.
+
+    Args:
+        entries: Universe entries to ingest
+        max_workers: Maximum number of concurrent tickers
+        executor_type: "thread" or "process"
+        include_documents: Whether to also ingest filing documents
+        database_url: Database URL for process workers (defaults to settings)
+        edgar_contact: EDGAR identity for process workers (defaults to settings)
+
+    Returns:
+        Aggregated IngestionStats for the run
+    """
+    if executor_type not in EXECUTOR_TYPES:
+        raise ValueError(f"Unknown executor type '{executor_type}'. Valid types: {EXECUTOR_TYPES}")
+
+    grouped = group_by_ticker(entries)
+    total = IngestionStats()
+    start = time.perf_counter()
+
+    executor: Executor
+    if executor_type == "process":
+        executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(database_url or settings.database.url, edgar_contact or settings.edgar_api.edgar_contact),
+        )
+    else:
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ingest")
+
+    logger.info("ingestion_run_started", tickers=len(grouped), workers=max_workers, executor=executor_type)
+
+    with executor:
+        futures = {
+            executor.submit(ingest_ticker, ticker, ticker_entries, include_documents): ticker
+            for ticker, ticker_entries in grouped.items()
+        }
+        for future in as_completed(futures):
+            ticker = futures[future]
+            try:
+                total.merge(future.result())
+            except Exception as e:
+                logger.error("ingestion_worker_failed", ticker=ticker, error=str(e), exc_info=True)
+                total.tickers += 1
+                total.failures.append(ticker)
+
+            total.elapsed = time.perf_counter() - start
+            logger.info("ingestion_progress",
+                        ticker=ticker,
+                        completed=total.tickers,
+                        remaining=len(grouped) - total.tickers,
+                        filings_per_second=f"{total.filings_per_second:0.2f}",
+                        documents_per_second=f"{total.documents_per_second:0.2f}")
+
+    total.elapsed = time.perf_counter() - start
+    _record_metrics(total, executor_type)
+    logger.info("ingestion_run_complete", **total.to_dict())
+    return total
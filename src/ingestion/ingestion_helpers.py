@@ -1,91 +1,234 @@
+from dataclasses import dataclass
 from datetime import date
-from decimal import Decimal, InvalidOperation
-from typing import Dict, List, Tuple
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple, Union
 from uuid import UUID
 
 from edgar import Company, Filing
 import pandas as pd
 from src.database.companies import create_company, get_company, get_company_by_ticker, update_company
-from src.database.documents import DocumentType, find_or_create_document
+from src.database.documents import DocumentType, DocumentWriteStatus, upsert_document
 from src.database.filings import upsert_filing_by_accession_number
-from src.database.financial_concepts import find_or_create_financial_concept
-from src.database.financial_values import upsert_financial_value
+from src.database.financial_concepts import bulk_find_or_create_financial_concepts
+from src.database.financial_values import bulk_upsert_financial_values
 from src.ingestion.edgar_db.accessors import (
     get_sections_for_document_types,
+    SECTION_EXTRACTOR_VERSION,
 )
+from src.ingestion.edgar_db.cache import EdgarCacheMissError, get_edgar_cache
 from src.utils.logging import get_logger
+from src.utils.metrics import INGESTED_FILINGS, INGESTED_SECTIONS
 
 logger = get_logger(__name__)
 
-def _is_numeric_value(value_str: str) -> bool:
-    """Check if a string value can be converted to a numeric Decimal.
+# Formatting characters stripped from statement cells before numeric coercion; a
+# leading '(' marks an accounting negative
+_STATEMENT_VALUE_STRIP_PATTERN = r'[,$)\s]'
+
+def normalize_statement_dataframe(statement_df: pd.DataFrame, report_date: date) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Normalize a financial statement dataframe into typed values for one report date.
+
+    Cleans the report date column with vectorized string operations and validates it
+    with a single numeric coercion pass, rather than parsing each row in Python.
 
     Args:
-        value_str: String value to check
+        statement_df: Statement dataframe with 'concept', optional 'label' and date columns
+        report_date: Period of report to extract values for
 
     Returns:
-        True if the value can be converted to Decimal, False otherwise
+        Tuple of (normalized, rejected) dataframes. The normalized frame has 'concept',
+        'label', 'value_date' and 'value' (Decimal) columns; the rejected frame has
+        'concept', 'label' and the original 'value' for cells that were not numeric.
     """
-    if not value_str or pd.isna(value_str):
-        return False
+    normalized = pd.DataFrame(columns=['concept', 'label', 'value_date', 'value'])
+    rejected = pd.DataFrame(columns=['concept', 'label', 'value'])
+
+    date_column = report_date.isoformat()
+    if statement_df.empty or 'concept' not in statement_df or date_column not in statement_df:
+        return normalized, rejected
+
+    statement_df = statement_df.reset_index(drop=True)
+    labels = statement_df['label'] if 'label' in statement_df else pd.Series(None, index=statement_df.index, dtype=object)
+    raw = statement_df[date_column]
+
+    # Blank cells mean there is no value for this period; they are neither stored nor rejected
+    text = raw.astype(str).str.strip()
+    present = raw.notna() & (text != '')
+    if not present.any():
+        return normalized, rejected
+
+    cleaned = text[present].str.replace(_STATEMENT_VALUE_STRIP_PATTERN, '', regex=True).str.replace('(', '-', regex=False)
+    numeric = pd.to_numeric(cleaned, errors='coerce')
+    valid = numeric.notna() & (numeric.abs() != float('inf'))
+
+    valid_index = valid[valid].index
+    normalized = pd.DataFrame({
+        'concept': statement_df.loc[valid_index, 'concept'],
+        'label': labels.loc[valid_index],
+        'value_date': report_date,
+        # Build Decimals from the cleaned text so values keep their exact precision
+        'value': cleaned[valid].map(Decimal),
+    }, columns=normalized.columns)
+
+    rejected_index = valid[~valid].index
+    rejected = pd.DataFrame({
+        'concept': statement_df.loc[rejected_index, 'concept'],
+        'label': labels.loc[rejected_index],
+        'value': raw.loc[rejected_index],
+    }, columns=rejected.columns)
+
+    return normalized, rejected
+
+@dataclass
+class CachedFiling:
+    """Filing metadata replayed from the EDGAR cache, used in place of an edgar Filing offline."""
+    cik: int
+    accession_number: str
+    form: str
+    filing_date: date
+    period_of_report: str
+    url: str
+
+
+def _company_record_url(ticker: str) -> str:
+    return f"edgar://company/{ticker.upper()}"
+
+
+def _filings_index_url(cik: int, form: str) -> str:
+    return f"edgar://filings/{cik}/{form}"
+
+
+def _filing_sections_url(filing_url: str) -> str:
+    return f"edgar://sections/v{SECTION_EXTRACTOR_VERSION}/{filing_url}"
+
+
+def _load_cached_company_record(ticker: str) -> Dict[str, Any]:
+    """Load a company record cached by a previous online ingestion."""
+    record = get_edgar_cache().get(url=_company_record_url(ticker))
+    if record is None:
+        raise EdgarCacheMissError(f"No cached EDGAR company record for {ticker}")
+    return record
+
+
+def _cache_filings_index(cik: int, form: str, filings: List[Filing]) -> None:
+    """Merge fetched filings into the cached filings index for (cik, form), newest first."""
+    cache = get_edgar_cache()
+    index_url = _filings_index_url(cik, form)
+    records = {record['accession_number']: record for record in cache.get(cik=cik, url=index_url) or []}
+    for filing in filings:
+        records[filing.accession_number] = {
+            'cik': cik,
+            'accession_number': filing.accession_number,
+            'form': filing.form,
+            'filing_date': str(filing.filing_date),
+            'period_of_report': filing.period_of_report,
+            'url': filing.url,
+        }
+    cache.put(sorted(records.values(), key=lambda r: r['filing_date'], reverse=True), cik=cik, url=index_url)
 
-    # Remove common formatting characters
-    cleaned = str(value_str).strip().replace(',', '').replace('$', '').replace('(', '-').replace(')', '')
 
-    # Check if it's a number (including negative numbers, decimals, scientific notation)
-    try:
-        Decimal(cleaned)
-        return True
-    except (ValueError, TypeError, InvalidOperation):
-        return False
+def _load_cached_filings(ticker: str, form: str, count: int) -> List[CachedFiling]:
+    """Replay the latest filings for a ticker and form from the cached filings index."""
+    cik = _load_cached_company_record(ticker)['cik']
+    records = get_edgar_cache().get(cik=cik, url=_filings_index_url(cik, form))
+    if records is None:
+        raise EdgarCacheMissError(f"No cached EDGAR {form} filings index for {ticker}")
+
+    return [
+        CachedFiling(**{**record, 'filing_date': date.fromisoformat(record['filing_date'])})
+        for record in records[:count]
+    ]
+
+
+def get_filing_sections(filing: Union[Filing, CachedFiling], refresh: bool = False) -> Dict[DocumentType, str]:
+    """Get document sections for a filing, reading through the EDGAR cache.
+
+    Filings are immutable for a given accession number, so a cached copy is used when
+    present. Cached sections are keyed by SECTION_EXTRACTOR_VERSION, so sections
+    extracted by an older version are extracted again. Cached filings (offline mode)
+    never fall back to EDGAR.
+
+    Args:
+        filing: EDGAR filing, or a CachedFiling when replaying offline
+        refresh: Extract the sections again and overwrite the cached copy (ignored offline)
+
+    Returns:
+        Dictionary mapping DocumentType to section content
+    """
+    cache = get_edgar_cache()
+    cache_key = {'cik': filing.cik, 'accession_number': filing.accession_number, 'url': _filing_sections_url(filing.url)}
+    offline = isinstance(filing, CachedFiling)
+    if offline or not refresh:
+        cached = cache.get(**cache_key)
+        if cached is not None:
+            return {DocumentType(doc_type): content for doc_type, content in cached.items()}
+
+    if offline:
+        raise EdgarCacheMissError(f"No cached EDGAR sections for filing {filing.accession_number}")
+
+    sections = get_sections_for_document_types(filing)
+    cache.put({doc_type.value: content for doc_type, content in sections.items()}, **cache_key)
+    return sections
+
 
-def ingest_company(ticker: str) -> Tuple[Company, UUID]:
+def ingest_company(ticker: str, offline: bool = False) -> Tuple[Optional[Company], UUID]:
     """Fetch company data from EDGAR and store in database.
 
     Args:
         ticker: Stock ticker symbol
+        offline: Replay the company record from the EDGAR cache instead of fetching it
 
     Returns:
-        Tuple of (EDGAR company data, company UUID in database)
+        Tuple of (EDGAR company data or None when offline, company UUID in database)
     """
     try:
-        # Get company data from EDGAR
-        edgar_company = Company(ticker)
-        entity_data = edgar_company.data
-
-        # Prepare data for database
-        company_data = {
-            'name': entity_data.name,
-            'display_name': entity_data.display_name,
-            'ticker': edgar_company.get_ticker(),
-            'exchanges': edgar_company.get_exchanges(),
-            'sic': entity_data.sic,
-            'sic_description': entity_data.sic_description,
-            'former_names': entity_data.former_names if hasattr(entity_data, 'former_names') else [],
-        }
+        if offline:
+            # Replay the company record from the EDGAR cache
+            edgar_company = None
+            company_data = _load_cached_company_record(ticker)
+            company_data.pop('cik', None)
+            if company_data.get('fiscal_year_end'):
+                company_data['fiscal_year_end'] = date.fromisoformat(company_data['fiscal_year_end'])
+        else:
+            # Get company data from EDGAR
+            edgar_company = Company(ticker)
+            entity_data = edgar_company.data
 
-        # Handle fiscal_year_end conversion from MMDD string to date
-        if hasattr(entity_data, 'fiscal_year_end') and edgar_company.fiscal_year_end:
-            # If it's in MMDD format, convert to a proper date
-            if isinstance(edgar_company.fiscal_year_end, str) and len(edgar_company.fiscal_year_end) == 4:
-                try:
-                    # Create a date with current year and MM-DD from fiscal_year_end
-                    month = int(edgar_company.fiscal_year_end[:2])
-                    day = int(edgar_company.fiscal_year_end[2:])
-                    fiscal_date = date(date.today().year, month, day)
-                    company_data['fiscal_year_end'] = fiscal_date
-                except (ValueError, TypeError):
+            # Prepare data for database
+            company_data = {
+                'name': entity_data.name,
+                'display_name': entity_data.display_name,
+                'ticker': edgar_company.get_ticker(),
+                'exchanges': edgar_company.get_exchanges(),
+                'sic': entity_data.sic,
+                'sic_description': entity_data.sic_description,
+                'former_names': entity_data.former_names if hasattr(entity_data, 'former_names') else [],
+            }
+
+            # Handle fiscal_year_end conversion from MMDD string to date
+            if hasattr(entity_data, 'fiscal_year_end') and edgar_company.fiscal_year_end:
+                # If it's in MMDD format, convert to a proper date
+                if isinstance(edgar_company.fiscal_year_end, str) and len(edgar_company.fiscal_year_end) == 4:
+                    try:
+                        # Create a date with current year and MM-DD from fiscal_year_end
+                        month = int(edgar_company.fiscal_year_end[:2])
+                        day = int(edgar_company.fiscal_year_end[2:])
+                        fiscal_date = date(date.today().year, month, day)
+                        company_data['fiscal_year_end'] = fiscal_date
+                    except (ValueError, TypeError):
+                        logger.warning("invalid_fiscal_year_end_format",
+                                      value=edgar_company.fiscal_year_end,
+                                      ticker=edgar_company.get_ticker())
+                        company_data['fiscal_year_end'] = None
+                else:
                     logger.warning("invalid_fiscal_year_end_format",
                                   value=edgar_company.fiscal_year_end,
                                   ticker=edgar_company.get_ticker())
                     company_data['fiscal_year_end'] = None
             else:
-                logger.warning("invalid_fiscal_year_end_format",
-                              value=edgar_company.fiscal_year_end,
-                              ticker=edgar_company.get_ticker())
                 company_data['fiscal_year_end'] = None
-        else:
-            company_data['fiscal_year_end'] = None
+
+            get_edgar_cache().put({'cik': edgar_company.cik, **company_data}, url=_company_record_url(ticker))
 
         # Store in database
         db_company = get_company_by_ticker(ticker)
@@ -104,7 +247,10 @@ def ingest_company(ticker: str) -> Tuple[Company, UUID]:
         logger.error("ingest_company_failed", ticker=ticker, error=str(e), exc_info=True)
         raise
 
-def ingest_filings(db_id: str, ticker: str, form: str, count: int, include_documents: bool = True) -> List[Tuple]:
+def ingest_filings(db_id: str, ticker: str, form: str, count: int, include_documents: bool = True,
+                   offline: bool = False,
+                   section_counts: Optional[Dict[DocumentWriteStatus, int]] = None,
+                   refresh_sections: bool = False) -> List[Tuple]:
     """Fetch filings from EDGAR and store in database.
 
     Args:
@@ -113,37 +259,46 @@ def ingest_filings(db_id: str, ticker: str, form: str, count: int, include_docum
         form: Form type (10-K, 10-Q, etc.)
         count: Number of filings to retrieve
         include_documents: Whether to also ingest filing documents
+        offline: Replay filings and documents from the EDGAR cache instead of fetching them
+        section_counts: If given, the number of sections written is added to it, by write status
+        refresh_sections: Extract document sections again instead of reading cached ones
 
     Returns:
         List of tuples containing (ticker, form, period_of_report, filing_id)
     """
     try:
-        company = Company(ticker)
-        if company is None:
-            #  some error
-            return (None, None)
-
-        logger.info("filings", ticker=ticker, form=form, count=count)
-        # Get filings from EDGAR
-        edgar_filings = company.get_filings(form=form).latest(count)
-
-        # Handle case where fewer filings are available than requested
-        if count == 1:
-            filings = [edgar_filings] if edgar_filings is not None else []
+        if offline:
+            logger.info("filings", ticker=ticker, form=form, count=count, offline=True)
+            filings = _load_cached_filings(ticker, form, count)
         else:
-            # Check how many filings are actually available
-            try:
-                # Try to get the filings up to the requested count
-                filings = []
-                for i in range(count):
-                    try:
-                        filing = edgar_filings[i]
-                        filings.append(filing)
-                    except IndexError:
-                        # No more filings available
-                        break
-            except Exception:
-                filings = []
+            company = Company(ticker)
+            if company is None:
+                #  some error
+                return (None, None)
+
+            logger.info("filings", ticker=ticker, form=form, count=count)
+            # Get filings from EDGAR
+            edgar_filings = company.get_filings(form=form).latest(count)
+
+            # Handle case where fewer filings are available than requested
+            if count == 1:
+                filings = [edgar_filings] if edgar_filings is not None else []
+            else:
+                # Check how many filings are actually available
+                try:
+                    # Try to get the filings up to the requested count
+                    filings = []
+                    for i in range(count):
+                        try:
+                            filing = edgar_filings[i]
+                            filings.append(filing)
+                        except IndexError:
+                            # No more filings available
+                            break
+                except Exception:
+                    filings = []
+
+            _cache_filings_index(company.cik, form, filings)
 
         actual_count = len(filings)
         if actual_count < count:
@@ -181,7 +336,9 @@ def ingest_filings(db_id: str, ticker: str, form: str, count: int, include_docum
                 document_uuids = ingest_filing_documents(
                     company_id=db_id,
                     filing_id=db_filing.id,
-                    filing=filing
+                    filing=filing,
+                    section_counts=section_counts,
+                    refresh_sections=refresh_sections
                 )
 
                 logger.info("filing_documents_ingested",
@@ -195,6 +352,7 @@ def ingest_filings(db_id: str, ticker: str, form: str, count: int, include_docum
                        accession_number=filing.accession_number,
                        filing_id=str(db_filing.id))
 
+            INGESTED_FILINGS.inc(form=form)
             filing_info.append((ticker, form, filing.period_of_report, db_filing.id))
 
         return filing_info
@@ -202,14 +360,19 @@ def ingest_filings(db_id: str, ticker: str, form: str, count: int, include_docum
         logger.error("ingest_filing_failed", company_id=str(db_id), error=str(e), exc_info=True)
         raise
 
-def ingest_filing_documents(company_id: UUID, filing_id: UUID, filing: Filing, company_name: str = None) -> Dict[DocumentType, UUID]:
+def ingest_filing_documents(company_id: UUID, filing_id: UUID, filing: Union[Filing, CachedFiling],
+                            company_name: str = None,
+                            section_counts: Optional[Dict[DocumentWriteStatus, int]] = None,
+                            refresh_sections: bool = False) -> Dict[DocumentType, UUID]:
     """Extract document sections from a filing and store in database.
 
     Args:
         company_id: UUID of the company in database
         filing_id: UUID of the filing in database
-        filing: EDGAR filing data
+        filing: EDGAR filing data, or a CachedFiling when replaying offline
         company_name: Name of the company (optional)
+        section_counts: If given, the number of sections written is added to it, by write status
+        refresh_sections: Extract the sections again instead of reading a cached copy
 
     Returns:
         Dictionary mapping DocumentType to their UUIDs in database
@@ -223,9 +386,10 @@ def ingest_filing_documents(company_id: UUID, filing_id: UUID, filing: Filing, c
                    accession_number=filing.accession_number)
 
         document_uuids = {}
+        write_counts = {status: 0 for status in DocumentWriteStatus}
 
         # Use the new mapping system to get all available sections for this document type
-        sections_content = get_sections_for_document_types(filing)
+        sections_content = get_filing_sections(filing, refresh=refresh_sections)
         logger.debug("sections_content_length", length=sections_content.__len__())
 
         for doc_type, content in sections_content.items():
@@ -244,7 +408,7 @@ def ingest_filing_documents(company_id: UUID, filing_id: UUID, filing: Filing, c
 
                 document_name = f"{formatted_base_name} - {doc_type_names.get(doc_type, doc_type.value)}"
 
-                doc = find_or_create_document(
+                doc, write_status = upsert_document(
                     company_id=company_id,
                     filing_id=filing_id,
                     title=document_name,
@@ -252,16 +416,26 @@ def ingest_filing_documents(company_id: UUID, filing_id: UUID, filing: Filing, c
                     content=content
                 )
                 document_uuids[doc_type] = doc.id
+                write_counts[write_status] += 1
+                INGESTED_SECTIONS.inc(status=write_status.value)
 
                 logger.debug("document_ingested",
                            document_type=doc_type.value,
                            document_id=str(doc.id),
+                           status=write_status.value,
                            content_length=len(content))
 
         logger.info("ingest_filing_documents_complete",
                    document_count=len(document_uuids),
+                   created=write_counts[DocumentWriteStatus.CREATED],
+                   updated=write_counts[DocumentWriteStatus.UPDATED],
+                   unchanged=write_counts[DocumentWriteStatus.UNCHANGED],
                    document_types=[doc_type.value for doc_type in document_uuids.keys()])
 
+        if section_counts is not None:
+            for status, status_count in write_counts.items():
+                section_counts[status] = section_counts.get(status, 0) + status_count
+
         return document_uuids
     except Exception as e:
         logger.error("ingest_filing_documents_failed",
@@ -272,6 +446,55 @@ def ingest_filing_documents(company_id: UUID, filing_id: UUID, filing: Filing, c
         raise
 
 
+def _store_statement_values(company_id: UUID, filing_id: UUID, statement: str,
+                            statement_df: pd.DataFrame, report_date: date) -> int:
+    """Parse one financial statement and store its concepts and values in bulk.
+
+    The statement is normalized in one vectorized pass, concepts are resolved with a
+    single bulk upsert, then every valid value for the report date is written with a
+    single multi-row upsert. Rejected cells are logged once per statement.
+
+    Args:
+        company_id: UUID of the company in database
+        filing_id: UUID of the filing in database
+        statement: Statement type, used as the concept label (e.g. 'balance_sheet')
+        statement_df: Statement dataframe with 'concept', 'label' and date columns
+        report_date: Period of report for the filing
+
+    Returns:
+        Number of financial values stored
+    """
+    if statement_df.empty or 'concept' not in statement_df:
+        return 0
+
+    normalized, rejected = normalize_statement_dataframe(statement_df, report_date)
+
+    if not rejected.empty:
+        if statement == 'cover_page':
+            # Cover pages mix text and numbers; non-numeric values are expected there
+            logger.debug("skipping_non_numeric_cover_page_values",
+                        count=len(rejected),
+                        concepts=rejected['concept'].tolist())
+        else:
+            logger.warning(f"invalid_{statement}_values",
+                          count=len(rejected),
+                          concepts=rejected['concept'].tolist(),
+                          values=[str(value) for value in rejected['value']])
+
+    labels = statement_df['label'] if 'label' in statement_df else [None] * len(statement_df)
+    concepts = [
+        {'name': name, 'description': label if pd.notna(label) else None, 'labels': [statement]}
+        for name, label in zip(statement_df['concept'], labels)
+    ]
+    concept_ids = bulk_find_or_create_financial_concepts(concepts)
+    return bulk_upsert_financial_values(
+        company_id,
+        filing_id,
+        [(concept_ids[name], value_date, value)
+         for name, value_date, value in zip(normalized['concept'], normalized['value_date'], normalized['value'])]
+    )
+
+
 def ingest_financial_data(company_id: UUID, filing_id: UUID, filing: Filing) -> Dict[str, int]:
     """Extract financial data from filing and store concepts and values in database.
 
@@ -286,195 +509,29 @@ def ingest_financial_data(company_id: UUID, filing_id: UUID, filing: Filing) ->
     try:
         counts = {'balance_sheet': 0, 'income_statement': 0, 'cash_flow': 0, 'cover_page': 0}
 
+        report_date = filing.period_of_report
+        if isinstance(report_date, str):
+            report_date = date.fromisoformat(report_date)
+
         # FIXME: Balance sheet values
         balance_sheet_df = get_balance_sheet_values(filing) # noqa: F821
-        for _index, row in balance_sheet_df.iterrows():
-            concept_name = row['concept']
-            concept_label = row['label'] if 'label' in row else None
-
-            concept = find_or_create_financial_concept(
-                name=concept_name,
-                description=concept_label,
-                labels=['balance_sheet']
-            )
-
-            # Get the value for the filing period date
-            report_date = filing.period_of_report
-            if isinstance(report_date, str):
-                report_date = date.fromisoformat(report_date)
-
-            if report_date.isoformat() in row:
-                value_str = row[report_date.isoformat()]
-            else:
-                # Skip if there's no value for this period
-                continue
-
-            if pd.notna(value_str) and value_str != '':
-                if _is_numeric_value(value_str):
-                    try:
-                        # Clean and convert the value
-                        cleaned_value = str(value_str).strip().replace(',', '').replace('$', '').replace('(', '-').replace(')', '')
-                        value = Decimal(cleaned_value)
-                        upsert_financial_value(
-                            company_id=company_id,
-                            concept_id=concept.id,
-                            value_date=report_date,
-                            value=value,
-                            filing_id=filing_id
-                        )
-                        counts['balance_sheet'] += 1
-                    except (ValueError, TypeError, InvalidOperation):
-                        logger.warning("invalid_balance_sheet_value",
-                                      concept=concept_name,
-                                      value=str(value_str))
-                else:
-                    # Log warning for non-numeric values
-                    logger.warning("invalid_balance_sheet_value",
-                                  concept=concept_name,
-                                  value=str(value_str))
+        counts['balance_sheet'] = _store_statement_values(company_id, filing_id, 'balance_sheet',
+                                                          balance_sheet_df, report_date)
 
         # FIXME: Income statement values
         income_df = get_income_statement_values(filing) # noqa: F821
-        for _index, row in income_df.iterrows():
-            concept_name = row['concept']
-            concept_label = row['label'] if 'label' in row else None
-
-            concept = find_or_create_financial_concept(
-                name=concept_name,
-                description=concept_label,
-                labels=['income_statement']
-            )
-
-            # Get the value for the filing period date
-            report_date = filing.period_of_report
-            if isinstance(report_date, str):
-                report_date = date.fromisoformat(report_date)
-
-            if report_date.isoformat() in row:
-                value_str = row[report_date.isoformat()]
-            else:
-                # Skip if there's no value for this period
-                continue
-
-            if pd.notna(value_str) and value_str != '':
-                if _is_numeric_value(value_str):
-                    try:
-                        # Clean and convert the value
-                        cleaned_value = str(value_str).strip().replace(',', '').replace('$', '').replace('(', '-').replace(')', '')
-                        value = Decimal(cleaned_value)
-                        upsert_financial_value(
-                            company_id=company_id,
-                            concept_id=concept.id,
-                            value_date=report_date,
-                            value=value,
-                            filing_id=filing_id
-                        )
-                        counts['income_statement'] += 1
-                    except (ValueError, TypeError, InvalidOperation):
-                        logger.warning("invalid_income_statement_value",
-                                      concept=concept_name,
-                                      value=str(value_str))
-                else:
-                    # Log warning for non-numeric values
-                    logger.warning("invalid_income_statement_value",
-                                  concept=concept_name,
-                                  value=str(value_str))
+        counts['income_statement'] = _store_statement_values(company_id, filing_id, 'income_statement',
+                                                             income_df, report_date)
 
         # FIXME: Cash flow statement values
         cashflow_df = get_cash_flow_statement_values(filing) # noqa: F821
-        for _index, row in cashflow_df.iterrows():
-            concept_name = row['concept']
-            concept_label = row['label'] if 'label' in row else None
-
-            concept = find_or_create_financial_concept(
-                name=concept_name,
-                description=concept_label,
-                labels=['cash_flow']
-            )
-
-            # Get the value for the filing period date
-            report_date = filing.period_of_report
-            if isinstance(report_date, str):
-                report_date = date.fromisoformat(report_date)
-
-            if report_date.isoformat() in row:
-                value_str = row[report_date.isoformat()]
-            else:
-                # Skip if there's no value for this period
-                continue
-
-            if pd.notna(value_str) and value_str != '':
-                if _is_numeric_value(value_str):
-                    try:
-                        # Clean and convert the value
-                        cleaned_value = str(value_str).strip().replace(',', '').replace('$', '').replace('(', '-').replace(')', '')
-                        value = Decimal(cleaned_value)
-                        upsert_financial_value(
-                            company_id=company_id,
-                            concept_id=concept.id,
-                            value_date=report_date,
-                            value=value,
-                            filing_id=filing_id
-                        )
-                        counts['cash_flow'] += 1
-                    except (ValueError, TypeError, InvalidOperation):
-                        logger.warning("invalid_cash_flow_value",
-                                      concept=concept_name,
-                                      value=str(value_str))
-                else:
-                    # Log warning for non-numeric values
-                    logger.warning("invalid_cash_flow_value",
-                                  concept=concept_name,
-                                  value=str(value_str))
+        counts['cash_flow'] = _store_statement_values(company_id, filing_id, 'cash_flow',
+                                                      cashflow_df, report_date)
 
         # FIXME: Cover page data - only process numeric values
         cover_df = get_cover_page_values(filing) # noqa: F821
-        for _index, row in cover_df.iterrows():
-            concept_name = row['concept']
-            concept_label = row['label'] if 'label' in row else None
-
-            concept = find_or_create_financial_concept(
-                name=concept_name,
-                description=concept_label,
-                labels=['cover_page']
-            )
-
-            # Get the value for the filing period date
-            report_date = filing.period_of_report
-            if isinstance(report_date, str):
-                report_date = date.fromisoformat(report_date)
-
-            if report_date.isoformat() in row:
-                value_str = row[report_date.isoformat()]
-            else:
-                # Skip if there's no value for this period
-                continue
-
-            # Only process numeric values for cover page data
-            if pd.notna(value_str) and value_str != '':
-                if _is_numeric_value(value_str):
-                    try:
-                        # Clean and convert the value
-                        cleaned_value = str(value_str).strip().replace(',', '').replace('$', '').replace('(', '-').replace(')', '')
-                        value = Decimal(cleaned_value)
-                        upsert_financial_value(
-                            company_id=company_id,
-                            concept_id=concept.id,
-                            value_date=report_date,
-                            value=value,
-                            filing_id=filing_id
-                        )
-                        counts['cover_page'] += 1
-                    except (ValueError, TypeError, InvalidOperation):
-                        logger.warning("invalid_cover_page_value",
-                                      concept=concept_name,
-                                      value=str(value_str))
-                else:
-                    # Log non-numeric values for debugging but don't try to store them
-                    logger.debug("skipping_non_numeric_cover_page_value",
-                               concept=concept_name,
-                               value=str(value_str),
-                               value_type=type(value_str).__name__)
+        counts['cover_page'] = _store_statement_values(company_id, filing_id, 'cover_page',
+                                                       cover_df, report_date)
 
         return counts
     except Exception as e:
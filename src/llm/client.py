@@ -1,14 +1,22 @@
+import asyncio
+from dataclasses import dataclass
 import json
+import math
 import re
+import threading
 import time
 
-from typing import Dict, List, Optional
-from ollama import ChatResponse, Client, GenerateResponse, Options
-from transformers import AutoTokenizer
+from typing import Dict, Iterator, List, Optional, TYPE_CHECKING
+from ollama import AsyncClient, ChatResponse, Client, GenerateResponse, Options
 
 from src.database.model_configs import ModelConfig
 from src.utils.config import settings
 from src.utils.logging import get_logger
+from src.utils.metrics import LLM_GENERATION_SECONDS, LLM_TIME_TO_FIRST_TOKEN_SECONDS, LLM_TOKENS, LLM_TOKENS_PER_SECOND
+
+if TYPE_CHECKING:
+    # transformers takes seconds to import, so it is only loaded when a tokenizer is needed
+    from transformers import PreTrainedTokenizerBase
 
 logger = get_logger(__name__)
 
@@ -28,6 +36,21 @@ def retry_backoff(timeout, func, *args, **kwargs):
     else:
         raise TimeoutError
 
+async def async_retry_backoff(timeout, func, *args, **kwargs):
+    backoff = 1
+    logger.debug("async_retry_backoff", backoff=backoff, timeout=timeout, func=func)
+    start = time.time()
+    while time.time() - start < timeout:
+        try:
+            return await func(*args, **kwargs)
+
+        except Exception as e:
+            logger.error("async_retry_backoff", backoff=backoff, error=e)
+            backoff = min(60, backoff * 2)
+            await asyncio.sleep(backoff)
+    else:
+        raise TimeoutError
+
 def init_client(url: str):
     client = Client(host=url)
     try:
@@ -40,6 +63,41 @@ def init_client(url: str):
     return client
 
 
+async def init_async_client(url: str) -> AsyncClient:
+    client = AsyncClient(host=url)
+    try:
+        await async_retry_backoff(3600, client.ps)
+    except TimeoutError as err:
+        logger.error("ollama_connection_failed", url=url, err=err)
+        raise TimeoutError from err
+
+    logger.debug('connected_to_ollama', url=url)
+    return client
+
+
+def record_generation_metrics(model: str, response, output_tokens: Optional[int] = None,
+                              time_to_first_token: Optional[float] = None) -> None:
+    """Record timings and token counts of a completed chat or generate response.
+
+    Token counts and throughput come from Ollama's own eval counters when present.
+    Without a measured time to first token (non-streaming requests), it is taken as
+    model load plus prompt evaluation time.
+    """
+    output_tokens = response.eval_count or output_tokens or 0
+    input_tokens = response.prompt_eval_count or 0
+    LLM_TOKENS.inc(input_tokens, model=model, direction="input")
+    LLM_TOKENS.inc(output_tokens, model=model, direction="output")
+
+    if response.total_duration:
+        LLM_GENERATION_SECONDS.observe(response.total_duration / 1e9, model=model)
+    if time_to_first_token is None and response.prompt_eval_duration is not None:
+        time_to_first_token = ((response.load_duration or 0) + response.prompt_eval_duration) / 1e9
+    if time_to_first_token is not None:
+        LLM_TIME_TO_FIRST_TOKEN_SECONDS.observe(time_to_first_token, model=model)
+    if response.eval_duration and output_tokens:
+        LLM_TOKENS_PER_SECOND.observe(output_tokens / (response.eval_duration / 1e9), model=model)
+
+
 def get_chat_response(
         model_config: ModelConfig,
         messages: List[Dict],
@@ -50,7 +108,7 @@ def get_chat_response(
         client = init_client(settings.openai_api.url)
 
     contents = [msg['content'] for msg in messages]
-    input_tokens = sum(count_tokens(model_config, content) for content in contents)
+    input_tokens = sum(count_tokens_many(model_config, contents))
 
     logger.info("sending_chat_request", model=model_config.model, input_tokens=input_tokens)
 
@@ -70,6 +128,8 @@ def get_chat_response(
     output_tokens=count_tokens(model_config, response.message.content)
     tokens_per_second = output_tokens / duration
 
+    record_generation_metrics(model_config.model, response, output_tokens)
+
     logger.info("recieved_chat_response",
         model=model_config.model,
         done=response.done,
@@ -83,16 +143,77 @@ def get_chat_response(
 
 
 
-def count_tokens(model_config: ModelConfig, content: str):
-    if 'qwen' in model_config.model.lower():
-        encoder = "Qwen/Qwen3-4B"
-    elif 'gemma' in model_config.model.lower():
-        encoder = "google/gemma-3-12b-it"
+# Hugging Face encoders used to count tokens, keyed by model family
+TOKENIZER_ENCODERS: Dict[str, str] = {
+    "qwen": "Qwen/Qwen3-4B",
+    "gemma": "google/gemma-3-12b-it",
+}
+
+# Rough characters-per-token ratio used when no tokenizer is available
+APPROXIMATE_CHARS_PER_TOKEN = 4
+
+# Process-wide tokenizer registry; None marks a family whose tokenizer failed to load
+_tokenizers: Dict[str, Optional["PreTrainedTokenizerBase"]] = {}
+_tokenizers_lock = threading.Lock()
+
 
-    tokenizer = AutoTokenizer.from_pretrained(encoder, token=settings.huggingface_api.token)
-    tokens = tokenizer.encode(content)
+def model_family(model: str) -> Optional[str]:
+    """Derive the tokenizer family from an Ollama model name, e.g. 'qwen3:4b' -> 'qwen'."""
+    model = model.lower()
+    for family in TOKENIZER_ENCODERS:
+        if family in model:
+            return family
+    return None
+
+
+def get_tokenizer(model_config: ModelConfig) -> Optional["PreTrainedTokenizerBase"]:
+    """Get the tokenizer for a model config, loading it at most once per process.
+
+    Returns None for unknown model families, or if the tokenizer could not be loaded.
+    """
+    family = model_family(model_config.model)
+    if family is None:
+        return None
 
-    return len(tokens)
+    tokenizer = _tokenizers.get(family)
+    if tokenizer is not None or family in _tokenizers:
+        return tokenizer
+
+    with _tokenizers_lock:
+        if family not in _tokenizers:
+            encoder = TOKENIZER_ENCODERS[family]
+            try:
+                from transformers import AutoTokenizer
+
+                start = time.time()
+                _tokenizers[family] = AutoTokenizer.from_pretrained(encoder, token=settings.huggingface_api.token)
+                logger.debug("loaded_tokenizer", family=family, encoder=encoder, duration=f"{time.time() - start:.2f}s")
+            except Exception as e:
+                logger.warning("tokenizer_load_failed", family=family, encoder=encoder, error=str(e))
+                _tokenizers[family] = None
+        return _tokenizers[family]
+
+
+def approximate_token_count(content: str) -> int:
+    """Cheap token estimate for models without a known tokenizer."""
+    return math.ceil(len(content or "") / APPROXIMATE_CHARS_PER_TOKEN)
+
+
+def count_tokens(model_config: ModelConfig, content: str) -> int:
+    return count_tokens_many(model_config, [content])[0]
+
+
+def count_tokens_many(model_config: ModelConfig, contents: List[str]) -> List[int]:
+    """Count tokens for several strings with one batched tokenizer call."""
+    if not contents:
+        return []
+
+    tokenizer = get_tokenizer(model_config)
+    if tokenizer is None:
+        return [approximate_token_count(content) for content in contents]
+
+    encoded = tokenizer([content or "" for content in contents])
+    return [len(input_ids) for input_ids in encoded["input_ids"]]
 
 def remove_thinking_tags(content: str):
     if not content:
@@ -108,10 +229,8 @@ def remove_thinking_tags(content: str):
 
 
 
-def get_generate_response(model_config: ModelConfig, system_prompt: str, user_prompt: str, client: Optional[Client] = None) -> tuple[GenerateResponse, Optional[str]]:
-    if not client:
-        client = init_client(settings.openai_api.url)
-
+def prepare_generate_request(model_config: ModelConfig, system_prompt: str, user_prompt: str) -> tuple[Options, Optional[str]]:
+    """Build request options for a generate call and check the input fits the context window."""
     input_tokens = count_tokens(model_config, system_prompt + user_prompt)
 
     logger.info("sending_generate_request", model=model_config.model, input_tokens=input_tokens)
@@ -126,6 +245,15 @@ def get_generate_response(model_config: ModelConfig, system_prompt: str, user_pr
         warning = f"oversized_input: {input_tokens} tokens exceeds num_ctx {num_ctx}"
         logger.warning("oversized_input", tokens=input_tokens, num_ctx=num_ctx)
 
+    return options, warning
+
+
+def get_generate_response(model_config: ModelConfig, system_prompt: str, user_prompt: str, client: Optional[Client] = None) -> tuple[GenerateResponse, Optional[str]]:
+    if not client:
+        client = init_client(settings.openai_api.url)
+
+    options, warning = prepare_generate_request(model_config, system_prompt, user_prompt)
+
     response = retry_backoff(
         timeout=3600,
         func=client.generate,
@@ -138,6 +266,8 @@ def get_generate_response(model_config: ModelConfig, system_prompt: str, user_pr
     output_tokens=count_tokens(model_config, response.response)
     tokens_per_second = output_tokens / duration
 
+    record_generation_metrics(model_config.model, response, output_tokens)
+
     logger.info("recieved_generate_response",
         model=model_config.model,
         done=response.done,
@@ -147,4 +277,102 @@ def get_generate_response(model_config: ModelConfig, system_prompt: str, user_pr
         tokens_per_second=tokens_per_second,
     )
 
-    return response, warning
\ No newline at end of file
+    return response, warning
+
+
+@dataclass
+class StreamChunk:
+    """A piece of a streaming generate response, with throughput so far."""
+    text: str
+    tokens: int
+    elapsed: float
+    time_to_first_token: Optional[float]
+    tokens_per_second: Optional[float]
+    done: bool = False
+
+
+class GenerateStream:
+    """Streaming generate response.
+
+    Iterating yields a StreamChunk as each piece of the response arrives. Once the
+    stream is exhausted, `response` holds a GenerateResponse with the full text and
+    Ollama's final timings, so it can be persisted like a non-streaming response.
+    """
+
+    def __init__(self, model_config: ModelConfig, chunks: Iterator[GenerateResponse], warning: Optional[str]):
+        self.model_config = model_config
+        self.warning = warning
+        self.response: Optional[GenerateResponse] = None
+        self.time_to_first_token: Optional[float] = None
+        self.tokens = 0
+        self._chunks = chunks
+        self._parts: List[str] = []
+
+    @property
+    def content(self) -> str:
+        """Text received so far."""
+        return "".join(self._parts)
+
+    def __iter__(self) -> Iterator[StreamChunk]:
+        start = time.time()
+        for chunk in self._chunks:
+            now = time.time()
+            text = chunk.response or ""
+            if text:
+                if self.time_to_first_token is None:
+                    self.time_to_first_token = now - start
+                    logger.debug("first_token_received", model=self.model_config.model,
+                                 time_to_first_token=f"{self.time_to_first_token:.2f}s")
+                # Ollama streams roughly one token per chunk
+                self.tokens += 1
+                self._parts.append(text)
+
+            generating = now - start - (self.time_to_first_token or 0)
+            yield StreamChunk(
+                text=text,
+                tokens=self.tokens,
+                elapsed=now - start,
+                time_to_first_token=self.time_to_first_token,
+                tokens_per_second=self.tokens / generating if generating > 0 else None,
+                done=bool(chunk.done),
+            )
+
+            if chunk.done:
+                self.response = chunk.model_copy(update={'response': self.content})
+
+        if self.response is None:
+            raise RuntimeError(f"Stream from {self.model_config.model} ended before completion")
+
+        duration = self.response.total_duration / 1e9 if self.response.total_duration else time.time() - start
+        output_tokens = self.response.eval_count or self.tokens
+        record_generation_metrics(self.model_config.model, self.response, self.tokens, self.time_to_first_token)
+
+        logger.info("recieved_generate_stream",
+            model=self.model_config.model,
+            done_reason=self.response.done_reason,
+            duration=f"{duration:.2f}s",
+            time_to_first_token=f"{self.time_to_first_token:.2f}s" if self.time_to_first_token is not None else None,
+            output_tokens=output_tokens,
+            tokens_per_second=f"{output_tokens / duration:0.2f} tokens/s" if duration else None,
+        )
+
+
+def stream_generate_response(model_config: ModelConfig, system_prompt: str, user_prompt: str, client: Optional[Client] = None) -> GenerateStream:
+    """Start a streaming generate request.
+
+    Unlike get_generate_response the request is not retried, since a retry after
+    partial output would repeat text the caller has already consumed.
+    """
+    if not client:
+        client = init_client(settings.openai_api.url)
+
+    options, warning = prepare_generate_request(model_config, system_prompt, user_prompt)
+
+    chunks = client.generate(
+        model=model_config.model,
+        system=system_prompt,
+        prompt=user_prompt,
+        options=options,
+        stream=True,
+    )
+    return GenerateStream(model_config, chunks, warning)
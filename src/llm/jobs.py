@@ -0,0 +1,241 @@
+"""Concurrent runner for batches of content generation jobs.
+
+Jobs are issued to the Ollama endpoint with asyncio, bounded by a global
+concurrency limit and a per-model semaphore, so a local GPU box stays busy
+instead of idling between requests. Each result is persisted through
+create_generated_content as soon as it completes.
+"""
+import asyncio
+from dataclasses import dataclass, field
+import hashlib
+import time
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from ollama import AsyncClient, GenerateResponse
+from src.database.base import get_db_session
+from src.database.documents import Document, DocumentType
+import src.database.generated_content as db
+from src.database.model_configs import ModelConfig
+from src.database.prompts import Prompt
+from src.llm.client import async_retry_backoff, count_tokens, init_async_client, prepare_generate_request, record_generation_metrics
+from src.llm.prompts import format_user_prompt_content, save_user_prompt
+from src.utils.config import settings
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class GenerationJob:
+    """A single (prompt, model config, sources) generation request."""
+    system_prompt: Prompt
+    model_config: ModelConfig
+    source_documents: List[Document] = field(default_factory=list)
+    source_content: List[db.GeneratedContent] = field(default_factory=list)
+    additional_text: Optional[str] = None
+    company_id: Optional[UUID] = None
+    description: Optional[str] = None
+    document_type: Optional[DocumentType] = None
+    kind: Optional[db.ContentKind] = None
+
+
+@dataclass
+class GenerationResult:
+    """Outcome of a generation job."""
+    job: GenerationJob
+    generated_content: Optional[db.GeneratedContent] = None
+    was_created: bool = False
+    skipped: bool = False
+    warning: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def job_input_fingerprint(job: GenerationJob, user_prompt: str) -> str:
+    """Compute the input fingerprint of a job from its model config, prompts and sources."""
+    return db.compute_input_fingerprint(
+        job.model_config.content_hash,
+        job.system_prompt.content_hash,
+        hashlib.sha256(user_prompt.encode('utf-8')).hexdigest(),
+        [doc.content_hash for doc in job.source_documents],
+        [content.content_hash for content in job.source_content],
+    )
+
+
+def save_generated_content(job: GenerationJob, response: GenerateResponse, warning: Optional[str],
+                           input_fingerprint: Optional[str] = None) -> tuple[db.GeneratedContent, bool]:
+    """Persist a generation response, its user prompt and source associations.
+
+    Args:
+        job: The job that produced the response
+        response: Response from the generate endpoint
+        warning: Warning raised while preparing the request, if any
+        input_fingerprint: Fingerprint of the job's inputs
+
+    Returns:
+        Tuple of (GeneratedContent object, was_created: bool)
+    """
+    user_prompt_obj, _ = save_user_prompt(job.system_prompt, job.source_documents, job.source_content,
+                                          job.additional_text)
+
+    if job.source_documents and job.source_content:
+        source_type = db.ContentSourceType.BOTH
+    elif job.source_content:
+        source_type = db.ContentSourceType.GENERATED_CONTENT
+    else:
+        source_type = db.ContentSourceType.DOCUMENTS
+
+    generated_content_obj, was_created = db.create_generated_content({
+        'content': response.response,
+        'company_id': job.company_id,
+        'description': job.description,
+        'document_type': job.document_type,
+        'kind': job.kind,
+        'source_type': source_type,
+        'total_duration': response.total_duration / 1e9 if response.total_duration else None,
+        'warning': warning,
+        'input_fingerprint': input_fingerprint,
+        'model_config_id': job.model_config.id,
+        'system_prompt_id': job.system_prompt.id,
+        'user_prompt_id': user_prompt_obj.id
+    })
+
+    # Associate source documents and content with the generated content (only if newly created)
+    if was_created:
+        session = get_db_session()
+        if job.source_documents:
+            generated_content_obj.source_documents.extend(job.source_documents)
+        if job.source_content:
+            generated_content_obj.source_content.extend(job.source_content)
+        session.commit()
+
+    return generated_content_obj, was_created
+
+
+class GenerationJobRunner:
+    """Runs generation jobs concurrently with global and per-model limits."""
+
+    def __init__(self, max_concurrency: int = None, per_model_concurrency: int = None, url: Optional[str] = None,
+                 skip_existing: bool = True):
+        """
+        Initialize the runner.
+
+        Args:
+            max_concurrency: Maximum number of in-flight requests across all models
+            per_model_concurrency: Maximum number of in-flight requests per model
+            url: Ollama endpoint URL (defaults to settings)
+            skip_existing: Reuse content generated from inputs with the same fingerprint instead of
+                calling the model (disable to force regeneration)
+        """
+        self.max_concurrency = max_concurrency or settings.openai_api.max_concurrency
+        self.per_model_concurrency = per_model_concurrency or settings.openai_api.per_model_concurrency
+        self.url = url or settings.openai_api.url
+        self.skip_existing = skip_existing
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._model_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def _model_semaphore(self, model: str) -> asyncio.Semaphore:
+        if model not in self._model_semaphores:
+            self._model_semaphores[model] = asyncio.Semaphore(self.per_model_concurrency)
+        return self._model_semaphores[model]
+
+    async def run_job(self, client: AsyncClient, job: GenerationJob, index: int = 0) -> GenerationResult:
+        """Run a single job, sharing this runner's concurrency limits with any other in-flight jobs."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        model_config = job.model_config
+        try:
+            user_prompt = format_user_prompt_content(
+                source_documents=job.source_documents or None,
+                source_content=job.source_content or None,
+                additional_text=job.additional_text
+            )
+
+            input_fingerprint = job_input_fingerprint(job, user_prompt)
+            if self.skip_existing:
+                existing = db.get_generated_content_by_input_fingerprint(input_fingerprint)
+                if existing:
+                    logger.info("generation_job_skipped", job=index, hash=existing.get_short_hash())
+                    return GenerationResult(job=job, generated_content=existing, skipped=True,
+                                            warning=existing.warning)
+
+            options, warning = prepare_generate_request(model_config, job.system_prompt.content, user_prompt)
+
+            # Wait for the model's slot before taking a global one, so jobs queued behind a
+            # busy model don't hold global slots that jobs for other models could use
+            async with self._model_semaphore(model_config.model):
+                async with self._semaphore:
+                    logger.info("generation_job_started", job=index, model=model_config.model)
+                    response = await async_retry_backoff(
+                        3600,
+                        client.generate,
+                        model=model_config.model,
+                        system=job.system_prompt.content,
+                        prompt=user_prompt,
+                        options=options,
+                    )
+
+            duration = response.total_duration / 1e9 if response.total_duration else None
+            output_tokens = count_tokens(model_config, response.response)
+            record_generation_metrics(model_config.model, response, output_tokens)
+            logger.info("generation_job_complete",
+                        job=index,
+                        model=model_config.model,
+                        duration=f"{duration:.2f}s" if duration else None,
+                        output_tokens=output_tokens,
+                        tokens_per_second=f"{output_tokens / duration:0.2f} tokens/s" if duration else None)
+
+            # All jobs share the event loop thread, so database writes never run concurrently
+            generated_content_obj, was_created = save_generated_content(
+                job, response, warning, input_fingerprint)
+            return GenerationResult(job=job, generated_content=generated_content_obj,
+                                    was_created=was_created, warning=warning)
+        except Exception as e:
+            logger.error("generation_job_failed", job=index, model=model_config.model, error=str(e), exc_info=True)
+            get_db_session().rollback()
+            return GenerationResult(job=job, error=str(e))
+
+    async def run(self, jobs: List[GenerationJob], client: Optional[AsyncClient] = None) -> List[GenerationResult]:
+        """Run all jobs and return their results in submission order."""
+        if not jobs:
+            return []
+
+        if client is None:
+            client = await init_async_client(self.url)
+        start = time.time()
+
+        logger.info("generation_jobs_started", jobs=len(jobs), max_concurrency=self.max_concurrency,
+                    per_model_concurrency=self.per_model_concurrency)
+        results = await asyncio.gather(*(
+            self.run_job(client, job, index) for index, job in enumerate(jobs)
+        ))
+        logger.info("generation_jobs_complete",
+                    jobs=len(jobs),
+                    failed=sum(1 for result in results if not result.ok),
+                    skipped=sum(1 for result in results if result.skipped),
+                    duration=f"{time.time() - start:.2f}s")
+        return list(results)
+
+
+def run_generation_jobs(jobs: List[GenerationJob], max_concurrency: int = None,
+                        per_model_concurrency: int = None, url: Optional[str] = None,
+                        force: bool = False) -> List[GenerationResult]:
+    """Run a batch of generation jobs concurrently from synchronous code.
+
+    Args:
+        jobs: Jobs to run
+        max_concurrency: Maximum number of in-flight requests across all models
+        per_model_concurrency: Maximum number of in-flight requests per model
+        url: Ollama endpoint URL (defaults to settings)
+        force: Call the model even if content was already generated from the same inputs
+
+    Returns:
+        List of GenerationResult objects in the same order as jobs
+    """
+    runner = GenerationJobRunner(max_concurrency, per_model_concurrency, url, skip_existing=not force)
+    return asyncio.run(runner.run(jobs))
@@ -0,0 +1,216 @@
+"""In-process summary pipeline for a company's filings.
+
+For each document type the pipeline runs a small DAG:
+
+    single summary (one per filing) -> aggregate summary -> frontpage summary
+
+Everything runs in one process with one database session and one Ollama client.
+Single summaries, and separate document types, are independent branches and run
+concurrently through a shared GenerationJobRunner. Nodes whose inputs were already
+generated are reused instead of calling the model again.
+"""
+import asyncio
+from dataclasses import dataclass, field
+import json
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from src.database.companies import Company, get_company_by_ticker
+from src.database.documents import DocumentType, get_documents_by_filing
+from src.database.filings import Filing, get_filing, get_filings_page
+from src.database.generated_content import ContentKind
+from src.database.model_configs import get_or_create_model_config, ModelConfig
+from src.database.prompts import create_prompt, Prompt, PromptRole
+from src.llm.client import init_async_client
+from src.llm.jobs import GenerationJob, GenerationJobRunner, GenerationResult
+from src.llm.prompts import load_prompt_file
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+SINGLE_SUMMARY = "single"
+AGGREGATE_SUMMARY = "aggregate"
+FRONTPAGE_SUMMARY = "frontpage"
+
+# (model, option overrides) for each stage of the pipeline
+DEFAULT_PIPELINE_MODELS: Dict[str, Tuple[str, Dict]] = {
+    SINGLE_SUMMARY: ("qwen3:4b", {"num_ctx": 28567}),
+    AGGREGATE_SUMMARY: ("qwen3:14b", {"num_ctx": 8000}),
+    FRONTPAGE_SUMMARY: ("gemma3:12b", {"num_ctx": 10000}),
+}
+
+AGGREGATE_SUMMARY_PROMPT_NAME = "aggregate-summary"
+FRONTPAGE_SUMMARY_PROMPT_NAME = "general-summary"
+
+
+@dataclass
+class PipelineResult:
+    """Results of the summary DAG for one document type."""
+    document_type: DocumentType
+    single_summaries: List[GenerationResult] = field(default_factory=list)
+    aggregate_summary: Optional[GenerationResult] = None
+    frontpage_summary: Optional[GenerationResult] = None
+
+    @property
+    def results(self) -> List[GenerationResult]:
+        return [r for r in [*self.single_summaries, self.aggregate_summary, self.frontpage_summary] if r]
+
+    @property
+    def ok(self) -> bool:
+        # A document type with no documents for these filings is not a failure
+        if not self.single_summaries:
+            return True
+        return self.frontpage_summary is not None and all(r.ok for r in self.results)
+
+
+def get_pipeline_model_config(model: str, options: Dict) -> ModelConfig:
+    """Get or create a model config with default options plus the given overrides."""
+    config_options = json.loads(ModelConfig.create_default(model).options_json)
+    config_options.update(options)
+    return get_or_create_model_config({
+        'model': model,
+        'options_json': json.dumps(config_options, sort_keys=True)
+    })
+
+
+def get_pipeline_prompt(name: str) -> Prompt:
+    """Get or create a system prompt from prompts/{name}/prompt.md."""
+    prompt_obj, _ = create_prompt({
+        'name': name,
+        'description': f"Prompt: {name}",
+        'role': PromptRole.SYSTEM,
+        'content': load_prompt_file(name)
+    })
+    return prompt_obj
+
+
+def get_latest_filings(company_id: UUID, form: str, count: int) -> List[Filing]:
+    """Get the latest filings of a form for a company, newest first."""
+    return get_filings_page(company_id, form=form, limit=count).items
+
+
+class SummaryPipeline:
+    """Runs the single -> aggregate -> frontpage summary DAG for a company."""
+
+    def __init__(self, company: Company, filings: List[Filing], runner: GenerationJobRunner,
+                 models: Dict[str, Tuple[str, Dict]] = None):
+        """
+        Initialize the pipeline.
+
+        Args:
+            company: Company the filings belong to
+            filings: Filings to summarize, newest first
+            runner: Job runner shared by every branch of the pipeline
+            models: (model, option overrides) per stage, defaults to DEFAULT_PIPELINE_MODELS
+        """
+        self.company = company
+        self.filings = filings
+        self.runner = runner
+
+        models = models or DEFAULT_PIPELINE_MODELS
+        self.model_configs = {stage: get_pipeline_model_config(model, options) for stage, (model, options) in models.items()}
+        self.aggregate_prompt = get_pipeline_prompt(AGGREGATE_SUMMARY_PROMPT_NAME)
+        self.frontpage_prompt = get_pipeline_prompt(FRONTPAGE_SUMMARY_PROMPT_NAME)
+
+    def _job(self, stage: str, prompt: Prompt, document_type: DocumentType, **sources) -> GenerationJob:
+        return GenerationJob(
+            system_prompt=prompt,
+            model_config=self.model_configs[stage],
+            company_id=self.company.id,
+            description=f"{document_type.value}_{stage}_summary",
+            document_type=document_type,
+            kind=ContentKind(stage),
+            **sources,
+        )
+
+    async def run_document_type(self, client, document_type: DocumentType) -> PipelineResult:
+        """Run the DAG for one document type."""
+        result = PipelineResult(document_type=document_type)
+        single_prompt = get_pipeline_prompt(document_type.value)
+
+        documents = [
+            document
+            for filing in self.filings
+            for document in get_documents_by_filing(filing.id)
+            if document.document_type == document_type
+        ]
+        if not documents:
+            logger.warning("pipeline_no_documents", ticker=self.company.ticker, document_type=document_type.value)
+            return result
+
+        result.single_summaries = list(await asyncio.gather(*(
+            self.runner.run_job(client, self._job(SINGLE_SUMMARY, single_prompt, document_type,
+                                                  source_documents=[document]))
+            for document in documents
+        )))
+        single_summaries = [r.generated_content for r in result.single_summaries if r.ok]
+        if len(single_summaries) < len(documents):
+            logger.error("pipeline_single_summaries_failed", ticker=self.company.ticker,
+                         document_type=document_type.value)
+            return result
+
+        result.aggregate_summary = await self.runner.run_job(
+            client, self._job(AGGREGATE_SUMMARY, self.aggregate_prompt, document_type, source_content=single_summaries))
+        if not result.aggregate_summary.ok:
+            return result
+
+        result.frontpage_summary = await self.runner.run_job(
+            client, self._job(FRONTPAGE_SUMMARY, self.frontpage_prompt, document_type,
+                              source_content=[result.aggregate_summary.generated_content]))
+        return result
+
+    async def run(self, document_types: List[DocumentType]) -> List[PipelineResult]:
+        """Run the DAG for every document type concurrently with one shared client."""
+        client = await init_async_client(self.runner.url)
+        return list(await asyncio.gather(*(
+            self.run_document_type(client, document_type) for document_type in document_types
+        )))
+
+
+def run_pipeline(ticker: str, form: str, count: int, document_types: List[DocumentType], ingest: bool = True,
+                 max_concurrency: int = None, per_model_concurrency: int = None,
+                 force: bool = False) -> List[PipelineResult]:
+    """Ingest a company's filings and run the summary DAG for each document type.
+
+    Args:
+        ticker: Company ticker symbol
+        form: Form type (10-K, 10-Q, etc.)
+        count: Number of latest filings to summarize
+        document_types: Document types to summarize
+        ingest: Whether to ingest the company and filings from EDGAR first
+        max_concurrency: Maximum number of in-flight LLM requests
+        per_model_concurrency: Maximum number of in-flight LLM requests per model
+        force: Regenerate every node even if its inputs were already generated
+
+    Returns:
+        List of PipelineResult objects, one per document type
+    """
+    ticker = ticker.upper()
+
+    if ingest:
+        # Imported here so summarizing already-ingested filings doesn't load edgartools
+        from src.ingestion.ingestion_helpers import ingest_company, ingest_filings
+
+        company = get_company_by_ticker(ticker)
+        company_id = company.id if company else ingest_company(ticker)[1]
+        filing_info = ingest_filings(company_id, ticker=ticker, form=form, count=count)
+        filings = [get_filing(info[3]) for info in filing_info]
+        company = get_company_by_ticker(ticker)
+    else:
+        company = get_company_by_ticker(ticker)
+        if not company:
+            raise ValueError(f"Company {ticker} not found")
+        filings = get_latest_filings(company.id, form, count)
+
+    logger.info("pipeline_started", ticker=ticker, form=form, filings=len(filings),
+                document_types=[d.value for d in document_types])
+
+    runner = GenerationJobRunner(max_concurrency, per_model_concurrency, skip_existing=not force)
+    pipeline = SummaryPipeline(company, filings, runner)
+    results = asyncio.run(pipeline.run(document_types))
+
+    logger.info("pipeline_complete", ticker=ticker, form=form,
+                generated=sum(1 for r in results for g in r.results if g.was_created),
+                skipped=sum(1 for r in results for g in r.results if g.skipped),
+                failed=sum(1 for r in results for g in r.results if not g.ok))
+    return results
@@ -8,15 +8,36 @@ This module provides:
 """
 
 from enum import Enum
-from typing import List, Optional
+from functools import lru_cache
+import hashlib
+from pathlib import Path
+import re
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+from uuid import UUID
 
+from src.database.base import get_db_session
 from src.database.documents import Document, DocumentType
 from src.database.generated_content import GeneratedContent
+from src.database.prompts import compute_recipe_hash, create_user_prompt, Prompt
+from src.database.prompts import PromptRole as DbPromptRole
 from src.llm.client import remove_thinking_tags
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Version of the format_user_prompt_content layout; bump when the layout changes so
+# user prompts stored as recipes keep rendering the way they were sent
+USER_PROMPT_TEMPLATE_VERSION = 1
+
+# Number of rendered user prompts kept in memory
+USER_PROMPT_RENDER_CACHE_SIZE = 16
+
+_ADDITIONAL_CONTENT_PATTERN = re.compile(r"\n<additional_content>\n(?P<text>.*)\n</additional_content>\n$", re.DOTALL)
+
+
+class StaleUserPromptError(ValueError):
+    """Raised when a recipe's sources have changed since the prompt was sent."""
+
 class PromptRole(str, Enum):
     """Enumeration of valid prompt roles."""
     SYSTEM = "system"
@@ -83,6 +104,41 @@ Consider these historical reports. Write 100 words providing an overview of the
 """
 
 
+def load_prompt_file(name: str, prompts_dir: Union[str, Path] = "prompts") -> str:
+    """
+    Load prompt content from {prompts_dir}/{name}/prompt.md.
+
+    Examples in {prompts_dir}/{name}/examples/*.md are appended in sorted order.
+
+    Args:
+        name: Name of the prompt directory
+        prompts_dir: Directory containing prompt directories
+
+    Returns:
+        Prompt content as a string
+
+    Raises:
+        FileNotFoundError: If the prompt file does not exist
+    """
+    prompt_dir = Path(prompts_dir) / name
+    prompt_file = prompt_dir / "prompt.md"
+    examples_dir = prompt_dir / "examples"
+
+    if not prompt_file.exists():
+        raise FileNotFoundError(f"{prompt_file} does not exist")
+
+    # Read main prompt content
+    content = prompt_file.read_text().strip()
+
+    # Append examples if they exist
+    if examples_dir.exists() and examples_dir.is_dir():
+        for example_file in sorted(examples_dir.glob("*.md")):
+            content += "\n\n"
+            content += example_file.read_text().strip()
+
+    return content
+
+
 def format_user_prompt_content(
     source_documents: Optional[List[Document]] = None,
     source_content: Optional[List[GeneratedContent]] = None,
@@ -150,4 +206,176 @@ def format_user_prompt_content(
 </additional_content>
 """)
 
-    return ("").join(formatted_parts)
\ No newline at end of file
+    return ("").join(formatted_parts)
+
+
+def save_user_prompt(system_prompt: Prompt, source_documents: Sequence[Document],
+                     source_content: Sequence[GeneratedContent],
+                     additional_text: Optional[str] = None) -> Tuple[Prompt, bool]:
+    """
+    Save the user prompt for a generation as a recipe of its sources.
+
+    Args:
+        system_prompt: System prompt the user prompt was sent with
+        source_documents: Source documents, in prompt order
+        source_content: Source generated content, in prompt order
+        additional_text: Additional text appended to the prompt
+
+    Returns:
+        Tuple of (Prompt object, was_created: bool)
+    """
+    return create_user_prompt(
+        name=f"User prompt for {system_prompt.name}",
+        description=f"Generated user prompt combining {len(source_documents)} documents, {len(source_content)} content items" + (", and additional text" if additional_text else ""),
+        template_version=USER_PROMPT_TEMPLATE_VERSION,
+        source_documents=source_documents,
+        source_content=source_content,
+        additional_text=additional_text,
+    )
+
+
+def _load_in_order(model, ids: Sequence[UUID]) -> list:
+    if not ids:
+        return []
+    by_id = {obj.id: obj for obj in get_db_session().query(model).filter(model.id.in_(ids)).all()}
+    missing = [str(obj_id) for obj_id in ids if obj_id not in by_id]
+    if missing:
+        raise ValueError(f"Sources of user prompt no longer exist: {', '.join(missing)}")
+    return [by_id[obj_id] for obj_id in ids]
+
+
+@lru_cache(maxsize=USER_PROMPT_RENDER_CACHE_SIZE)
+def _render_recipe(content_hash: str, template_version: int, source_document_ids: Tuple[UUID, ...],
+                   source_content_ids: Tuple[UUID, ...], additional_text: Optional[str]) -> str:
+    if template_version != USER_PROMPT_TEMPLATE_VERSION:
+        raise ValueError(f"Unsupported user prompt template version {template_version}")
+    documents = _load_in_order(Document, source_document_ids)
+    contents = _load_in_order(GeneratedContent, source_content_ids)
+    text = format_user_prompt_content(documents or None, contents or None, additional_text)
+
+    # Sources are updated in place on re-ingestion, so check they still render the
+    # prompt that was sent: recipes created as recipes are hashed over their sources'
+    # content hashes, compacted prompts keep the hash of their text
+    if (content_hash != compute_recipe_hash(template_version, documents, contents, additional_text)
+            and content_hash != hashlib.sha256(text.encode('utf-8')).hexdigest()):
+        logger.warning("stale_user_prompt_recipe", content_hash=content_hash)
+        raise StaleUserPromptError(f"Sources of user prompt {content_hash[:12]} have changed since it was sent")
+    return text
+
+
+def render_user_prompt(prompt: Prompt) -> Optional[str]:
+    """
+    Get the text of a prompt, rendering it from its sources if it is stored as a recipe.
+
+    Rendered recipes are cached. Rendering uses the sources' current content, and
+    is refused if that content no longer matches the prompt's content hash.
+
+    Args:
+        prompt: Prompt to render
+
+    Returns:
+        Prompt text
+
+    Raises:
+        StaleUserPromptError: If a source's content has changed since the prompt was sent
+        ValueError: If a source no longer exists or the template version is unknown
+    """
+    if not prompt.is_recipe:
+        return prompt.content
+    return _render_recipe(
+        prompt.content_hash,
+        prompt.template_version,
+        tuple(prompt.source_document_ids or ()),
+        tuple(prompt.source_content_ids or ()),
+        prompt.additional_text,
+    )
+
+
+def _order_by_position(text: str, sources: Sequence, render: Callable[[object], str]) -> Optional[list]:
+    # Sources are associated with generated content without an order; recover the
+    # prompt order from where each source's block appears in the text
+    positions = []
+    for source in sources:
+        position = text.find(render(source))
+        if position < 0:
+            return None
+        positions.append((position, source))
+    return [source for _, source in sorted(positions, key=lambda p: p[0])]
+
+
+def _recover_recipe(prompt: Prompt) -> Optional[Tuple[List[Document], List[GeneratedContent], Optional[str]]]:
+    generated = (
+        get_db_session().query(GeneratedContent)
+        .filter(GeneratedContent.user_prompt_id == prompt.id)
+        .first()
+    )
+    if not generated:
+        return None
+
+    text = prompt.content
+    match = _ADDITIONAL_CONTENT_PATTERN.search(text)
+    additional_text = match.group("text") if match else None
+
+    try:
+        documents = _order_by_position(text, generated.source_documents,
+                                       lambda d: format_user_prompt_content(source_documents=[d]))
+        contents = _order_by_position(text, generated.source_content,
+                                      lambda c: format_user_prompt_content(source_content=[c]))
+        if documents is None or contents is None:
+            return None
+
+        # Only compact when the recipe renders back to exactly the stored text
+        rendered = format_user_prompt_content(documents or None, contents or None, additional_text)
+    except AttributeError:
+        # Sources missing their filing or company can't be rendered
+        return None
+    if rendered != text:
+        return None
+    return documents, contents, additional_text
+
+
+def compact_user_prompts(dry_run: bool = False) -> Dict[str, int]:
+    """
+    Convert materialized user prompts to recipes where the recipe renders the same text.
+
+    A prompt is compacted only if a generation that used it has sources from which
+    the stored text can be rendered exactly; other prompts are left as they are. The
+    content hash is kept, so links to compacted prompts keep working.
+
+    Args:
+        dry_run: Count the prompts that would be compacted without changing them
+
+    Returns:
+        Dictionary with the number of 'compacted' and 'skipped' prompts
+    """
+    session = get_db_session()
+    prompt_ids = [
+        prompt_id for prompt_id, in session.query(Prompt.id)
+        .filter(Prompt.role == DbPromptRole.USER)
+        .filter(Prompt.content.is_not(None))
+        .filter(Prompt.template_version.is_(None))
+        .order_by(Prompt.id)
+    ]
+
+    counts = {"compacted": 0, "skipped": 0}
+    for prompt_id in prompt_ids:
+        prompt = session.get(Prompt, prompt_id)
+        recipe = _recover_recipe(prompt)
+        if recipe is None:
+            counts["skipped"] += 1
+            continue
+
+        counts["compacted"] += 1
+        if not dry_run:
+            documents, contents, additional_text = recipe
+            prompt.template_version = USER_PROMPT_TEMPLATE_VERSION
+            prompt.source_document_ids = [document.id for document in documents]
+            prompt.source_content_ids = [content.id for content in contents]
+            prompt.additional_text = additional_text
+            prompt.content = None
+            session.commit()
+        # Release the loaded prompt and source text before the next prompt
+        session.expire_all()
+
+    logger.info("compacted_user_prompts", dry_run=dry_run, **counts)
+    return counts
@@ -2,8 +2,11 @@
 from unittest.mock import patch
 
 from fastapi.testclient import TestClient
+import pytest
 from src.api.main import create_app
+from src.api.schemas import NEXT_CURSOR_HEADER
 from src.database.companies import Company
+from src.database.pagination import InvalidCursorError, Page
 from uuid_extensions import uuid7
 
 client = TestClient(create_app())
@@ -70,6 +73,25 @@ class TestCompanyApi:
         # Verify the mock was called with the correct arguments
         mock_search_companies.assert_called_once_with("test", 10)
 
+    @patch("src.api.routes.companies.get_frontpage_summaries_by_company_ids")
+    @patch("src.api.routes.companies.search_companies_by_query")
+    def test_search_companies_partial_batches_summaries(self, mock_search_companies, mock_get_frontpage_summaries):
+        """Test that summaries for all search results are loaded with one call."""
+        mock_search_companies.return_value = SAMPLE_SEARCH_RESULTS
+        mock_get_frontpage_summaries.return_value = {SAMPLE_COMPANY_ID: "Test company frontpage summary"}
+
+        # Make the API call
+        response = client.get("/companies/search?query=test&limit=10")
+
+        # Assertions
+        assert response.status_code == 200
+        data = response.json()
+        assert data[0]["summary"] == "Test company frontpage summary"
+        assert data[1]["summary"] is None
+
+        # Verify summaries were resolved once for the whole page
+        mock_get_frontpage_summaries.assert_called_once_with([company.id for company in SAMPLE_SEARCH_RESULTS])
+
     @patch("src.api.routes.companies.search_companies_by_query")
     def test_search_companies_partial_empty_results(self, mock_search_companies):
         """Test searching companies with query that returns no results."""
@@ -170,14 +192,14 @@ class TestCompanyApi:
         assert response.status_code == 422
         assert "uuid_parsing" in str(response.json())
 
-    @patch("src.api.routes.companies.get_frontpage_summary_by_ticker")
+    @patch("src.api.routes.companies.get_frontpage_summaries_by_company_ids")
     @patch("src.api.routes.companies.get_company_by_ticker")
     def test_search_companies_by_ticker_found(self, mock_get_company_by_ticker, mock_get_frontpage_summary):
         """Test searching for a company by ticker when it exists."""
         # Setup the mock to return our sample company as a dictionary
         mock_get_company_by_ticker.return_value = SAMPLE_COMPANY_DATA
         # Mock the frontpage summary retrieval
-        mock_get_frontpage_summary.return_value = "Test company frontpage summary"
+        mock_get_frontpage_summary.return_value = {SAMPLE_COMPANY_ID: "Test company frontpage summary"}
 
         # Make the API call
         response = client.get("/companies/?ticker=TEST")
@@ -192,17 +214,18 @@ class TestCompanyApi:
         assert company["id"] == str(SAMPLE_COMPANY_ID)
         assert company["name"] == "Test Company"
         assert company["ticker"] == "TEST"
+        assert company["summary"] == "Test company frontpage summary"
 
         # Verify the mock was called with the correct arguments
         mock_get_company_by_ticker.assert_called_once_with("TEST")
 
-    @patch("src.api.routes.companies.get_frontpage_summary_by_ticker")
+    @patch("src.api.routes.companies.get_frontpage_summaries_by_company_ids")
     @patch("src.api.routes.companies.get_company_by_ticker")
     def test_search_companies_by_ticker_not_found(self, mock_get_company_by_ticker, mock_get_frontpage_summary):
         """Test searching for a company by ticker when it doesn't exist."""
         # Setup the mock to return None (company not found)
         mock_get_company_by_ticker.return_value = None
-        mock_get_frontpage_summary.return_value = None
+        mock_get_frontpage_summary.return_value = {}
 
         # Make the API call
         response = client.get("/companies/?ticker=NONEXISTENT")
@@ -214,3 +237,77 @@ class TestCompanyApi:
         # Verify the mock was called with the correct arguments
         mock_get_company_by_ticker.assert_called_once_with("NONEXISTENT")
 
+    @patch("src.api.routes.companies.get_frontpage_summaries_by_company_ids")
+    @patch("src.api.routes.companies.list_companies_page")
+    def test_get_companies_cursor(self, mock_list_companies_page, mock_get_frontpage_summaries):
+        """Test that the company list returns the next page's cursor in a header."""
+        mock_list_companies_page.return_value = Page(items=SAMPLE_SEARCH_RESULTS, next_cursor="next-page")
+        mock_get_frontpage_summaries.return_value = {}
+
+        response = client.get("/companies/?limit=2&cursor=this-page")
+
+        assert response.status_code == 200
+        assert len(response.json()) == 2
+        assert response.headers[NEXT_CURSOR_HEADER] == "next-page"
+        mock_list_companies_page.assert_called_once_with(cursor="this-page", limit=2)
+
+    @patch("src.api.routes.companies.list_companies_page")
+    def test_get_companies_invalid_cursor(self, mock_list_companies_page):
+        """Test that a malformed cursor is rejected."""
+        mock_list_companies_page.side_effect = InvalidCursorError("Invalid cursor: bad")
+
+        response = client.get("/companies/?cursor=bad")
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid cursor: bad"
+
+
+@pytest.fixture
+def company_search_index():
+    """Build the company search index from this test's companies."""
+    import src.database.companies as companies_module
+
+    companies_module.invalidate_company_search_index()
+    yield
+    companies_module.invalidate_company_search_index()
+
+
+class TestCompanyApiQueryCount:
+    """Regression tests for the number of queries each company route runs.
+
+    Each route should make one query for the companies and one for their summaries,
+    however many companies, filings or documents there are.
+    """
+
+    @pytest.mark.parametrize("path", [
+        "/companies/search?query=Query%20Count&limit=50",
+        "/companies?search=Query%20Count&limit=50",
+        "/companies?limit=100",
+    ])
+    def test_company_list_routes(self, populated_companies, company_search_index, query_budget, path):
+        with query_budget(2) as queries:
+            response = client.get(path)
+
+        assert response.status_code == 200
+        summaries = {company["ticker"]: company["summary"] for company in response.json()}
+        assert summaries["QC0"] == "Summary for company 0"
+        assert len(queries) == 2
+
+    def test_get_company_by_id_route(self, populated_companies, query_budget):
+        # Read the id first: the fixture's commit expired the company, and refreshing it would count
+        company_id = populated_companies[0].id
+        with query_budget(2) as queries:
+            response = client.get(f"/companies/id/{company_id}")
+
+        assert response.status_code == 200
+        assert response.json()["summary"] == "Summary for company 0"
+        assert len(queries) == 2
+
+    @pytest.mark.parametrize("path", ["/companies/by-ticker/QC1", "/companies?ticker=QC1"])
+    def test_get_company_by_ticker_routes(self, populated_companies, query_budget, path):
+        with query_budget(2) as queries:
+            response = client.get(path)
+
+        assert response.status_code == 200
+        assert "Summary for company 1" in response.text
+        assert len(queries) == 2
@@ -2,6 +2,7 @@
 from unittest.mock import patch
 
 from fastapi.testclient import TestClient
+import pytest
 from src.api.main import create_app
 from src.database.companies import Company
 from src.database.documents import Document, DocumentType
@@ -66,7 +67,7 @@ class TestDocumentApi:
         assert data["filing"] is None
 
         # Verify the mock was called with the correct arguments
-        mock_get_document.assert_called_once_with(SAMPLE_DOCUMENT_ID)
+        mock_get_document.assert_called_once_with(SAMPLE_DOCUMENT_ID, include_content=True)
 
     @patch("src.api.routes.documents.get_document")
     def test_get_document_by_id_not_found(self, mock_get_document):
@@ -82,7 +83,7 @@ class TestDocumentApi:
         assert response.json()["detail"] == "Document not found"
 
         # Verify the mock was called with the correct arguments
-        mock_get_document.assert_called_once_with(SAMPLE_DOCUMENT_ID)
+        mock_get_document.assert_called_once_with(SAMPLE_DOCUMENT_ID, include_content=True)
 
     def test_get_document_by_id_invalid_uuid(self):
         """Test retrieving a document with an invalid UUID format."""
@@ -109,7 +110,7 @@ class TestDocumentApi:
         assert response.text == "This is a sample 10-K document content"
 
         # Verify the mock was called with the correct arguments
-        mock_get_document.assert_called_once_with(SAMPLE_DOCUMENT_ID)
+        mock_get_document.assert_called_once_with(SAMPLE_DOCUMENT_ID, include_content=True)
 
     @patch("src.api.routes.documents.get_document")
     def test_get_document_content_not_found(self, mock_get_document):
@@ -125,7 +126,7 @@ class TestDocumentApi:
         assert response.json()["detail"] == "Document not found"
 
         # Verify the mock was called with the correct arguments
-        mock_get_document.assert_called_once_with(SAMPLE_DOCUMENT_ID)
+        mock_get_document.assert_called_once_with(SAMPLE_DOCUMENT_ID, include_content=True)
 
     @patch("src.api.routes.documents.get_document")
     def test_get_document_content_no_content(self, mock_get_document):
@@ -151,7 +152,7 @@ class TestDocumentApi:
         assert response.json()["detail"] == "Document content not available"
 
         # Verify the mock was called with the correct arguments
-        mock_get_document.assert_called_once_with(SAMPLE_DOCUMENT_ID)
+        mock_get_document.assert_called_once_with(SAMPLE_DOCUMENT_ID, include_content=True)
 
     @patch("src.api.routes.documents.get_document")
     def test_get_document_content_empty_string(self, mock_get_document):
@@ -178,7 +179,7 @@ class TestDocumentApi:
         assert response.text == ""
 
         # Verify the mock was called with the correct arguments
-        mock_get_document.assert_called_once_with(SAMPLE_DOCUMENT_ID)
+        mock_get_document.assert_called_once_with(SAMPLE_DOCUMENT_ID, include_content=True)
 
     def test_get_document_content_invalid_uuid(self):
         """Test retrieving document content with an invalid UUID format."""
@@ -204,7 +205,7 @@ class TestDocumentApi:
         assert "Failed to get document" in response.json()["detail"]
 
         # Verify the mock was called with the correct arguments
-        mock_get_document.assert_called_once_with(SAMPLE_DOCUMENT_ID)
+        mock_get_document.assert_called_once_with(SAMPLE_DOCUMENT_ID, include_content=True)
 
     @patch("src.api.routes.documents.get_document")
     def test_get_document_content_database_error(self, mock_get_document):
@@ -220,4 +221,51 @@ class TestDocumentApi:
         assert "Failed to get document content" in response.json()["detail"]
 
         # Verify the mock was called with the correct arguments
-        mock_get_document.assert_called_once_with(SAMPLE_DOCUMENT_ID)
\ No newline at end of file
+        mock_get_document.assert_called_once_with(SAMPLE_DOCUMENT_ID, include_content=True)
+
+class TestDocumentApiQueryCount:
+    """Regression tests for the number of queries each document route runs.
+
+    The filing and company are joined to the document, with the content when the
+    route returns it, instead of loading it and the related collections separately.
+    """
+
+    @pytest.mark.parametrize("suffix", ["", "/content"])
+    def test_get_document_routes(self, populated_content, query_budget, suffix):
+        document = populated_content.documents[0]
+        with query_budget(1) as queries:
+            response = client.get(f"/documents/{document.id}{suffix}")
+
+        assert response.status_code == 200
+        assert "risk_factors 0 0: supply chain exposure" in response.text
+        assert len(queries) == 1
+
+    def test_get_documents_by_filing_route(self, populated_content, query_budget):
+        with query_budget(1) as queries:
+            response = client.get(f"/documents/by-filing/{populated_content.documents[0].filing_id}")
+
+        assert response.status_code == 200
+        assert len(response.json()) == 2
+        assert len(queries) == 1
+
+    def test_get_documents_by_ids_route(self, populated_content, query_budget):
+        document_ids = [str(document.id) for document in populated_content.documents]
+        with query_budget(1) as queries:
+            response = client.post("/documents/by-ids", json=document_ids)
+
+        assert response.status_code == 200
+        documents = response.json()
+        assert {document["id"] for document in documents} == set(document_ids)
+        assert all(document["content"] and document["filing"] for document in documents)
+        assert len(queries) == 1
+
+    def test_get_document_by_accession_and_hash_route(self, populated_content, query_budget):
+        """Test one query to resolve the hash prefix, and one for the document."""
+        document = populated_content.documents[0]
+        with query_budget(2) as queries:
+            response = client.get(f"/documents/by-accession/{document.filing.accession_number}/"
+                                  f"{document.content_hash[:12]}")
+
+        assert response.status_code == 200
+        assert response.json()["id"] == str(document.id)
+        assert len(queries) == 2
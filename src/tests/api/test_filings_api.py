@@ -6,6 +6,7 @@ from fastapi.testclient import TestClient
 from src.api.main import create_app
 from src.database.companies import Company
 from src.database.filings import Filing
+from src.database.pagination import InvalidCursorError, Page
 from uuid_extensions import uuid7
 
 client = TestClient(create_app())
@@ -40,15 +41,18 @@ SAMPLE_FILING = Filing(
 # Attach the company relationship
 SAMPLE_FILING.company = SAMPLE_COMPANY
 
+# Arguments the filings routes pass to get_filings_page without query parameters
+DEFAULT_PAGE_ARGS = dict(form=None, start_date=None, end_date=None, cursor=None, limit=100)
+
 
 class TestFilingsApi:
     """Test class for Filings API endpoints."""
 
-    @patch("src.api.routes.filings.get_filings_by_company")
+    @patch("src.api.routes.filings.get_filings_page")
     def test_get_company_filings_found(self, mock_get_filings):
         """Test retrieving filings by company ID when filings exist."""
         # Setup the mock to return our sample filings
-        mock_get_filings.return_value = [SAMPLE_FILING]
+        mock_get_filings.return_value = Page(items=[SAMPLE_FILING])
 
         # Make the API call
         response = client.get(f"/filings/by-company/{SAMPLE_COMPANY_ID}")
@@ -66,13 +70,13 @@ class TestFilingsApi:
         assert data[0]["period_of_report"] == "2023-09-30"
 
         # Verify the mock was called with the correct arguments
-        mock_get_filings.assert_called_once_with(SAMPLE_COMPANY_ID)
+        mock_get_filings.assert_called_once_with(SAMPLE_COMPANY_ID, **DEFAULT_PAGE_ARGS)
 
-    @patch("src.api.routes.filings.get_filings_by_company")
+    @patch("src.api.routes.filings.get_filings_page")
     def test_get_company_filings_empty_list(self, mock_get_filings):
         """Test retrieving filings by company ID when no filings exist."""
         # Setup the mock to return empty list
-        mock_get_filings.return_value = []
+        mock_get_filings.return_value = Page(items=[])
 
         # Make the API call
         response = client.get(f"/filings/by-company/{SAMPLE_COMPANY_ID}")
@@ -83,9 +87,9 @@ class TestFilingsApi:
         assert len(data) == 0
 
         # Verify the mock was called with the correct arguments
-        mock_get_filings.assert_called_once_with(SAMPLE_COMPANY_ID)
+        mock_get_filings.assert_called_once_with(SAMPLE_COMPANY_ID, **DEFAULT_PAGE_ARGS)
 
-    @patch("src.api.routes.filings.get_filings_by_company")
+    @patch("src.api.routes.filings.get_filings_page")
     def test_get_company_filings_multiple_filings(self, mock_get_filings):
         """Test retrieving multiple filings by company ID."""
         # Setup the mock to return multiple filings
@@ -100,7 +104,7 @@ class TestFilingsApi:
             period_of_report=date(2023, 6, 30)
         )
         filing2.company = SAMPLE_COMPANY
-        mock_get_filings.return_value = [SAMPLE_FILING, filing2]
+        mock_get_filings.return_value = Page(items=[SAMPLE_FILING, filing2])
 
         # Make the API call
         response = client.get(f"/filings/by-company/{SAMPLE_COMPANY_ID}")
@@ -113,7 +117,33 @@ class TestFilingsApi:
         assert data[1]["form"] == "10-Q"
 
         # Verify the mock was called with the correct arguments
-        mock_get_filings.assert_called_once_with(SAMPLE_COMPANY_ID)
+        mock_get_filings.assert_called_once_with(SAMPLE_COMPANY_ID, **DEFAULT_PAGE_ARGS)
+
+    @patch("src.api.routes.filings.get_filings_page")
+    def test_get_company_filings_filters_and_cursor(self, mock_get_filings):
+        """Test that filters are passed through and the next page cursor is returned."""
+        mock_get_filings.return_value = Page(items=[SAMPLE_FILING], next_cursor="next-page")
+
+        # Make the API call
+        response = client.get(f"/filings/by-company/{SAMPLE_COMPANY_ID}?form=10-K&start_date=2023-01-01"
+                              "&end_date=2023-12-31&cursor=this-page&limit=1")
+
+        # Assertions
+        assert response.status_code == 200
+        assert len(response.json()) == 1
+        assert response.headers["X-Next-Cursor"] == "next-page"
+
+        mock_get_filings.assert_called_once_with(SAMPLE_COMPANY_ID, form="10-K", start_date=date(2023, 1, 1),
+                                                 end_date=date(2023, 12, 31), cursor="this-page", limit=1)
+
+    @patch("src.api.routes.filings.get_filings_page")
+    def test_get_company_filings_invalid_cursor(self, mock_get_filings):
+        """Test that a malformed cursor is rejected."""
+        mock_get_filings.side_effect = InvalidCursorError("Invalid cursor: bogus")
+
+        response = client.get(f"/filings/by-company/{SAMPLE_COMPANY_ID}?cursor=bogus")
+
+        assert response.status_code == 400
 
     def test_get_company_filings_invalid_uuid(self):
         """Test retrieving filings with an invalid UUID format."""
@@ -125,7 +155,7 @@ class TestFilingsApi:
         assert response.status_code == 422
         assert "uuid_parsing" in str(response.json())
 
-    @patch("src.api.routes.filings.get_filings_by_company")
+    @patch("src.api.routes.filings.get_filings_page")
     def test_get_company_filings_database_error(self, mock_get_filings):
         """Test error handling when database operation fails."""
         # Setup the mock to raise an exception
@@ -139,12 +169,12 @@ class TestFilingsApi:
         assert "Failed to retrieve filings" in response.json()["detail"]
 
     @patch("src.database.companies.get_company_by_ticker")
-    @patch("src.api.routes.filings.get_filings_by_company")
+    @patch("src.api.routes.filings.get_filings_page")
     def test_get_filings_by_ticker_found(self, mock_get_filings, mock_get_company):
         """Test retrieving filings by ticker when company and filings exist."""
         # Setup the mocks
         mock_get_company.return_value = SAMPLE_COMPANY
-        mock_get_filings.return_value = [SAMPLE_FILING]
+        mock_get_filings.return_value = Page(items=[SAMPLE_FILING])
 
         # Make the API call
         response = client.get(f"/filings/by-ticker/{SAMPLE_TICKER}")
@@ -159,7 +189,7 @@ class TestFilingsApi:
 
         # Verify the mocks were called correctly
         mock_get_company.assert_called_once_with(SAMPLE_TICKER)
-        mock_get_filings.assert_called_once_with(SAMPLE_COMPANY_ID)
+        mock_get_filings.assert_called_once_with(SAMPLE_COMPANY_ID, **DEFAULT_PAGE_ARGS)
 
     @patch("src.database.companies.get_company_by_ticker")
     def test_get_filings_by_ticker_company_not_found(self, mock_get_company):
@@ -178,12 +208,12 @@ class TestFilingsApi:
         mock_get_company.assert_called_once_with(SAMPLE_TICKER)
 
     @patch("src.database.companies.get_company_by_ticker")
-    @patch("src.api.routes.filings.get_filings_by_company")
+    @patch("src.api.routes.filings.get_filings_page")
     def test_get_filings_by_ticker_empty_list(self, mock_get_filings, mock_get_company):
         """Test retrieving filings by ticker when company exists but has no filings."""
         # Setup the mocks
         mock_get_company.return_value = SAMPLE_COMPANY
-        mock_get_filings.return_value = []
+        mock_get_filings.return_value = Page(items=[])
 
         # Make the API call
         response = client.get(f"/filings/by-ticker/{SAMPLE_TICKER}")
@@ -195,7 +225,7 @@ class TestFilingsApi:
 
         # Verify the mocks were called correctly
         mock_get_company.assert_called_once_with(SAMPLE_TICKER)
-        mock_get_filings.assert_called_once_with(SAMPLE_COMPANY_ID)
+        mock_get_filings.assert_called_once_with(SAMPLE_COMPANY_ID, **DEFAULT_PAGE_ARGS)
 
     @patch("src.database.companies.get_company_by_ticker")
     def test_get_filings_by_ticker_database_error(self, mock_get_company):
@@ -211,7 +241,7 @@ class TestFilingsApi:
         assert "Failed to retrieve filings" in response.json()["detail"]
 
     @patch("src.database.companies.get_company_by_ticker")
-    @patch("src.api.routes.filings.get_filings_by_company")
+    @patch("src.api.routes.filings.get_filings_page")
     def test_get_filings_by_ticker_filings_error(self, mock_get_filings, mock_get_company):
         """Test error handling when filings retrieval fails."""
         # Setup the mocks
@@ -224,3 +254,58 @@ class TestFilingsApi:
         # Assertions
         assert response.status_code == 500
         assert "Failed to retrieve filings" in response.json()["detail"]
+
+
+class TestFilingsApiQueryCount:
+    """Regression tests for the number of queries each filing route runs.
+
+    The company is joined to its filings, and neither the filings' documents nor
+    the company's other filings and documents are loaded with it.
+    """
+
+    def test_get_company_filings_route(self, populated_content, query_budget):
+        with query_budget(1) as queries:
+            response = client.get(f"/filings/by-company/{populated_content.company.id}")
+
+        assert response.status_code == 200
+        assert len(response.json()) == 2
+        assert len(queries) == 1
+
+    def test_get_filings_by_ticker_route(self, populated_content, query_budget):
+        with query_budget(2) as queries:
+            response = client.get("/filings/by-ticker/QC0")
+
+        assert response.status_code == 200
+        assert len(response.json()) == 2
+        assert len(queries) == 2
+
+    def test_get_filing_by_accession_route(self, populated_content, query_budget):
+        accession_number = populated_content.documents[0].filing.accession_number
+        with query_budget(1) as queries:
+            response = client.get(f"/filings/{accession_number}")
+
+        assert response.status_code == 200
+        assert response.json()["accession_number"] == accession_number
+        assert len(queries) == 1
+
+    def test_get_filing_documents_route(self, populated_content, query_budget):
+        """Test that the documents and their contents are loaded in one query."""
+        accession_number = populated_content.documents[0].filing.accession_number
+        with query_budget(2) as queries:
+            response = client.get(f"/filings/{accession_number}/documents")
+
+        assert response.status_code == 200
+        documents = response.json()
+        assert len(documents) == 2
+        assert all(document["content"] and document["company_ticker"] == "QC0" for document in documents)
+        assert len(queries) == 2
+
+    def test_get_filing_company_route(self, populated_content, query_budget):
+        """Test the company lookup with its frontpage summary."""
+        accession_number = populated_content.documents[0].filing.accession_number
+        with query_budget(2) as queries:
+            response = client.get(f"/filings/{accession_number}/company")
+
+        assert response.status_code == 200
+        assert response.json()["summary"] == "Summary for company 0"
+        assert len(queries) == 2
@@ -3,7 +3,9 @@ from datetime import datetime
 from unittest.mock import MagicMock, patch
 
 from fastapi.testclient import TestClient
+import pytest
 from src.api.main import create_app
+from src.database.content_hashes import AmbiguousHashError
 from uuid_extensions import uuid7
 
 client = TestClient(create_app())
@@ -142,6 +144,16 @@ class TestGeneratedContentAPI:
         assert response.status_code == 404
         assert "Generated content not found" in response.json()["detail"]
 
+    @patch("src.api.routes.generated_content.get_generated_content_by_company_and_ticker")
+    def test_get_generated_content_by_ticker_and_hash_ambiguous(self, mock_get_by_ticker_hash):
+        """Test that an ambiguous hash prefix is reported as a conflict."""
+        mock_get_by_ticker_hash.side_effect = AmbiguousHashError("a1", ["a1b2", "a1c3"])
+
+        response = client.get("/generated-content/by-ticker/AAPL/a1")
+
+        assert response.status_code == 409
+        assert "ambiguous" in response.json()["detail"]
+
     @patch("src.api.routes.generated_content.get_generated_content")
     def test_get_generated_content_by_id_success(self, mock_get_content):
         """Test successful retrieval by content ID."""
@@ -361,3 +373,58 @@ class TestGeneratedContentAPIIntegration:
         detail_data = detail_response.json()
         assert detail_data["short_hash"] == short_hash
 
+
+
+class TestGeneratedContentApiQueryCount:
+    """Regression tests for the number of queries each generated content route runs.
+
+    The content is loaded with each row, and the source documents and source
+    content in one query each for the whole result. The model config and prompts
+    aren't loaded at all, for the content or its sources.
+    """
+
+    @pytest.mark.parametrize("path", [
+        "/generated-content/by-ticker/QC0",
+        "/generated-content/aggregate-summaries/by-ticker/QC0",
+    ])
+    def test_ticker_list_routes(self, populated_content, query_budget, path):
+        with query_budget(3) as queries:
+            response = client.get(path)
+
+        assert response.status_code == 200
+        aggregate = next(item for item in response.json() if item["id"] == str(populated_content.aggregate.id))
+        assert aggregate["content"] == "Aggregate summary 0: supply chain exposure"
+        assert set(aggregate["source_content_ids"]) == {str(single.id) for single in populated_content.singles}
+        assert len(queries) == 3
+
+    @pytest.mark.parametrize("route", ["by-ticker/QC0", "by-hash"])
+    def test_hash_routes(self, populated_content, query_budget, route):
+        """Test one query to resolve the hash prefix, then the same loads as by id."""
+        aggregate = populated_content.aggregate
+        with query_budget(4) as queries:
+            response = client.get(f"/generated-content/{route}/{aggregate.content_hash[:12]}")
+
+        assert response.status_code == 200
+        assert response.json()["id"] == str(aggregate.id)
+        assert len(queries) == 4
+
+    def test_get_by_id_route(self, populated_content, query_budget):
+        single = populated_content.singles[0]
+        with query_budget(3) as queries:
+            response = client.get(f"/generated-content/{single.id}")
+
+        assert response.status_code == 200
+        assert response.json()["source_document_ids"] == [str(populated_content.documents[0].id)]
+        assert len(queries) == 3
+
+    def test_get_sources_route(self, populated_content, query_budget):
+        aggregate = populated_content.aggregate
+        with query_budget(3) as queries:
+            response = client.get(f"/generated-content/{aggregate.id}/sources")
+
+        assert response.status_code == 200
+        sources = response.json()["source_content"]
+        assert {source["short_hash"] for source in sources} == {
+            single.content_hash[:12] for single in populated_content.singles
+        }
+        assert len(queries) == 3
@@ -0,0 +1,74 @@
+"""Tests for the metrics registry and the /metrics endpoint."""
+from fastapi.testclient import TestClient
+import pytest
+from src.api.main import create_app
+from src.utils.metrics import Counter, Gauge, Histogram, Metric, MetricsRegistry, write_textfile
+
+client = TestClient(create_app())
+
+
+class TestMetricsApi:
+    """Test class for metrics exposition."""
+
+    def test_metrics_endpoint_records_route_latency(self):
+        """Test that requests are recorded by route template and served in the text format."""
+        client.get("/health")
+
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert "# TYPE symbology_http_request_duration_seconds histogram" in response.text
+        assert 'symbology_http_request_duration_seconds_count{method="GET",route="/health",status="200"}' in response.text
+
+    def test_registry_render(self):
+        """Test rendering counters, gauges and cumulative histogram buckets."""
+        registry = MetricsRegistry()
+        queries = Counter("test_queries", "Queries", ["statement"], registry=registry)
+        pool = Gauge("test_pool", "Pool", ["state"], registry=registry)
+        latency = Histogram("test_latency_seconds", "Latency", buckets=(0.1, 1.0), registry=registry)
+
+        queries.inc(statement="SELECT")
+        queries.inc(2, statement="SELECT")
+        pool.set(3, state="checked_out")
+        latency.observe(0.05)
+        latency.observe(0.5)
+        latency.observe(5)
+
+        output = registry.render()
+
+        assert 'test_queries_total{statement="SELECT"} 3' in output
+        assert 'test_pool{state="checked_out"} 3' in output
+        assert 'test_latency_seconds_bucket{le="0.1"} 1' in output
+        assert 'test_latency_seconds_bucket{le="1"} 2' in output
+        assert 'test_latency_seconds_bucket{le="+Inf"} 3' in output
+        assert "test_latency_seconds_count 3" in output
+        assert "test_latency_seconds_sum 5.55" in output
+
+    def test_registry_rejects_wrong_labels(self):
+        """Test that observations must use the metric's label names."""
+        registry = MetricsRegistry()
+        queries = Counter("test_queries", "Queries", ["statement"], registry=registry)
+
+        with pytest.raises(ValueError, match="expects labels"):
+            queries.inc(table="documents")
+
+    def test_metric_subclass_must_implement_samples_and_clear(self):
+        """Test that an incomplete metric type fails when created, not when the registry is rendered."""
+        class IncompleteMetric(Metric):
+            def samples(self):
+                return []
+
+        with pytest.raises(TypeError, match="clear"):
+            IncompleteMetric("test_incomplete", "Incomplete", registry=MetricsRegistry())
+
+    def test_write_textfile(self, tmp_path):
+        """Test exporting a registry for the node_exporter textfile collector."""
+        registry = MetricsRegistry()
+        Gauge("test_filings_per_second", "Throughput", registry=registry).set(2.5)
+
+        path = tmp_path / "textfile" / "symbology.prom"
+        write_textfile(str(path), registry)
+
+        assert "test_filings_per_second 2.5" in path.read_text()
+        assert list(path.parent.iterdir()) == [path]
@@ -18,6 +18,10 @@ def create_mock_prompt():
     mock_prompt.name = "Financial Statement Analysis"
     mock_prompt.description = "Analyzes financial statements from SEC filings"
     mock_prompt.content = "Analyze the financial statements for the company, focusing on key metrics and trends."
+    mock_prompt.template_version = None
+    mock_prompt.source_document_ids = None
+    mock_prompt.source_content_ids = None
+    mock_prompt.additional_text = None
 
     # Mock the role enum
     mock_role = MagicMock()
@@ -118,6 +122,10 @@ class TestPromptsApi:
         mock_prompt.name = "Simple Prompt"
         mock_prompt.description = None  # Optional field
         mock_prompt.content = "Simple prompt content"
+        mock_prompt.template_version = None
+        mock_prompt.source_document_ids = None
+        mock_prompt.source_content_ids = None
+        mock_prompt.additional_text = None
 
         # Mock the role enum
         mock_role = MagicMock()
@@ -162,3 +170,15 @@ class TestPromptsApi:
         assert response.status_code == 200
         data = response.json()
         assert data["role"] == "user"
+
+
+class TestPromptsApiQueryCount:
+    """Regression test for the number of queries the prompt route runs."""
+
+    def test_get_prompt_route(self, populated_content, query_budget):
+        with query_budget(1) as queries:
+            response = client.get(f"/prompts/{populated_content.system_prompt.id}")
+
+        assert response.status_code == 200
+        assert response.json()["content"] == "Summarize the risk factors."
+        assert len(queries) == 1
@@ -0,0 +1,76 @@
+"""Tests for the search API endpoints."""
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+import pytest
+from src.api.main import create_app
+from src.database.documents import DocumentType
+from uuid_extensions import uuid7
+
+client = TestClient(create_app())
+
+SAMPLE_DOCUMENT_HIT = SimpleNamespace(
+    id=uuid7(),
+    title="test-risk-factors.html",
+    document_type=DocumentType.RISK_FACTORS,
+    content_hash="abcdef1234567890",
+    ticker="TEST",
+    form="10-K",
+    accession_number="0001234567-23-000001",
+    period_of_report=date(2023, 12, 31),
+    rank=0.5,
+    snippet="exposure to <mark>tariffs</mark>",
+)
+
+
+class TestSearchApi:
+    """Test class for search API endpoints."""
+
+    @patch("src.api.routes.search.search_documents")
+    def test_search_documents(self, mock_search_documents):
+        """Test searching documents passes filters through and returns ranked hits."""
+        mock_search_documents.return_value = [SAMPLE_DOCUMENT_HIT]
+
+        response = client.get("/search/documents?query=tariff%20exposure&ticker=TEST&form=10-K"
+                              "&document_type=risk_factors&period_start=2023-01-01&limit=5")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 1
+        assert data[0]["company_ticker"] == "TEST"
+        assert data[0]["document_type"] == "risk_factors"
+        assert data[0]["short_hash"] == "abcdef123456"
+        assert data[0]["snippet"] == "exposure to <mark>tariffs</mark>"
+
+        mock_search_documents.assert_called_once_with(
+            "tariff exposure", ticker="TEST", form="10-K", document_type=DocumentType.RISK_FACTORS,
+            period_start=date(2023, 1, 1), period_end=None, limit=5, offset=0
+        )
+
+    def test_search_documents_empty_query(self):
+        """Test that a blank query is rejected."""
+        response = client.get("/search/documents?query=%20")
+        assert response.status_code == 400
+
+    def test_search_documents_invalid_period(self):
+        """Test that an inverted period range is rejected."""
+        response = client.get("/search/documents?query=tariff&period_start=2024-01-01&period_end=2023-01-01")
+        assert response.status_code == 400
+
+
+class TestSearchApiQueryCount:
+    """Regression tests for the number of queries each search route runs."""
+
+    @pytest.mark.parametrize("path", [
+        "/search/documents?query=supply%20chain",
+        "/search/generated-content?query=supply%20chain",
+    ])
+    def test_search_routes(self, populated_content, query_budget, path):
+        with query_budget(1) as queries:
+            response = client.get(path)
+
+        assert response.status_code == 200
+        assert response.json()
+        assert len(queries) == 1
@@ -0,0 +1,59 @@
+"""Startup-time regression tests for the CLI.
+
+Each test runs a fresh interpreter, since this one has already imported most of
+the project.
+"""
+from pathlib import Path
+import subprocess
+import sys
+
+import pytest
+from src.cli.main import COMMANDS
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+# Cumulative import time allowed for src.cli.main, per `python -X importtime`
+CLI_IMPORT_BUDGET_SECONDS = 1.5
+
+# Modules that take seconds to import and are only needed by some commands
+HEAVY_MODULES = ("transformers", "torch", "pandas", "edgar", "ollama", "matplotlib")
+
+
+def _run_python(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, *args], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True)
+
+
+def _cumulative_import_seconds(importtime_output: str, module: str) -> float:
+    # Lines look like "import time:   self [us] | cumulative | imported package"
+    for line in importtime_output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) == 3 and fields[2].strip() == module:
+            return int(fields[1]) / 1e6
+    raise AssertionError(f"{module} not found in -X importtime output")
+
+
+def test_cli_import_time_budget():
+    """Test that importing the CLI stays within its startup budget."""
+    result = _run_python("-X", "importtime", "-c", "import src.cli.main")
+
+    seconds = _cumulative_import_seconds(result.stderr, "src.cli.main")
+    assert seconds < CLI_IMPORT_BUDGET_SECONDS, (
+        f"Importing src.cli.main took {seconds:.2f}s, budget is {CLI_IMPORT_BUDGET_SECONDS}s"
+    )
+
+
+@pytest.mark.parametrize("command", sorted(COMMANDS))
+def test_command_lookup_skips_heavy_imports(command):
+    """Test that resolving a command group imports none of the heavy dependencies."""
+    script = (
+        "import sys\n"
+        "import click\n"
+        "from src.cli.main import cli\n"
+        f"assert cli.get_command(click.Context(cli), {command!r}) is not None\n"
+        f"print(','.join(name for name in {HEAVY_MODULES!r} if name in sys.modules))\n"
+    )
+    result = _run_python("-c", script)
+
+    assert result.stdout.strip() == "", f"'{command}' imported {result.stdout.strip()} at startup"
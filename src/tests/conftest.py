@@ -1,7 +1,16 @@
 import os
 import sys
 
-from src.tests.database.fixtures import create_test_database, db_engine, db_session, TEST_DATABASE_NAME, TEST_DATABASE_URL
+from src.tests.database.fixtures import (
+    create_test_database,
+    db_engine,
+    db_session,
+    populated_companies,
+    populated_content,
+    query_budget,
+    TEST_DATABASE_NAME,
+    TEST_DATABASE_URL,
+)
 from src.utils.logging import get_logger
 
 # Add the project root directory to the Python path for imports
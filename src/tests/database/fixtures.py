@@ -1,9 +1,16 @@
+from contextlib import contextmanager
+from datetime import date
+import sys
+from types import SimpleNamespace
+from unittest.mock import patch
+
 import pytest
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 
 # Import the models and settings
-from src.database.base import Base
+from src.database.base import QueryRecorder
+from src.database.migrations import migrate
 from src.utils.logging import configure_logging, get_logger
 
 from utils.config import settings
@@ -41,9 +48,9 @@ def create_test_database():
             logger.error(f"Error creating test database: {e}")
             raise
 
-    # Create an engine connected to the test database and create the tables
+    # Create an engine connected to the test database and migrate it to the latest schema
     test_engine = create_engine(TEST_DATABASE_URL)
-    Base.metadata.create_all(bind=test_engine)
+    migrate(test_engine)
     test_engine.dispose()
 
     # Log the list of created tables
@@ -100,3 +107,168 @@ def db_session(db_engine):
         if transaction.is_active:
             transaction.rollback()
         connection.close()
+
+@pytest.fixture(scope="function")
+def query_budget(db_session):
+    """Route every database module through the test session, and check query budgets.
+
+    Usage:
+        with query_budget(2) as queries:
+            response = client.get("/companies")
+
+    The block fails if it runs more than max_queries statements, or runs the same
+    statement shape more than max_repeats times (an N+1 pattern, such as a lazy
+    load per row).
+    """
+    connection = db_session.connection()
+    patches = [
+        patch.object(module, "get_db_session", lambda: db_session)
+        for name, module in list(sys.modules.items())
+        if name.startswith("src.database.") and hasattr(module, "get_db_session")
+    ]
+
+    @contextmanager
+    def _budget(max_queries: int, max_repeats: int = 1):
+        recorder = QueryRecorder("query_budget")
+        with recorder.listen(connection):
+            yield recorder
+
+        assert len(recorder) <= max_queries, (
+            f"Ran {len(recorder)} queries, budget is {max_queries}:\n{recorder.format_statements()}"
+        )
+        repeated = recorder.repeated(max_repeats + 1)
+        assert not repeated, "Repeated statements (N+1):\n" + "\n".join(
+            f"{count}x  {shape}" for shape, count in repeated.items()
+        )
+
+    for module_patch in patches:
+        module_patch.start()
+    try:
+        yield _budget
+    finally:
+        for module_patch in patches:
+            module_patch.stop()
+
+
+@pytest.fixture(scope="function")
+def populated_companies(db_session):
+    """Create companies with filings, documents and frontpage summaries."""
+    from src.database.companies import Company
+    from src.database.documents import Document, DocumentType
+    from src.database.filings import Filing
+    from src.database.generated_content import ContentSourceType, GeneratedContent
+
+    companies = []
+    for i in range(3):
+        company = Company(name=f"Query Count Company {i}", ticker=f"QC{i}", exchanges=["NYSE"])
+        db_session.add(company)
+        db_session.flush()
+        for j in range(2):
+            filing = Filing(
+                company_id=company.id,
+                accession_number=f"000000000{i}-23-00000{j}",
+                form="10-K",
+                filing_date=date(2023, 3, 15 + j),
+                period_of_report=date(2022, 12, 31 - j),
+            )
+            db_session.add(filing)
+            db_session.flush()
+            for document_type in (DocumentType.RISK_FACTORS, DocumentType.MDA):
+                document = Document(
+                    company_id=company.id,
+                    filing_id=filing.id,
+                    title=f"{document_type.value}-{i}-{j}.html",
+                    document_type=document_type,
+                    content=f"{document_type.value} {i} {j}: supply chain exposure",
+                )
+                document.update_content_hash()
+                db_session.add(document)
+        db_session.add(GeneratedContent(
+            company_id=company.id,
+            description="business_description_frontpage_summary",
+            source_type=ContentSourceType.GENERATED_CONTENT,
+            content=f"Summary for company {i}",
+        ))
+        companies.append(company)
+    db_session.commit()
+    return companies
+
+
+@pytest.fixture(scope="function")
+def populated_content(db_session, populated_companies):
+    """Add risk factors summaries, with their prompts and model config, to populated_companies.
+
+    Returns a namespace with the first company's risk factors documents, their
+    single summaries and aggregate summary, and the shared prompts and model
+    config. The objects are detached, with their columns loaded.
+    """
+    from src.database.content_hashes import clear_hash_cache
+    from src.database.documents import Document, DocumentType
+    from src.database.generated_content import ContentSourceType, GeneratedContent
+    from src.database.model_configs import ModelConfig
+    from src.database.prompts import Prompt, PromptRole
+
+    model_config = ModelConfig(model="test-model", options_json="{}")
+    system_prompt = Prompt(name="Risk analysis", role=PromptRole.SYSTEM, content="Summarize the risk factors.")
+    user_prompt = Prompt(name="User prompt", role=PromptRole.USER, content="Risk factors")
+    for obj in (system_prompt, user_prompt):
+        obj.update_content_hash()
+    db_session.add_all([model_config, system_prompt, user_prompt])
+    db_session.flush()
+
+    content = {}
+    for i, company in enumerate(populated_companies):
+        documents = (db_session.query(Document)
+                     .filter(Document.company_id == company.id, Document.document_type == DocumentType.RISK_FACTORS)
+                     .order_by(Document.title).all())
+        singles = []
+        for j, document in enumerate(documents):
+            single = GeneratedContent(
+                company_id=company.id,
+                description="risk_factors_single_summary",
+                document_type=DocumentType.RISK_FACTORS,
+                source_type=ContentSourceType.DOCUMENTS,
+                form_type="10-K",
+                content=f"Single summary {i} {j}: supply chain exposure",
+                model_config_id=model_config.id,
+                system_prompt_id=system_prompt.id,
+                user_prompt_id=user_prompt.id,
+                source_documents=[document],
+            )
+            single.update_content_hash()
+            singles.append(single)
+        aggregate = GeneratedContent(
+            company_id=company.id,
+            description="risk_factors_aggregate_summary",
+            document_type=DocumentType.RISK_FACTORS,
+            source_type=ContentSourceType.GENERATED_CONTENT,
+            content=f"Aggregate summary {i}: supply chain exposure",
+            model_config_id=model_config.id,
+            system_prompt_id=system_prompt.id,
+            source_content=singles,
+        )
+        aggregate.update_content_hash()
+        db_session.add_all(singles + [aggregate])
+        content[company.ticker] = SimpleNamespace(company=company, documents=documents, singles=singles,
+                                                  aggregate=aggregate)
+    db_session.commit()
+
+    # Resolved hash prefixes from earlier tests' rolled-back rows must not be reused
+    clear_hash_cache()
+
+    # Reload what the commit expired, so tests can read ids and hashes, then detach
+    # everything so routes load from the database rather than the identity map
+    first = content[populated_companies[0].ticker]
+    for obj in [first.company, *first.documents, *first.singles, first.aggregate,
+                model_config, system_prompt, user_prompt]:
+        db_session.refresh(obj)
+    db_session.expunge_all()
+    return SimpleNamespace(
+        company=first.company,
+        documents=first.documents,
+        singles=first.singles,
+        aggregate=first.aggregate,
+        model_config=model_config,
+        system_prompt=system_prompt,
+        user_prompt=user_prompt,
+    )
@@ -0,0 +1,28 @@
+"""Tests for database session scoping."""
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
+
+from sqlalchemy.orm import scoped_session, sessionmaker
+import src.database.base as base
+
+
+def test_request_session_scope_isolates_sessions(monkeypatch):
+    """Each request scope gets its own session, in whichever thread it runs."""
+    monkeypatch.setattr(base, "db_session", scoped_session(sessionmaker(), scopefunc=base._session_scope_key))
+
+    def request_session():
+        with base.request_session_scope():
+            session = base.get_db_session()()
+            # The session follows the request's context into a worker thread
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                worker_session = executor.submit(contextvars.copy_context().run,
+                                                 lambda: base.get_db_session()()).result()
+            assert worker_session is session
+            return session
+
+    first = request_session()
+    second = request_session()
+
+    assert first is not second
+    # Outside a request the thread-local session is unaffected
+    assert base.get_db_session()() is not first
@@ -327,4 +327,35 @@ def test_get_company_by_ticker(db_session, sample_company_data):
         assert non_existent is None
     finally:
         # Restore the original function
-        companies_module.get_db_session = original_get_db_session
\ No newline at end of file
+        companies_module.get_db_session = original_get_db_session
+@pytest.mark.parametrize("use_index", [False, True])
+def test_search_companies_by_query_ranking(db_session, use_index):
+    """Test that search ranks exact ticker, ticker prefix, name prefix, then substring."""
+    for name, ticker in [
+        ("Apple Inc.", "AAPL"),
+        ("Applied Materials, Inc.", "AMAT"),
+        ("AppLovin Corporation", "APP"),
+        ("Snap-on Incorporated", "SNA"),
+    ]:
+        db_session.add(Company(name=name, ticker=ticker))
+    db_session.commit()
+
+    # Mock the db_session global
+    import src.database.companies as companies_module
+    original_get_db_session = companies_module.get_db_session
+    companies_module.get_db_session = lambda: db_session
+    companies_module.invalidate_company_search_index()
+
+    try:
+        results = companies_module.search_companies_by_query("app", limit=10, use_index=use_index)
+        assert [c.ticker for c in results][:3] == ["APP", "AAPL", "AMAT"]
+
+        results = companies_module.search_companies_by_query("incorporated", limit=10, use_index=use_index)
+        assert [c.ticker for c in results] == ["SNA"]
+
+        # LIKE wildcards in the query are matched literally
+        assert companies_module.search_companies_by_query("%", limit=10, use_index=use_index) == []
+    finally:
+        # Restore the original function
+        companies_module.get_db_session = original_get_db_session
+        companies_module.invalidate_company_search_index()
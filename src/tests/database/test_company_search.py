@@ -0,0 +1,69 @@
+"""Tests for the in-memory company search index."""
+from collections import namedtuple
+
+from src.database.company_search import CompanySearchIndex, PrefixTrie
+
+CompanyRow = namedtuple("CompanyRow", ["id", "name", "ticker"])
+
+COMPANIES = [
+    CompanyRow(1, "Apple Inc.", "AAPL"),
+    CompanyRow(2, "Applied Materials, Inc.", "AMAT"),
+    CompanyRow(3, "American Airlines Group Inc.", "AAL"),
+    CompanyRow(4, "Snap-on Incorporated", "SNA"),
+    CompanyRow(5, "AppLovin Corporation", "APP"),
+]
+
+
+def test_prefix_trie_returns_shortest_keys_first():
+    trie = PrefixTrie()
+    for key in ["APPLE", "APP", "APPS", "AMAT"]:
+        trie.insert(key, key)
+
+    assert list(trie.search("APP", limit=10)) == ["APP", "APPS", "APPLE"]
+    assert list(trie.search("APP", limit=2)) == ["APP", "APPS"]
+    assert list(trie.search("X", limit=10)) == []
+
+
+def test_company_search_index_ranking():
+    index = CompanySearchIndex(COMPANIES)
+
+    # Exact ticker, then ticker prefix, then name prefix
+    assert [c.ticker for c in index.search("app")] == ["APP", "AAPL", "AMAT"]
+    assert [c.ticker for c in index.search("AA")] == ["AAL", "AAPL"]
+
+
+def test_company_search_index_substring_and_limit():
+    index = CompanySearchIndex(COMPANIES)
+
+    # Substring matches fill in after prefix matches
+    assert [c.ticker for c in index.search("inc", limit=10)] == ["AAPL", "AMAT", "AAL", "SNA"]
+    assert len(index.search("a", limit=2)) == 2
+    assert index.search("  ") == []
+
+
+def test_company_search_index_fills_page_past_duplicates():
+    """Test that companies matched by several tiers don't leave the page short."""
+    companies = [
+        CompanyRow(1, "Abc", "AB"),
+        CompanyRow(2, "Abcd", "ABC"),
+        CompanyRow(3, "Abcde", "ABCD"),
+        CompanyRow(4, "Abcdef Holdings", "ZZZ"),
+        CompanyRow(5, "Abcdefg Partners", "YYY"),
+    ]
+    index = CompanySearchIndex(companies)
+
+    # The name tier's first three matches were all found by ticker
+    assert [c.id for c in index.search("ab", limit=5)] == [1, 2, 3, 4, 5]
+
+
+def test_company_search_index_stops_when_page_is_full(monkeypatch):
+    """Test that later tiers aren't consumed once the page is full."""
+    index = CompanySearchIndex(COMPANIES)
+
+    def substring_matches(upper_query, lower_query):
+        raise AssertionError("substring tier scanned")
+        yield
+
+    monkeypatch.setattr(index, "_substring_matches", substring_matches)
+    assert [c.ticker for c in index.search("app", limit=3)] == ["APP", "AAPL", "AMAT"]
+    assert index.search("app", limit=0) == []
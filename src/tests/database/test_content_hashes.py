@@ -0,0 +1,101 @@
+"""Tests for short content hash resolution."""
+import pytest
+from src.database import content_hashes
+from src.database.content_hashes import (
+    AmbiguousHashError,
+    clear_hash_cache,
+    get_by_content_hash,
+    resolve_content_hash,
+)
+from src.database.model_configs import ModelConfig
+from uuid_extensions import uuid7
+
+
+@pytest.fixture(autouse=True)
+def empty_hash_cache():
+    clear_hash_cache()
+    yield
+    clear_hash_cache()
+
+
+def _model_config(db_session, content_hash: str) -> ModelConfig:
+    model_config = ModelConfig(model="test-model", options_json="{}", content_hash=content_hash)
+    db_session.add(model_config)
+    db_session.commit()
+    return model_config
+
+
+def test_resolve_content_hash(db_session):
+    """Test resolving full and partial hashes."""
+    model_config = _model_config(db_session, "abc1" + "0" * 60)
+    query = db_session.query(ModelConfig)
+
+    assert resolve_content_hash(query, ModelConfig.content_hash, model_config.content_hash) == model_config.content_hash
+    assert resolve_content_hash(query, ModelConfig.content_hash, "abc1") == model_config.content_hash
+    assert resolve_content_hash(query, ModelConfig.content_hash, "ABC1") == model_config.content_hash
+    assert get_by_content_hash(query, ModelConfig.content_hash, "abc").id == model_config.id
+
+    # Not found, and not a hash at all
+    assert resolve_content_hash(query, ModelConfig.content_hash, "fff") is None
+    assert resolve_content_hash(query, ModelConfig.content_hash, "not-a-hash") is None
+    assert resolve_content_hash(query, ModelConfig.content_hash, "") is None
+
+
+def test_resolve_ambiguous_content_hash(db_session):
+    """Test that a prefix matching several hashes is reported instead of picking one."""
+    _model_config(db_session, "abc1" + "0" * 60)
+    _model_config(db_session, "abc2" + "0" * 60)
+    query = db_session.query(ModelConfig)
+
+    with pytest.raises(AmbiguousHashError) as exc_info:
+        resolve_content_hash(query, ModelConfig.content_hash, "abc")
+    assert exc_info.value.prefix == "abc"
+    assert len(exc_info.value.matches) == 2
+
+    assert resolve_content_hash(query, ModelConfig.content_hash, "abc2") == "abc2" + "0" * 60
+
+
+def test_new_hash_invalidates_cached_prefix(db_session):
+    """Test that a cached prefix is forgotten once another hash shares it."""
+    first = _model_config(db_session, "abc1" + "0" * 60)
+    query = db_session.query(ModelConfig)
+    assert resolve_content_hash(query, ModelConfig.content_hash, "abc") == first.content_hash
+
+    _model_config(db_session, "abc2" + "0" * 60)
+
+    with pytest.raises(AmbiguousHashError):
+        resolve_content_hash(query, ModelConfig.content_hash, "abc")
+
+
+def test_cached_prefix_expires(db_session, monkeypatch):
+    """Test that a cached prefix is resolved again after the TTL, for hashes written by other processes."""
+    first = _model_config(db_session, "abc1" + "0" * 60)
+    query = db_session.query(ModelConfig)
+    assert resolve_content_hash(query, ModelConfig.content_hash, "abc") == first.content_hash
+
+    # Insert a colliding hash without a flush in this process's sessions
+    db_session.execute(ModelConfig.__table__.insert().values(
+        id=uuid7(), model="test-model", options_json="{}", content_hash="abc2" + "0" * 60
+    ))
+    assert resolve_content_hash(query, ModelConfig.content_hash, "abc") == first.content_hash
+
+    monkeypatch.setattr(content_hashes, "HASH_CACHE_TTL", 0)
+    with pytest.raises(AmbiguousHashError):
+        resolve_content_hash(query, ModelConfig.content_hash, "abc")
+
+
+def test_invalidation_only_touches_matching_prefixes():
+    """Test that a new hash forgets the cached prefixes it shares, in its table only."""
+    full_hash = "abc1" + "0" * 60
+    content_hashes._cache_put(("model_configs", None, "abc"), full_hash)
+    content_hashes._cache_put(("model_configs", "scoped", "ab"), full_hash)
+    content_hashes._cache_put(("model_configs", None, "abd"), "abd" + "0" * 61)
+    content_hashes._cache_put(("prompts", None, "abc"), full_hash)
+
+    content_hashes._invalidate_prefixes("model_configs", "abc2" + "0" * 60)
+
+    assert content_hashes._cache_get(("model_configs", None, "abc")) is None
+    assert content_hashes._cache_get(("model_configs", "scoped", "ab")) is None
+    assert content_hashes._cache_get(("model_configs", None, "abd")) == "abd" + "0" * 61
+    assert content_hashes._cache_get(("prompts", None, "abc")) == full_hash
+    assert set(content_hashes._prefix_index["model_configs"]) == {"abd"}
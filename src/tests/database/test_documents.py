@@ -1,4 +1,5 @@
 from datetime import date
+import hashlib
 from typing import Any, Dict, List
 import uuid
 
@@ -542,6 +543,66 @@ def test_find_or_create_document_update_existing(db_session, create_test_company
         # Restore the original function
         documents_module.get_db_session = original_get_db_session
 
+def test_upsert_document_write_status(db_session, create_test_company, create_test_filing):
+    """Test that upsert_document only writes changed content and reports what it did."""
+    import src.database.documents as documents_module
+    original_get_db_session = documents_module.get_db_session
+    documents_module.get_db_session = lambda: db_session
+
+    def upsert(content):
+        return documents_module.upsert_document(
+            company_id=create_test_company.id,
+            filing_id=create_test_filing.id,
+            title="Risk Factors",
+            document_type=documents_module.DocumentType.RISK_FACTORS,
+            content=content
+        )
+
+    try:
+        document, status = upsert("Original risk factors.")
+        assert status == documents_module.DocumentWriteStatus.CREATED
+
+        same_document, status = upsert("Original risk factors.")
+        assert status == documents_module.DocumentWriteStatus.UNCHANGED
+        assert same_document.id == document.id
+        assert not db_session.dirty
+
+        _, status = upsert(None)
+        assert status == documents_module.DocumentWriteStatus.UNCHANGED
+
+        updated_document, status = upsert("Updated risk factors.")
+        assert status == documents_module.DocumentWriteStatus.UPDATED
+        assert updated_document.id == document.id
+        assert updated_document.content == "Updated risk factors."
+        assert updated_document.content_hash == hashlib.sha256(b"Updated risk factors.").hexdigest()
+    finally:
+        documents_module.get_db_session = original_get_db_session
+
+def test_upsert_unchanged_document_runs_one_query(db_session, create_test_company, create_test_filing, query_budget):
+    """Test that an unchanged section costs one query, without loading its filing or company."""
+    import src.database.documents as documents_module
+
+    document = Document(company_id=create_test_company.id, filing_id=create_test_filing.id, title="Risk Factors",
+                        document_type=documents_module.DocumentType.RISK_FACTORS, content="Original risk factors.")
+    document.update_content_hash()
+    db_session.add(document)
+    db_session.commit()
+    company_id, filing_id, document_id = create_test_company.id, create_test_filing.id, document.id
+    db_session.expire_all()
+
+    with query_budget(1):
+        same_document, status = documents_module.upsert_document(
+            company_id=company_id,
+            filing_id=filing_id,
+            title="Risk Factors",
+            document_type=documents_module.DocumentType.RISK_FACTORS,
+            content="Original risk factors."
+        )
+
+    assert status == documents_module.DocumentWriteStatus.UNCHANGED
+    assert same_document.id == document_id
+    assert same_document.content_hash == hashlib.sha256(b"Original risk factors.").hexdigest()
+
 def test_get_documents_by_filing(db_session, create_test_company, create_test_filing, multiple_document_data):
     """Test the get_documents_by_filing helper function."""
     # Create multiple documents for the same filing
@@ -535,4 +535,36 @@ def test_get_filings_by_company(db_session, create_test_company, multiple_filing
         assert len(non_existent_filings) == 0
     finally:
         # Restore the original function
-        filings_module.get_db_session = original_get_db_session
\ No newline at end of file
+        filings_module.get_db_session = original_get_db_session
+def test_get_filings_page(db_session, create_test_company, multiple_filing_data):
+    """Test paging through a company's filings, newest first, with filters."""
+    for data in multiple_filing_data:
+        db_session.add(Filing(**data))
+    db_session.add(Filing(company_id=create_test_company.id, accession_number="0000123456-24-000001",
+                          form="10-K", filing_date=date(2024, 2, 1)))
+    db_session.commit()
+
+    import src.database.filings as filings_module
+    original_get_db_session = filings_module.get_db_session
+    filings_module.get_db_session = lambda: db_session
+
+    try:
+        company_id = create_test_company.id
+
+        # Page through the 10-Qs two at a time
+        first = filings_module.get_filings_page(company_id, form="10-Q", limit=2)
+        assert [f.filing_date for f in first.items] == [date(2023, 9, 30), date(2023, 6, 30)]
+        assert first.next_cursor is not None
+
+        second = filings_module.get_filings_page(company_id, form="10-Q", cursor=first.next_cursor, limit=2)
+        assert [f.filing_date for f in second.items] == [date(2023, 3, 31)]
+        assert second.next_cursor is None
+
+        # Date range filter
+        page = filings_module.get_filings_page(company_id, start_date=date(2023, 6, 1), end_date=date(2023, 12, 31))
+        assert [f.filing_date for f in page.items] == [date(2023, 9, 30), date(2023, 6, 30)]
+
+        # Filters are also applied by get_filings_by_company
+        assert len(filings_module.get_filings_by_company(company_id, form="10-K")) == 1
+    finally:
+        filings_module.get_db_session = original_get_db_session
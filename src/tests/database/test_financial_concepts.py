@@ -482,4 +482,42 @@ def test_get_financial_concept_by_name(db_session, sample_gaap_net_income_concep
         assert non_existent is None
     finally:
         # Restore the original function
-        concepts_module.get_db_session = original_get_db_session
\ No newline at end of file
+        concepts_module.get_db_session = original_get_db_session
+
+
+def test_bulk_find_or_create_financial_concepts(db_session):
+    """Test resolving new and existing concepts with bulk_find_or_create_financial_concepts."""
+    existing = FinancialConcept(name="Assets", description="Total assets.", labels=["balance_sheet"])
+    db_session.add(existing)
+    db_session.commit()
+    existing_id = existing.id
+
+    # Mock the db_session global
+    import src.database.financial_concepts as concepts_module
+    original_get_db_session = concepts_module.get_db_session
+    concepts_module.get_db_session = lambda: db_session
+
+    try:
+        concept_ids = concepts_module.bulk_find_or_create_financial_concepts([
+            {"name": "Assets", "description": None, "labels": ["cover_page"]},
+            {"name": "Liabilities", "description": "Total liabilities.", "labels": ["balance_sheet"]},
+            {"name": "Liabilities", "labels": ["balance_sheet"]},
+        ])
+
+        assert set(concept_ids) == {"Assets", "Liabilities"}
+        assert concept_ids["Assets"] == existing_id
+
+        db_session.expire_all()
+        assets = db_session.get(FinancialConcept, existing_id)
+        # Description is kept when none is provided, labels are merged
+        assert assets.description == "Total assets."
+        assert sorted(assets.labels) == ["balance_sheet", "cover_page"]
+
+        liabilities = db_session.get(FinancialConcept, concept_ids["Liabilities"])
+        assert liabilities.description == "Total liabilities."
+        assert liabilities.labels == ["balance_sheet"]
+
+        assert concepts_module.bulk_find_or_create_financial_concepts([]) == {}
+    finally:
+        # Restore the original function
+        concepts_module.get_db_session = original_get_db_session
@@ -605,3 +605,46 @@ def test_get_financial_values_by_company_and_date(db_session, create_test_compan
     finally:
         # Restore the original function
         values_module.get_db_session = original_get_db_session
+
+def test_bulk_upsert_financial_values(db_session, create_test_company, create_test_concept, create_test_filing):
+    """Test creating and updating values with bulk_upsert_financial_values."""
+    second_concept = FinancialConcept(name="Liabilities", labels=["balance_sheet"])
+    db_session.add(second_concept)
+    db_session.commit()
+
+    # Mock the db_session global
+    import src.database.financial_values as values_module
+    original_get_db_session = values_module.get_db_session
+    values_module.get_db_session = lambda: db_session
+
+    try:
+        value_date = date(2023, 12, 31)
+        written = values_module.bulk_upsert_financial_values(
+            create_test_company.id,
+            create_test_filing.id,
+            [
+                (create_test_concept.id, value_date, Decimal("100.00")),
+                (second_concept.id, value_date, Decimal("50.00")),
+            ]
+        )
+        assert written == 2
+
+        # Upserting again updates in place rather than inserting duplicates
+        written = values_module.bulk_upsert_financial_values(
+            create_test_company.id,
+            create_test_filing.id,
+            [(create_test_concept.id, value_date, Decimal("125.00"))]
+        )
+        assert written == 1
+
+        db_session.expire_all()
+        values = db_session.query(FinancialValue).filter_by(filing_id=create_test_filing.id).all()
+        assert len(values) == 2
+        by_concept = {v.concept_id: v.value for v in values}
+        assert by_concept[create_test_concept.id] == Decimal("125.00")
+        assert by_concept[second_concept.id] == Decimal("50.00")
+
+        assert values_module.bulk_upsert_financial_values(create_test_company.id, create_test_filing.id, []) == 0
+    finally:
+        # Restore the original function
+        values_module.get_db_session = original_get_db_session
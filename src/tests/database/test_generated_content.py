@@ -7,18 +7,24 @@ from sqlalchemy.exc import IntegrityError
 from src.database.companies import Company
 from src.database.documents import Document, DocumentType
 from src.database.generated_content import (
+    compute_input_fingerprint,
+    ContentKind,
     ContentSourceType,
     create_generated_content,
     delete_generated_content,
     GeneratedContent,
+    get_aggregate_summaries_by_ticker,
     get_content_with_sources_loaded,
+    get_frontpage_summaries_by_company_ids,
     get_generated_content,
     get_generated_content_by_company_and_ticker,
     get_generated_content_by_hash,
+    get_generated_content_by_input_fingerprint,
     get_generated_content_by_source_content,
     get_generated_content_by_source_document,
     get_generated_content_ids,
     get_recent_generated_content_by_ticker,
+    parse_content_description,
     update_generated_content,
 )
 from src.database.model_configs import ModelConfig
@@ -390,6 +396,90 @@ class TestGeneratedContentCRUD:
             # Restore the original function
             generated_content_module.get_db_session = original_get_db_session
 
+    def test_get_aggregate_summaries_by_ticker(self, db_session, sample_company):
+        """Test retrieving the latest aggregate summary per document type."""
+        from datetime import datetime, timedelta
+
+        # Mock the db_session global
+        import src.database.generated_content as generated_content_module
+        original_get_db_session = generated_content_module.get_db_session
+        generated_content_module.get_db_session = lambda: db_session
+
+        try:
+            now = datetime.now()
+            for description, content, created_at in [
+                ("risk_factors_aggregate_summary", "Old risk summary", now - timedelta(days=1)),
+                ("risk_factors_aggregate_summary", "Tied risk summary", now),
+                ("risk_factors_aggregate_summary", "New risk summary", now),
+                ("management_discussion_aggregate_summary", "MDA summary", now),
+                ("risk_factors_single_summary", "Single summary", now + timedelta(days=1)),
+            ]:
+                create_generated_content({
+                    "company_id": sample_company.id,
+                    "description": description,
+                    "source_type": ContentSourceType.GENERATED_CONTENT,
+                    "content": content,
+                    "created_at": created_at
+                })
+
+            summaries = get_aggregate_summaries_by_ticker(sample_company.ticker)
+
+            # One per document type; the later-inserted row wins a created_at tie
+            assert sorted(s.content for s in summaries) == ["MDA summary", "New risk summary"]
+            assert all(s.kind == ContentKind.AGGREGATE for s in summaries)
+            assert {s.document_type for s in summaries} == {DocumentType.RISK_FACTORS, DocumentType.MDA}
+        finally:
+            # Restore the original function
+            generated_content_module.get_db_session = original_get_db_session
+
+    def test_get_frontpage_summaries_by_company_ids(self, db_session, sample_company):
+        """Test retrieving the latest frontpage summary for several companies at once."""
+        from datetime import datetime, timedelta
+
+        other_company = Company(name="Other Company Inc.", ticker="OTHR", exchanges=["NASDAQ"])
+        no_summary_company = Company(name="Quiet Company Inc.", ticker="QUIE", exchanges=["NASDAQ"])
+        db_session.add_all([other_company, no_summary_company])
+        db_session.commit()
+
+        # Mock the db_session global
+        import src.database.generated_content as generated_content_module
+        original_get_db_session = generated_content_module.get_db_session
+        generated_content_module.get_db_session = lambda: db_session
+
+        try:
+            now = datetime.now()
+            for company, content, created_at in [
+                (sample_company, "Old summary", now - timedelta(days=1)),
+                (sample_company, "New summary", now),
+                (other_company, "Other summary", now),
+            ]:
+                create_generated_content({
+                    "company_id": company.id,
+                    "description": "business_description_frontpage_summary",
+                    "source_type": ContentSourceType.GENERATED_CONTENT,
+                    "content": content,
+                    "created_at": created_at
+                })
+            create_generated_content({
+                "company_id": no_summary_company.id,
+                "description": "risk_factors_single_summary",
+                "source_type": ContentSourceType.DOCUMENTS,
+                "content": "Not a frontpage summary"
+            })
+
+            summaries = get_frontpage_summaries_by_company_ids(
+                [sample_company.id, other_company.id, no_summary_company.id]
+            )
+
+            assert summaries == {
+                sample_company.id: "New summary",
+                other_company.id: "Other summary",
+            }
+            assert get_frontpage_summaries_by_company_ids([]) == {}
+        finally:
+            # Restore the original function
+            generated_content_module.get_db_session = original_get_db_session
+
     def test_update_generated_content(self, db_session, sample_generated_content_data):
         """Test updating generated content."""
         # Mock the db_session global
@@ -544,6 +634,77 @@ class TestGeneratedContentCRUD:
             generated_content_module.get_db_session = original_get_db_session
 
 
+    def test_parse_content_description(self):
+        """Test reading the document type and kind from summary descriptions."""
+        assert parse_content_description("risk_factors_aggregate_summary") == (DocumentType.RISK_FACTORS, ContentKind.AGGREGATE)
+        assert parse_content_description("business_description_frontpage_summary") == (DocumentType.DESCRIPTION, ContentKind.FRONTPAGE)
+        assert parse_content_description("custom_single_summary") == (None, ContentKind.SINGLE)
+        assert parse_content_description("Generated summary") == (None, None)
+        assert parse_content_description(None) == (None, None)
+
+    def test_compute_input_fingerprint(self):
+        """Test that the input fingerprint depends on every input but not on source order."""
+        fingerprint = compute_input_fingerprint("model", "system", "user", ["doc1", "doc2"], ["content1"])
+        assert len(fingerprint) == 64
+        assert fingerprint == compute_input_fingerprint("model", "system", "user", ["doc2", "doc1"], ["content1"])
+        assert fingerprint != compute_input_fingerprint("model", "system", "user", ["doc1"], ["content1"])
+        assert fingerprint != compute_input_fingerprint("other", "system", "user", ["doc1", "doc2"], ["content1"])
+        # Documents and generated content are fingerprinted separately
+        assert (compute_input_fingerprint("model", "system", "user", ["a"], [])
+                != compute_input_fingerprint("model", "system", "user", [], ["a"]))
+
+    def test_get_generated_content_by_input_fingerprint(self, db_session, sample_generated_content_data):
+        """Test finding content previously generated from the same inputs."""
+        # Mock the db_session global
+        import src.database.generated_content as generated_content_module
+        original_get_db_session = generated_content_module.get_db_session
+        generated_content_module.get_db_session = lambda: db_session
+
+        try:
+            fingerprint = compute_input_fingerprint("model", "system", "user", ["doc"])
+            content, _ = create_generated_content({**sample_generated_content_data, "input_fingerprint": fingerprint})
+
+            found = get_generated_content_by_input_fingerprint(fingerprint)
+            assert found is not None
+            assert found.id == content.id
+
+            # Different inputs have a different fingerprint
+            assert get_generated_content_by_input_fingerprint(
+                compute_input_fingerprint("model", "system", "other user", ["doc"])
+            ) is None
+        finally:
+            # Restore the original function
+            generated_content_module.get_db_session = original_get_db_session
+
+    def test_duplicate_content_records_input_fingerprint(self, db_session, sample_generated_content_data):
+        """Test that output matching existing content memoizes the new inputs on it."""
+        # Mock the db_session global
+        import src.database.generated_content as generated_content_module
+        original_get_db_session = generated_content_module.get_db_session
+        generated_content_module.get_db_session = lambda: db_session
+
+        try:
+            content, _ = create_generated_content(sample_generated_content_data)
+            assert content.input_fingerprint is None
+
+            fingerprint = compute_input_fingerprint("model", "system", "user", ["doc"])
+            same_content, was_created = create_generated_content(
+                {**sample_generated_content_data, "input_fingerprint": fingerprint})
+            assert not was_created
+            assert same_content.id == content.id
+
+            db_session.expire_all()
+            assert get_generated_content_by_input_fingerprint(fingerprint).id == content.id
+
+            # An existing fingerprint is kept
+            create_generated_content({**sample_generated_content_data,
+                                      "input_fingerprint": compute_input_fingerprint("model", "system", "other user")})
+            assert get_generated_content_by_input_fingerprint(fingerprint).id == content.id
+        finally:
+            # Restore the original function
+            generated_content_module.get_db_session = original_get_db_session
+
+
 class TestGeneratedContentAdvanced:
     """Test advanced features and edge cases."""
 
@@ -0,0 +1,59 @@
+"""Tests for versioned schema migrations."""
+import pytest
+from sqlalchemy import create_engine, text
+from src.database.migrations import (
+    get_schema_version,
+    LATEST_SCHEMA_VERSION,
+    migrate,
+    MIGRATIONS,
+    SchemaVersionError,
+    verify_schema_version,
+)
+from src.tests.database.fixtures import TEST_DATABASE_URL
+
+
+def test_migration_versions_are_sequential():
+    """Test that migration versions start at 1 and have no gaps."""
+    assert [migration.version for migration in MIGRATIONS] == list(range(1, len(MIGRATIONS) + 1))
+    assert LATEST_SCHEMA_VERSION == len(MIGRATIONS)
+
+
+def test_test_database_is_migrated(db_engine):
+    """Test that the migrated test database passes init_db's version check."""
+    assert verify_schema_version(db_engine) == LATEST_SCHEMA_VERSION
+
+
+def test_migrate_is_idempotent(db_engine):
+    """Test that migrating an up-to-date database applies nothing."""
+    assert migrate(db_engine) == []
+    assert migrate(db_engine, dry_run=True) == []
+
+
+def test_migrations_upgrade_existing_schema(db_engine):
+    """Test that rerunning every migration over existing tables succeeds, as on a pre-migration database."""
+    with db_engine.connect() as connection:
+        transaction = connection.begin()
+        try:
+            for migration in MIGRATIONS:
+                migration.apply(connection)
+        finally:
+            transaction.rollback()
+
+
+def test_verify_schema_version_rejects_unmigrated_database(db_engine):
+    """Test that a database without a schema version is refused."""
+    with db_engine.connect() as connection:
+        connection.execute(text("CREATE SCHEMA IF NOT EXISTS unmigrated"))
+        connection.commit()
+
+    engine = create_engine(TEST_DATABASE_URL, connect_args={"options": "-c search_path=unmigrated"})
+    try:
+        with engine.connect() as connection:
+            assert get_schema_version(connection) is None
+        with pytest.raises(SchemaVersionError, match="symbology db migrate"):
+            verify_schema_version(engine)
+    finally:
+        engine.dispose()
+        with db_engine.connect() as connection:
+            connection.execute(text("DROP SCHEMA unmigrated"))
+            connection.commit()
@@ -0,0 +1,25 @@
+from datetime import date
+import uuid
+
+import pytest
+from src.database.filings import Filing
+from src.database.pagination import decode_cursor, encode_cursor, InvalidCursorError
+
+
+def test_cursor_round_trip():
+    """Test that a cursor decodes to the id and sort value it was encoded from."""
+    row_id = uuid.uuid4()
+
+    assert decode_cursor(encode_cursor(row_id)) == (row_id, None)
+    assert decode_cursor(encode_cursor(row_id, "Apple Inc."), Filing.form) == (row_id, "Apple Inc.")
+
+    # Dates are restored from the sort column's type
+    cursor = encode_cursor(row_id, date(2023, 9, 30))
+    assert decode_cursor(cursor, Filing.filing_date) == (row_id, date(2023, 9, 30))
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "", "W10", encode_cursor("not-a-uuid")])
+def test_decode_invalid_cursor(cursor):
+    """Test that malformed cursors raise InvalidCursorError."""
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor)
@@ -1,3 +1,4 @@
+from types import SimpleNamespace
 from typing import Any, Dict, List
 import uuid
 
@@ -8,7 +9,16 @@ from src.database.generated_content import ContentSourceType, create_generated_c
 from src.database.model_configs import ModelConfig
 
 # Import the Prompt model and functions
-from src.database.prompts import create_prompt, delete_prompt, get_prompt, get_prompt_ids, Prompt, PromptRole
+from src.database.prompts import (
+    compute_recipe_hash,
+    create_prompt,
+    create_user_prompt,
+    delete_prompt,
+    get_prompt,
+    get_prompt_ids,
+    Prompt,
+    PromptRole,
+)
 
 
 # Sample prompt data fixtures
@@ -218,6 +228,39 @@ def test_create_prompt_function(db_session, sample_user_prompt_data):
         # Restore the original function
         prompts_module.get_db_session = original_get_db_session
 
+def test_create_user_prompt(db_session):
+    """Test that user prompts are stored as recipes and deduplicated by recipe hash."""
+    document = SimpleNamespace(id=uuid.uuid4(), content_hash="a" * 64)
+    content = SimpleNamespace(id=uuid.uuid4(), content_hash="b" * 64)
+
+    # Mock the db_session global
+    import src.database.prompts as prompts_module
+    original_get_db_session = prompts_module.get_db_session
+    prompts_module.get_db_session = lambda: db_session
+
+    try:
+        prompt, created = create_user_prompt("Recipe Prompt", 1, [document], [content], "Focus on margins.")
+
+        assert created == True # noqa: E712
+        assert prompt.role == PromptRole.USER
+        assert prompt.content is None
+        assert prompt.is_recipe
+        assert prompt.source_document_ids == [document.id]
+        assert prompt.source_content_ids == [content.id]
+        assert prompt.content_hash == compute_recipe_hash(1, [document], [content], "Focus on margins.")
+
+        # The same recipe is not stored twice
+        duplicate, created = create_user_prompt("Recipe Prompt", 1, [document], [content], "Focus on margins.")
+        assert created == False # noqa: E712
+        assert duplicate.id == prompt.id
+
+        # A changed source gives a new recipe
+        changed = SimpleNamespace(id=document.id, content_hash="c" * 64)
+        assert compute_recipe_hash(1, [changed], [content], "Focus on margins.") != prompt.content_hash
+    finally:
+        # Restore the original function
+        prompts_module.get_db_session = original_get_db_session
+
 def test_create_prompt_invalid_role(db_session):
     """Test that creating a prompt with an invalid role raises an error."""
     # Mock the db_session global
@@ -0,0 +1,70 @@
+"""Tests for SQL statement recording and N+1 detection."""
+import pytest
+from sqlalchemy import event, text
+import src.database.base as base
+from src.database.base import parameter_shape, QueryRecorder, record_queries, statement_shape
+from src.tests.database.fixtures import TEST_DATABASE_URL
+from src.utils.config import settings
+
+
+def test_statement_shape_collapses_parameter_lists():
+    """Test that statements differing only in the length of an IN list share a shape."""
+    one = "SELECT * FROM documents\n  WHERE id IN (%(id_1_1)s)"
+    three = "SELECT * FROM documents WHERE id IN (%(id_1_1)s, %(id_1_2)s, %(id_1_3)s)"
+
+    assert statement_shape(three) == "SELECT * FROM documents WHERE id IN (...)"
+    assert statement_shape(one) == "SELECT * FROM documents WHERE id IN (%(id_1_1)s)"
+
+
+def test_parameter_shape_omits_values():
+    """Test that parameter shapes keep names and types but not values."""
+    assert parameter_shape({"ticker": "AAPL", "limit": 5}) == {"ticker": "str", "limit": "int"}
+    assert parameter_shape([{"name": "a"}, {"name": "b"}]) == {"rows": 2, "row": {"name": "str"}}
+
+
+def test_recorder_flags_repeated_statements():
+    """Test that a statement run once per row is reported as repeated."""
+    recorder = QueryRecorder("test", slow_query_ms=1000, repeated_query_threshold=3)
+    recorder.record("SELECT * FROM companies", {}, 0.001)
+    for i in range(3):
+        recorder.record("SELECT * FROM filings WHERE company_id = %(company_id)s", {"company_id": i}, 0.001)
+
+    assert len(recorder) == 4
+    assert recorder.repeated() == {"SELECT * FROM filings WHERE company_id = %(company_id)s": 3}
+
+
+def test_recorder_listen(db_session):
+    """Test recording the statements run on a connection."""
+    recorder = QueryRecorder("test")
+    with recorder.listen(db_session.connection()):
+        db_session.execute(text("SELECT 1"))
+        db_session.execute(text("SELECT 1"))
+
+    assert recorder.statements == ["SELECT 1", "SELECT 1"]
+    assert recorder.repeated(2) == {"SELECT 1": 2}
+
+    # Listeners are removed when the block exits
+    db_session.execute(text("SELECT 1"))
+    assert len(recorder) == 2
+
+
+def test_record_queries_scope():
+    """Test that record_queries yields an empty recorder named after its scope."""
+    with record_queries("cli companies") as recorder:
+        assert recorder.name == "cli companies"
+    assert len(recorder) == 0
+
+
+@pytest.mark.parametrize("metrics_enabled,record", [(False, False), (True, False), (False, True)])
+def test_init_db_instruments_engine_only_when_used(monkeypatch, metrics_enabled, record):
+    """Test that init_db only adds the cursor listeners if metrics or query recording are on."""
+    for name in ("engine", "db_session", "SessionLocal"):
+        monkeypatch.setattr(base, name, None)
+    monkeypatch.setattr(settings.metrics, "enabled", metrics_enabled)
+    monkeypatch.setattr(settings.database, "record_queries", record)
+
+    engine, _ = base.init_db(TEST_DATABASE_URL)
+    try:
+        assert event.contains(engine, "before_cursor_execute", base._before_cursor_execute) == (metrics_enabled or record)
+    finally:
+        engine.dispose()
@@ -0,0 +1,73 @@
+"""Tests for full-text search over documents and generated content."""
+from datetime import date
+
+import pytest
+from src.database.companies import Company
+from src.database.documents import Document, DocumentType
+from src.database.filings import Filing
+from src.database.generated_content import ContentSourceType, GeneratedContent
+
+
+@pytest.fixture
+def searchable_documents(db_session):
+    """Create documents for two companies with different risk factors."""
+    documents = {}
+    for ticker, period, text in [
+        ("TARF", date(2023, 12, 31), "Tariff exposure on imported components could reduce our margins."),
+        ("CLMT", date(2022, 12, 31), "Climate regulation may increase our operating costs."),
+    ]:
+        company = Company(name=f"{ticker} Inc.", ticker=ticker)
+        db_session.add(company)
+        db_session.flush()
+        filing = Filing(company_id=company.id, accession_number=f"{ticker}-23-000001", form="10-K",
+                        filing_date=period, period_of_report=period)
+        db_session.add(filing)
+        db_session.flush()
+        document = Document(company_id=company.id, filing_id=filing.id, title=f"{ticker}-risk-factors",
+                            document_type=DocumentType.RISK_FACTORS, content=text)
+        db_session.add(document)
+        documents[ticker] = document
+
+    db_session.add(GeneratedContent(company_id=documents["TARF"].company_id,
+                                    description="risk_factors_aggregate_summary",
+                                    source_type=ContentSourceType.DOCUMENTS,
+                                    content="The company is exposed to tariffs on imports."))
+    db_session.commit()
+    return documents
+
+
+def _patch_sessions(db_session):
+    import src.database.search as search_module
+    original_get_db_session = search_module.get_db_session
+    search_module.get_db_session = lambda: db_session
+    return search_module, original_get_db_session
+
+
+def test_search_documents(db_session, searchable_documents):
+    """Test that document search matches stemmed terms and highlights them."""
+    search_module, original_get_db_session = _patch_sessions(db_session)
+    try:
+        results = search_module.search_documents("tariffs")
+        assert [r.id for r in results] == [searchable_documents["TARF"].id]
+        assert results[0].ticker == "TARF"
+        assert "<mark>Tariff</mark>" in results[0].snippet
+
+        # Filters narrow the search
+        assert search_module.search_documents("tariffs", ticker="CLMT") == []
+        assert search_module.search_documents("climate", period_end=date(2022, 12, 31))[0].ticker == "CLMT"
+        assert search_module.search_documents("climate", period_start=date(2023, 1, 1)) == []
+        assert search_module.search_documents("climate", document_type=DocumentType.MDA) == []
+    finally:
+        search_module.get_db_session = original_get_db_session
+
+
+def test_search_generated_content(db_session, searchable_documents):
+    """Test searching generated content bodies."""
+    search_module, original_get_db_session = _patch_sessions(db_session)
+    try:
+        results = search_module.search_generated_content("tariff", ticker="TARF")
+        assert len(results) == 1
+        assert results[0].description == "risk_factors_aggregate_summary"
+        assert search_module.search_generated_content("climate") == []
+    finally:
+        search_module.get_db_session = original_get_db_session
@@ -0,0 +1,66 @@
+from unittest import mock
+
+from src.database.documents import DocumentType
+from src.ingestion.edgar_db.accessors import (
+    clear_parse_cache,
+    FilingObjectCache,
+    get_parse_cache_stats,
+    get_sections_for_document_types,
+)
+
+
+def _mock_filing(accession_number: str, form: str = "10-K") -> mock.MagicMock:
+    filing = mock.MagicMock()
+    filing.accession_number = accession_number
+    filing.form = form
+    return filing
+
+
+def test_filing_object_cache_hits_and_misses():
+    cache = FilingObjectCache(maxsize=2)
+    filing = _mock_filing("0000123456-23-000001")
+
+    first = cache.get(filing)
+    second = cache.get(filing)
+
+    assert first is second
+    filing.obj.assert_called_once()
+    assert cache.stats() == {"hits": 1, "misses": 1, "size": 1, "maxsize": 2}
+
+
+def test_filing_object_cache_evicts_least_recently_used():
+    cache = FilingObjectCache(maxsize=2)
+    filings = [_mock_filing(f"0000123456-23-00000{i}") for i in range(3)]
+
+    cache.get(filings[0])
+    cache.get(filings[1])
+    cache.get(filings[0])  # filings[1] is now least recently used
+    cache.get(filings[2])
+    cache.get(filings[1])
+
+    assert filings[0].obj.call_count == 1
+    assert filings[1].obj.call_count == 2
+    assert cache.stats()["size"] == 2
+
+
+def test_get_sections_for_document_types_parses_once():
+    clear_parse_cache()
+    filing = _mock_filing("0000123456-23-000010")
+    filing_obj = filing.obj.return_value
+    filing_obj.business = "Business description text"
+    filing_obj.risk_factors = "Risk factors text"
+    filing_obj.management_discussion = "MD&A text"
+    filing_obj.directors_officers_and_governance = "Directors text"
+    filing_obj.get_item_with_part.return_value = "Item text"
+
+    sections = get_sections_for_document_types(filing)
+
+    filing.obj.assert_called_once()
+    assert sections[DocumentType.DESCRIPTION] == "Business description text"
+    assert sections[DocumentType.MARKET_RISK] == "Item text"
+    assert get_parse_cache_stats()["misses"] == 1
+
+    get_sections_for_document_types(filing)
+    filing.obj.assert_called_once()
+    assert get_parse_cache_stats()["hits"] == 1
+    clear_parse_cache()
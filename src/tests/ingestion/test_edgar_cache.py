@@ -0,0 +1,142 @@
+from datetime import date
+import os
+from types import SimpleNamespace
+
+import pytest
+from src.database.documents import DocumentType
+from src.ingestion.edgar_db.cache import EdgarCache, EdgarCacheMissError
+import src.ingestion.ingestion_helpers as ingestion_helpers
+from src.ingestion.ingestion_helpers import CachedFiling, get_filing_sections
+
+
+def test_edgar_cache_round_trip(tmp_path):
+    cache = EdgarCache(str(tmp_path), max_bytes=1024 * 1024)
+
+    assert cache.get(cik=320193, accession_number="0000320193-23-000106", url="https://sec.gov/a") is None
+
+    cache.put({"filing_date": date(2023, 11, 3), "sections": ["risk_factors"]},
+              cik=320193, accession_number="0000320193-23-000106", url="https://sec.gov/a")
+    payload = cache.get(cik=320193, accession_number="0000320193-23-000106", url="https://sec.gov/a")
+
+    assert payload == {"filing_date": "2023-11-03", "sections": ["risk_factors"]}
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["entries"] == 1
+
+
+def test_edgar_cache_keys_are_content_addressed():
+    assert EdgarCache.key(1, "a", "u") == EdgarCache.key(1, "a", "u")
+    assert EdgarCache.key(1, "a", "u") != EdgarCache.key(1, "b", "u")
+
+
+def test_edgar_cache_evicts_least_recently_used(tmp_path):
+    cache = EdgarCache(str(tmp_path), max_bytes=10 * 1024 * 1024)
+    payload = os.urandom(2048).hex()
+
+    for i in range(3):
+        cache.put(payload, url=f"edgar://test/{i}")
+        path = cache._path(cache.key(url=f"edgar://test/{i}"))
+        os.utime(path, (i, i))
+
+    entry_size = cache.stats()["size"] // 3
+    cache.max_bytes = entry_size * 2
+    removed = cache.evict()
+
+    assert removed == 1
+    assert cache.get(url="edgar://test/0") is None
+    assert cache.get(url="edgar://test/2") == payload
+
+
+def test_edgar_cache_treats_corrupt_entries_as_misses(tmp_path):
+    cache = EdgarCache(str(tmp_path), max_bytes=1024 * 1024)
+    cache.put({"a": 1}, url="edgar://test/corrupt")
+    path = cache._path(cache.key(url="edgar://test/corrupt"))
+    path.write_bytes(b"not gzip")
+
+    assert cache.get(url="edgar://test/corrupt") is None
+    assert not path.exists()
+
+
+def test_edgar_cache_tracks_size_without_rescanning(tmp_path, monkeypatch):
+    EdgarCache(str(tmp_path), max_bytes=1024 * 1024).put({"a": 1}, url="edgar://test/existing")
+
+    # Totals are seeded from disk once, then kept up to date by writes
+    cache = EdgarCache(str(tmp_path), max_bytes=1024 * 1024)
+    assert cache.stats()["entries"] == 1
+
+    def fail_scan():
+        raise AssertionError("cache directory scanned")
+
+    monkeypatch.setattr(cache, "_scan", fail_scan)
+    cache.put({"b": 2}, url="edgar://test/new")
+    cache.put({"b": 3}, url="edgar://test/new")
+
+    stats = cache.stats()
+    assert stats["entries"] == 2
+    assert stats["size"] == sum(path.stat().st_size for path in tmp_path.glob("*/*.json.gz"))
+
+
+def test_edgar_cache_put_evicts_below_low_water(tmp_path):
+    cache = EdgarCache(str(tmp_path), max_bytes=10 * 1024 * 1024)
+    payload = os.urandom(2048).hex()
+    cache.put(payload, url="edgar://test/size")
+    entry_size = cache.stats()["size"]
+
+    cache.max_bytes = int(entry_size * 4.5)
+    for i in range(5):
+        cache.put(payload, url=f"edgar://test/{i}")
+        os.utime(cache._path(cache.key(url=f"edgar://test/{i}")), (i + 1, i + 1))
+
+    # Writes that fill the cache evict down to 90% of it rather than just under it
+    stats = cache.stats()
+    assert stats["size"] <= cache.max_bytes * 0.9
+    assert stats["entries"] == 4
+    assert stats["size"] == sum(path.stat().st_size for path in tmp_path.glob("*/*.json.gz"))
+
+
+@pytest.fixture
+def section_cache(tmp_path, monkeypatch):
+    """Read filing sections through a temporary cache, counting extractions."""
+    extractions = []
+
+    def extract(filing):
+        extractions.append(filing.accession_number)
+        return {DocumentType.RISK_FACTORS: f"Risk factors, extraction {len(extractions)}"}
+
+    monkeypatch.setattr(ingestion_helpers, "get_edgar_cache", lambda: EdgarCache(str(tmp_path), max_bytes=1024 * 1024))
+    monkeypatch.setattr(ingestion_helpers, "get_sections_for_document_types", extract)
+    return extractions
+
+
+FILING = SimpleNamespace(cik=320193, accession_number="0000320193-23-000106", form="10-K",
+                         filing_date=date(2023, 11, 3), period_of_report="2023-09-30", url="https://sec.gov/a")
+
+
+def test_filing_sections_are_cached(section_cache):
+    """Test that sections are extracted once, and replayed offline from the cache."""
+    assert get_filing_sections(FILING) == {DocumentType.RISK_FACTORS: "Risk factors, extraction 1"}
+    assert get_filing_sections(FILING) == {DocumentType.RISK_FACTORS: "Risk factors, extraction 1"}
+    assert get_filing_sections(CachedFiling(**vars(FILING))) == {DocumentType.RISK_FACTORS: "Risk factors, extraction 1"}
+    assert section_cache == [FILING.accession_number]
+
+
+def test_filing_sections_refresh(section_cache):
+    """Test that a refresh extracts the sections again and overwrites the cached copy."""
+    get_filing_sections(FILING)
+
+    assert get_filing_sections(FILING, refresh=True) == {DocumentType.RISK_FACTORS: "Risk factors, extraction 2"}
+    assert get_filing_sections(FILING) == {DocumentType.RISK_FACTORS: "Risk factors, extraction 2"}
+    # Offline there is nothing to refresh from, so the cached copy is replayed
+    offline_filing = CachedFiling(**vars(FILING))
+    assert get_filing_sections(offline_filing, refresh=True) == {DocumentType.RISK_FACTORS: "Risk factors, extraction 2"}
+    assert len(section_cache) == 2
+
+
+def test_filing_sections_are_keyed_by_extractor_version(section_cache, monkeypatch):
+    """Test that sections extracted by an older extractor version are extracted again."""
+    get_filing_sections(FILING)
+    monkeypatch.setattr(ingestion_helpers, "SECTION_EXTRACTOR_VERSION", ingestion_helpers.SECTION_EXTRACTOR_VERSION + 1)
+
+    with pytest.raises(EdgarCacheMissError):
+        get_filing_sections(CachedFiling(**vars(FILING)))
+    assert get_filing_sections(FILING) == {DocumentType.RISK_FACTORS: "Risk factors, extraction 2"}
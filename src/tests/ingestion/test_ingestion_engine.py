@@ -0,0 +1,164 @@
+from datetime import date
+import json
+from unittest import mock
+
+from src.database.documents import DocumentWriteStatus
+from src.ingestion.engine import (
+    _record_metrics,
+    group_by_ticker,
+    ingest_ticker,
+    IngestionStats,
+    load_universe,
+    run_ingestion,
+    UniverseEntry,
+)
+from src.utils.metrics import (
+    INGESTED_FILINGS,
+    INGESTED_SECTIONS,
+    INGESTION_FILINGS_PER_SECOND,
+    INGESTION_SECTIONS_PER_SECOND,
+)
+from uuid_extensions import uuid7
+
+
+def test_load_universe_text(tmp_path):
+    universe = tmp_path / "universe.txt"
+    universe.write_text("# backfill\nAAPL 10-K 5\nmsft, 10-Q, 6\nNVDA\n")
+
+    entries = load_universe(universe)
+
+    assert entries == [
+        UniverseEntry(ticker="AAPL", form="10-K", count=5),
+        UniverseEntry(ticker="MSFT", form="10-Q", count=6),
+        UniverseEntry(ticker="NVDA", form="10-K", count=1),
+    ]
+
+
+def test_load_universe_json(tmp_path):
+    universe = tmp_path / "universe.json"
+    universe.write_text(json.dumps([
+        {"ticker": "aapl", "form": "10-K", "count": 2},
+        {"ticker": "MSFT", "forms": {"10-K": 5, "10-Q": 6}},
+    ]))
+
+    entries = load_universe(universe)
+
+    assert [(e.ticker, e.form, e.count) for e in entries] == [
+        ("AAPL", "10-K", 2),
+        ("MSFT", "10-K", 5),
+        ("MSFT", "10-Q", 6),
+    ]
+
+
+def test_group_by_ticker_preserves_order():
+    entries = [
+        UniverseEntry("AAPL", "10-K", 5),
+        UniverseEntry("MSFT", "10-K", 5),
+        UniverseEntry("AAPL", "10-Q", 6),
+    ]
+
+    grouped = group_by_ticker(entries)
+
+    assert list(grouped) == ["AAPL", "MSFT"]
+    assert [e.form for e in grouped["AAPL"]] == ["10-K", "10-Q"]
+
+
+def test_ingest_ticker_runs_forms_in_order():
+    company = mock.MagicMock()
+    company.id = uuid7()
+    filing_ids = [uuid7(), uuid7()]
+
+    with mock.patch('src.ingestion.engine.get_company_by_ticker', return_value=company), \
+         mock.patch('src.ingestion.engine.ingest_filings') as mock_ingest_filings, \
+         mock.patch('src.ingestion.engine.count_documents_by_filings', return_value=3), \
+         mock.patch('src.ingestion.engine.close_session') as mock_close_session:
+
+        mock_ingest_filings.side_effect = [
+            [("AAPL", "10-K", date(2023, 9, 30), filing_ids[0])],
+            [("AAPL", "10-Q", date(2023, 12, 30), filing_ids[1])],
+        ]
+
+        stats = ingest_ticker("AAPL", [UniverseEntry("AAPL", "10-K", 1), UniverseEntry("AAPL", "10-Q", 1)])
+
+        assert [c.kwargs['form'] for c in mock_ingest_filings.call_args_list] == ["10-K", "10-Q"]
+        assert stats.filings == 2
+        assert stats.documents == 6
+        assert stats.failures == []
+        mock_close_session.assert_called_once()
+
+
+def test_ingest_ticker_records_failures():
+    with mock.patch('src.ingestion.engine.get_company_by_ticker', side_effect=Exception("boom")), \
+         mock.patch('src.ingestion.engine.close_session'):
+
+        stats = ingest_ticker("AAPL", [UniverseEntry("AAPL")])
+
+        assert stats.failures == ["AAPL"]
+        assert stats.filings == 0
+
+
+def test_run_ingestion_aggregates_stats():
+    entries = [UniverseEntry("AAPL"), UniverseEntry("MSFT"), UniverseEntry("AAPL", "10-Q")]
+
+    def fake_ingest_ticker(ticker, ticker_entries, include_documents):
+        return IngestionStats(tickers=1, filings=len(ticker_entries), documents=2 * len(ticker_entries))
+
+    with mock.patch('src.ingestion.engine.ingest_ticker', side_effect=fake_ingest_ticker):
+        stats = run_ingestion(entries, max_workers=2)
+
+    assert stats.tickers == 2
+    assert stats.filings == 3
+    assert stats.documents == 6
+    assert stats.elapsed > 0
+
+
+def test_ingest_ticker_returns_metric_counts():
+    """Test that the per-form and per-status counts come back with the stats, for the parent to record."""
+    company = mock.MagicMock()
+    company.id = uuid7()
+
+    def fake_ingest_filings(company_id, ticker, form, count, include_documents, section_counts):
+        section_counts[DocumentWriteStatus.CREATED] = section_counts.get(DocumentWriteStatus.CREATED, 0) + 2
+        section_counts[DocumentWriteStatus.UNCHANGED] = section_counts.get(DocumentWriteStatus.UNCHANGED, 0) + 1
+        return [(ticker, form, date(2023, 9, 30), uuid7()) for _ in range(count)]
+
+    with mock.patch('src.ingestion.engine.get_company_by_ticker', return_value=company), \
+         mock.patch('src.ingestion.engine.ingest_filings', side_effect=fake_ingest_filings), \
+         mock.patch('src.ingestion.engine.count_documents_by_filings', return_value=3), \
+         mock.patch('src.ingestion.engine.close_session'):
+
+        stats = ingest_ticker("AAPL", [UniverseEntry("AAPL", "10-K", 2), UniverseEntry("AAPL", "10-Q", 1)])
+
+    assert stats.filings_by_form == {"10-K": 2, "10-Q": 1}
+    assert stats.sections_by_form == {"10-K": 3, "10-Q": 3}
+    assert stats.sections_by_status == {"created": 4, "unchanged": 2}
+
+
+def test_record_metrics_counts_process_results_in_parent():
+    """Test that counts from process workers are recorded here, and thread workers' counts aren't recorded twice."""
+    stats = IngestionStats(tickers=2, filings=3, elapsed=2.0, filings_by_form={"10-K": 2, "10-Q": 1},
+                           sections_by_form={"10-K": 8, "10-Q": 2}, sections_by_status={"created": 10})
+    filings_before = INGESTED_FILINGS.value(form="10-K")
+    sections_before = INGESTED_SECTIONS.value(status="created")
+
+    _record_metrics(stats, "thread")
+    assert INGESTED_FILINGS.value(form="10-K") == filings_before
+    assert INGESTED_SECTIONS.value(status="created") == sections_before
+
+    _record_metrics(stats, "process")
+    assert INGESTED_FILINGS.value(form="10-K") == filings_before + 2
+    assert INGESTED_SECTIONS.value(status="created") == sections_before + 10
+
+    # Throughput is over the whole run, not the last ingest_filings call
+    assert INGESTION_FILINGS_PER_SECOND.value(form="10-K") == 1.0
+    assert INGESTION_SECTIONS_PER_SECOND.value(form="10-K") == 4.0
+    assert INGESTION_FILINGS_PER_SECOND.value(form="10-Q") == 0.5
+
+
+def test_stats_merge_breakdowns():
+    total = IngestionStats()
+    total.merge(IngestionStats(tickers=1, filings_by_form={"10-K": 1}, sections_by_status={"created": 2}))
+    total.merge(IngestionStats(tickers=1, filings_by_form={"10-K": 2, "10-Q": 1}, sections_by_status={"updated": 1}))
+
+    assert total.filings_by_form == {"10-K": 3, "10-Q": 1}
+    assert total.sections_by_status == {"created": 2, "updated": 1}
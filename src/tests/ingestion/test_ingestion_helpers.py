@@ -1,12 +1,21 @@
 from datetime import date
+from decimal import Decimal
 from unittest import mock
 
 import pandas as pd
 import pytest
-from src.ingestion.ingestion_helpers import ingest_financial_data
+from src.ingestion.ingestion_helpers import ingest_financial_data, normalize_statement_dataframe
 from uuid_extensions import uuid7
 
 
+def _resolve_concepts(concepts):
+    return {concept['name']: uuid7() for concept in concepts}
+
+
+def _upsert_values(company_id, filing_id, values):
+    return len(list(values))
+
+
 def test_ingest_financial_data_happy_path():
     # Setup mocks
     company_id = uuid7()
@@ -44,14 +53,9 @@ def test_ingest_financial_data_happy_path():
          mock.patch('src.ingestion.ingestion_helpers.get_income_statement_values', return_value=income_stmt_df), \
          mock.patch('src.ingestion.ingestion_helpers.get_cash_flow_statement_values', return_value=cash_flow_df), \
          mock.patch('src.ingestion.ingestion_helpers.get_cover_page_values', return_value=cover_page_df), \
-         mock.patch('src.ingestion.ingestion_helpers.find_or_create_financial_concept') as mock_create_concept, \
-         mock.patch('src.ingestion.ingestion_helpers.upsert_financial_value') as mock_upsert_value, \
-         mock.patch('src.ingestion.ingestion_helpers.find_or_create_document') as _mock_create_document:
-
-        # Configure concept creation mock
-        mock_concept = mock.MagicMock()
-        mock_concept.id = uuid7()
-        mock_create_concept.return_value = mock_concept
+         mock.patch('src.ingestion.ingestion_helpers.bulk_find_or_create_financial_concepts', side_effect=_resolve_concepts) as mock_create_concept, \
+         mock.patch('src.ingestion.ingestion_helpers.bulk_upsert_financial_values', side_effect=_upsert_values) as mock_upsert_value, \
+         mock.patch('src.ingestion.ingestion_helpers.upsert_document') as _mock_upsert_document:
 
         # Call the function
         result = ingest_financial_data(company_id, filing_id, mock_filing)
@@ -59,11 +63,11 @@ def test_ingest_financial_data_happy_path():
         # Assertions
         assert result == {'balance_sheet': 2, 'income_statement': 2, 'cash_flow': 2, 'cover_page': 1}
 
-        # Check concept creation calls
-        assert mock_create_concept.call_count == 7  # Total number of financial concepts
-
-        # Check value storage calls for numeric values
-        assert mock_upsert_value.call_count == 7  # All numeric values
+        # One bulk concept resolution and one bulk value upsert per statement
+        assert mock_create_concept.call_count == 4
+        assert sum(len(c.args[0]) for c in mock_create_concept.call_args_list) == 7  # Total number of financial concepts
+        assert mock_upsert_value.call_count == 4
+        assert sum(len(c.args[2]) for c in mock_upsert_value.call_args_list) == 7  # All numeric values
 
 
 def test_ingest_financial_data_with_string_report_date():
@@ -83,20 +87,16 @@ def test_ingest_financial_data_with_string_report_date():
          mock.patch('src.ingestion.ingestion_helpers.get_income_statement_values', return_value=pd.DataFrame()), \
          mock.patch('src.ingestion.ingestion_helpers.get_cash_flow_statement_values', return_value=pd.DataFrame()), \
          mock.patch('src.ingestion.ingestion_helpers.get_cover_page_values', return_value=pd.DataFrame()), \
-         mock.patch('src.ingestion.ingestion_helpers.find_or_create_financial_concept') as mock_create_concept, \
-         mock.patch('src.ingestion.ingestion_helpers.upsert_financial_value') as mock_upsert_value:
-
-        mock_concept = mock.MagicMock()
-        mock_concept.id = uuid7()
-        mock_create_concept.return_value = mock_concept
+         mock.patch('src.ingestion.ingestion_helpers.bulk_find_or_create_financial_concepts', side_effect=_resolve_concepts) as mock_create_concept, \
+         mock.patch('src.ingestion.ingestion_helpers.bulk_upsert_financial_values', side_effect=_upsert_values) as mock_upsert_value:
 
         result = ingest_financial_data(company_id, filing_id, mock_filing)
 
         assert result == {'balance_sheet': 1, 'income_statement': 0, 'cash_flow': 0, 'cover_page': 0}
         mock_upsert_value.assert_called_once()
         # Verify the date was properly converted from string to date object
-        _, kwargs = mock_upsert_value.call_args
-        assert kwargs['value_date'] == date(2023, 12, 31)
+        (_, _, values), _ = mock_upsert_value.call_args
+        assert values[0][1] == date(2023, 12, 31)
 
 
 def test_ingest_financial_data_skips_missing_values():
@@ -118,17 +118,14 @@ def test_ingest_financial_data_skips_missing_values():
          mock.patch('src.ingestion.ingestion_helpers.get_income_statement_values', return_value=pd.DataFrame()), \
          mock.patch('src.ingestion.ingestion_helpers.get_cash_flow_statement_values', return_value=pd.DataFrame()), \
          mock.patch('src.ingestion.ingestion_helpers.get_cover_page_values', return_value=pd.DataFrame()), \
-         mock.patch('src.ingestion.ingestion_helpers.find_or_create_financial_concept') as mock_create_concept, \
-         mock.patch('src.ingestion.ingestion_helpers.upsert_financial_value') as mock_upsert_value:
-
-        mock_concept = mock.MagicMock()
-        mock_concept.id = uuid7()
-        mock_create_concept.return_value = mock_concept
+         mock.patch('src.ingestion.ingestion_helpers.bulk_find_or_create_financial_concepts', side_effect=_resolve_concepts) as mock_create_concept, \
+         mock.patch('src.ingestion.ingestion_helpers.bulk_upsert_financial_values', side_effect=_upsert_values) as mock_upsert_value:
 
         result = ingest_financial_data(company_id, filing_id, mock_filing)
 
         assert result == {'balance_sheet': 1, 'income_statement': 0, 'cash_flow': 0, 'cover_page': 0}
-        assert mock_upsert_value.call_count == 1  # Only one valid value
+        (_, _, values), _ = mock_upsert_value.call_args
+        assert len(values) == 1  # Only one valid value
 
 
 def test_ingest_financial_data_handles_invalid_numeric_values():
@@ -149,23 +146,21 @@ def test_ingest_financial_data_handles_invalid_numeric_values():
          mock.patch('src.ingestion.ingestion_helpers.get_income_statement_values', return_value=income_stmt_df), \
          mock.patch('src.ingestion.ingestion_helpers.get_cash_flow_statement_values', return_value=pd.DataFrame()), \
          mock.patch('src.ingestion.ingestion_helpers.get_cover_page_values', return_value=pd.DataFrame()), \
-         mock.patch('src.ingestion.ingestion_helpers.find_or_create_financial_concept') as mock_create_concept, \
-         mock.patch('src.ingestion.ingestion_helpers.upsert_financial_value') as mock_upsert_value, \
+         mock.patch('src.ingestion.ingestion_helpers.bulk_find_or_create_financial_concepts', side_effect=_resolve_concepts) as mock_create_concept, \
+         mock.patch('src.ingestion.ingestion_helpers.bulk_upsert_financial_values', side_effect=_upsert_values) as mock_upsert_value, \
          mock.patch('src.ingestion.ingestion_helpers.logger') as mock_logger:
 
-        mock_concept = mock.MagicMock()
-        mock_concept.id = uuid7()
-        mock_create_concept.return_value = mock_concept
-
         result = ingest_financial_data(company_id, filing_id, mock_filing)
 
         assert result == {'balance_sheet': 0, 'income_statement': 0, 'cash_flow': 0, 'cover_page': 0}
-        assert mock_upsert_value.call_count == 0  # No valid values to insert
+        (_, _, values), _ = mock_upsert_value.call_args
+        assert values == []  # No valid values to insert
         # Check that a warning was logged
         mock_logger.warning.assert_called_with(
-            "invalid_income_statement_value",
-            concept='Revenue',
-            value='not-a-number'
+            "invalid_income_statement_values",
+            count=1,
+            concepts=['Revenue'],
+            values=['not-a-number']
         )
 
 
@@ -191,3 +186,34 @@ def test_ingest_financial_data_error_handling():
             exc_info=True
         )
 
+
+
+def test_normalize_statement_dataframe():
+    """Test vectorized cleaning of formatted statement values."""
+    statement_df = pd.DataFrame({
+        'concept': ['Revenue', 'Loss', 'Shares', 'Name', 'Blank', 'Missing'],
+        'label': ['Total Revenue', 'Net Loss', 'Shares Outstanding', 'Registrant Name', 'Blank', 'Missing'],
+        '2023-12-31': ['$1,000.50', '(250)', 1000000, 'Acme Corp', '', None]
+    })
+
+    normalized, rejected = normalize_statement_dataframe(statement_df, date(2023, 12, 31))
+
+    assert normalized['concept'].tolist() == ['Revenue', 'Loss', 'Shares']
+    assert normalized['value'].tolist() == [Decimal('1000.50'), Decimal('-250'), Decimal('1000000')]
+    assert (normalized['value_date'] == date(2023, 12, 31)).all()
+    assert rejected['concept'].tolist() == ['Name']
+    assert rejected['value'].tolist() == ['Acme Corp']
+
+
+def test_normalize_statement_dataframe_missing_period():
+    """Test that a statement without the report date column yields no values."""
+    statement_df = pd.DataFrame({
+        'concept': ['Revenue'],
+        'label': ['Total Revenue'],
+        '2022-12-31': [1000]
+    })
+
+    normalized, rejected = normalize_statement_dataframe(statement_df, date(2023, 12, 31))
+
+    assert normalized.empty
+    assert rejected.empty
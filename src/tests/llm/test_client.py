@@ -0,0 +1,189 @@
+"""Tests for token counting and streaming generate responses, without an Ollama server or tokenizer downloads."""
+import sys
+from types import SimpleNamespace
+
+from ollama import GenerateResponse
+import pytest
+from src.database.model_configs import ModelConfig
+import src.llm.client as client_module
+from src.llm.client import (
+    approximate_token_count,
+    count_tokens,
+    count_tokens_many,
+    GenerateStream,
+    get_tokenizer,
+    model_family,
+    stream_generate_response,
+)
+from src.utils.metrics import LLM_TIME_TO_FIRST_TOKEN_SECONDS, LLM_TOKENS
+
+MODEL = "stream-test-model"
+
+
+@pytest.fixture
+def model_config():
+    # Not a known tokenizer family, so token counts are approximated instead of loading a tokenizer
+    return ModelConfig(model=MODEL, options_json='{"num_ctx": 4096}')
+
+
+class StubTokenizer:
+    """Stands in for a Hugging Face tokenizer, with one token per word."""
+
+    def __init__(self):
+        self.batches = []
+
+    def __call__(self, contents):
+        self.batches.append(contents)
+        return {"input_ids": [list(range(len(content.split()))) for content in contents]}
+
+
+@pytest.fixture
+def tokenizers(monkeypatch):
+    """Start from an empty tokenizer registry, loading stub tokenizers in place of transformers.
+
+    Yields the list of encoders loaded, one entry per from_pretrained call.
+    """
+    loaded = []
+
+    def from_pretrained(encoder, token=None):
+        loaded.append(encoder)
+        if encoder == client_module.TOKENIZER_ENCODERS["gemma"]:
+            raise OSError("gated repository")
+        return StubTokenizer()
+
+    monkeypatch.setattr(client_module, "_tokenizers", {})
+    monkeypatch.setitem(sys.modules, "transformers",
+                        SimpleNamespace(AutoTokenizer=SimpleNamespace(from_pretrained=from_pretrained)))
+    yield loaded
+
+
+@pytest.mark.parametrize("model, family", [
+    ("qwen3:4b", "qwen"),
+    ("Qwen2.5-Coder:32B", "qwen"),
+    ("gemma3:12b", "gemma"),
+    ("hf.co/unsloth/gemma-3-27b-it-GGUF", "gemma"),
+    ("llama3.1:8b", None),
+])
+def test_model_family(model, family):
+    assert model_family(model) == family
+
+
+def test_get_tokenizer_loads_once(tokenizers):
+    """Test that each family's tokenizer is loaded once and shared by its models."""
+    tokenizer = get_tokenizer(ModelConfig(model="qwen3:4b"))
+
+    assert isinstance(tokenizer, StubTokenizer)
+    assert get_tokenizer(ModelConfig(model="qwen3:30b")) is tokenizer
+    assert tokenizers == [client_module.TOKENIZER_ENCODERS["qwen"]]
+
+
+def test_get_tokenizer_unknown_family(tokenizers, model_config):
+    assert get_tokenizer(model_config) is None
+    assert tokenizers == []
+
+
+def test_failed_tokenizer_falls_back_to_approximation(tokenizers):
+    """Test that a tokenizer that fails to load is approximated, and not retried on every count."""
+    gemma = ModelConfig(model="gemma3:12b")
+    content = "Revenue increased in every segment."
+
+    assert get_tokenizer(gemma) is None
+    assert count_tokens(gemma, content) == approximate_token_count(content)
+    assert count_tokens_many(gemma, [content, ""]) == [approximate_token_count(content), 0]
+    assert tokenizers == [client_module.TOKENIZER_ENCODERS["gemma"]]
+
+
+def test_count_tokens_many_matches_count_tokens(tokenizers):
+    """Test that a batch counts the same as counting one string at a time, in one tokenizer call."""
+    qwen = ModelConfig(model="qwen3:4b")
+    contents = ["Supply chain risks", "", None, "Net revenue grew 12 percent"]
+
+    counts = count_tokens_many(qwen, contents)
+
+    assert counts == [3, 0, 0, 5]
+    assert get_tokenizer(qwen).batches == [["Supply chain risks", "", "", "Net revenue grew 12 percent"]]
+    assert counts == [count_tokens(qwen, content) for content in contents]
+    assert count_tokens_many(qwen, []) == []
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace time.time in the client with a clock that advances half a second per call."""
+    ticks = iter(100.0 + 0.5 * i for i in range(1000))
+    monkeypatch.setattr(client_module, "time", SimpleNamespace(time=lambda: next(ticks)))
+
+
+def _chunks():
+    # Ollama sends an empty chunk while the prompt is evaluated, one chunk per token, then the final timings
+    yield GenerateResponse(model=MODEL, response="", done=False)
+    yield GenerateResponse(model=MODEL, response="Supply", done=False)
+    yield GenerateResponse(model=MODEL, response=" chain", done=False)
+    yield GenerateResponse(model=MODEL, response="", done=True, done_reason="stop", total_duration=int(2e9),
+                           prompt_eval_count=12, eval_count=2, eval_duration=int(1e9))
+
+
+def test_generate_stream_chunks(model_config, clock):
+    """Test time to first token and per-chunk token counts and throughput."""
+    stream = GenerateStream(model_config, _chunks(), warning=None)
+
+    chunks = list(stream)
+
+    # Started at 100.0, chunks arrive at 100.5, 101.0, 101.5 and 102.0
+    assert [chunk.text for chunk in chunks] == ["", "Supply", " chain", ""]
+    assert [chunk.tokens for chunk in chunks] == [0, 1, 2, 2]
+    assert [chunk.done for chunk in chunks] == [False, False, False, True]
+    assert chunks[0].time_to_first_token is None
+    assert chunks[1].time_to_first_token == pytest.approx(1.0)
+    assert chunks[2].elapsed == pytest.approx(1.5)
+    # Throughput counts generation time only, after the first token
+    assert chunks[1].tokens_per_second is None
+    assert chunks[2].tokens_per_second == pytest.approx(4.0)
+    assert stream.time_to_first_token == pytest.approx(1.0)
+    assert stream.tokens == 2
+
+
+def test_generate_stream_final_response(model_config, clock):
+    """Test that the final response carries the full text and Ollama's timings, and is recorded."""
+    first_tokens = LLM_TIME_TO_FIRST_TOKEN_SECONDS.count(model=MODEL)
+    input_tokens = LLM_TOKENS.value(model=MODEL, direction="input")
+    stream = GenerateStream(model_config, _chunks(), warning="oversized_input")
+
+    assert stream.response is None
+    for _ in stream:
+        pass
+
+    assert stream.content == "Supply chain"
+    assert stream.response.response == "Supply chain"
+    assert stream.response.done_reason == "stop"
+    assert stream.response.total_duration == int(2e9)
+    assert stream.warning == "oversized_input"
+    assert LLM_TIME_TO_FIRST_TOKEN_SECONDS.count(model=MODEL) == first_tokens + 1
+    assert LLM_TOKENS.value(model=MODEL, direction="input") == input_tokens + 12
+
+
+def test_generate_stream_incomplete(model_config, clock):
+    """Test that a stream ending without a done chunk is an error, not a truncated response."""
+    stream = GenerateStream(model_config, iter(list(_chunks())[:3]), warning=None)
+
+    with pytest.raises(RuntimeError, match="ended before completion"):
+        list(stream)
+    assert stream.content == "Supply chain"
+    assert stream.response is None
+
+
+def test_stream_generate_response(model_config, clock):
+    """Test that the request is sent as a stream, with the context window warning."""
+    class FakeClient:
+        def generate(self, **kwargs):
+            self.kwargs = kwargs
+            return _chunks()
+
+    fake_client = FakeClient()
+    model_config.options_json = '{"num_ctx": 1}'
+
+    stream = stream_generate_response(model_config, "Summarize the risk factors.", "Risk factors", client=fake_client)
+
+    assert fake_client.kwargs["stream"] is True
+    assert fake_client.kwargs["model"] == MODEL
+    assert stream.warning.startswith("oversized_input")
+    assert "".join(chunk.text for chunk in stream) == "Supply chain"
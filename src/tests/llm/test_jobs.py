@@ -0,0 +1,154 @@
+"""Tests for the concurrent generation job runner, with a stub Ollama client."""
+import asyncio
+from collections import Counter
+from typing import Optional
+
+from ollama import GenerateResponse
+import pytest
+from src.database.model_configs import ModelConfig
+from src.database.prompts import Prompt, PromptRole
+import src.llm.client as client_module
+from src.llm.jobs import GenerationJob, GenerationJobRunner
+
+# Captured before tests replace asyncio.sleep to skip retry backoff
+_sleep = asyncio.sleep
+
+
+class StubAsyncClient:
+    """Stands in for ollama.AsyncClient, tracking how many requests are in flight."""
+
+    def __init__(self, failures: int = 0, total_duration: Optional[int] = int(1e9)):
+        self.failures = failures
+        self.total_duration = total_duration
+        self.calls = 0
+        self.started = []
+        self.in_flight = Counter()
+        self.max_in_flight = 0
+        self.max_in_flight_per_model = Counter()
+
+    async def generate(self, model, system, prompt, options):
+        self.calls += 1
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("connection refused")
+
+        self.started.append(model)
+        self.in_flight[model] += 1
+        self.max_in_flight = max(self.max_in_flight, sum(self.in_flight.values()))
+        self.max_in_flight_per_model[model] = max(self.max_in_flight_per_model[model], self.in_flight[model])
+        try:
+            await _sleep(0.01)
+        finally:
+            self.in_flight[model] -= 1
+
+        return GenerateResponse(model=model, response=f"Summary of: {prompt}", done=True, done_reason="stop",
+                                total_duration=self.total_duration, prompt_eval_count=10, eval_count=5, eval_duration=int(5e8))
+
+
+@pytest.fixture
+def job_session(db_session, monkeypatch):
+    """Route the runner's database writes through the test session."""
+    import src.database.generated_content as db_generated_content
+    import src.database.prompts as db_prompts
+    import src.llm.jobs as jobs_module
+    import src.llm.prompts as prompts_module
+
+    for module in (db_generated_content, db_prompts, jobs_module, prompts_module):
+        monkeypatch.setattr(module, "get_db_session", lambda: db_session)
+    return db_session
+
+
+def _jobs(session, models, count):
+    system_prompt = Prompt(name="Risk analysis", role=PromptRole.SYSTEM, content="Summarize the risk factors.")
+    system_prompt.update_content_hash()
+    model_configs = [ModelConfig(model=model, options_json='{"num_ctx": 4096}') for model in models]
+    session.add_all([system_prompt, *model_configs])
+    session.commit()
+    return [
+        GenerationJob(system_prompt=system_prompt, model_config=model_config,
+                      additional_text=f"Filing {i} of {model_config.model}")
+        for model_config in model_configs
+        for i in range(count)
+    ]
+
+
+def test_run_job_saves_result(job_session):
+    job, = _jobs(job_session, ["jobs-test-model"], 1)
+    client = StubAsyncClient()
+
+    result = asyncio.run(GenerationJobRunner(2, 1).run_job(client, job))
+
+    assert result.ok and result.was_created and not result.skipped
+    assert "Filing 0 of jobs-test-model" in result.generated_content.content
+    assert result.generated_content.input_fingerprint
+    assert result.generated_content.user_prompt_id is not None
+    assert client.calls == 1
+
+
+def test_run_limits_concurrency(job_session):
+    """Test the global limit, and the per-model limit within it."""
+    jobs = _jobs(job_session, ["jobs-test-model-a", "jobs-test-model-b", "jobs-test-model-c"], 3)
+    client = StubAsyncClient()
+
+    results = asyncio.run(GenerationJobRunner(max_concurrency=4, per_model_concurrency=2).run(jobs, client=client))
+
+    assert all(result.ok for result in results)
+    assert [result.job for result in results] == jobs
+    assert client.max_in_flight == 4
+    assert max(client.max_in_flight_per_model.values()) == 2
+
+
+def test_run_does_not_hold_back_other_models(job_session):
+    """Test that jobs queued behind a busy model leave the global slots to other models."""
+    # Three jobs for model a, then one for model b
+    jobs = _jobs(job_session, ["jobs-test-model-a", "jobs-test-model-b"], 3)[:4]
+    client = StubAsyncClient()
+
+    results = asyncio.run(GenerationJobRunner(max_concurrency=2, per_model_concurrency=1).run(jobs, client=client))
+
+    assert all(result.ok for result in results)
+    # Model b's job runs alongside the first of model a's, not after the jobs queued behind it
+    assert client.started == ["jobs-test-model-a", "jobs-test-model-b", "jobs-test-model-a", "jobs-test-model-a"]
+    assert client.max_in_flight == 2
+
+
+def test_run_job_without_total_duration(job_session):
+    """Test that a response without Ollama's timings is still saved."""
+    job, = _jobs(job_session, ["jobs-test-model"], 1)
+
+    result = asyncio.run(GenerationJobRunner(2, 1).run_job(StubAsyncClient(total_duration=None), job))
+
+    assert result.ok and result.was_created
+    assert result.generated_content.total_duration is None
+
+
+def test_run_job_retries_failed_requests(job_session, monkeypatch):
+    job, = _jobs(job_session, ["jobs-test-model"], 1)
+    client = StubAsyncClient(failures=2)
+
+    async def no_backoff(delay):
+        await _sleep(0)
+
+    monkeypatch.setattr(client_module.asyncio, "sleep", no_backoff)
+    result = asyncio.run(GenerationJobRunner(2, 1).run_job(client, job))
+
+    assert result.ok and result.was_created
+    assert client.calls == 3
+
+
+def test_run_job_skips_memoized_inputs(job_session):
+    """Test that a job whose inputs were already generated reuses the content without calling the model."""
+    job, = _jobs(job_session, ["jobs-test-model"], 1)
+    client = StubAsyncClient()
+    first = asyncio.run(GenerationJobRunner(2, 1).run_job(client, job))
+
+    again = asyncio.run(GenerationJobRunner(2, 1).run_job(client, job))
+
+    assert again.skipped and not again.was_created
+    assert again.generated_content.id == first.generated_content.id
+    assert client.calls == 1
+
+    # Forcing regeneration calls the model again
+    forced = asyncio.run(GenerationJobRunner(2, 1, skip_existing=False).run_job(client, job))
+    assert not forced.skipped
+    assert client.calls == 2
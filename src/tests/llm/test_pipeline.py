@@ -0,0 +1,145 @@
+"""Tests for the summary pipeline DAG, with a stubbed job runner."""
+import asyncio
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from src.database.documents import DocumentType
+from src.database.generated_content import ContentKind
+from src.llm.jobs import GenerationJobRunner, GenerationResult
+import src.llm.pipeline as pipeline_module
+from src.llm.pipeline import run_pipeline, SummaryPipeline
+
+
+class StubRunner:
+    """Records the jobs submitted to GenerationJobRunner.run_job and completes them without a model."""
+
+    def __init__(self, fail=(), skip=()):
+        self.fail = set(fail)
+        self.skip = set(skip)
+        self.submitted = []
+
+    async def run_job(self, client, job, index=0):
+        name = f"{job.description}:{len(self.submitted)}"
+        self.submitted.append(job)
+        # Yield to the event loop, as a request to the model would
+        await asyncio.sleep(0)
+        if job.kind in self.fail:
+            return GenerationResult(job=job, error="model unavailable")
+        return GenerationResult(job=job, generated_content=SimpleNamespace(name=name),
+                                was_created=job.kind not in self.skip, skipped=job.kind in self.skip)
+
+    def stages(self, document_type):
+        return [job.kind for job in self.submitted if job.document_type == document_type]
+
+
+@pytest.fixture
+def stub_runner(monkeypatch):
+    """Stub run_job, the Ollama client and the database lookups the pipeline makes."""
+    def install(**kwargs):
+        stub = StubRunner(**kwargs)
+
+        async def run_job(runner, client, job, index=0):
+            return await stub.run_job(client, job, index)
+
+        async def init_async_client(url):
+            return SimpleNamespace(url=url)
+
+        monkeypatch.setattr(GenerationJobRunner, "run_job", run_job)
+        monkeypatch.setattr(pipeline_module, "init_async_client", init_async_client)
+        monkeypatch.setattr(pipeline_module, "get_pipeline_model_config",
+                            lambda model, options: SimpleNamespace(model=model, options=options))
+        monkeypatch.setattr(pipeline_module, "get_pipeline_prompt", lambda name: SimpleNamespace(name=name))
+        monkeypatch.setattr(pipeline_module, "get_documents_by_filing", lambda filing_id: DOCUMENTS[filing_id])
+        return stub
+    return install
+
+
+FILINGS = [SimpleNamespace(id=uuid4()), SimpleNamespace(id=uuid4())]
+
+# Risk factors in both filings, and an MD&A section in the newest one only
+DOCUMENTS = {
+    FILINGS[0].id: [SimpleNamespace(name="risk-0", document_type=DocumentType.RISK_FACTORS),
+                    SimpleNamespace(name="mda-0", document_type=DocumentType.MDA)],
+    FILINGS[1].id: [SimpleNamespace(name="risk-1", document_type=DocumentType.RISK_FACTORS)],
+}
+
+COMPANY = SimpleNamespace(id=uuid4(), ticker="TEST")
+
+
+def _run(document_types):
+    pipeline = SummaryPipeline(COMPANY, FILINGS, GenerationJobRunner(4, 2))
+    return asyncio.run(pipeline.run(document_types))
+
+
+def test_pipeline_runs_stages_in_order(stub_runner):
+    """Test single summaries, then the aggregate of them, then the frontpage summary of the aggregate."""
+    stub = stub_runner()
+
+    result, = _run([DocumentType.RISK_FACTORS])
+
+    assert stub.stages(DocumentType.RISK_FACTORS) == [ContentKind.SINGLE, ContentKind.SINGLE,
+                                                      ContentKind.AGGREGATE, ContentKind.FRONTPAGE]
+    single, other_single, aggregate, frontpage = stub.submitted
+    assert [job.source_documents[0].name for job in (single, other_single)] == ["risk-0", "risk-1"]
+    assert aggregate.source_content == [r.generated_content for r in result.single_summaries]
+    assert frontpage.source_content == [result.aggregate_summary.generated_content]
+    assert frontpage.description == "risk_factors_frontpage_summary"
+    assert frontpage.company_id == COMPANY.id
+    assert result.ok
+    assert result.frontpage_summary.generated_content.name == "risk_factors_frontpage_summary:3"
+
+
+def test_pipeline_continues_from_existing_content(stub_runner):
+    """Test that reused single summaries feed the later stages like new ones."""
+    stub = stub_runner(skip={ContentKind.SINGLE})
+
+    result, = _run([DocumentType.RISK_FACTORS])
+
+    assert all(r.skipped for r in result.single_summaries)
+    assert stub.stages(DocumentType.RISK_FACTORS)[2:] == [ContentKind.AGGREGATE, ContentKind.FRONTPAGE]
+    assert result.ok and result.frontpage_summary.was_created
+
+
+@pytest.mark.parametrize("failed_stage, submitted", [
+    (ContentKind.SINGLE, [ContentKind.SINGLE, ContentKind.SINGLE]),
+    (ContentKind.AGGREGATE, [ContentKind.SINGLE, ContentKind.SINGLE, ContentKind.AGGREGATE]),
+])
+def test_failed_stage_stops_dependent_stages(stub_runner, failed_stage, submitted):
+    stub = stub_runner(fail={failed_stage})
+
+    result, = _run([DocumentType.RISK_FACTORS])
+
+    assert stub.stages(DocumentType.RISK_FACTORS) == submitted
+    assert result.frontpage_summary is None
+    assert not result.ok
+
+
+def test_document_types_run_independently(stub_runner):
+    """Test that each document type runs its own DAG, and one without documents is not a failure."""
+    stub = stub_runner()
+
+    risk, mda, legal = _run([DocumentType.RISK_FACTORS, DocumentType.MDA, DocumentType.LEGAL_PROCEEDINGS])
+
+    assert stub.stages(DocumentType.MDA) == [ContentKind.SINGLE, ContentKind.AGGREGATE, ContentKind.FRONTPAGE]
+    assert len(risk.single_summaries) == 2 and risk.ok
+    assert len(mda.single_summaries) == 1 and mda.ok
+    assert legal.results == [] and legal.ok
+
+
+def test_run_pipeline_without_ingestion(stub_runner, monkeypatch):
+    """Test that run_pipeline summarizes the latest stored filings, and that force disables reuse."""
+    stub = stub_runner()
+    runners = []
+    monkeypatch.setattr(pipeline_module, "get_company_by_ticker", lambda ticker: COMPANY if ticker == "TEST" else None)
+    monkeypatch.setattr(pipeline_module, "get_latest_filings", lambda company_id, form, count: FILINGS[:count])
+    monkeypatch.setattr(pipeline_module, "SummaryPipeline",
+                        lambda company, filings, runner: runners.append(runner) or SummaryPipeline(company, filings, runner))
+
+    results = run_pipeline("test", "10-K", 1, [DocumentType.RISK_FACTORS], ingest=False, force=True)
+
+    assert [len(result.single_summaries) for result in results] == [1]
+    assert [job.source_documents[0].name for job in stub.submitted[:1]] == ["risk-0"]
+    assert runners[0].skip_existing is False
+    with pytest.raises(ValueError, match="Company MISSING not found"):
+        run_pipeline("missing", "10-K", 1, [DocumentType.RISK_FACTORS], ingest=False)
@@ -0,0 +1,130 @@
+"""Tests for rendering and compacting user prompts stored as recipes."""
+from datetime import date
+import hashlib
+
+import pytest
+from src.database.companies import Company
+from src.database.documents import Document, DocumentType
+from src.database.filings import Filing
+from src.database.generated_content import GeneratedContent
+from src.database.prompts import create_user_prompt, Prompt, PromptRole
+import src.llm.prompts as prompts_module
+from src.llm.prompts import (
+    compact_user_prompts,
+    format_user_prompt_content,
+    render_user_prompt,
+    StaleUserPromptError,
+    USER_PROMPT_TEMPLATE_VERSION,
+)
+
+
+@pytest.fixture
+def prompt_session(db_session, monkeypatch):
+    """Route prompt functions through the test session, with an empty render cache."""
+    import src.database.prompts as db_prompts
+    monkeypatch.setattr(prompts_module, "get_db_session", lambda: db_session)
+    monkeypatch.setattr(db_prompts, "get_db_session", lambda: db_session)
+    prompts_module._render_recipe.cache_clear()
+    yield db_session
+    prompts_module._render_recipe.cache_clear()
+
+
+@pytest.fixture
+def source_document(prompt_session):
+    """Create a risk factors document with its company and filing."""
+    company = Company(name="Test Company, Inc.", ticker="TEST")
+    prompt_session.add(company)
+    prompt_session.flush()
+    filing = Filing(company_id=company.id, accession_number="0000123456-23-000123", form="10-K",
+                    filing_date=date(2023, 12, 31), period_of_report=date(2023, 12, 31))
+    prompt_session.add(filing)
+    prompt_session.flush()
+    document = Document(company_id=company.id, filing_id=filing.id, title="Risk Factors",
+                        document_type=DocumentType.RISK_FACTORS, content="Supply chain risks.")
+    document.update_content_hash()
+    prompt_session.add(document)
+    prompt_session.commit()
+    return document
+
+
+def _reingest(session, document, content):
+    # As upsert_document does when a filing is re-ingested with new content
+    document.content = content
+    document.update_content_hash()
+    session.commit()
+
+
+def _materialized_prompt(session, text, document=None):
+    prompt = Prompt(name="User prompt", role=PromptRole.USER, content=text)
+    prompt.update_content_hash()
+    session.add(prompt)
+    session.flush()
+    if document is not None:
+        generated = GeneratedContent(company_id=document.company_id, content="Summary.", user_prompt_id=prompt.id,
+                                     source_documents=[document])
+        generated.update_content_hash()
+        session.add(generated)
+    session.commit()
+    return prompt
+
+
+def test_render_user_prompt_recipe(prompt_session, source_document):
+    """Test that a recipe renders the text its sources were formatted to."""
+    prompt, _ = create_user_prompt("User prompt", USER_PROMPT_TEMPLATE_VERSION, [source_document], [],
+                                   "Focus on margins.")
+
+    assert render_user_prompt(prompt) == format_user_prompt_content([source_document], None, "Focus on margins.")
+
+
+def test_render_user_prompt_rejects_changed_sources(prompt_session, source_document):
+    """Test that a recipe whose source was updated in place is not rendered."""
+    prompt, _ = create_user_prompt("User prompt", USER_PROMPT_TEMPLATE_VERSION, [source_document], [])
+    _reingest(prompt_session, source_document, "Restated supply chain risks.")
+
+    with pytest.raises(StaleUserPromptError):
+        render_user_prompt(prompt)
+
+
+def test_render_user_prompt_materialized(prompt_session):
+    """Test that materialized prompts are returned as stored."""
+    prompt = _materialized_prompt(prompt_session, "Stored text")
+
+    assert render_user_prompt(prompt) == "Stored text"
+
+
+def test_compact_user_prompts(prompt_session, source_document):
+    """Test that a prompt is compacted only when its recipe renders back to the same text."""
+    text = format_user_prompt_content([source_document], None, "Focus on margins.")
+    prompt = _materialized_prompt(prompt_session, text, source_document)
+    content_hash = prompt.content_hash
+
+    assert compact_user_prompts(dry_run=True) == {"compacted": 1, "skipped": 0}
+    assert prompt_session.get(Prompt, prompt.id).content == text
+
+    assert compact_user_prompts() == {"compacted": 1, "skipped": 0}
+    prompt = prompt_session.get(Prompt, prompt.id)
+    assert prompt.is_recipe
+    assert prompt.content_hash == content_hash
+    assert prompt.source_document_ids == [source_document.id]
+    assert prompt.additional_text == "Focus on margins."
+    assert render_user_prompt(prompt) == text
+    assert hashlib.sha256(render_user_prompt(prompt).encode('utf-8')).hexdigest() == content_hash
+
+    # The stored text is gone, so a changed source must not be rendered in its place
+    prompts_module._render_recipe.cache_clear()
+    _reingest(prompt_session, source_document, "Restated supply chain risks.")
+    with pytest.raises(StaleUserPromptError):
+        render_user_prompt(prompt)
+
+
+def test_compact_user_prompts_skips_unrenderable(prompt_session, source_document):
+    """Test that prompts without sources, or whose sources no longer render their text, are kept."""
+    without_generation = _materialized_prompt(prompt_session, "Ad hoc prompt")
+    text = format_user_prompt_content([source_document])
+    changed_source = _materialized_prompt(prompt_session, text, source_document)
+    _reingest(prompt_session, source_document, "Restated supply chain risks.")
+
+    assert compact_user_prompts() == {"compacted": 0, "skipped": 2}
+    assert prompt_session.get(Prompt, without_generation.id).content == "Ad hoc prompt"
+    assert prompt_session.get(Prompt, changed_source.id).content == text
+    assert not prompt_session.get(Prompt, changed_source.id).is_recipe
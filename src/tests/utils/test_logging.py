@@ -0,0 +1,83 @@
+"""Tests for event sampling and the production logging profile."""
+import json
+import logging
+from logging.handlers import QueueHandler
+
+import pytest
+import structlog
+from src.utils.logging import configure_logging, EventSampler, get_logger, shutdown_logging
+
+
+def _log(sampler, event, method_name="info", count=1):
+    """Pass an event through the sampler count times, returning the kept event dicts."""
+    kept = []
+    for _ in range(count):
+        try:
+            kept.append(sampler(None, method_name, {"event": event}))
+        except structlog.DropEvent:
+            pass
+    return kept
+
+
+def test_sampler_keeps_one_in_n():
+    sampler = EventSampler({"created_new_financial_value": 100, "retrieved_document": 10})
+
+    kept = _log(sampler, "created_new_financial_value", count=250)
+
+    # The first occurrence is kept, then every 100th
+    assert len(kept) == 3
+    assert all(event_dict["sampled"] == 100 for event_dict in kept)
+    # Each event keeps its own count
+    assert len(_log(sampler, "retrieved_document", count=25)) == 3
+
+
+@pytest.mark.parametrize("method_name", ["warning", "error", "exception", "critical"])
+def test_sampler_never_drops_warnings_and_errors(method_name):
+    sampler = EventSampler({"created_new_financial_value": 100})
+
+    kept = _log(sampler, "created_new_financial_value", method_name=method_name, count=10)
+
+    assert len(kept) == 10
+    assert all("sampled" not in event_dict for event_dict in kept)
+
+
+def test_sampler_passes_unknown_events_through():
+    sampler = EventSampler({"created_new_financial_value": 100, "document_ingested": 1})
+
+    assert len(_log(sampler, "filing_ingested", count=10)) == 10
+    # A rate of 1 keeps every event, so it isn't sampled at all
+    kept = _log(sampler, "document_ingested", count=10)
+    assert len(kept) == 10
+    assert all("sampled" not in event_dict for event_dict in kept)
+
+
+@pytest.fixture
+def production_logging():
+    """Configure the production profile, restoring the test suite's logging afterwards."""
+    yield lambda **kwargs: configure_logging(log_level="INFO", json_format=True, profile="production", **kwargs)
+    shutdown_logging()
+    configure_logging(log_level="INFO")
+
+
+def test_production_profile_routes_application_loggers_through_queue(production_logging, capsys):
+    """Test that src.* loggers write through the queue, and that shutdown_logging flushes it."""
+    # Created before configuring, so its handler has to be swapped
+    earlier = get_logger("src.tests.utils.earlier")
+    production_logging(sampled_events={"row_written": 10})
+    later = get_logger("src.tests.utils.later")
+
+    for name in ("src.tests.utils.earlier", "src.tests.utils.later"):
+        handlers = logging.getLogger(name).handlers
+        assert len(handlers) == 1 and isinstance(handlers[0], QueueHandler)
+
+    earlier.info("filing_ingested", ticker="AAPL")
+    for i in range(20):
+        later.info("row_written", row=i)
+    later.debug("below_log_level")
+    shutdown_logging()
+
+    events = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [event["event"] for event in events] == ["filing_ingested", "row_written", "row_written"]
+    assert events[0]["ticker"] == "AAPL"
+    assert [event["row"] for event in events[1:]] == [0, 10]
+    assert all(event["sampled"] == 10 for event in events[1:])
@@ -15,6 +15,14 @@ class DatabaseSettings(BaseSettings):
     database_name: str = Field(default="symbology")
     host: str = Field(default="localhost")
     port: int = Field(default=5432)
+    # Together these should cover the API's threadpool (40 workers by default),
+    # so concurrent requests don't queue waiting for a connection
+    pool_size: int = Field(default=20)
+    max_overflow: int = Field(default=20)
+    # Group statements per API request / CLI command, and log slow and repeated (N+1) ones
+    record_queries: bool = Field(default=False)
+    slow_query_ms: int = Field(default=250)
+    repeated_query_threshold: int = Field(default=3)
 
     model_config = SettingsConfigDict(
         env_prefix="DATABASE_",
@@ -51,6 +59,8 @@ class EdgarApiSettings(BaseSettings):
     """API connector settings."""
 
     edgar_contact: str = Field(default="dude@stev.lol")
+    cache_dir: str = Field(default="~/.cache/symbology/edgar")
+    cache_max_bytes: int = Field(default=2 * 1024 ** 3)
 
     model_config = SettingsConfigDict(
         env_prefix="EDGAR_",
@@ -64,6 +74,8 @@ class OpenAISettings(BaseSettings):
     host: str = Field(default="localhost")
     port: str = Field(default="8000")
     default_model: str = Field(default="hf.co/lmstudio-community/gemma-3-12b-it-GGUF:Q6_K")
+    max_concurrency: int = Field(default=4)
+    per_model_concurrency: int = Field(default=2)
 
     model_config = SettingsConfigDict(
         env_prefix="OPENAI_API_",
@@ -84,20 +96,48 @@ class LoggingSettings(BaseSettings):
         level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         json_format: Whether to output logs in JSON format
                     (useful for production environments and log aggregation)
+        profile: "development" for caller locations on every event, or "production"
+                 for sampled high-frequency events written by a background thread
 
     Environment variables:
         LOG_LEVEL: Override the log level
         LOG_JSON_FORMAT: Set to "true" or "1" to enable JSON logging format
+        LOG_PROFILE: Set to "production" for the low-overhead logging profile
     """
 
     level: str = Field(default="INFO")
     json_format: bool = Field(default=False)
+    profile: str = Field(default="development")
     model_config = SettingsConfigDict(
         env_prefix="LOG_",
         extra="ignore",
     )
 
 
+class MetricsSettings(BaseSettings):
+    """
+    Metrics export settings.
+
+    The API always serves metrics at /metrics. CLI commands exit before they can be
+    scraped, so when they finish they write the metrics to textfile_path (for the
+    node_exporter textfile collector) and/or push them to pushgateway_url.
+
+    Environment variables:
+        METRICS_ENABLED: Set to "false" to disable recording hooks and exports
+        METRICS_TEXTFILE_PATH: e.g. /var/lib/node_exporter/textfile/symbology.prom
+        METRICS_PUSHGATEWAY_URL: e.g. http://localhost:9091
+    """
+
+    enabled: bool = Field(default=True)
+    textfile_path: str = Field(default="")
+    pushgateway_url: str = Field(default="")
+
+    model_config = SettingsConfigDict(
+        env_prefix="METRICS_",
+        extra="ignore",
+    )
+
+
 class HuggingFaceApiSettings():
     token: str = Field(default="")
 
@@ -117,6 +157,7 @@ class Settings(BaseSettings):
     huggingface_api: HuggingFaceApiSettings = Field(default_factory=HuggingFaceApiSettings)
     openai_api: OpenAISettings = Field(default_factory=OpenAISettings)
     logging: LoggingSettings = Field(default_factory=LoggingSettings)
+    metrics: MetricsSettings = Field(default_factory=MetricsSettings)
 
     model_config = SettingsConfigDict(
         env_file=".env",
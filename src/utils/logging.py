@@ -17,9 +17,22 @@ Usage:
     # Get a logger
     logger = get_logger(__name__)
     logger.info("application_started", version="1.0.0")
+
+Profiles:
+    development: every event carries a clickable caller location, and is written
+        synchronously to stdout.
+    production: no callsite introspection, events below the log level are dropped
+        before any processing, high-frequency events are sampled (see
+        DEFAULT_SAMPLED_EVENTS), and records are written to stdout by a background
+        thread through a queue. Measure the difference with
+        `python -m src.bin.logging_benchmark`.
 """
+import atexit
+import itertools
 import logging
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+import queue
 import sys
 import traceback
 from typing import Dict, List, Optional
@@ -92,10 +105,101 @@ def format_clickable_callsite(logger, method_name, event_dict):
 
     return event_dict
 
+LOG_PROFILES = ("development", "production")
+
+# Events logged once per row or document in ingestion loops, with the production
+# profile keeping one in every N of them. Warnings and errors are never sampled.
+DEFAULT_SAMPLED_EVENTS: Dict[str, int] = {
+    "created_new_financial_value": 100,
+    "updated_existing_financial_value": 100,
+    "created_new_financial_concept": 10,
+    "updated_existing_financial_concept": 10,
+    "retrieved_financial_value": 10,
+    "retrieved_financial_concept": 10,
+    "retrieved_document": 10,
+    "created_new_document": 10,
+    "updated_document_content": 10,
+    "document_content_unchanged": 10,
+    "document_ingested": 10,
+}
+
+_UNSAMPLED_METHODS = frozenset({"warning", "warn", "error", "exception", "critical", "fatal"})
+
+# Background writer of the production profile, replaced on reconfiguration
+_queue_listener: Optional[QueueListener] = None
+
+# Handler shared by application (src.*) loggers, set by configure_logging
+_application_handler: Optional[logging.Handler] = None
+
+
+class EventSampler:
+    """
+    Processor keeping one in every N occurrences of high-frequency events.
+
+    Events are keyed by name, so each sampled event keeps its own count. Kept
+    events carry `sampled=N` so readers know each line stands for N events.
+    """
+
+    def __init__(self, rates: Dict[str, int]):
+        self.rates = {event: every for event, every in rates.items() if every > 1}
+        self._counters: Dict[str, itertools.count] = {event: itertools.count() for event in self.rates}
+
+    def __call__(self, logger, method_name, event_dict):
+        every = self.rates.get(event_dict.get("event"))
+        if every is None or method_name in _UNSAMPLED_METHODS:
+            return event_dict
+        # next() on itertools.count is atomic under the GIL, so no lock is needed
+        if next(self._counters[event_dict["event"]]) % every:
+            raise structlog.DropEvent
+        event_dict["sampled"] = every
+        return event_dict
+
+
+def shutdown_logging() -> None:
+    """Write out any records queued by the production profile and stop its writer thread."""
+    global _queue_listener
+    if _queue_listener is not None:
+        # Flushes any queued records before returning
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(shutdown_logging)
+
+
+def _output_handler(profile: str) -> logging.Handler:
+    """Create the handler application loggers write to."""
+    global _queue_listener
+    shutdown_logging()
+
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(logging.Formatter("%(message)s"))
+    if profile != "production":
+        return console_handler
+
+    # Callers only enqueue the rendered message; a background thread does the write
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _queue_listener = QueueListener(log_queue, console_handler, respect_handler_level=True)
+    _queue_listener.start()
+    return QueueHandler(log_queue)
+
+
+def _set_application_handler(handler: logging.Handler) -> None:
+    global _application_handler
+    _application_handler = handler
+    # Loggers from get_logger don't propagate, so loggers created before this
+    # call keep their own handlers until they are swapped here
+    for name, existing in list(logging.root.manager.loggerDict.items()):
+        if name.startswith("src.") and isinstance(existing, logging.Logger) and not existing.propagate:
+            existing.handlers = [handler]
+
+
 def configure_logging(log_level: str = "INFO",
                         json_format: bool = False,
                         extra_processors: Optional[List[Processor]] = None,
-                        configure_root_logger: bool = True) -> None:
+                        configure_root_logger: bool = True,
+                        profile: str = "development",
+                        sampled_events: Optional[Dict[str, int]] = None) -> None:
     """
     Configure structured logging for the application.
 
@@ -104,6 +208,9 @@ def configure_logging(log_level: str = "INFO",
         json_format: Whether to output logs in JSON format (useful for production)
         extra_processors: Additional structlog processors to add to the chain
         configure_root_logger: Whether to configure the root logger (set False when using custom uvicorn config)
+        profile: "development" or "production" (see the module docstring)
+        sampled_events: Events to sample in the production profile, mapped to the N of
+            "keep one in N"; defaults to DEFAULT_SAMPLED_EVENTS
 
     Examples:
         # Configure basic logging
@@ -114,55 +221,68 @@ def configure_logging(log_level: str = "INFO",
 
         # Configure without root logger (for uvicorn integration)
         configure_logging(log_level="INFO", configure_root_logger=False)
+
+        # Configure the low-overhead production profile
+        configure_logging(log_level="INFO", json_format=True, profile="production")
     """
+    if profile not in LOG_PROFILES:
+        raise ValueError(f"Unknown logging profile '{profile}', expected one of {LOG_PROFILES}")
+
     # Set the log level for the standard library's logging
     log_level_int = getattr(logging, log_level)
+    handler = _output_handler(profile)
 
     if configure_root_logger:
         logging.basicConfig(
             format="%(message)s",
             level=log_level_int,
-            handlers=[
-                logging.StreamHandler(sys.stdout),
-            ],
+            handlers=[handler],
+            force=True,
         )
     else:
         # Configure a minimal setup for structlog without interfering with uvicorn
         # Create a logger specifically for our application
         app_logger = logging.getLogger("symbology")
         app_logger.setLevel(log_level_int)
-
-        # Only add handlers if they don't already exist
-        if not app_logger.handlers:
-            console_handler = logging.StreamHandler(sys.stdout)
-            console_handler.setFormatter(logging.Formatter("%(message)s"))
-
-            app_logger.addHandler(console_handler)
-            app_logger.propagate = False  # Don't propagate to root logger
-
-    # Define processors for structlog
-    processors: List[Processor] = [
-        # Add timestamps to logs
-        structlog.processors.TimeStamper(fmt="iso"),
-        # Add log level as string
-        structlog.processors.add_log_level,
-        # Add callsite parameters.
-        structlog.processors.CallsiteParameterAdder(
-            {
-                structlog.processors.CallsiteParameter.FILENAME,
-                structlog.processors.CallsiteParameter.FUNC_NAME,
-                structlog.processors.CallsiteParameter.LINENO,
-            }
-        ),
-        # Format callsite into clickable location
-        format_clickable_callsite,
-        # Add logger name
-        structlog.processors.StackInfoRenderer(),
-        # Add extra context from the logging call
-        structlog.contextvars.merge_contextvars,
-        # Format exceptions
-        structlog.processors.format_exc_info,
-    ]
+        app_logger.handlers = [handler]
+        app_logger.propagate = False  # Don't propagate to root logger
+
+    _set_application_handler(handler)
+
+    if profile == "production":
+        processors: List[Processor] = [
+            # Drop events below the log level before doing any work on them
+            structlog.stdlib.filter_by_level,
+            EventSampler(DEFAULT_SAMPLED_EVENTS if sampled_events is None else sampled_events),
+            structlog.processors.TimeStamper(fmt="iso"),
+            structlog.processors.add_log_level,
+            structlog.contextvars.merge_contextvars,
+            structlog.processors.format_exc_info,
+        ]
+    else:
+        # Define processors for structlog
+        processors = [
+            # Add timestamps to logs
+            structlog.processors.TimeStamper(fmt="iso"),
+            # Add log level as string
+            structlog.processors.add_log_level,
+            # Add callsite parameters.
+            structlog.processors.CallsiteParameterAdder(
+                {
+                    structlog.processors.CallsiteParameter.FILENAME,
+                    structlog.processors.CallsiteParameter.FUNC_NAME,
+                    structlog.processors.CallsiteParameter.LINENO,
+                }
+            ),
+            # Format callsite into clickable location
+            format_clickable_callsite,
+            # Add logger name
+            structlog.processors.StackInfoRenderer(),
+            # Add extra context from the logging call
+            structlog.contextvars.merge_contextvars,
+            # Format exceptions
+            structlog.processors.format_exc_info,
+        ]
 
     # Add any extra processors
     if extra_processors:
@@ -210,10 +330,13 @@ def get_logger(name: str) -> structlog.stdlib.BoundLogger:
         stdlib_logger = logging.getLogger(name)
         stdlib_logger.propagate = False
 
-        # Ensure it has handlers - either copy from symbology app logger or add directly
+        # Ensure it has handlers - the configured application handler, a copy of the
+        # symbology app logger's, or a console handler added directly
         if not stdlib_logger.handlers:
             app_logger = logging.getLogger("symbology")
-            if app_logger.handlers:
+            if _application_handler is not None:
+                stdlib_logger.addHandler(_application_handler)
+            elif app_logger.handlers:
                 # Copy handlers from the symbology app logger
                 for handler in app_logger.handlers:
                     stdlib_logger.addHandler(handler)
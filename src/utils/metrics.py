@@ -0,0 +1,415 @@
+"""
+Metrics for the Symbology project.
+
+A small in-process registry of counters, gauges and histograms rendered in the
+Prometheus text exposition format. The API serves the default registry at
+/metrics; CLI batch jobs, which exit before they could be scraped, write it to a
+node_exporter textfile or push it to a Pushgateway when they finish (see
+export_metrics and MetricsSettings).
+
+Usage:
+    from src.utils.metrics import Histogram
+
+    REQUEST_SECONDS = Histogram("symbology_example_seconds", "Example latency", ["route"])
+    REQUEST_SECONDS.observe(0.25, route="/companies")
+
+Label values should have low cardinality: route templates, model names and
+statement types, never ids or hashes.
+"""
+from abc import ABC, abstractmethod
+import math
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from urllib import request as urllib_request
+
+from src.utils.config import settings
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Content type of the Prometheus text exposition format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Histogram buckets, in seconds, for request and query latencies
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Histogram buckets, in seconds, for LLM generation timings
+GENERATION_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0)
+
+# Histogram buckets for LLM throughput, in tokens per second
+THROUGHPUT_BUCKETS = (1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 50.0, 75.0, 100.0, 150.0, 250.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value):
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values)) + "}"
+
+
+class Metric(ABC):
+    """Base class for a named metric with a fixed set of label names."""
+
+    type_name = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 registry: Optional["MetricsRegistry"] = None):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        (REGISTRY if registry is None else registry).register(self)
+
+    def _label_values(self, labels: Dict[str, object]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {list(self.labelnames)}, got {sorted(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    @abstractmethod
+    def samples(self) -> Iterable[Tuple[str, Sequence[str], LabelValues, float]]:
+        """Yield (sample name, label names, label values, value) tuples."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Drop every recorded series."""
+
+
+class Counter(Metric):
+    """A value that only goes up, e.g. a number of queries or tokens."""
+
+    type_name = "counter"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        """Increase the counter of a label set."""
+        if amount < 0:
+            raise ValueError("Counters can only be increased")
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        """Current value of a label set."""
+        with self._lock:
+            return self._values.get(self._label_values(labels), 0)
+
+    def samples(self):
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            yield f"{self.name}_total", self.labelnames, key, value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Gauge(Metric):
+    """A value that goes up and down, e.g. checked out connections or a throughput."""
+
+    type_name = "gauge"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: Dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels) -> None:
+        """Set the gauge of a label set."""
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def value(self, **labels) -> float:
+        """Current value of a label set."""
+        with self._lock:
+            return self._values.get(self._label_values(labels), 0)
+
+    def samples(self):
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            yield self.name, self.labelnames, key, value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Histogram(Metric):
+    """Distribution of observed values in cumulative buckets, e.g. latencies."""
+
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS, registry: Optional["MetricsRegistry"] = None):
+        super().__init__(name, documentation, labelnames, registry)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [count per bucket..., count in +Inf], sum
+        self._values: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        """Record one observation for a label set."""
+        key = self._label_values(labels)
+        index = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = i
+                break
+        with self._lock:
+            counts, total = self._values.setdefault(key, ([0] * (len(self.buckets) + 1), [0.0]))
+            counts[index] += 1
+            total[0] += value
+
+    def count(self, **labels) -> int:
+        """Number of observations of a label set."""
+        with self._lock:
+            counts, _ = self._values.get(self._label_values(labels), ([0], [0.0]))
+            return sum(counts)
+
+    def time(self, **labels) -> "_Timer":
+        """Context manager observing the duration of the enclosed block."""
+        return _Timer(self, labels)
+
+    def samples(self):
+        with self._lock:
+            items = [(key, list(counts), total[0]) for key, (counts, total) in self._values.items()]
+        names = self.labelnames + ("le",)
+        for key, counts, total in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                yield f"{self.name}_bucket", names, key + (_format_value(bound),), cumulative
+            yield f"{self.name}_count", self.labelnames, key, cumulative
+            yield f"{self.name}_sum", self.labelnames, key, total
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class _Timer:
+    def __init__(self, histogram: Histogram, labels: Dict[str, object]):
+        self._histogram = histogram
+        self._labels = labels
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self._histogram.observe(time.perf_counter() - self._start, **self._labels)
+        return False
+
+
+class MetricsRegistry:
+    """A set of metrics, plus collectors run before each render to refresh gauges."""
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+        self._collectors: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    def register(self, metric: Metric) -> None:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name} is already registered")
+            self._metrics[metric.name] = metric
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        """Run collector before each render, e.g. to sample connection pool state into gauges."""
+        with self._lock:
+            self._collectors.append(collector)
+
+    def clear(self) -> None:
+        """Drop every recorded series, keeping the metrics registered."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.clear()
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        with self._lock:
+            collectors = list(self._collectors)
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+
+        for collector in collectors:
+            try:
+                collector()
+            except Exception as e:
+                logger.warning("metrics_collector_failed", collector=getattr(collector, "__name__", str(collector)), error=str(e))
+
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {_escape(metric.documentation)}")
+            lines.append(f"# TYPE {metric.name} {metric.type_name}")
+            for name, labelnames, labelvalues, value in metric.samples():
+                lines.append(f"{name}{_format_labels(labelnames, labelvalues)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+# Default registry, served by the API and exported by CLI jobs
+REGISTRY = MetricsRegistry()
+
+
+def write_textfile(path: str, registry: MetricsRegistry = REGISTRY) -> None:
+    """
+    Write the registry to a file for the node_exporter textfile collector.
+
+    The file is written next to its destination and renamed into place, so the
+    collector never reads a partial file.
+
+    Args:
+        path: Destination path, conventionally ending in .prom
+        registry: Registry to write
+    """
+    destination = Path(path).expanduser()
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    temporary = destination.with_name(f".{destination.name}.{os.getpid()}.tmp")
+    temporary.write_text(registry.render(), encoding="utf-8")
+    os.replace(temporary, destination)
+
+
+def push_to_gateway(url: str, job: str, registry: MetricsRegistry = REGISTRY, timeout: float = 10.0) -> None:
+    """
+    Push the registry to a Prometheus Pushgateway, replacing the job's previous metrics.
+
+    Args:
+        url: Pushgateway base URL, e.g. http://localhost:9091
+        job: Job name to group the metrics under
+        registry: Registry to push
+        timeout: Request timeout in seconds
+    """
+    push_request = urllib_request.Request(
+        f"{url.rstrip('/')}/metrics/job/{job}",
+        data=registry.render().encode("utf-8"),
+        method="PUT",
+        headers={"Content-Type": CONTENT_TYPE},
+    )
+    with urllib_request.urlopen(push_request, timeout=timeout):
+        pass
+
+
+def export_metrics(job: str, registry: MetricsRegistry = REGISTRY) -> None:
+    """
+    Export the registry at the end of a batch job, to the textfile and/or Pushgateway in settings.
+
+    Failures are logged rather than raised, so a metrics outage never fails the job.
+
+    Args:
+        job: Job name, e.g. the CLI command that ran
+        registry: Registry to export
+    """
+    if not settings.metrics.enabled:
+        return
+
+    if settings.metrics.textfile_path:
+        try:
+            write_textfile(settings.metrics.textfile_path, registry)
+            logger.debug("metrics_textfile_written", path=settings.metrics.textfile_path, job=job)
+        except Exception as e:
+            logger.warning("metrics_textfile_failed", path=settings.metrics.textfile_path, error=str(e))
+
+    if settings.metrics.pushgateway_url:
+        try:
+            push_to_gateway(settings.metrics.pushgateway_url, job, registry)
+            logger.debug("metrics_pushed", url=settings.metrics.pushgateway_url, job=job)
+        except Exception as e:
+            logger.warning("metrics_push_failed", url=settings.metrics.pushgateway_url, error=str(e))
+
+
+# Metrics recorded by the API, database, LLM and ingestion hot paths
+
+HTTP_REQUEST_SECONDS = Histogram(
+    "symbology_http_request_duration_seconds",
+    "API request latency by route template",
+    ["method", "route", "status"],
+)
+
+DB_QUERIES = Counter(
+    "symbology_db_queries",
+    "SQL statements executed, by statement type",
+    ["statement"],
+)
+
+DB_QUERY_SECONDS = Histogram(
+    "symbology_db_query_duration_seconds",
+    "SQL statement execution time, by statement type",
+    ["statement"],
+)
+
+DB_POOL_CONNECTIONS = Gauge(
+    "symbology_db_pool_connections",
+    "Database connection pool state",
+    ["state"],
+)
+
+LLM_TIME_TO_FIRST_TOKEN_SECONDS = Histogram(
+    "symbology_llm_time_to_first_token_seconds",
+    "Time from request to first generated token, including model load and prompt evaluation",
+    ["model"],
+    buckets=GENERATION_BUCKETS,
+)
+
+LLM_GENERATION_SECONDS = Histogram(
+    "symbology_llm_generation_duration_seconds",
+    "Total LLM request time",
+    ["model"],
+    buckets=GENERATION_BUCKETS,
+)
+
+LLM_TOKENS_PER_SECOND = Histogram(
+    "symbology_llm_tokens_per_second",
+    "LLM output throughput per request",
+    ["model"],
+    buckets=THROUGHPUT_BUCKETS,
+)
+
+LLM_TOKENS = Counter(
+    "symbology_llm_tokens",
+    "LLM tokens processed, by direction",
+    ["model", "direction"],
+)
+
+INGESTED_FILINGS = Counter(
+    "symbology_ingestion_filings",
+    "Filings ingested",
+    ["form"],
+)
+
+INGESTED_SECTIONS = Counter(
+    "symbology_ingestion_sections",
+    "Filing sections ingested, by write status",
+    ["status"],
+)
+
+INGESTION_FILINGS_PER_SECOND = Gauge(
+    "symbology_ingestion_filings_per_second",
+    "Filing throughput of the most recent ingestion run",
+    ["form"],
+)
+
+INGESTION_SECTIONS_PER_SECOND = Gauge(
+    "symbology_ingestion_sections_per_second",
+    "Section throughput of the most recent ingestion run",
+    ["form"],
+)